@@ -23,7 +23,8 @@ COMPONENTS:
 - app: FastAPI application factory and default instance
 - routes: API endpoint definitions
 - schemas: Pydantic request/response models
-- middleware: Request processing middleware
+- middleware: Request processing middleware (single fused ASGI layer)
+- serialization: Fast JSON encoding, projection and MessagePack negotiation
 
 USAGE:
     # Run with uvicorn
@@ -39,6 +40,7 @@ ENDPOINTS:
     GET  /health          - Health check
     GET  /status          - Detailed status
     GET  /models          - Model information
+    POST /admin/profile   - Sampling profile (X-Ash-Internal-Key, Phase 8)
 """
 
 # Module version
@@ -64,6 +66,8 @@ from .routes import (
     analysis_router,
     health_router,
     models_router,
+    config_router,
+    admin_router,
 )
 
 # =============================================================================
@@ -97,15 +101,43 @@ from .schemas import (
 # =============================================================================
 
 from .middleware import (
-    RequestIDMiddleware,
-    LoggingMiddleware,
-    ErrorHandlingMiddleware,
-    RateLimitMiddleware,
+    AshMiddleware,
+    RateLimiter,
     RequestContext,
     setup_middleware,
     get_request_context,
     get_request_id,
     REQUEST_ID_HEADER,
+    INTERNAL_KEY_HEADER,
+)
+
+# =============================================================================
+# Rate Limiting (Phase 8)
+# =============================================================================
+
+from .rate_limit import (
+    RouteLimit,
+    RateLimitDecision,
+    RateLimitBackend,
+    InMemoryTokenBucketBackend,
+    create_rate_limit_backend,
+)
+
+# =============================================================================
+# Response Serialization (Phase 8)
+# =============================================================================
+
+from .serialization import (
+    FastJSONResponse,
+    build_analyze_payload,
+    resolve_projection,
+    COMPACT_FIELDS,
+    ORJSON_AVAILABLE,
+    MsgPackResponse,
+    NegotiatedRoute,
+    negotiate_response,
+    MSGPACK_AVAILABLE,
+    MSGPACK_MEDIA_TYPE,
 )
 
 # =============================================================================
@@ -125,6 +157,8 @@ __all__ = [
     "analysis_router",
     "health_router",
     "models_router",
+    "config_router",
+    "admin_router",
     # Enums
     "SeverityLevel",
     "RecommendedAction",
@@ -144,13 +178,29 @@ __all__ = [
     "ErrorDetail",
     "CrisisAlertPayload",
     # Middleware
-    "RequestIDMiddleware",
-    "LoggingMiddleware",
-    "ErrorHandlingMiddleware",
-    "RateLimitMiddleware",
+    "AshMiddleware",
+    "RateLimiter",
     "RequestContext",
     "setup_middleware",
     "get_request_context",
     "get_request_id",
     "REQUEST_ID_HEADER",
+    "INTERNAL_KEY_HEADER",
+    # Rate limiting
+    "RouteLimit",
+    "RateLimitDecision",
+    "RateLimitBackend",
+    "InMemoryTokenBucketBackend",
+    "create_rate_limit_backend",
+    # Serialization
+    "FastJSONResponse",
+    "build_analyze_payload",
+    "resolve_projection",
+    "COMPACT_FIELDS",
+    "ORJSON_AVAILABLE",
+    "MsgPackResponse",
+    "NegotiatedRoute",
+    "negotiate_response",
+    "MSGPACK_AVAILABLE",
+    "MSGPACK_MEDIA_TYPE",
 ]
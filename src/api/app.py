@@ -10,9 +10,9 @@ Ash-NLP is a CRISIS DETECTION BACKEND that:
 ********************************************************************************
 FastAPI Application Factory for Ash-NLP Service
 ---
-FILE VERSION: v5.0-6-4.0-1
-LAST MODIFIED: 2026-01-02
-PHASE: Phase 6 - Sprint 4 (FE-004: Enhanced Warmup)
+FILE VERSION: v5.0-8-25.0-1
+LAST MODIFIED: 2026-02-24
+PHASE: Phase 8 Step 25.0 - Background Alert Delivery
 CLEAN ARCHITECTURE: v5.1 Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-nlp
 Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
@@ -34,6 +34,16 @@ PHASE 4 FEATURES:
 - Consensus algorithm configuration endpoint
 - Enhanced analysis with explainability
 - Conflict detection and resolution
+
+PHASE 8 FEATURES:
+- Prometheus /metrics endpoint and request metrics middleware
+  (no-op when prometheus_client is not installed)
+- Admin profiling endpoints, enabled only when the internal bypass key
+  is configured
+- Config file watcher: thresholds, weights, labels and context settings
+  reload without a restart (performance.config_reload_enabled)
+- Alert outbox: Discord alerts are queued and delivered by a background
+  task, never from the analysis path (performance.alert_outbox_enabled)
 """
 
 import asyncio
@@ -48,12 +58,22 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from src.managers.config_manager import ConfigManager, create_config_manager
 from src.ensemble import EnsembleDecisionEngine, create_decision_engine
-
-from .routes import analysis_router, health_router, models_router, config_router
+from src.utils.metrics import (
+    set_models_loaded,
+    setup_metrics,
+)
+
+from .routes import (
+    analysis_router,
+    health_router,
+    models_router,
+    config_router,
+    admin_router,
+)
 from .middleware import setup_middleware
 
 # Module version
-__version__ = "v5.0-6-4.0-1"
+__version__ = "v5.0-8-25.0-1"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -70,8 +90,8 @@ async def lifespan(app: FastAPI):
     Application lifespan manager.
 
     Handles startup and shutdown events:
-    - Startup: Configure logging, secrets, alerter, load models, warmup, send alerts
-    - Shutdown: Gracefully shutdown engine, close alerter, release resources
+    - Startup: Configure logging, secrets, alerter, load models, warmup, start escalation sweep, send alerts
+    - Shutdown: Stop escalation sweep, shutdown engine, close alerter, release resources
     """
     # =========================================================================
     # STARTUP
@@ -81,6 +101,7 @@ async def lifespan(app: FastAPI):
     start_time = time.time()
 
     alerter = None
+    outbox = None
 
     try:
         # Configure logging from environment
@@ -125,6 +146,14 @@ async def lifespan(app: FastAPI):
             config = create_config_manager()
             app.state.config = config
 
+        # Background alert delivery (Phase 8)
+        from src.utils.alert_outbox import create_alert_outbox
+
+        outbox = create_alert_outbox(alerter, config_manager=config)
+        if outbox:
+            outbox.start()
+        app.state.alert_outbox = outbox
+
         # Check if Phase 4 should be enabled
         phase4_enabled = os.environ.get("NLP_PHASE4_ENABLED", "true").lower() == "true"
 
@@ -165,8 +194,43 @@ async def lifespan(app: FastAPI):
         app.state.secrets = secrets
         app.state.alerter = alerter
 
+        # Background escalation sweep over stored histories (Phase 8)
+        from src.context import create_escalation_sweeper
+
+        sweeper = create_escalation_sweeper(
+            getattr(engine, "context_analyzer", None), alerter=alerter
+        )
+        if sweeper:
+            sweeper.start()
+        app.state.escalation_sweeper = sweeper
+
+        # Hot configuration reload (Phase 8)
+        from src.managers.config_watcher import create_config_watcher
+
+        def on_config_reload(new_config, new_context_config):
+            summary = engine.reload_config(new_config, new_context_config)
+            app.state.config = new_config
+            if sweeper and "context_analyzer" in summary["rebuilt"]:
+                sweeper.set_context_analyzer(engine.context_analyzer)
+            return summary
+
+        context_analyzer = getattr(engine, "context_analyzer", None)
+        watcher = create_config_watcher(
+            config,
+            on_reload=on_config_reload,
+            context_config_dir=(
+                context_analyzer.get_config_manager().config_dir
+                if context_analyzer
+                else None
+            ),
+        )
+        if watcher:
+            watcher.start()
+        app.state.config_watcher = watcher
+
         startup_time = time.time() - start_time
         models_loaded = engine.model_loader._models_loaded
+        set_models_loaded(models_loaded)
         total_models = len(engine.model_loader._models) if engine.model_loader._models else 4
 
         logger.info(f"✅ Ash-NLP Service started in {startup_time:.2f}s")
@@ -190,6 +254,10 @@ async def lifespan(app: FastAPI):
                 description=f"Service failed to start: {str(e)[:200]}",
                 source="startup",
             )
+
+        # Deliver queued alerts (including the one above) before failing
+        if outbox:
+            await outbox.stop()
         
         raise
 
@@ -206,11 +274,23 @@ async def lifespan(app: FastAPI):
     logger.info("🛑 Shutting down Ash-NLP Service...")
 
     try:
+        watcher = getattr(app.state, "config_watcher", None)
+        if watcher:
+            await watcher.stop()
+
+        sweeper = getattr(app.state, "escalation_sweeper", None)
+        if sweeper:
+            await sweeper.stop()
+
         engine = getattr(app.state, "engine", None)
         if engine:
             engine.shutdown()
 
-        # Close alerter session
+        # Deliver queued alerts, then close the alerter session
+        outbox = getattr(app.state, "alert_outbox", None)
+        if outbox:
+            await outbox.stop()
+
         alerter = getattr(app.state, "alerter", None)
         if alerter:
             await alerter.close()
@@ -233,6 +313,8 @@ def create_app(
     enable_rate_limiting: bool = True,
     requests_per_minute: int = 60,
     phase4_enabled: bool = True,
+    batch_requests_per_minute: Optional[int] = None,
+    rate_limit_max_clients: int = 10000,
 ) -> FastAPI:
     """
     Create and configure the FastAPI application.
@@ -246,6 +328,9 @@ def create_app(
         enable_rate_limiting: Enable rate limiting middleware
         requests_per_minute: Rate limit threshold
         phase4_enabled: Enable Phase 4 features (default: True)
+        batch_requests_per_minute: Rate limit for /analyze/batch
+            (default: requests_per_minute // 10)
+        rate_limit_max_clients: Bound on tracked rate limit clients
 
     Returns:
         Configured FastAPI application
@@ -354,11 +439,16 @@ Ash-NLP uses a multi-model ensemble for crisis detection:
     secrets = get_secrets_manager()
     bypass_key = secrets.get("ash_internal_bypass_key")
 
+    # Phase 8: Same key gates the /admin endpoints (absent key = disabled)
+    app.state.internal_key = bypass_key
+
     setup_middleware(
         app=app,
         enable_rate_limiting=enable_rate_limiting,
         requests_per_minute=requests_per_minute,
         rate_limit_bypass_key=bypass_key,
+        batch_requests_per_minute=batch_requests_per_minute,
+        rate_limit_max_clients=rate_limit_max_clients,
     )
 
     # =========================================================================
@@ -377,6 +467,12 @@ Ash-NLP uses a multi-model ensemble for crisis detection:
     # Phase 4: Configuration endpoints
     app.include_router(config_router)
 
+    # Phase 8: Admin profiling endpoints (require X-Ash-Internal-Key)
+    app.include_router(admin_router)
+
+    # Phase 8: Prometheus /metrics (skipped if prometheus_client missing)
+    setup_metrics(app)
+
     logger.info(
         f"🔧 Application created "
         f"(cors={enable_cors}, rate_limit={enable_rate_limiting}, phase4={phase4_enabled})"
@@ -437,6 +533,8 @@ def create_production_app() -> FastAPI:
     api_config = config.get_api_config() if config else {}
     rate_limit_enabled = api_config.get("rate_limit_enabled", True)
     rate_limit_rpm = api_config.get("rate_limit_rpm", 60)
+    rate_limit_batch_rpm = api_config.get("rate_limit_batch_rpm")
+    rate_limit_max_clients = api_config.get("rate_limit_max_clients", 10000)
 
     return create_app(
         config_manager=config,
@@ -444,6 +542,8 @@ def create_production_app() -> FastAPI:
         cors_origins=["https://alphabetcartel.org", "https://discord.gg"],
         enable_rate_limiting=rate_limit_enabled,
         requests_per_minute=rate_limit_rpm,
+        batch_requests_per_minute=rate_limit_batch_rpm,
+        rate_limit_max_clients=rate_limit_max_clients,
     )
 
 
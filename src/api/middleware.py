@@ -10,9 +10,9 @@ Ash-NLP is a CRISIS DETECTION BACKEND that:
 ********************************************************************************
 API Middleware for Ash-NLP Service
 ---
-FILE VERSION: v5.0-3-4.4-2
-LAST MODIFIED: 2025-12-31
-PHASE: Phase 3 Step 4.4 - API Layer
+FILE VERSION: v5.0-8-12.0-1
+LAST MODIFIED: 2026-02-11
+PHASE: Phase 8 Step 12.0 - Fused ASGI Middleware
 CLEAN ARCHITECTURE: v5.1 Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-nlp
 Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
@@ -21,22 +21,43 @@ RESPONSIBILITIES:
 - Generate unique request IDs for tracking
 - Log all requests and responses
 - Handle exceptions with consistent error format
-- Track request timing and performance
-- Implement rate limiting (optional)
+- Track request timing and performance (Prometheus when available)
+- Implement rate limiting (optional, token buckets per client and route)
+
+PIPELINE (one pure-ASGI middleware, in order):
+    request ID → request context (contextvar) → rate limit → request log
+        → app → error handling → response log → metrics
+
+Phase 8 replaced the four BaseHTTPMiddleware layers (plus the metrics
+middleware) with AshMiddleware: no per-layer task and stream wrapping,
+and the request context lives in a ContextVar instead of a global dict.
 """
 
 import logging
 import time
 import uuid
+from contextvars import ContextVar
 from datetime import datetime
-from typing import Callable, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.utils.metrics import record_http_request
+
+from .rate_limit import (
+    DEFAULT_MAX_CLIENTS,
+    RateLimitBackend,
+    RateLimitDecision,
+    RouteLimit,
+    build_route_limits,
+    create_rate_limit_backend,
+)
 
 # Module version
-__version__ = "v5.0-3-4.4-2"
+__version__ = "v5.0-8-12.0-1"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -44,6 +65,12 @@ logger = logging.getLogger(__name__)
 # Request ID header name
 REQUEST_ID_HEADER = "X-Request-ID"
 
+# Internal tools key header (rate limit bypass, admin endpoints)
+INTERNAL_KEY_HEADER = "X-Ash-Internal-Key"
+
+# Raw (lowercase) response header name
+_REQUEST_ID_HEADER_RAW = REQUEST_ID_HEADER.lower().encode("latin-1")
+
 
 # =============================================================================
 # Request Context
@@ -58,358 +85,350 @@ class RequestContext:
     accessible throughout request lifecycle.
     """
 
+    __slots__ = ("request_id", "start_time", "metadata")
+
     def __init__(self, request_id: str):
         self.request_id = request_id
         self.start_time = time.perf_counter()
-        self.metadata: Dict[str, any] = {}
+        self.metadata: Dict[str, Any] = {}
 
     @property
     def elapsed_ms(self) -> float:
         """Get elapsed time in milliseconds."""
         return (time.perf_counter() - self.start_time) * 1000
 
-    def set(self, key: str, value: any) -> None:
+    def set(self, key: str, value: Any) -> None:
         """Set metadata value."""
         self.metadata[key] = value
 
-    def get(self, key: str, default: any = None) -> any:
+    def get(self, key: str, default: Any = None) -> Any:
         """Get metadata value."""
         return self.metadata.get(key, default)
 
 
-# Store for request contexts (request-scoped)
-_request_contexts: Dict[str, RequestContext] = {}
-
-
-def get_request_context(request: Request) -> Optional[RequestContext]:
-    """Get request context for current request."""
-    request_id = getattr(request.state, "request_id", None)
-    if request_id:
-        return _request_contexts.get(request_id)
-    return None
-
-
-def get_request_id(request: Request) -> Optional[str]:
-    """Get request ID from current request."""
-    return getattr(request.state, "request_id", None)
+# Current request context (set by AshMiddleware for the request's task;
+# copied into threadpool workers for sync endpoints)
+_request_context: ContextVar[Optional[RequestContext]] = ContextVar(
+    "ash_request_context", default=None
+)
 
 
-# =============================================================================
-# Request ID Middleware
-# =============================================================================
-
-
-class RequestIDMiddleware(BaseHTTPMiddleware):
-    """
-    Middleware to generate and track request IDs.
-
-    - Generates unique request ID for each request
-    - Accepts client-provided request ID (if valid)
-    - Adds request ID to response headers
-    - Creates request context for tracking
+def get_request_context(request: Optional[Request] = None) -> Optional[RequestContext]:
     """
+    Get request context for current request.
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # Get or generate request ID
-        request_id = request.headers.get(REQUEST_ID_HEADER)
-
-        if not request_id or not self._is_valid_request_id(request_id):
-            request_id = self._generate_request_id()
-
-        # Store in request state
-        request.state.request_id = request_id
-
-        # Create request context
-        context = RequestContext(request_id)
-        _request_contexts[request_id] = context
-
-        try:
-            # Process request
-            response = await call_next(request)
-
-            # Add request ID to response headers
-            response.headers[REQUEST_ID_HEADER] = request_id
-
-            return response
-
-        finally:
-            # Cleanup context
-            _request_contexts.pop(request_id, None)
-
-    def _generate_request_id(self) -> str:
-        """Generate unique request ID."""
-        return f"req_{uuid.uuid4().hex[:12]}"
-
-    def _is_valid_request_id(self, request_id: str) -> bool:
-        """Validate request ID format."""
-        if not request_id:
-            return False
-        if len(request_id) > 64:
-            return False
-        # Allow alphanumeric, hyphens, underscores
-        return all(c.isalnum() or c in "-_" for c in request_id)
-
-
-# =============================================================================
-# Logging Middleware
-# =============================================================================
-
-
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """
-    Middleware for request/response logging.
+    Args:
+        request: Unused; kept for callers written against the old
+            request-keyed lookup
 
-    Logs:
-    - Request method, path, client IP
-    - Response status code
-    - Processing time
-    - Request ID for correlation
+    Returns:
+        RequestContext, or None outside a request
     """
+    return _request_context.get()
 
-    # Paths to skip logging (health checks, etc.)
-    SKIP_PATHS = {"/health", "/healthz", "/ready", "/metrics"}
-
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # Skip logging for certain paths
-        if request.url.path in self.SKIP_PATHS:
-            return await call_next(request)
-
-        # Get request info
-        request_id = getattr(request.state, "request_id", "unknown")
-        method = request.method
-        path = request.url.path
-        client_ip = self._get_client_ip(request)
-
-        # Log request
-        logger.info(
-            f"📥 {method} {path}",
-            extra={
-                "request_id": request_id,
-                "client_ip": client_ip,
-                "method": method,
-                "path": path,
-            },
-        )
-
-        start_time = time.perf_counter()
-
-        try:
-            response = await call_next(request)
-
-            # Calculate duration
-            duration_ms = (time.perf_counter() - start_time) * 1000
-
-            # Log response
-            log_level = logging.INFO if response.status_code < 400 else logging.WARNING
-            logger.log(
-                log_level,
-                f"📤 {method} {path} → {response.status_code} ({duration_ms:.1f}ms)",
-                extra={
-                    "request_id": request_id,
-                    "status_code": response.status_code,
-                    "duration_ms": duration_ms,
-                },
-            )
-
-            return response
-
-        except Exception as e:
-            duration_ms = (time.perf_counter() - start_time) * 1000
-            logger.error(
-                f"❌ {method} {path} → ERROR ({duration_ms:.1f}ms): {e}",
-                extra={
-                    "request_id": request_id,
-                    "error": str(e),
-                    "duration_ms": duration_ms,
-                },
-                exc_info=True,
-            )
-            raise
-
-    def _get_client_ip(self, request: Request) -> str:
-        """Extract client IP from request."""
-        # Check forwarded headers (for reverse proxy)
-        forwarded = request.headers.get("X-Forwarded-For")
-        if forwarded:
-            return forwarded.split(",")[0].strip()
-
-        real_ip = request.headers.get("X-Real-IP")
-        if real_ip:
-            return real_ip
-
-        # Fallback to direct client
-        if request.client:
-            return request.client.host
 
-        return "unknown"
+def get_request_id(request: Request) -> Optional[str]:
+    """Get request ID from current request."""
+    return getattr(request.state, "request_id", None)
 
 
-# =============================================================================
-# Error Handling Middleware
-# =============================================================================
+def _generate_request_id() -> str:
+    """Generate unique request ID."""
+    return f"req_{uuid.uuid4().hex[:12]}"
 
 
-class ErrorHandlingMiddleware(BaseHTTPMiddleware):
-    """
-    Middleware for consistent error handling.
+def _is_valid_request_id(request_id: str) -> bool:
+    """Validate request ID format."""
+    if not request_id:
+        return False
+    if len(request_id) > 64:
+        return False
+    # Allow alphanumeric, hyphens, underscores
+    return all(c.isalnum() or c in "-_" for c in request_id)
 
-    Catches unhandled exceptions and returns
-    consistent JSON error responses.
-    """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        try:
-            return await call_next(request)
+def _get_client_ip(headers: Headers, client: Optional[Tuple[str, int]]) -> str:
+    """Extract client IP (reverse-proxy headers first)."""
+    forwarded = headers.get("x-forwarded-for")
+    if forwarded:
+        return forwarded.split(",")[0].strip()
 
-        except Exception as e:
-            request_id = getattr(request.state, "request_id", None)
+    real_ip = headers.get("x-real-ip")
+    if real_ip:
+        return real_ip
 
-            logger.error(
-                f"Unhandled exception: {e}",
-                extra={"request_id": request_id},
-                exc_info=True,
-            )
+    if client:
+        return client[0]
 
-            return JSONResponse(
-                status_code=500,
-                content={
-                    "error": "internal_error",
-                    "message": "An unexpected error occurred",
-                    "request_id": request_id,
-                    "timestamp": datetime.utcnow().isoformat() + "Z",
-                },
-                headers={REQUEST_ID_HEADER: request_id} if request_id else {},
-            )
+    return "unknown"
 
 
 # =============================================================================
-# Rate Limiting Middleware (Simple Implementation)
+# Rate Limiter
 # =============================================================================
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+class RateLimiter:
     """
-    Simple in-memory rate limiting middleware.
+    Token bucket rate limiting policy.
 
-    Note: For production, use Redis-based rate limiting
-    for distributed deployments.
+    Each client gets one bucket per route group (see RouteLimit), so
+    batch requests are limited separately from single analyses. State
+    lives in a RateLimitBackend; the default is per process.
 
     Attributes:
-        requests_per_minute: Max requests per minute per client
-        enabled: Whether rate limiting is active
+        requests_per_minute: Max requests per minute per client (default route)
         bypass_key: Optional secret key to bypass rate limiting (for internal tools)
+        backend: Bucket storage
+        route_limits: Path → RouteLimit overrides
     """
 
     # Header name for internal bypass key
-    BYPASS_HEADER = "X-Ash-Internal-Key"
+    BYPASS_HEADER = INTERNAL_KEY_HEADER
+
+    # Paths never rate limited
+    SKIP_PATHS = {"/health", "/healthz", "/ready"}
 
     def __init__(
         self,
-        app: FastAPI,
         requests_per_minute: int = 60,
-        enabled: bool = True,
         bypass_key: Optional[str] = None,
+        backend: Optional[RateLimitBackend] = None,
+        route_limits: Optional[Dict[str, RouteLimit]] = None,
     ):
-        super().__init__(app)
         self.requests_per_minute = requests_per_minute
-        self.enabled = enabled
         self.bypass_key = bypass_key
-        self._request_counts: Dict[str, list] = {}
+        self.backend = backend if backend is not None else create_rate_limit_backend()
+
+        default_limit, default_routes = build_route_limits(requests_per_minute)
+        self.default_limit = default_limit
+        self.route_limits = default_routes if route_limits is None else route_limits
 
         # Log bypass key status (without revealing the key)
         if self.bypass_key:
             logger.info("🔑 Rate limit bypass key configured for internal tools")
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        if not self.enabled:
-            return await call_next(request)
-
-        # Skip rate limiting for health checks
-        if request.url.path in {"/health", "/healthz", "/ready"}:
-            return await call_next(request)
+    def check(
+        self,
+        path: str,
+        headers: Headers,
+        client: Optional[Tuple[str, int]],
+    ) -> Tuple[Optional[RateLimitDecision], Optional[RouteLimit], str]:
+        """
+        Take a token for this request.
+
+        Returns:
+            (decision, limit, client_id); decision is None when the request
+            is exempt (health checks, valid bypass key)
+        """
+        if path in self.SKIP_PATHS:
+            return None, None, ""
 
         # Skip rate limiting for internal tools with valid bypass key
         if self.bypass_key:
-            provided_key = request.headers.get(self.BYPASS_HEADER)
+            provided_key = headers.get(self.BYPASS_HEADER)
             if provided_key and provided_key == self.bypass_key:
                 logger.debug("🔓 Rate limit bypassed for internal tool")
-                return await call_next(request)
-
-        client_id = self._get_client_id(request)
-
-        if self._is_rate_limited(client_id):
-            request_id = getattr(request.state, "request_id", None)
-
-            logger.warning(
-                f"Rate limit exceeded for {client_id}",
-                extra={"request_id": request_id, "client_id": client_id},
-            )
-
-            return JSONResponse(
-                status_code=429,
-                content={
-                    "error": "rate_limit_exceeded",
-                    "message": f"Rate limit exceeded. Max {self.requests_per_minute} requests per minute.",
-                    "request_id": request_id,
-                    "timestamp": datetime.utcnow().isoformat() + "Z",
-                },
-                headers={
-                    "Retry-After": "60",
-                    REQUEST_ID_HEADER: request_id or "",
-                },
-            )
-
-        # Record request
-        self._record_request(client_id)
-
-        return await call_next(request)
-
-    def _get_client_id(self, request: Request) -> str:
+                return None, None, ""
+
+        client_id = self._get_client_id(headers, client)
+        limit = self.route_limits.get(path, self.default_limit)
+        return self.backend.acquire(f"{client_id}|{limit.name}", limit), limit, client_id
+
+    def _get_client_id(self, headers: Headers, client: Optional[Tuple[str, int]]) -> str:
         """Get unique client identifier."""
         # Use API key if provided
-        api_key = request.headers.get("X-API-Key")
+        api_key = headers.get("x-api-key")
         if api_key:
             return f"key:{api_key[:8]}"
 
         # Fall back to IP
-        forwarded = request.headers.get("X-Forwarded-For")
+        forwarded = headers.get("x-forwarded-for")
         if forwarded:
             return f"ip:{forwarded.split(',')[0].strip()}"
 
-        if request.client:
-            return f"ip:{request.client.host}"
+        if client:
+            return f"ip:{client[0]}"
 
         return "unknown"
 
-    def _is_rate_limited(self, client_id: str) -> bool:
-        """Check if client is rate limited."""
-        now = time.time()
-        window_start = now - 60  # 1 minute window
+    def get_stats(self) -> Dict[str, Any]:
+        """Get rate limiter statistics."""
+        return {
+            "requests_per_minute": self.requests_per_minute,
+            "route_limits": {
+                path: limit.requests_per_minute for path, limit in self.route_limits.items()
+            },
+            **self.backend.get_stats(),
+        }
+
+
+# =============================================================================
+# Fused ASGI Middleware
+# =============================================================================
+
+
+class AshMiddleware:
+    """
+    Pure-ASGI middleware combining request ID, rate limiting, logging,
+    error handling and request metrics.
+
+    Behaviour matches the former middleware stack:
+    - Request ID: client-provided X-Request-ID if valid, else generated;
+      stored on request.state and echoed in the response headers
+    - Rate limiting: 429 with Retry-After; rate-limited requests are not
+      logged as requests (only the warning)
+    - Logging: 📥/📤 lines per request, except SKIP_LOG_PATHS
+    - Errors: unhandled exceptions become a JSON 500 (if the response has
+      not started)
+    - Metrics: count and duration per path, except /metrics
+    """
+
+    # Paths to skip logging (health checks, etc.)
+    SKIP_LOG_PATHS = {"/health", "/healthz", "/ready", "/metrics"}
+
+    # Paths excluded from request metrics
+    SKIP_METRICS_PATHS = {"/metrics"}
 
-        if client_id not in self._request_counts:
-            return False
+    def __init__(
+        self,
+        app: ASGIApp,
+        rate_limiter: Optional[RateLimiter] = None,
+        record_metrics: bool = True,
+    ):
+        self.app = app
+        self.rate_limiter = rate_limiter
+        self.record_metrics = record_metrics
 
-        # Count requests in window
-        recent_requests = [
-            ts for ts in self._request_counts[client_id] if ts > window_start
-        ]
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        return len(recent_requests) >= self.requests_per_minute
+        start_time = time.perf_counter()
+        headers = Headers(scope=scope)
+        path = scope["path"]
+        method = scope["method"]
 
-    def _record_request(self, client_id: str) -> None:
-        """Record a request for rate limiting."""
-        now = time.time()
+        # Request ID (request.state reads scope["state"])
+        request_id = headers.get(REQUEST_ID_HEADER)
+        if not request_id or not _is_valid_request_id(request_id):
+            request_id = _generate_request_id()
+        scope.setdefault("state", {})["request_id"] = request_id
+        raw_request_id = request_id.encode("latin-1")
 
-        if client_id not in self._request_counts:
-            self._request_counts[client_id] = []
+        context = RequestContext(request_id)
+        context.start_time = start_time
+        token = _request_context.set(context)
+
+        status_code = 500
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                status_code = message["status"]
+                raw_headers: List[Tuple[bytes, bytes]] = [
+                    header for header in message.get("headers", ())
+                    if header[0].lower() != _REQUEST_ID_HEADER_RAW
+                ]
+                raw_headers.append((_REQUEST_ID_HEADER_RAW, raw_request_id))
+                message = {**message, "headers": raw_headers}
+            await send(message)
 
-        self._request_counts[client_id].append(now)
+        try:
+            # Rate limiting (before logging, as in the former stack)
+            if self.rate_limiter is not None:
+                decision, limit, client_id = self.rate_limiter.check(
+                    path, headers, scope.get("client")
+                )
+                if decision is not None and not decision.allowed:
+                    logger.warning(
+                        f"Rate limit exceeded for {client_id} ({limit.name})",
+                        extra={"request_id": request_id, "client_id": client_id},
+                    )
+                    response = JSONResponse(
+                        status_code=429,
+                        content={
+                            "error": "rate_limit_exceeded",
+                            "message": (
+                                f"Rate limit exceeded. Max {limit.requests_per_minute} "
+                                f"requests per minute."
+                            ),
+                            "request_id": request_id,
+                            "timestamp": datetime.utcnow().isoformat() + "Z",
+                        },
+                        headers={"Retry-After": decision.retry_after_header},
+                    )
+                    await response(scope, receive, send_wrapper)
+                    return
+
+            log_request = path not in self.SKIP_LOG_PATHS
+            if log_request:
+                logger.info(
+                    f"📥 {method} {path}",
+                    extra={
+                        "request_id": request_id,
+                        "client_ip": _get_client_ip(headers, scope.get("client")),
+                        "method": method,
+                        "path": path,
+                    },
+                )
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            except Exception as e:
+                duration_ms = (time.perf_counter() - start_time) * 1000
+                if response_started:
+                    # Too late for a JSON error body; let the server close it
+                    if log_request:
+                        logger.error(
+                            f"❌ {method} {path} → ERROR ({duration_ms:.1f}ms): {e}",
+                            extra={
+                                "request_id": request_id,
+                                "error": str(e),
+                                "duration_ms": duration_ms,
+                            },
+                            exc_info=True,
+                        )
+                    raise
+
+                logger.error(
+                    f"Unhandled exception: {e}",
+                    extra={"request_id": request_id},
+                    exc_info=True,
+                )
+                response = JSONResponse(
+                    status_code=500,
+                    content={
+                        "error": "internal_error",
+                        "message": "An unexpected error occurred",
+                        "request_id": request_id,
+                        "timestamp": datetime.utcnow().isoformat() + "Z",
+                    },
+                )
+                await response(scope, receive, send_wrapper)
+
+            if log_request:
+                duration_ms = (time.perf_counter() - start_time) * 1000
+                log_level = logging.INFO if status_code < 400 else logging.WARNING
+                logger.log(
+                    log_level,
+                    f"📤 {method} {path} → {status_code} ({duration_ms:.1f}ms)",
+                    extra={
+                        "request_id": request_id,
+                        "status_code": status_code,
+                        "duration_ms": duration_ms,
+                    },
+                )
 
-        # Cleanup old entries (older than 2 minutes)
-        cutoff = now - 120
-        self._request_counts[client_id] = [
-            ts for ts in self._request_counts[client_id] if ts > cutoff
-        ]
+        finally:
+            _request_context.reset(token)
+            if self.record_metrics and path not in self.SKIP_METRICS_PATHS:
+                record_http_request(
+                    path, method, status_code, time.perf_counter() - start_time
+                )
 
 
 # =============================================================================
@@ -422,38 +441,43 @@ def setup_middleware(
     enable_rate_limiting: bool = True,
     requests_per_minute: int = 60,
     rate_limit_bypass_key: Optional[str] = None,
+    batch_requests_per_minute: Optional[int] = None,
+    rate_limit_max_clients: int = DEFAULT_MAX_CLIENTS,
+    rate_limit_backend: Optional[RateLimitBackend] = None,
 ) -> None:
     """
     Setup all middleware for the FastAPI application.
 
-    Order matters! Middleware is executed in reverse order of addition.
+    Adds the single fused AshMiddleware (outermost of the custom
+    middleware, so its timing covers everything inside it).
 
     Args:
         app: FastAPI application instance
         enable_rate_limiting: Whether to enable rate limiting
         requests_per_minute: Rate limit threshold
         rate_limit_bypass_key: Optional secret key to bypass rate limiting (for internal tools)
+        batch_requests_per_minute: Limit for /analyze/batch (default: rpm // 10)
+        rate_limit_max_clients: Bound on tracked client buckets
+        rate_limit_backend: Shared bucket storage (default: in-process)
     """
-    # Add middleware in reverse execution order
-    # (last added = first executed)
-
-    # 1. Error handling (outermost - catches all errors)
-    app.add_middleware(ErrorHandlingMiddleware)
-
-    # 2. Logging (logs all requests/responses)
-    app.add_middleware(LoggingMiddleware)
-
-    # 3. Rate limiting (before processing)
+    rate_limiter = None
     if enable_rate_limiting:
-        app.add_middleware(
-            RateLimitMiddleware,
+        _, route_limits = build_route_limits(
+            requests_per_minute, batch_requests_per_minute
+        )
+        backend = rate_limit_backend
+        if backend is None:
+            backend = create_rate_limit_backend(max_clients=rate_limit_max_clients)
+        rate_limiter = RateLimiter(
             requests_per_minute=requests_per_minute,
-            enabled=True,
             bypass_key=rate_limit_bypass_key,
+            backend=backend,
+            route_limits=route_limits,
         )
+        # Exposed for status/diagnostics
+        app.state.rate_limit_backend = backend
 
-    # 4. Request ID (innermost - generates ID first)
-    app.add_middleware(RequestIDMiddleware)
+    app.add_middleware(AshMiddleware, rate_limiter=rate_limiter)
 
     logger.info(
         f"🔧 Middleware configured "
@@ -468,13 +492,12 @@ def setup_middleware(
 # =============================================================================
 
 __all__ = [
-    "RequestIDMiddleware",
-    "LoggingMiddleware",
-    "ErrorHandlingMiddleware",
-    "RateLimitMiddleware",
+    "AshMiddleware",
+    "RateLimiter",
     "RequestContext",
     "setup_middleware",
     "get_request_context",
     "get_request_id",
     "REQUEST_ID_HEADER",
+    "INTERNAL_KEY_HEADER",
 ]
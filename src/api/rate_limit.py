@@ -0,0 +1,334 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+CORE PRINCIPLE: Multi-Model Ensemble → Weighted Decision Engine → Crisis Classification
+******************  CORE SYSTEM VISION (Never to be violated):  ****************
+Ash-NLP is a CRISIS DETECTION BACKEND that:
+1. PRIMARY: Uses BART Zero-Shot Classification for semantic crisis detection
+2. CONTEXTUAL: Enhances with sentiment, irony, and emotion model signals
+3. ENSEMBLE: Combines weighted model outputs through decision engine
+4. PURPOSE: Detect crisis messages in Discord community communications
+********************************************************************************
+Rate Limit Backends for Ash-NLP Service
+---
+FILE VERSION: v5.0-8-11.0-2
+LAST MODIFIED: 2026-02-10
+PHASE: Phase 8 Step 11.0 - Token Bucket Rate Limiting
+CLEAN ARCHITECTURE: v5.1 Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+
+RESPONSIBILITIES:
+- Define the RateLimitBackend interface used by the API middleware (RateLimiter)
+- Provide an in-process token bucket backend with O(1) checks
+- Bound the client table (LRU) and evict idle clients
+- Describe per-route limits (e.g. /analyze/batch vs /analyze)
+
+TOKEN BUCKET:
+    capacity = requests_per_minute (one minute of burst)
+    refill   = requests_per_minute / 60 tokens per second
+    A request takes one token; an empty bucket reports how long until
+    the next token (used for Retry-After).
+
+    A bucket left idle long enough to refill completely is identical to
+    a new one, so it can be dropped without changing any decision.
+
+BACKENDS:
+    InMemoryTokenBucketBackend is per process. With several uvicorn
+    workers each worker enforces its own limit; a backend sharing state
+    between workers (shared memory, local socket, Redis) can implement
+    RateLimitBackend and be passed to setup_middleware().
+"""
+
+import logging
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+# Module version
+__version__ = "v5.0-8-11.0-2"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Default bound on tracked clients
+DEFAULT_MAX_CLIENTS = 10000
+
+# Oldest buckets inspected for idle eviction per acquire
+IDLE_SCAN_PER_ACQUIRE = 2
+
+
+# =============================================================================
+# Route Limits
+# =============================================================================
+
+@dataclass(frozen=True)
+class RouteLimit:
+    """
+    Rate limit for one route group.
+
+    Attributes:
+        name: Bucket namespace (kept separate per client)
+        requests_per_minute: Sustained rate and burst capacity
+    """
+    name: str
+    requests_per_minute: int
+
+    @property
+    def capacity(self) -> float:
+        """Burst capacity in tokens."""
+        return float(self.requests_per_minute)
+
+    @property
+    def refill_per_second(self) -> float:
+        """Tokens added per second."""
+        return self.requests_per_minute / 60.0
+
+
+@dataclass
+class RateLimitDecision:
+    """
+    Outcome of one rate limit check.
+
+    Attributes:
+        allowed: Whether the request may proceed
+        remaining: Whole tokens left after this request
+        retry_after: Seconds until a token is available (0 when allowed)
+    """
+    allowed: bool
+    remaining: int
+    retry_after: float = 0.0
+
+    @property
+    def retry_after_header(self) -> str:
+        """Retry-After value (whole seconds, at least 1)."""
+        return str(max(1, math.ceil(self.retry_after)))
+
+
+# =============================================================================
+# Backend Interface
+# =============================================================================
+
+class RateLimitBackend(ABC):
+    """
+    Storage for rate limit state.
+
+    Implementations must be safe to call from concurrent requests.
+    """
+
+    @abstractmethod
+    def acquire(
+        self,
+        key: str,
+        limit: RouteLimit,
+        now: Optional[float] = None,
+    ) -> RateLimitDecision:
+        """
+        Take one token for key under limit.
+
+        Args:
+            key: Client + route bucket key
+            limit: Route limit to apply
+            now: Monotonic seconds (default: time.monotonic())
+
+        Returns:
+            RateLimitDecision
+        """
+
+    @abstractmethod
+    def reset(self, key: Optional[str] = None) -> None:
+        """Drop one bucket, or all buckets when key is None."""
+
+    @abstractmethod
+    def get_stats(self) -> Dict[str, Any]:
+        """Get backend statistics."""
+
+    def close(self) -> None:
+        """Release backend resources (no-op by default)."""
+
+
+# =============================================================================
+# In-Memory Token Bucket Backend
+# =============================================================================
+
+class InMemoryTokenBucketBackend(RateLimitBackend):
+    """
+    Per-process token buckets in a bounded LRU table.
+
+    STORAGE:
+        OrderedDict[key → [tokens, last_refill, full_after]]
+        - order is last use (oldest first), so idle buckets sit at the front
+        - full_after: monotonic time at which the bucket is full again
+
+    Clean Architecture v5.1 Compliance:
+    - Factory function: create_rate_limit_backend()
+    """
+
+    def __init__(self, max_clients: int = DEFAULT_MAX_CLIENTS):
+        """
+        Initialize InMemoryTokenBucketBackend.
+
+        Args:
+            max_clients: Buckets kept before least-recently-used are evicted
+
+        Note:
+            Use create_rate_limit_backend() factory function instead.
+        """
+        self.max_clients = max(1, max_clients)
+        self._buckets: "OrderedDict[str, list]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Statistics
+        self._allowed = 0
+        self._limited = 0
+        self._idle_evictions = 0
+        self._capacity_evictions = 0
+
+    def acquire(
+        self,
+        key: str,
+        limit: RouteLimit,
+        now: Optional[float] = None,
+    ) -> RateLimitDecision:
+        """Take one token for key under limit."""
+        now = time.monotonic() if now is None else now
+        capacity = limit.capacity
+        rate = limit.refill_per_second
+
+        with self._lock:
+            self._evict_idle(now)
+
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                tokens = capacity
+                while len(self._buckets) >= self.max_clients:
+                    self._buckets.popitem(last=False)
+                    self._capacity_evictions += 1
+            else:
+                tokens = min(capacity, bucket[0] + (now - bucket[1]) * rate)
+                self._buckets.move_to_end(key)
+
+            if tokens >= 1.0:
+                tokens -= 1.0
+                allowed = True
+                retry_after = 0.0
+                self._allowed += 1
+            else:
+                allowed = False
+                retry_after = (1.0 - tokens) / rate if rate > 0 else 60.0
+                self._limited += 1
+
+            full_after = now + (capacity - tokens) / rate if rate > 0 else math.inf
+            if bucket is None:
+                self._buckets[key] = [tokens, now, full_after]
+            else:
+                bucket[0] = tokens
+                bucket[1] = now
+                bucket[2] = full_after
+
+        return RateLimitDecision(
+            allowed=allowed,
+            remaining=int(tokens),
+            retry_after=retry_after,
+        )
+
+    def _evict_idle(self, now: float) -> None:
+        """Drop least-recently-used buckets that have fully refilled."""
+        for _ in range(IDLE_SCAN_PER_ACQUIRE):
+            if not self._buckets:
+                return
+            key, bucket = next(iter(self._buckets.items()))
+            if bucket[2] > now:
+                return
+            del self._buckets[key]
+            self._idle_evictions += 1
+
+    def reset(self, key: Optional[str] = None) -> None:
+        """Drop one bucket, or all buckets when key is None."""
+        with self._lock:
+            if key is None:
+                self._buckets.clear()
+            else:
+                self._buckets.pop(key, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get backend statistics."""
+        with self._lock:
+            return {
+                "backend": "memory",
+                "clients": len(self._buckets),
+                "max_clients": self.max_clients,
+                "allowed": self._allowed,
+                "limited": self._limited,
+                "idle_evictions": self._idle_evictions,
+                "capacity_evictions": self._capacity_evictions,
+            }
+
+    def __len__(self) -> int:
+        """Return number of tracked buckets."""
+        with self._lock:
+            return len(self._buckets)
+
+
+# =============================================================================
+# Factory Functions
+# =============================================================================
+
+def create_rate_limit_backend(
+    max_clients: int = DEFAULT_MAX_CLIENTS,
+) -> RateLimitBackend:
+    """
+    Factory function for the default rate limit backend.
+
+    Args:
+        max_clients: Bound on tracked client buckets
+
+    Returns:
+        InMemoryTokenBucketBackend
+    """
+    return InMemoryTokenBucketBackend(max_clients=max_clients)
+
+
+def build_route_limits(
+    requests_per_minute: int,
+    batch_requests_per_minute: Optional[int] = None,
+) -> Tuple[RouteLimit, Dict[str, RouteLimit]]:
+    """
+    Build the default limit and per-route overrides.
+
+    Args:
+        requests_per_minute: Limit for ordinary endpoints
+        batch_requests_per_minute: Limit for /analyze/batch (one batch
+            carries up to 100 messages; default: requests_per_minute // 10)
+
+    Returns:
+        (default RouteLimit, {path: RouteLimit})
+    """
+    if batch_requests_per_minute is None:
+        batch_requests_per_minute = max(1, requests_per_minute // 10)
+
+    default = RouteLimit(name="default", requests_per_minute=requests_per_minute)
+    routes = {
+        "/analyze/batch": RouteLimit(
+            name="batch", requests_per_minute=batch_requests_per_minute
+        ),
+    }
+    return default, routes
+
+
+# =============================================================================
+# Export public interface
+# =============================================================================
+
+__all__ = [
+    "RouteLimit",
+    "RateLimitDecision",
+    "RateLimitBackend",
+    "InMemoryTokenBucketBackend",
+    "create_rate_limit_backend",
+    "build_route_limits",
+    "DEFAULT_MAX_CLIENTS",
+]
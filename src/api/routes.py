@@ -10,9 +10,9 @@ Ash-NLP is a CRISIS DETECTION BACKEND that:
 ********************************************************************************
 API Routes for Ash-NLP Service
 ---
-FILE VERSION: v5.0-5-5.2-1
-LAST MODIFIED: 2026-01-01
-PHASE: Phase 5 - Context History Analysis
+FILE VERSION: v5.0-8-14.0-2
+LAST MODIFIED: 2026-02-13
+PHASE: Phase 8 Step 14.0 - MessagePack Content Negotiation
 CLEAN ARCHITECTURE: v5.1 Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-nlp
 Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
@@ -33,6 +33,16 @@ PHASE 5 ENHANCEMENTS:
 - Context analysis in responses
 - Context configuration endpoints
 
+PHASE 8 ENHANCEMENTS:
+- Optional per-stage timing in analyze responses (include_timing)
+- Admin profiling endpoints behind the X-Ash-Internal-Key header
+- user_id forwarded so the server-side history store can supply context
+- history_analyzed reports batch-scored vs cached history items
+- user_timezone (FE-001) forwarded to context analysis (was accepted but unused)
+- /analyze serialized straight from CrisisAssessment (no pydantic re-validation),
+  with fields/compact projection; vigil and requires_review now populated
+- MessagePack request/response bodies on /analyze and /analyze/batch
+
 ENDPOINTS:
 - POST /analyze - Analyze single message for crisis signals
 - POST /analyze/batch - Analyze multiple messages
@@ -43,15 +53,19 @@ ENDPOINTS:
 - PUT /config/consensus - Update consensus configuration (Phase 4)
 - GET /config/context - Get context configuration (Phase 5)
 - PUT /config/context - Update context configuration (Phase 5)
+- POST /admin/profile - Sampling profile of the process (Phase 8)
+- POST /admin/profile/analyze - Profile a single analysis call (Phase 8)
 """
 
+import asyncio
+import hmac
 import logging
 import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
 
 from .schemas import (
     # Request schemas
@@ -62,52 +76,49 @@ from .schemas import (
     BatchAnalyzeResponseItem,
     ConsensusConfigUpdateRequest,
     ContextConfigUpdateRequest,
+    ProfileAnalyzeRequest,
     # Response schemas
     HealthResponse,
     StatusResponse,
     ModelStatusResponse,
-    ModelSignalResponse,
     ErrorResponse,
     # Phase 3 Vigil Response schemas
     VigilStatusResponse,
     # Phase 4 Response schemas
-    ExplanationResponse,
-    ConflictAnalysisResponse,
-    DetectedConflictResponse,
-    ConsensusResponse,
     ConsensusConfigResponse,
     Phase4StatusResponse,
     # Phase 5 Response schemas
-    ContextAnalysisResponse,
-    TrendResponse,
-    TemporalFactorsResponse,
-    TrajectoryResponse,
-    InterventionResponse,
-    HistoryMetadataResponse,
     ContextConfigResponse,
     EscalationConfigResponse,
     TemporalConfigResponse,
     TrendConfigResponse,
     # Enums
     SeverityLevel,
-    RecommendedAction,
     HealthStatus,
     ConsensusAlgorithm,
     ResolutionStrategy,
     VerbosityLevel,
-    ConflictType,
-    ConflictSeverity,
-    AgreementLevel,
-    # Phase 5 Enums
-    InterventionUrgency,
-    TrendDirection,
-    TrendVelocity,
-    EscalationRate,
+    # Phase 8 Enums
+    ProfilerMode,
+)
+from .middleware import get_request_id, INTERNAL_KEY_HEADER
+from .serialization import (
+    MSGPACK_MEDIA_TYPE,
+    NegotiatedRoute,
+    build_analyze_payload,
+    negotiate_response,
+    resolve_projection,
+)
+from src.utils.profiling import (
+    ProfilerBusyError,
+    SamplingProfiler,
+    create_sampling_profiler,
+    is_torch_profiler_available,
+    profile_torch_call,
 )
-from .middleware import get_request_id
 
 # Module version
-__version__ = "v5.0-5-5.2-1"
+__version__ = "v5.0-8-14.0-2"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -121,6 +132,7 @@ logger = logging.getLogger(__name__)
 analysis_router = APIRouter(
     prefix="/analyze",
     tags=["Analysis"],
+    route_class=NegotiatedRoute,
 )
 
 # Health and status router
@@ -140,6 +152,12 @@ config_router = APIRouter(
     tags=["Configuration"],
 )
 
+# Phase 8: Admin router (internal tools only)
+admin_router = APIRouter(
+    prefix="/admin",
+    tags=["Admin"],
+)
+
 
 # =============================================================================
 # Dependency Injection
@@ -167,6 +185,35 @@ def get_start_time(request: Request) -> float:
     return getattr(request.app.state, "start_time", time.time())
 
 
+def require_internal_key(request: Request) -> None:
+    """
+    Gate admin endpoints behind the internal bypass key (Phase 8).
+
+    Without a configured key the admin endpoints do not exist (404);
+    with one, callers must present it in X-Ash-Internal-Key (403).
+    """
+    expected = getattr(request.app.state, "internal_key", None)
+    if not expected:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+    provided = request.headers.get(INTERNAL_KEY_HEADER, "")
+    if not hmac.compare_digest(provided.encode(), expected.encode()):
+        logger.warning(f"🔒 Admin endpoint rejected: {request.url.path}")
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid internal key",
+        )
+
+
+def get_profiler(request: Request) -> SamplingProfiler:
+    """Get (or lazily create) the process sampling profiler."""
+    profiler = getattr(request.app.state, "profiler", None)
+    if profiler is None:
+        profiler = create_sampling_profiler()
+        request.app.state.profiler = profiler
+    return profiler
+
+
 # =============================================================================
 # Analysis Endpoints
 # =============================================================================
@@ -176,7 +223,10 @@ def get_start_time(request: Request) -> float:
     "",
     response_model=AnalyzeResponse,
     responses={
-        200: {"description": "Successful analysis"},
+        200: {
+            "description": "Successful analysis",
+            "content": {MSGPACK_MEDIA_TYPE: {}},
+        },
         400: {"model": ErrorResponse, "description": "Invalid request"},
         503: {"model": ErrorResponse, "description": "Service unavailable"},
     },
@@ -202,6 +252,12 @@ def get_start_time(request: Request) -> float:
     - Trend analysis (worsening, stable, improving)
     - Intervention urgency recommendations
 
+    **Phase 8 Features:**
+    - `fields`: return only the listed top-level response fields
+    - `compact`: return only severity/score fields
+    - MessagePack: send `Content-Type: application/msgpack` and/or
+      `Accept: application/msgpack` (same schema as JSON)
+
     Returns a comprehensive crisis assessment including severity level,
     confidence score, recommended action, optional explanation, and context analysis.
     """,
@@ -210,12 +266,15 @@ async def analyze_message(
     request: Request,
     body: AnalyzeRequest,
     engine=Depends(get_engine),
-) -> AnalyzeResponse:
+) -> Response:
     """
     Analyze a single message for crisis signals.
 
     This is the primary endpoint for crisis detection.
     Supports Phase 4 and Phase 5 enhanced options.
+
+    The response follows AnalyzeResponse but is serialized straight from
+    the CrisisAssessment (see src.api.serialization).
     """
     request_id = get_request_id(request)
     history_count = len(body.message_history) if body.message_history else 0
@@ -255,53 +314,18 @@ async def analyze_message(
             consensus_algorithm=body.consensus_algorithm.value if body.consensus_algorithm else None,
             message_history=message_history,
             include_context_analysis=body.include_context_analysis,
+            user_id=body.user_id,
+            user_timezone=body.user_timezone,
         )
 
-        # Convert signals to response format
-        signals = {}
-        for name, signal_data in assessment.signals.items():
-            if isinstance(signal_data, dict):
-                signals[name] = ModelSignalResponse(
-                    label=signal_data.get("label", "unknown"),
-                    score=signal_data.get("score", 0.0),
-                    crisis_signal=signal_data.get("crisis_signal", 0.0),
-                )
-
-        # Build base response
-        response = AnalyzeResponse(
-            crisis_detected=assessment.crisis_detected,
-            severity=SeverityLevel(assessment.severity.value),
-            confidence=assessment.confidence,
-            crisis_score=assessment.crisis_score,
-            requires_intervention=assessment.requires_intervention,
-            recommended_action=RecommendedAction(assessment.recommended_action),
-            signals=signals,
-            processing_time_ms=assessment.processing_time_ms,
-            models_used=assessment.models_used,
-            is_degraded=assessment.is_degraded,
+        # Serialize the trusted assessment directly (no model re-validation)
+        payload = build_analyze_payload(
+            assessment,
             request_id=request_id,
-            timestamp=datetime.utcnow(),
+            include_timing=body.include_timing,
+            fields=resolve_projection(body.fields, body.compact),
         )
 
-        # Add Phase 4 enhanced fields
-        if assessment.explanation:
-            response.explanation = _build_explanation_response(assessment.explanation)
-
-        if assessment.conflict_report:
-            response.conflict_analysis = _build_conflict_response(
-                assessment.conflict_report,
-                assessment.aggregated_result.resolution if assessment.aggregated_result else None,
-            )
-
-        if assessment.consensus_result:
-            response.consensus = _build_consensus_response(assessment.consensus_result)
-
-        # Add Phase 5 context analysis
-        if hasattr(assessment, 'context_analysis') and assessment.context_analysis:
-            response.context_analysis = _build_context_analysis_response(
-                assessment.context_analysis
-            )
-
         # Log crisis detections
         if assessment.crisis_detected:
             logger.warning(
@@ -315,7 +339,7 @@ async def analyze_message(
                 },
             )
 
-        return response
+        return negotiate_response(payload, request)
 
     except Exception as e:
         logger.error(
@@ -333,7 +357,10 @@ async def analyze_message(
     "/batch",
     response_model=BatchAnalyzeResponse,
     responses={
-        200: {"description": "Successful batch analysis"},
+        200: {
+            "description": "Successful batch analysis",
+            "content": {MSGPACK_MEDIA_TYPE: {}},
+        },
         400: {"model": ErrorResponse, "description": "Invalid request"},
         503: {"model": ErrorResponse, "description": "Service unavailable"},
     },
@@ -346,13 +373,15 @@ async def analyze_message(
 
     **Note:** For performance, explanations are optional in batch mode
     and only a summary is returned when enabled.
+
+    Accepts and returns MessagePack like POST /analyze.
     """,
 )
 async def analyze_batch(
     request: Request,
     body: BatchAnalyzeRequest,
     engine=Depends(get_engine),
-) -> BatchAnalyzeResponse:
+) -> Response:
     """
     Analyze multiple messages in batch.
     """
@@ -406,7 +435,7 @@ async def analyze_batch(
 
         processing_time_ms = (time.perf_counter() - start_time) * 1000
 
-        return BatchAnalyzeResponse(
+        response = BatchAnalyzeResponse(
             total_messages=len(body.messages),
             crisis_count=crisis_count,
             critical_count=critical_count,
@@ -416,6 +445,7 @@ async def analyze_batch(
             request_id=request_id,
             timestamp=datetime.utcnow(),
         )
+        return negotiate_response(response.model_dump(mode="json"), request)
 
     except Exception as e:
         logger.error(
@@ -968,230 +998,116 @@ async def root() -> Dict[str, str]:
 
 
 # =============================================================================
-# Helper Functions for Phase 4 Response Building
+# Phase 8: Admin Profiling Endpoints
 # =============================================================================
 
 
-def _build_explanation_response(explanation_data: Dict[str, Any]) -> ExplanationResponse:
-    """Build ExplanationResponse from explanation dict."""
-    return ExplanationResponse(
-        verbosity=VerbosityLevel(explanation_data.get("verbosity", "standard")),
-        decision_summary=explanation_data.get("decision_summary", ""),
-        key_factors=explanation_data.get("key_factors", []),
-        recommended_action=explanation_data.get("recommended_action"),
-        plain_text=explanation_data.get("plain_text", ""),
-        confidence_summary=explanation_data.get("confidence_summary"),
-        model_contributions=explanation_data.get("model_contributions"),
-        conflict_summary=explanation_data.get("conflict_summary"),
-    )
+@admin_router.post(
+    "/profile",
+    response_class=PlainTextResponse,
+    dependencies=[Depends(require_internal_key)],
+    summary="Capture a sampling profile",
+    description="""
+    Sample the Python stacks of every thread for a bounded window.
 
+    **Phase 8 Feature** - requires `X-Ash-Internal-Key`.
 
-def _build_conflict_response(
-    conflict_data: Dict[str, Any],
-    resolution_data: Optional[Any] = None,
-) -> ConflictAnalysisResponse:
-    """Build ConflictAnalysisResponse from conflict report dict."""
-    conflicts = []
-    for conflict in conflict_data.get("conflicts", []):
-        conflicts.append(
-            DetectedConflictResponse(
-                conflict_type=ConflictType(conflict.get("conflict_type", "score_disagreement")),
-                severity=ConflictSeverity(conflict.get("severity", "medium")),
-                description=conflict.get("description", ""),
-                involved_models=conflict.get("involved_models", []),
-                details=conflict.get("details", {}),
-            )
-        )
+    Returns flamegraph-compatible collapsed stacks (text/plain).
+    Only one capture runs at a time; nothing is sampled when idle.
+    """,
+)
+async def capture_profile(
+    seconds: float = Query(default=10.0, gt=0, le=60, description="Capture window"),
+    interval_ms: float = Query(default=5.0, ge=0.5, le=100, description="Sampling interval"),
+    include_idle: bool = Query(default=False, description="Keep blocked-thread stacks"),
+    profiler: SamplingProfiler = Depends(get_profiler),
+) -> PlainTextResponse:
+    """
+    Capture a sampling profile of the running process.
+    """
+    try:
+        profiler.start(interval_ms=interval_ms, include_idle=include_idle)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
 
-    response = ConflictAnalysisResponse(
-        has_conflicts=conflict_data.get("has_conflicts", False),
-        conflict_count=conflict_data.get("conflict_count", 0),
-        conflicts=conflicts,
-        highest_severity=ConflictSeverity(conflict_data["highest_severity"]) if conflict_data.get("highest_severity") else None,
-        requires_review=conflict_data.get("requires_review", False),
-        summary=conflict_data.get("summary", ""),
+    try:
+        # The event loop keeps serving (and being sampled) while we wait
+        await asyncio.sleep(seconds)
+    finally:
+        result = profiler.stop()
+
+    return PlainTextResponse(
+        content=result.to_collapsed(),
+        headers={
+            "X-Profile-Samples": str(result.samples),
+            "X-Profile-Duration-Ms": f"{result.duration_s * 1000:.1f}",
+        },
     )
 
-    # Add resolution info if available
-    if resolution_data:
-        if hasattr(resolution_data, "to_dict"):
-            res_dict = resolution_data.to_dict()
-        else:
-            res_dict = resolution_data
-
-        response.resolution_strategy = ResolutionStrategy(
-            res_dict.get("strategy_used", "conservative")
-        )
-        response.original_score = res_dict.get("original_score")
-        response.resolved_score = res_dict.get("resolved_score")
-
-    return response
 
+@admin_router.post(
+    "/profile/analyze",
+    response_class=PlainTextResponse,
+    dependencies=[Depends(require_internal_key)],
+    summary="Profile a single analysis",
+    description="""
+    Run one uncached analysis under a profiler.
 
-def _build_consensus_response(consensus_data: Dict[str, Any]) -> ConsensusResponse:
-    """Build ConsensusResponse from consensus result dict."""
-    return ConsensusResponse(
-        algorithm=ConsensusAlgorithm(consensus_data.get("algorithm", "weighted_voting")),
-        crisis_score=consensus_data.get("crisis_score", 0.0),
-        confidence=consensus_data.get("confidence", 0.0),
-        agreement_level=AgreementLevel(consensus_data.get("agreement_level", "moderate_agreement")),
-        is_crisis=consensus_data.get("is_crisis", False),
-        requires_review=consensus_data.get("requires_review", False),
-        has_conflict=consensus_data.get("has_conflict", False),
-        individual_scores=consensus_data.get("individual_scores", {}),
-        vote_breakdown=consensus_data.get("vote_breakdown"),
-    )
+    **Phase 8 Feature** - requires `X-Ash-Internal-Key`.
 
+    - `sampling`: Python stacks of all threads during the call
+    - `torch`: torch.profiler operator stacks (self CPU time, microseconds)
 
-# =============================================================================
-# Helper Functions for Phase 5 Response Building
-# =============================================================================
-
-
-def _build_context_analysis_response(context_data: Any) -> ContextAnalysisResponse:
+    Returns flamegraph-compatible collapsed stacks (text/plain).
+    """,
+)
+async def profile_analyze(
+    body: ProfileAnalyzeRequest,
+    engine=Depends(get_engine),
+    profiler: SamplingProfiler = Depends(get_profiler),
+) -> PlainTextResponse:
     """
-    Build ContextAnalysisResponse from context analysis result.
-    
-    Handles both dict format and ContextAnalysisResult dataclass.
+    Profile one analysis call.
     """
-    # Handle dataclass with to_dict method
-    if hasattr(context_data, 'to_dict'):
-        data = context_data.to_dict()
-    elif hasattr(context_data, '__dict__'):
-        # Handle dataclass directly
-        data = _context_dataclass_to_dict(context_data)
+    start_time = time.perf_counter()
+
+    if body.profiler == ProfilerMode.TORCH:
+        if not is_torch_profiler_available():
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="torch.profiler is not available",
+            )
+        assessment, collapsed = await asyncio.to_thread(
+            profile_torch_call, engine.analyze, body.message, use_cache=False
+        )
+        samples = collapsed.count("\n")
     else:
-        data = context_data
-    
-    # Build trend response
-    trend_data = data.get("trend", {})
-    trend = TrendResponse(
-        direction=TrendDirection(trend_data.get("direction", "stable")),
-        velocity=TrendVelocity(trend_data.get("velocity", "none")),
-        score_delta=trend_data.get("score_delta", 0.0),
-        time_span_hours=trend_data.get("time_span_hours", 0.0),
-    )
-    
-    # Build temporal factors response
-    temporal_data = data.get("temporal_factors", {})
-    temporal = TemporalFactorsResponse(
-        late_night_risk=temporal_data.get("late_night_risk", False),
-        rapid_posting=temporal_data.get("rapid_posting", False),
-        time_risk_modifier=temporal_data.get("time_risk_modifier", 1.0),
-        hour_of_day=temporal_data.get("hour_of_day", 12),
-        is_weekend=temporal_data.get("is_weekend", False),
-    )
-    
-    # Build trajectory response
-    trajectory_data = data.get("trajectory", {})
-    trajectory = TrajectoryResponse(
-        start_score=trajectory_data.get("start_score", 0.0),
-        end_score=trajectory_data.get("end_score", 0.0),
-        peak_score=trajectory_data.get("peak_score", trajectory_data.get("end_score", 0.0)),
-        scores=trajectory_data.get("scores", []),
-    )
-    
-    # Build intervention response
-    intervention_data = data.get("intervention", {})
-    intervention = InterventionResponse(
-        urgency=InterventionUrgency(intervention_data.get("urgency", "none")),
-        recommended_point=intervention_data.get("recommended_point"),
-        intervention_delayed=intervention_data.get("intervention_delayed", False),
-        reason=intervention_data.get("reason", ""),
-    )
-    
-    # Build history metadata response
-    history_data = data.get("history_analyzed", data.get("metadata", {}))
-    history = HistoryMetadataResponse(
-        message_count=history_data.get("message_count", 0),
-        time_span_hours=history_data.get("time_span_hours", 0.0),
-        oldest_timestamp=history_data.get("oldest_timestamp"),
-        newest_timestamp=history_data.get("newest_timestamp"),
-    )
-    
-    return ContextAnalysisResponse(
-        escalation_detected=data.get("escalation_detected", False),
-        escalation_rate=EscalationRate(data.get("escalation_rate", "none")),
-        escalation_pattern=data.get("escalation_pattern"),
-        pattern_confidence=data.get("pattern_confidence", 0.0),
-        trend=trend,
-        temporal_factors=temporal,
-        trajectory=trajectory,
-        intervention=intervention,
-        history_analyzed=history,
+        try:
+            assessment, result = await asyncio.to_thread(
+                profiler.profile_call,
+                engine.analyze,
+                body.message,
+                use_cache=False,
+                interval_ms=body.interval_ms,
+            )
+        except ProfilerBusyError as e:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+        collapsed = result.to_collapsed()
+        samples = result.samples
+
+    elapsed_ms = (time.perf_counter() - start_time) * 1000
+
+    return PlainTextResponse(
+        content=collapsed,
+        headers={
+            "X-Profile-Mode": body.profiler.value,
+            "X-Profile-Samples": str(samples),
+            "X-Profile-Duration-Ms": f"{elapsed_ms:.1f}",
+            "X-Processing-Time-Ms": f"{assessment.processing_time_ms:.1f}",
+        },
     )
 
 
-def _context_dataclass_to_dict(context_data: Any) -> Dict[str, Any]:
-    """
-    Convert ContextAnalysisResult dataclass to dict format.
-    
-    Handles nested dataclasses from the context module.
-    """
-    result = {}
-    
-    # Escalation fields
-    if hasattr(context_data, 'escalation'):
-        esc = context_data.escalation
-        result["escalation_detected"] = esc.detected if hasattr(esc, 'detected') else False
-        result["escalation_rate"] = esc.rate if hasattr(esc, 'rate') else "none"
-        result["escalation_pattern"] = esc.pattern if hasattr(esc, 'pattern') else None
-        result["pattern_confidence"] = esc.confidence if hasattr(esc, 'confidence') else 0.0
-    
-    # Trend fields
-    if hasattr(context_data, 'trend'):
-        trend = context_data.trend
-        result["trend"] = {
-            "direction": trend.direction if hasattr(trend, 'direction') else "stable",
-            "velocity": trend.velocity if hasattr(trend, 'velocity') else "none",
-            "score_delta": trend.score_delta if hasattr(trend, 'score_delta') else 0.0,
-            "time_span_hours": trend.time_span_hours if hasattr(trend, 'time_span_hours') else 0.0,
-        }
-    
-    # Temporal fields
-    if hasattr(context_data, 'temporal'):
-        temp = context_data.temporal
-        result["temporal_factors"] = {
-            "late_night_risk": temp.late_night_risk if hasattr(temp, 'late_night_risk') else False,
-            "rapid_posting": temp.rapid_posting if hasattr(temp, 'rapid_posting') else False,
-            "time_risk_modifier": temp.time_risk_modifier if hasattr(temp, 'time_risk_modifier') else 1.0,
-            "hour_of_day": temp.hour_of_day if hasattr(temp, 'hour_of_day') else 12,
-            "is_weekend": temp.is_weekend if hasattr(temp, 'is_weekend') else False,
-        }
-    
-    # Trajectory fields
-    if hasattr(context_data, 'trajectory'):
-        traj = context_data.trajectory
-        result["trajectory"] = {
-            "start_score": traj.start_score if hasattr(traj, 'start_score') else 0.0,
-            "end_score": traj.end_score if hasattr(traj, 'end_score') else 0.0,
-            "peak_score": traj.max_score if hasattr(traj, 'max_score') else 0.0,
-            "scores": traj.scores if hasattr(traj, 'scores') else [],
-        }
-    
-    # Intervention fields
-    if hasattr(context_data, 'intervention'):
-        intv = context_data.intervention
-        result["intervention"] = {
-            "urgency": intv.urgency if hasattr(intv, 'urgency') else "none",
-            "recommended_point": intv.recommended_point if hasattr(intv, 'recommended_point') else None,
-            "intervention_delayed": intv.intervention_delayed if hasattr(intv, 'intervention_delayed') else False,
-            "reason": intv.reason if hasattr(intv, 'reason') else "",
-        }
-    
-    # Metadata fields
-    if hasattr(context_data, 'metadata'):
-        meta = context_data.metadata
-        result["history_analyzed"] = {
-            "message_count": meta.message_count if hasattr(meta, 'message_count') else 0,
-            "time_span_hours": meta.time_span_hours if hasattr(meta, 'time_span_hours') else 0.0,
-            "oldest_timestamp": None,
-            "newest_timestamp": None,
-        }
-    
-    return result
-
-
 # =============================================================================
 # Export public interface
 # =============================================================================
@@ -1201,4 +1117,5 @@ __all__ = [
     "health_router",
     "models_router",
     "config_router",
+    "admin_router",
 ]
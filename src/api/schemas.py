@@ -10,9 +10,9 @@ Ash-NLP is a CRISIS DETECTION BACKEND that:
 ********************************************************************************
 API Schemas for Ash-NLP Service
 ---
-FILE VERSION: v5.0-3-5.0-1
-LAST MODIFIED: 2026-01-27
-PHASE: Phase 3 - Ash-Vigil Integration
+FILE VERSION: v5.0-8-24.0-1
+LAST MODIFIED: 2026-02-23
+PHASE: Phase 8 Step 24.0 - Near-Duplicate Cache
 CLEAN ARCHITECTURE: v5.2.3 Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-nlp
 Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
@@ -45,6 +45,11 @@ PHASE 5 ENHANCEMENTS:
 PHASE 6 ENHANCEMENTS:
 - FE-001: User timezone support for late night detection
 - Timezone parameter in analyze requests
+
+PHASE 8 ENHANCEMENTS:
+- include_timing debug flag and per-stage timing response
+- Admin profiling request schema
+- fields / compact response projection on analyze requests
 """
 
 from datetime import datetime
@@ -54,7 +59,7 @@ from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field, field_validator
 
 # Module version
-__version__ = "v5.0-3-5.0-1"
+__version__ = "v5.0-8-24.0-1"
 
 
 # =============================================================================
@@ -222,6 +227,13 @@ class EscalationRate(str, Enum):
     SUDDEN = "sudden"
 
 
+class ProfilerMode(str, Enum):
+    """Profiler used by the admin profiling endpoint (Phase 8)."""
+
+    SAMPLING = "sampling"
+    TORCH = "torch"
+
+
 # =============================================================================
 # Request Schemas
 # =============================================================================
@@ -292,6 +304,10 @@ class AnalyzeRequest(BaseModel):
         # Phase 5 options
         message_history: Previous messages for context analysis
         include_context_analysis: Enable context history analysis
+
+        # Phase 8 options
+        fields: Top-level response fields to return (projection)
+        compact: Return only the severity/score fields
     """
 
     message: str = Field(
@@ -304,7 +320,11 @@ class AnalyzeRequest(BaseModel):
     user_id: Optional[str] = Field(
         default=None,
         max_length=100,
-        description="Optional user identifier for tracking",
+        description=(
+            "Optional user identifier. When message_history is omitted and the "
+            "server-side history store is enabled, stored history for this user "
+            "is used for context analysis"
+        ),
     )
     channel_id: Optional[str] = Field(
         default=None,
@@ -333,8 +353,11 @@ class AnalyzeRequest(BaseModel):
     # Phase 5 options
     message_history: Optional[List[MessageHistoryItemRequest]] = Field(
         default=None,
-        max_length=20,
-        description="Previous messages for context analysis (max 20)",
+        max_length=200,
+        description=(
+            "Previous messages for context analysis (max 200; the server "
+            "analyzes the most recent max_history_size)"
+        ),
     )
     include_context_analysis: bool = Field(
         default=True,
@@ -349,6 +372,30 @@ class AnalyzeRequest(BaseModel):
         examples=["America/New_York", "Europe/London", "Asia/Tokyo", "UTC"],
     )
 
+    # Phase 8 debug options
+    include_timing: bool = Field(
+        default=False,
+        description="Debug: include per-stage latency breakdown in the response",
+    )
+
+    # Phase 8 response projection
+    fields: Optional[List[str]] = Field(
+        default=None,
+        max_length=32,
+        description=(
+            "Return only these top-level response fields "
+            "(e.g. ['severity', 'crisis_score']); omit for the full response"
+        ),
+    )
+    compact: bool = Field(
+        default=False,
+        description=(
+            "Return only crisis_detected, severity, crisis_score, confidence, "
+            "requires_intervention, recommended_action and request_id "
+            "(combined with fields when both are given)"
+        ),
+    )
+
     @field_validator("message")
     @classmethod
     def message_not_empty(cls, v: str) -> str:
@@ -357,6 +404,17 @@ class AnalyzeRequest(BaseModel):
             raise ValueError("Message cannot be empty or whitespace only")
         return v.strip()
 
+    @field_validator("fields")
+    @classmethod
+    def fields_known(cls, v: Optional[List[str]]) -> Optional[List[str]]:
+        """Validate projected fields are AnalyzeResponse fields."""
+        if v is None:
+            return v
+        unknown = [name for name in v if name not in AnalyzeResponse.model_fields]
+        if unknown:
+            raise ValueError(f"Unknown response fields: {', '.join(unknown)}")
+        return v
+
     model_config = {
         "json_schema_extra": {
             "examples": [
@@ -750,6 +808,20 @@ class HistoryMetadataResponse(BaseModel):
         default=None,
         description="Timestamp of newest message",
     )
+    source: str = Field(
+        default="request",
+        description="Where history came from: 'request' or 'store' (Phase 8)",
+    )
+    scores_computed: int = Field(
+        default=0,
+        ge=0,
+        description="History items without crisis_score scored by batch inference (Phase 8)",
+    )
+    scores_cached: int = Field(
+        default=0,
+        ge=0,
+        description="History items without crisis_score resolved from cache (Phase 8)",
+    )
 
 
 class ContextAnalysisResponse(BaseModel):
@@ -855,6 +927,34 @@ class ModelSignalResponse(BaseModel):
     crisis_signal: float = Field(description="Extracted crisis signal (0-1)")
 
 
+class StageTimingResponse(BaseModel):
+    """Per-stage latency breakdown (Phase 8 debug field)."""
+
+    total_ms: float = Field(description="End-to-end engine time in milliseconds")
+    stages: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Stage name → milliseconds (cache, inference, scoring, ...)",
+    )
+    models: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Per-model inference latency (overlaps when parallel)",
+    )
+    unattributed_ms: float = Field(
+        default=0.0, description="Time not covered by any named stage"
+    )
+
+
+class NearDuplicateResponse(BaseModel):
+    """Near-duplicate reuse flag (Phase 8)."""
+
+    similarity: float = Field(
+        ge=0.0, le=1.0, description="Estimated similarity to the matched message"
+    )
+    word_changes: int = Field(
+        default=0, ge=0, description="Word insertions / deletions between the two messages"
+    )
+
+
 class AnalyzeResponse(BaseModel):
     """
     Response schema for message analysis.
@@ -928,6 +1028,18 @@ class AnalyzeResponse(BaseModel):
         description="Context history analysis results (Phase 5)",
     )
 
+    # Phase 8 Fields
+    near_duplicate: Optional[NearDuplicateResponse] = Field(
+        default=None,
+        description="Set when the result was reused from a near-duplicate message",
+    )
+
+    # Phase 8 Debug Fields
+    timing: Optional[StageTimingResponse] = Field(
+        default=None,
+        description="Per-stage latency breakdown (only when include_timing=true)",
+    )
+
     model_config = {
         "json_schema_extra": {
             "examples": [
@@ -1337,8 +1449,8 @@ class ContextConfigUpdateRequest(BaseModel):
     max_history_size: Optional[int] = Field(
         default=None,
         ge=3,
-        le=50,
-        description="Maximum messages in history (3-50)",
+        le=500,
+        description="Maximum messages in history (3-500)",
     )
     escalation_enabled: Optional[bool] = Field(
         default=None,
@@ -1377,6 +1489,43 @@ class ContextConfigUpdateRequest(BaseModel):
     }
 
 
+# =============================================================================
+# Phase 8: Admin Profiling Schemas
+# =============================================================================
+
+
+class ProfileAnalyzeRequest(BaseModel):
+    """Request to profile a single analysis call (Phase 8)."""
+
+    message: str = Field(
+        ...,
+        min_length=1,
+        max_length=10000,
+        description="Message to analyze under the profiler",
+    )
+    profiler: ProfilerMode = Field(
+        default=ProfilerMode.SAMPLING,
+        description="sampling (Python stacks) or torch (torch.profiler ops)",
+    )
+    interval_ms: float = Field(
+        default=1.0,
+        ge=0.5,
+        le=100.0,
+        description="Sampling interval in milliseconds (sampling mode only)",
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "message": "I feel like nobody would notice if I was gone",
+                    "profiler": "torch",
+                }
+            ]
+        }
+    }
+
+
 # =============================================================================
 # Health and Status Schemas
 # =============================================================================
@@ -1703,12 +1852,15 @@ __all__ = [
     "TrendDirection",
     "TrendVelocity",
     "EscalationRate",
+    # Phase 8 Enums
+    "ProfilerMode",
     # Request schemas
     "AnalyzeRequest",
     "BatchAnalyzeRequest",
     "MessageHistoryItemRequest",
     "ConsensusConfigUpdateRequest",
     "ContextConfigUpdateRequest",
+    "ProfileAnalyzeRequest",
     # Response schemas
     "AnalyzeResponse",
     "ModelSignalResponse",
@@ -1746,6 +1898,9 @@ __all__ = [
     "EscalationConfigResponse",
     "TemporalConfigResponse",
     "TrendConfigResponse",
+    # Phase 8 Response components
+    "StageTimingResponse",
+    "NearDuplicateResponse",
     # Webhook schemas
     "CrisisAlertPayload",
     "ConflictAlertPayload",
@@ -0,0 +1,682 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+CORE PRINCIPLE: Multi-Model Ensemble → Weighted Decision Engine → Crisis Classification
+******************  CORE SYSTEM VISION (Never to be violated):  ****************
+Ash-NLP is a CRISIS DETECTION BACKEND that:
+1. PRIMARY: Uses BART Zero-Shot Classification for semantic crisis detection
+2. CONTEXTUAL: Enhances with sentiment, irony, and emotion model signals
+3. ENSEMBLE: Combines weighted model outputs through decision engine
+4. PURPOSE: Detect crisis messages in Discord community communications
+********************************************************************************
+Analyze Response Serialization for Ash-NLP Service
+---
+FILE VERSION: v5.0-8-24.0-2
+LAST MODIFIED: 2026-02-23
+PHASE: Phase 8 Step 24.0 - Near-Duplicate Cache
+CLEAN ARCHITECTURE: v5.1 Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+
+RESPONSIBILITIES:
+- Build the AnalyzeResponse payload straight from a CrisisAssessment
+- Encode payloads to JSON bytes (orjson when installed, stdlib json otherwise)
+- Field projection and the compact response (severity/score only)
+- MessagePack content negotiation for the analysis routes (Phase 8 Step 14)
+
+WHY NOT PYDANTIC:
+    The engine's CrisisAssessment is trusted internal data. Building the
+    nested AnalyzeResponse model validates every sub-model, and FastAPI
+    then validates and encodes it a second time through response_model.
+    build_analyze_payload() produces the same JSON document (same keys,
+    same order, same values) as AnalyzeResponse.model_dump(mode="json")
+    without either pass. AnalyzeResponse stays the documented schema.
+
+PROJECTION:
+    fields=[...]   top-level AnalyzeResponse fields to return
+    compact=true   COMPACT_FIELDS (adds to fields when both are given)
+    Sections that are not projected are never built.
+
+CONTENT NEGOTIATION:
+    Routes using NegotiatedRoute accept request bodies sent as
+    Content-Type: application/msgpack (or application/x-msgpack) and
+    answer in MessagePack when Accept lists one of those types. The
+    document is the same as the JSON one (datetimes as ISO strings).
+    Error responses stay JSON. Without the optional msgpack package,
+    MessagePack bodies get 415 and Accept falls back to JSON.
+
+USAGE:
+    from src.api.serialization import build_analyze_payload, negotiate_response
+
+    payload = build_analyze_payload(assessment, request_id=request_id)
+    return negotiate_response(payload, request)
+"""
+
+import dataclasses
+import json
+import logging
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Callable, Collection, Dict, FrozenSet, Iterable, Optional
+
+from fastapi import HTTPException, status
+from fastapi.routing import APIRoute
+from starlette.requests import Request
+from starlette.responses import Response
+
+from .schemas import AnalyzeResponse
+
+# Module version
+__version__ = "v5.0-8-24.0-2"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Flag for orjson availability
+ORJSON_AVAILABLE = False
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    logger.debug("orjson not installed - using stdlib json for responses")
+
+# Flag for msgpack availability
+MSGPACK_AVAILABLE = False
+
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    logger.debug("msgpack not installed - MessagePack transport disabled")
+
+
+# MessagePack media types (first is used for responses)
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+MSGPACK_MEDIA_TYPES = frozenset({MSGPACK_MEDIA_TYPE, "application/x-msgpack"})
+
+
+# Top-level AnalyzeResponse fields, in schema order
+RESPONSE_FIELDS = tuple(AnalyzeResponse.model_fields)
+
+# Fields returned by compact=true
+COMPACT_FIELDS = frozenset({
+    "crisis_detected",
+    "severity",
+    "crisis_score",
+    "confidence",
+    "requires_intervention",
+    "recommended_action",
+    "request_id",
+})
+
+
+# =============================================================================
+# Encoding
+# =============================================================================
+
+
+def _default(obj: Any) -> Any:
+    """Encode types the JSON encoders do not handle natively."""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(payload: Any) -> bytes:
+    """
+    Encode a payload to compact UTF-8 JSON bytes.
+
+    Args:
+        payload: JSON-compatible value (Enums, datetimes and dataclasses
+            are converted)
+
+    Returns:
+        JSON bytes
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload, default=_default)
+    return json.dumps(
+        payload,
+        default=_default,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+class FastJSONResponse(Response):
+    """
+    JSON response encoded with dumps().
+
+    Content may be pre-encoded bytes or any JSON-compatible value.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        """Encode content to JSON bytes."""
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
+
+
+def packb(payload: Any) -> bytes:
+    """
+    Encode a payload to MessagePack bytes (same document as dumps()).
+
+    Raises:
+        RuntimeError: If msgpack is not installed
+    """
+    if not MSGPACK_AVAILABLE:
+        raise RuntimeError("msgpack is not installed")
+    return msgpack.packb(payload, default=_default, use_bin_type=True)
+
+
+def unpackb(data: bytes) -> Any:
+    """
+    Decode MessagePack bytes.
+
+    Raises:
+        RuntimeError: If msgpack is not installed
+    """
+    if not MSGPACK_AVAILABLE:
+        raise RuntimeError("msgpack is not installed")
+    return msgpack.unpackb(data, raw=False)
+
+
+class MsgPackResponse(Response):
+    """
+    MessagePack response encoded with packb().
+
+    Content may be pre-encoded bytes or any JSON-compatible value.
+    """
+
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        """Encode content to MessagePack bytes."""
+        if isinstance(content, bytes):
+            return content
+        return packb(content)
+
+
+# =============================================================================
+# Content Negotiation
+# =============================================================================
+
+
+def _media_type(value: Optional[str]) -> str:
+    """Media type of a header value, without parameters."""
+    if not value:
+        return ""
+    return value.split(";", 1)[0].strip().lower()
+
+
+def is_msgpack_content(content_type: Optional[str]) -> bool:
+    """Whether a Content-Type header names MessagePack."""
+    return _media_type(content_type) in MSGPACK_MEDIA_TYPES
+
+
+def accepts_msgpack(accept: Optional[str]) -> bool:
+    """
+    Whether an Accept header asks for MessagePack.
+
+    A MessagePack type listed with a non-zero q selects it; wildcards
+    keep the JSON default. Media types compare case-insensitively.
+    """
+    if not accept:
+        return False
+    accept = accept.lower()
+    if "msgpack" not in accept:
+        return False
+    for item in accept.split(","):
+        media_type, _, params = item.partition(";")
+        if media_type.strip() not in MSGPACK_MEDIA_TYPES:
+            continue
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    if float(value) <= 0:
+                        break
+                except ValueError:
+                    break
+        else:
+            return True
+    return False
+
+
+def negotiate_response(
+    payload: Any,
+    request: Request,
+    status_code: int = 200,
+) -> Response:
+    """
+    Encode payload as MessagePack or JSON per the request's Accept header.
+
+    Args:
+        payload: JSON-compatible response document
+        request: Incoming request
+        status_code: HTTP status
+
+    Returns:
+        MsgPackResponse or FastJSONResponse (both Vary: Accept)
+    """
+    headers = {"vary": "accept"}
+    if MSGPACK_AVAILABLE and accepts_msgpack(request.headers.get("accept")):
+        return MsgPackResponse(payload, status_code=status_code, headers=headers)
+    return FastJSONResponse(payload, status_code=status_code, headers=headers)
+
+
+class _MsgPackBodyRequest(Request):
+    """Request carrying an already-decoded MessagePack body."""
+
+    def __init__(self, scope: Dict[str, Any], body: bytes, payload: Any):
+        super().__init__(scope)
+        self._msgpack_body = body
+        self._msgpack_payload = payload
+
+    async def body(self) -> bytes:
+        return self._msgpack_body
+
+    async def json(self) -> Any:
+        return self._msgpack_payload
+
+
+class NegotiatedRoute(APIRoute):
+    """
+    APIRoute that also accepts MessagePack request bodies.
+
+    The body is decoded once and handed to FastAPI's normal validation
+    as if it had arrived as JSON, so the same pydantic request models
+    apply to both encodings.
+    """
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def negotiated_handler(request: Request) -> Response:
+            if is_msgpack_content(request.headers.get("content-type")):
+                request = await _decode_msgpack_request(request)
+            return await handler(request)
+
+        return negotiated_handler
+
+
+async def _decode_msgpack_request(request: Request) -> Request:
+    """Decode a MessagePack request body into a JSON-typed request."""
+    if not MSGPACK_AVAILABLE:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="MessagePack is not supported by this server",
+        )
+
+    body = await request.body()
+    try:
+        payload = unpackb(body) if body else None
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid MessagePack body ({type(e).__name__})",
+        )
+
+    scope = dict(request.scope)
+    scope["headers"] = [
+        (key, b"application/json" if key == b"content-type" else value)
+        for key, value in request.scope["headers"]
+    ]
+    return _MsgPackBodyRequest(scope, body, payload)
+
+
+# =============================================================================
+# Projection
+# =============================================================================
+
+
+def resolve_projection(
+    fields: Optional[Iterable[str]] = None,
+    compact: bool = False,
+) -> Optional[FrozenSet[str]]:
+    """
+    Resolve the requested top-level fields.
+
+    Args:
+        fields: Requested AnalyzeResponse field names (validated upstream)
+        compact: Include COMPACT_FIELDS
+
+    Returns:
+        Field names to return, or None for the full response
+    """
+    selected = set(fields or ())
+    if compact:
+        selected |= COMPACT_FIELDS
+    return frozenset(selected) if selected else None
+
+
+# =============================================================================
+# Payload Building
+# =============================================================================
+
+
+def build_analyze_payload(
+    assessment: Any,
+    request_id: Optional[str] = None,
+    timestamp: Optional[datetime] = None,
+    include_timing: bool = False,
+    fields: Optional[Collection[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Build the AnalyzeResponse JSON document from a CrisisAssessment.
+
+    Args:
+        assessment: CrisisAssessment from the decision engine
+        request_id: Request identifier
+        timestamp: Response timestamp (default: now, UTC)
+        include_timing: Include the per-stage timing breakdown
+        fields: Projection from resolve_projection() (None = all fields)
+
+    Returns:
+        Dict in AnalyzeResponse field order
+    """
+    if timestamp is None:
+        timestamp = datetime.utcnow()
+
+    payload: Dict[str, Any] = {}
+    for name in RESPONSE_FIELDS:
+        if fields is not None and name not in fields:
+            continue
+
+        if name == "crisis_detected":
+            payload[name] = assessment.crisis_detected
+        elif name == "severity":
+            payload[name] = assessment.severity.value
+        elif name == "confidence":
+            payload[name] = assessment.confidence
+        elif name == "crisis_score":
+            payload[name] = assessment.crisis_score
+        elif name == "requires_intervention":
+            payload[name] = assessment.requires_intervention
+        elif name == "recommended_action":
+            payload[name] = assessment.recommended_action
+        elif name == "signals":
+            payload[name] = _signals_payload(assessment.signals)
+        elif name == "processing_time_ms":
+            payload[name] = assessment.processing_time_ms
+        elif name == "models_used":
+            payload[name] = list(assessment.models_used)
+        elif name == "is_degraded":
+            payload[name] = assessment.is_degraded
+        elif name == "request_id":
+            payload[name] = request_id
+        elif name == "timestamp":
+            payload[name] = timestamp.isoformat()
+        elif name == "vigil":
+            payload[name] = _vigil_payload(assessment.vigil) if assessment.vigil else None
+        elif name == "requires_review":
+            payload[name] = assessment.requires_review
+        elif name == "explanation":
+            explanation = assessment.explanation
+            payload[name] = _explanation_payload(explanation) if explanation else None
+        elif name == "conflict_analysis":
+            report = assessment.conflict_report
+            resolution = (
+                assessment.aggregated_result.resolution
+                if report and assessment.aggregated_result else None
+            )
+            payload[name] = _conflict_payload(report, resolution) if report else None
+        elif name == "consensus":
+            consensus = assessment.consensus_result
+            payload[name] = _consensus_payload(consensus) if consensus else None
+        elif name == "context_analysis":
+            context = getattr(assessment, "context_analysis", None)
+            payload[name] = _context_payload(context) if context else None
+        elif name == "near_duplicate":
+            near_duplicate = getattr(assessment, "near_duplicate", None)
+            payload[name] = dict(near_duplicate) if near_duplicate else None
+        elif name == "timing":
+            timing = assessment.timing if include_timing else None
+            payload[name] = _timing_payload(timing) if timing else None
+
+    return payload
+
+
+def _signals_payload(signals: Dict[str, Any]) -> Dict[str, Any]:
+    """Per-model signals (non-dict entries such as errors are dropped)."""
+    return {
+        name: {
+            "label": data.get("label", "unknown"),
+            "score": data.get("score", 0.0),
+            "crisis_signal": data.get("crisis_signal", 0.0),
+        }
+        for name, data in signals.items()
+        if isinstance(data, dict)
+    }
+
+
+def _vigil_payload(vigil: Any) -> Dict[str, Any]:
+    """Ash-Vigil details (Phase 3 Vigil)."""
+    return {
+        "status": vigil.status.value,
+        "risk_score": vigil.risk_score,
+        "risk_label": vigil.risk_label,
+        "amplification_applied": vigil.amplification_applied,
+        "base_score": vigil.base_score,
+        "amplified_score": vigil.amplified_score,
+    }
+
+
+def _explanation_payload(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Explanation (Phase 4)."""
+    return {
+        "verbosity": data.get("verbosity", "standard"),
+        "decision_summary": data.get("decision_summary", ""),
+        "key_factors": data.get("key_factors", []),
+        "recommended_action": data.get("recommended_action"),
+        "plain_text": data.get("plain_text", ""),
+        "confidence_summary": data.get("confidence_summary"),
+        "model_contributions": data.get("model_contributions"),
+        "conflict_summary": data.get("conflict_summary"),
+    }
+
+
+def _conflict_payload(data: Dict[str, Any], resolution: Optional[Any]) -> Dict[str, Any]:
+    """Conflict analysis with resolution details (Phase 4)."""
+    payload = {
+        "has_conflicts": data.get("has_conflicts", False),
+        "conflict_count": data.get("conflict_count", 0),
+        "conflicts": [
+            {
+                "conflict_type": conflict.get("conflict_type", "score_disagreement"),
+                "severity": conflict.get("severity", "medium"),
+                "description": conflict.get("description", ""),
+                "involved_models": conflict.get("involved_models", []),
+                "details": conflict.get("details", {}),
+            }
+            for conflict in data.get("conflicts", [])
+        ],
+        "highest_severity": data.get("highest_severity") or None,
+        "requires_review": data.get("requires_review", False),
+        "summary": data.get("summary", ""),
+        "resolution_strategy": None,
+        "original_score": None,
+        "resolved_score": None,
+    }
+
+    if resolution:
+        res = resolution.to_dict() if hasattr(resolution, "to_dict") else resolution
+        payload["resolution_strategy"] = res.get("strategy_used", "conservative")
+        payload["original_score"] = res.get("original_score")
+        payload["resolved_score"] = res.get("resolved_score")
+
+    return payload
+
+
+def _consensus_payload(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Consensus result (Phase 4)."""
+    return {
+        "algorithm": data.get("algorithm", "weighted_voting"),
+        "crisis_score": data.get("crisis_score", 0.0),
+        "confidence": data.get("confidence", 0.0),
+        "agreement_level": data.get("agreement_level", "moderate_agreement"),
+        "is_crisis": data.get("is_crisis", False),
+        "requires_review": data.get("requires_review", False),
+        "has_conflict": data.get("has_conflict", False),
+        "individual_scores": data.get("individual_scores", {}),
+        "vote_breakdown": data.get("vote_breakdown"),
+    }
+
+
+def _context_payload(context: Any) -> Dict[str, Any]:
+    """
+    Context analysis (Phase 5).
+
+    Reads ContextAnalysisResult attributes directly; a plain dict (the
+    to_dict() layout) is also accepted.
+    """
+    if isinstance(context, dict):
+        return _context_dict_payload(context)
+
+    escalation = context.escalation
+    trend = context.trend
+    temporal = context.temporal
+    trajectory = context.trajectory
+    intervention = context.intervention
+    meta = context.metadata
+    return {
+        "escalation_detected": escalation.detected,
+        "escalation_rate": escalation.rate,
+        "escalation_pattern": escalation.pattern,
+        "pattern_confidence": escalation.confidence,
+        "trend": {
+            "direction": trend.direction,
+            "velocity": trend.velocity,
+            "score_delta": trend.score_delta,
+            "time_span_hours": trend.time_span_hours,
+        },
+        "temporal_factors": {
+            "late_night_risk": temporal.late_night_risk,
+            "rapid_posting": temporal.rapid_posting,
+            "time_risk_modifier": temporal.time_risk_modifier,
+            "hour_of_day": temporal.hour_of_day,
+            "is_weekend": temporal.is_weekend,
+            "user_timezone": temporal.user_timezone,
+            "local_hour": temporal.local_hour,
+        },
+        "trajectory": {
+            "start_score": trajectory.start_score,
+            "end_score": trajectory.end_score,
+            "peak_score": trajectory.max_score,
+            "scores": list(trajectory.scores),
+        },
+        "intervention": {
+            "urgency": intervention.urgency,
+            "recommended_point": intervention.recommended_point,
+            "intervention_delayed": intervention.intervention_delayed,
+            "reason": intervention.reason,
+        },
+        "history_analyzed": {
+            "message_count": meta.message_count,
+            "time_span_hours": meta.time_span_hours,
+            "oldest_timestamp": None,
+            "newest_timestamp": None,
+            "source": meta.history_source,
+            "scores_computed": meta.scores_computed,
+            "scores_cached": meta.scores_cached,
+        },
+    }
+
+
+def _context_dict_payload(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Context analysis from a to_dict()-layout dict, with schema defaults."""
+    trend = data.get("trend", {})
+    temporal = data.get("temporal_factors", {})
+    trajectory = data.get("trajectory", {})
+    intervention = data.get("intervention", {})
+    history = data.get("history_analyzed", data.get("metadata", {}))
+    return {
+        "escalation_detected": data.get("escalation_detected", False),
+        "escalation_rate": data.get("escalation_rate", "none"),
+        "escalation_pattern": data.get("escalation_pattern"),
+        "pattern_confidence": data.get("pattern_confidence", 0.0),
+        "trend": {
+            "direction": trend.get("direction", "stable"),
+            "velocity": trend.get("velocity", "none"),
+            "score_delta": trend.get("score_delta", 0.0),
+            "time_span_hours": trend.get("time_span_hours", 0.0),
+        },
+        "temporal_factors": {
+            "late_night_risk": temporal.get("late_night_risk", False),
+            "rapid_posting": temporal.get("rapid_posting", False),
+            "time_risk_modifier": temporal.get("time_risk_modifier", 1.0),
+            "hour_of_day": temporal.get("hour_of_day", 12),
+            "is_weekend": temporal.get("is_weekend", False),
+            "user_timezone": temporal.get("user_timezone"),
+            "local_hour": temporal.get("local_hour"),
+        },
+        "trajectory": {
+            "start_score": trajectory.get("start_score", 0.0),
+            "end_score": trajectory.get("end_score", 0.0),
+            "peak_score": trajectory.get("peak_score", trajectory.get("end_score", 0.0)),
+            "scores": trajectory.get("scores", []),
+        },
+        "intervention": {
+            "urgency": intervention.get("urgency", "none"),
+            "recommended_point": intervention.get("recommended_point"),
+            "intervention_delayed": intervention.get("intervention_delayed", False),
+            "reason": intervention.get("reason", ""),
+        },
+        "history_analyzed": {
+            "message_count": history.get("message_count", 0),
+            "time_span_hours": history.get("time_span_hours", 0.0),
+            "oldest_timestamp": history.get("oldest_timestamp"),
+            "newest_timestamp": history.get("newest_timestamp"),
+            "source": history.get("source", "request"),
+            "scores_computed": history.get("scores_computed", 0),
+            "scores_cached": history.get("scores_cached", 0),
+        },
+    }
+
+
+def _timing_payload(timing: Dict[str, Any]) -> Dict[str, Any]:
+    """Per-stage timing breakdown (Phase 8 debug)."""
+    return {
+        "total_ms": timing.get("total_ms", 0.0),
+        "stages": timing.get("stages", {}),
+        "models": timing.get("models", {}),
+        "unattributed_ms": timing.get("unattributed_ms", 0.0),
+    }
+
+
+# =============================================================================
+# Export public interface
+# =============================================================================
+
+__all__ = [
+    "ORJSON_AVAILABLE",
+    "MSGPACK_AVAILABLE",
+    "MSGPACK_MEDIA_TYPE",
+    "MSGPACK_MEDIA_TYPES",
+    "RESPONSE_FIELDS",
+    "COMPACT_FIELDS",
+    "dumps",
+    "packb",
+    "unpackb",
+    "FastJSONResponse",
+    "MsgPackResponse",
+    "is_msgpack_content",
+    "accepts_msgpack",
+    "negotiate_response",
+    "NegotiatedRoute",
+    "resolve_projection",
+    "build_analyze_payload",
+]
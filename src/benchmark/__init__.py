@@ -0,0 +1,94 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+CORE PRINCIPLE: Multi-Model Ensemble → Weighted Decision Engine → Crisis Classification
+******************  CORE SYSTEM VISION (Never to be violated):  ****************
+Ash-NLP is a CRISIS DETECTION BACKEND that:
+1. PRIMARY: Uses BART Zero-Shot Classification for semantic crisis detection
+2. CONTEXTUAL: Enhances with sentiment, irony, and emotion model signals
+3. ENSEMBLE: Combines weighted model outputs through decision engine
+4. PURPOSE: Detect crisis messages in Discord community communications
+********************************************************************************
+Benchmark Package for Ash-NLP Service
+---
+FILE VERSION: v5.0-8-23.0-1
+LAST MODIFIED: 2026-02-22
+PHASE: Phase 8 Step 23.0 - Shared-Premise Encoder Reuse
+CLEAN ARCHITECTURE: v5.2.3 Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+
+DESCRIPTION:
+    Offline load-test and latency benchmark harness. Runs the production
+    engine and API code paths against stub model pipelines and synthetic
+    Discord-like traffic, and writes JSON results that can be compared
+    across commits.
+
+COMPONENTS:
+    - stubs: Stub HuggingFace pipelines + stub-backed ModelLoader
+    - traffic: Synthetic traffic generator (lengths, repeats, history)
+    - harness: Scenarios, per-stage timing, JSON reports, comparison
+    - context_bench: ContextAnalyzer timing, pure-Python vs NumPy primitives
+    - middleware_bench: Per-request middleware overhead, fused ASGI vs layered
+    - transport_bench: JSON vs MessagePack size/speed and round-trip check
+    - hedge_bench: analyze() tail latency with 1 vs 2 BART replicas
+    - fallback_stress: Concurrency check of FallbackStrategy snapshots
+    - premise_parity: Shared-premise vs standard BART scores (real model)
+
+USAGE:
+    python -m src.benchmark.harness --requests 500 --output bench.json
+    python -m src.benchmark.context_bench --sizes 20,50,200,500
+    python -m src.benchmark.middleware_bench --requests 2000
+    python -m src.benchmark.transport_bench --iterations 2000
+    python -m src.benchmark.hedge_bench --requests 600
+    python -m src.benchmark.fallback_stress --threads 8 --ops 20000
+    python -m src.benchmark.premise_parity --messages 200 --max-delta 0.05
+"""
+
+from src.benchmark.stubs import (
+    StubLatencyProfile,
+    DEFAULT_LATENCY_PROFILES,
+    ZERO_LATENCY_PROFILES,
+    create_stub_model_loader,
+)
+from src.benchmark.traffic import (
+    TrafficProfile,
+    SyntheticRequest,
+    SyntheticTrafficGenerator,
+    create_traffic_generator,
+)
+from src.benchmark.harness import (
+    SCENARIOS,
+    StageRecorder,
+    ScenarioResult,
+    BenchmarkReport,
+    BenchmarkHarness,
+    compare_reports,
+    create_benchmark_engine,
+    create_benchmark_harness,
+    run_benchmark,
+)
+
+__version__ = "v5.0-8-23.0-1"
+
+__all__ = [
+    # Stubs
+    "StubLatencyProfile",
+    "DEFAULT_LATENCY_PROFILES",
+    "ZERO_LATENCY_PROFILES",
+    "create_stub_model_loader",
+    # Traffic
+    "TrafficProfile",
+    "SyntheticRequest",
+    "SyntheticTrafficGenerator",
+    "create_traffic_generator",
+    # Harness
+    "SCENARIOS",
+    "StageRecorder",
+    "ScenarioResult",
+    "BenchmarkReport",
+    "BenchmarkHarness",
+    "compare_reports",
+    "create_benchmark_engine",
+    "create_benchmark_harness",
+    "run_benchmark",
+]
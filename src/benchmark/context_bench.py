@@ -0,0 +1,235 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+CORE PRINCIPLE: Multi-Model Ensemble → Weighted Decision Engine → Crisis Classification
+******************  CORE SYSTEM VISION (Never to be violated):  ****************
+Ash-NLP is a CRISIS DETECTION BACKEND that:
+1. PRIMARY: Uses BART Zero-Shot Classification for semantic crisis detection
+2. CONTEXTUAL: Enhances with sentiment, irony, and emotion model signals
+3. ENSEMBLE: Combines weighted model outputs through decision engine
+4. PURPOSE: Detect crisis messages in Discord community communications
+********************************************************************************
+Context Analysis Micro-Benchmark for Ash-NLP Service
+---
+FILE VERSION: v5.0-8-8.0-1
+LAST MODIFIED: 2026-02-07
+PHASE: Phase 8 Step 8.0 - Vectorized Context Primitives
+CLEAN ARCHITECTURE: v5.2.3 Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+
+RESPONSIBILITIES:
+- Time ContextAnalyzer.analyze over synthetic histories of increasing size
+- Compare the pure-Python and NumPy context primitive paths
+- Verify both paths produce the same analysis before timing them
+- Write machine-readable JSON results (same layout style as the harness)
+
+USAGE:
+    python -m src.benchmark.context_bench --sizes 20,50,200,500 --output ctx.json
+"""
+
+import argparse
+import json
+import logging
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from src.context import MessageHistoryItem, create_context_analyzer
+from src.context import primitives
+from src.managers import create_context_config_manager
+
+from .harness import summarize_latencies
+
+# Module version
+__version__ = "v5.0-8-8.0-1"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# History sizes measured by default
+DEFAULT_SIZES = (20, 50, 200, 500)
+
+# Context analysis paths compared
+PATHS = ("python", "numpy")
+
+
+# =============================================================================
+# Synthetic Histories
+# =============================================================================
+
+
+def build_history(size: int, rng: random.Random) -> List[MessageHistoryItem]:
+    """
+    Build a noisy, slowly escalating history of the given size.
+
+    Args:
+        size: Number of history messages
+        rng: Seeded random generator
+
+    Returns:
+        Chronological MessageHistoryItem list
+    """
+    start = datetime(2026, 1, 1, 12, 0)
+    history = []
+    for i in range(size):
+        drift = 0.6 * i / max(1, size - 1)
+        score = min(1.0, max(0.0, 0.15 + drift + rng.uniform(-0.12, 0.12)))
+        history.append(
+            MessageHistoryItem(
+                message=f"message {i}",
+                timestamp=start + timedelta(minutes=rng.randint(1, 90) * (i + 1)),
+                crisis_score=round(score, 3),
+            )
+        )
+    history.sort(key=lambda item: item.timestamp)
+    return history
+
+
+# =============================================================================
+# Benchmark
+# =============================================================================
+
+
+def run_context_benchmark(
+    sizes: Optional[List[int]] = None,
+    iterations: int = 200,
+    seed: int = 42,
+) -> Dict[str, Any]:
+    """
+    Time context analysis per history size and primitive path.
+
+    Args:
+        sizes: History sizes to measure (default: DEFAULT_SIZES)
+        iterations: Timed analyze() calls per size and path
+        seed: Random seed for synthetic histories
+
+    Returns:
+        JSON-friendly results dict
+    """
+    sizes = list(sizes or DEFAULT_SIZES)
+    config_manager = create_context_config_manager()
+    # Analyze the full synthetic history regardless of the configured cap
+    config_manager.get_context_analysis_config().max_history_size = max(sizes) + 1
+    analyzer = create_context_analyzer(config_manager)
+    rng = random.Random(seed)
+
+    paths = [path for path in PATHS if path == "python" or primitives.NUMPY_AVAILABLE]
+    results: Dict[str, Any] = {
+        "numpy_available": primitives.NUMPY_AVAILABLE,
+        "vectorize_min_length": primitives.VECTORIZE_MIN_LENGTH,
+        "iterations": iterations,
+        "sizes": {},
+    }
+
+    try:
+        for size in sizes:
+            history = build_history(size, rng)
+            current_ts = history[-1].timestamp + timedelta(minutes=5) if history else None
+
+            outputs = {}
+            timings: Dict[str, Dict[str, float]] = {}
+            for path in paths:
+                primitives.set_vectorize_enabled(path == "numpy")
+
+                outputs[path] = analyzer.analyze(
+                    "current", 0.8, history, current_ts
+                ).to_dict()
+
+                latencies = []
+                for _ in range(iterations):
+                    start = time.perf_counter()
+                    analyzer.analyze("current", 0.8, history, current_ts)
+                    latencies.append((time.perf_counter() - start) * 1000)
+                timings[path] = summarize_latencies(latencies)
+
+            entry: Dict[str, Any] = {"paths": timings}
+            if len(outputs) == len(PATHS):
+                entry["outputs_match"] = outputs["python"] == outputs["numpy"]
+                entry["speedup_p50"] = round(
+                    timings["python"]["p50"] / max(timings["numpy"]["p50"], 1e-9), 2
+                )
+            results["sizes"][str(size)] = entry
+
+            logger.info(
+                f"📈 history={size}: "
+                + ", ".join(
+                    f"{path} p50={timings[path]['p50']:.3f}ms" for path in paths
+                )
+                + (
+                    f", outputs_match={entry['outputs_match']}"
+                    if "outputs_match" in entry
+                    else ""
+                )
+            )
+    finally:
+        primitives.set_vectorize_enabled(True)
+
+    return results
+
+
+# =============================================================================
+# Main Entry Point
+# =============================================================================
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point.
+
+    Returns:
+        Exit code (0 = success, 1 = paths disagree)
+    """
+    parser = argparse.ArgumentParser(
+        description="Ash-NLP context analysis micro-benchmark (Python vs NumPy)"
+    )
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="Comma-separated history sizes",
+    )
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="context-benchmark-results.json")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    for noisy in ("src.context", "src.managers"):
+        logging.getLogger(noisy).setLevel(logging.WARNING)
+
+    results = run_context_benchmark(
+        sizes=[int(s) for s in args.sizes.split(",") if s.strip()],
+        iterations=args.iterations,
+        seed=args.seed,
+    )
+    with open(args.output, "w", encoding="utf-8") as fh:
+        json.dump(results, fh, indent=2)
+    logger.info(f"💾 Context benchmark results written to {args.output}")
+
+    if not primitives.NUMPY_AVAILABLE:
+        logger.warning("⚠️ numpy not installed - only the pure-Python path was measured")
+
+    mismatched = [
+        size for size, entry in results["sizes"].items()
+        if entry.get("outputs_match") is False
+    ]
+    if mismatched:
+        logger.warning(f"⚠️ Python and NumPy outputs differ for sizes: {mismatched}")
+        return 1
+    return 0
+
+
+__all__ = [
+    "DEFAULT_SIZES",
+    "PATHS",
+    "build_history",
+    "run_context_benchmark",
+    "main",
+]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,224 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+CORE PRINCIPLE: Multi-Model Ensemble → Weighted Decision Engine → Crisis Classification
+******************  CORE SYSTEM VISION (Never to be violated):  ****************
+Ash-NLP is a CRISIS DETECTION BACKEND that:
+1. PRIMARY: Uses BART Zero-Shot Classification for semantic crisis detection
+2. CONTEXTUAL: Enhances with sentiment, irony, and emotion model signals
+3. ENSEMBLE: Combines weighted model outputs through decision engine
+4. PURPOSE: Detect crisis messages in Discord community communications
+********************************************************************************
+Fallback State Concurrency Stress Check for Ash-NLP Service
+---
+FILE VERSION: v5.0-8-18.0-1
+LAST MODIFIED: 2026-02-17
+PHASE: Phase 8 Step 18.0 - Thread-Safe Fallback State
+CLEAN ARCHITECTURE: v5.2.3 Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+
+RESPONSIBILITIES:
+- Hammer one FallbackStrategy from many threads with the calls inference
+  threads make (failures, successes, latencies, circuit checks)
+- Read snapshots concurrently and check each one is consistent:
+    - weights equal the weights computed from its own failed set
+    - failed models carry zero weight, total weight is conserved
+    - is_degraded matches the failed set
+- Check no failure was lost and the failure history stayed bounded
+- Report throughput; exit 1 on any violation
+
+USAGE:
+    python -m src.benchmark.fallback_stress --threads 8 --ops 20000
+"""
+
+import argparse
+import json
+import logging
+import math
+import random
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from src.ensemble.fallback import FallbackSnapshot, FallbackStrategy, create_fallback_strategy
+
+# Module version
+__version__ = "v5.0-8-18.0-1"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Models the workers report on (BART failures raise and are not exercised)
+SECONDARY_MODELS = ("sentiment", "irony", "emotions")
+
+# Tolerance for float weight comparisons
+WEIGHT_TOLERANCE = 1e-9
+
+
+def check_snapshot(fallback: FallbackStrategy, snapshot: FallbackSnapshot) -> Optional[str]:
+    """
+    Check one snapshot for internal consistency.
+
+    Returns:
+        Description of the first violation, or None
+    """
+    expected = fallback._compute_weights(snapshot.failed_models)
+    for name, weight in expected.items():
+        if not math.isclose(snapshot.weights.get(name, -1.0), weight, abs_tol=WEIGHT_TOLERANCE):
+            return f"torn weights v{snapshot.version}: {dict(snapshot.weights)}"
+    if any(snapshot.weights.get(name, 0.0) != 0.0 for name in snapshot.failed_models):
+        return f"failed model with weight v{snapshot.version}"
+    if not math.isclose(
+        sum(snapshot.weights.values()),
+        sum(fallback.base_weights.values()),
+        abs_tol=WEIGHT_TOLERANCE,
+    ):
+        return f"weight not conserved v{snapshot.version}"
+    if snapshot.is_degraded != bool(snapshot.failed_models):
+        return f"is_degraded mismatch v{snapshot.version}"
+    return None
+
+
+# =============================================================================
+# Stress Run
+# =============================================================================
+
+
+def run_fallback_stress(threads: int = 8, ops: int = 20000, seed: int = 0) -> Dict[str, Any]:
+    """
+    Run the concurrency stress check.
+
+    Args:
+        threads: Worker threads (half report, half also read snapshots)
+        ops: Operations per thread
+        seed: Base seed for each thread's operation mix
+
+    Returns:
+        JSON-friendly results dict ("violations" empty on success)
+    """
+    fallback = create_fallback_strategy(failure_threshold=3, recovery_timeout=0.001)
+    # Latencies stay under the budget so every failure is an explicit one
+    latency_ms = fallback.secondary_budget_ms / 10
+
+    failures_issued = [0] * threads
+    snapshots_checked = [0] * threads
+    violations: List[str] = []
+    start_barrier = threading.Barrier(threads)
+
+    def worker(index: int) -> None:
+        rng = random.Random(seed + index)
+        start_barrier.wait()
+        for _ in range(ops):
+            model = rng.choice(SECONDARY_MODELS)
+            roll = rng.random()
+            if roll < 0.25:
+                fallback.handle_model_failure(model, "stress")
+                failures_issued[index] += 1
+            elif roll < 0.6:
+                fallback.handle_model_success(model)
+            elif roll < 0.8:
+                fallback.record_latency(model, latency_ms)
+            else:
+                fallback.can_call_model(model)
+
+            if index % 2 == 0:
+                problem = check_snapshot(fallback, fallback.get_snapshot())
+                snapshots_checked[index] += 1
+                if problem and len(violations) < 20:
+                    violations.append(problem)
+
+    # Switch threads far more often than the default 5 ms
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+        started = time.perf_counter()
+        for t in pool:
+            t.start()
+        for t in pool:
+            t.join()
+        elapsed = time.perf_counter() - started
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    status = fallback.get_status()
+    expected_failures = sum(failures_issued)
+    if status["total_failures"] != expected_failures:
+        violations.append(
+            f"lost failures: recorded {status['total_failures']} of {expected_failures}"
+        )
+    if len(fallback.failure_history) > fallback.FAILURE_HISTORY_SIZE:
+        violations.append(f"failure history grew to {len(fallback.failure_history)}")
+    final = check_snapshot(fallback, fallback.get_snapshot())
+    if final:
+        violations.append(f"final state: {final}")
+
+    total_ops = threads * ops
+    return {
+        "threads": threads,
+        "ops_per_thread": ops,
+        "elapsed_s": round(elapsed, 4),
+        "ops_per_second": round(total_ops / elapsed, 1) if elapsed > 0 else None,
+        "failures_issued": expected_failures,
+        "failures_recorded": status["total_failures"],
+        "failure_history_size": len(fallback.failure_history),
+        "snapshots_checked": sum(snapshots_checked),
+        "state_version": status["state_version"],
+        "violations": violations,
+    }
+
+
+# =============================================================================
+# Main Entry Point
+# =============================================================================
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point.
+
+    Returns:
+        Exit code (0 = no violations, 1 = violations found)
+    """
+    parser = argparse.ArgumentParser(
+        description="Ash-NLP fallback state concurrency stress check"
+    )
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--ops", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="fallback-stress-results.json")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    # Every injected failure logs; keep the output to the summary
+    logging.getLogger("src").setLevel(logging.CRITICAL)
+
+    results = run_fallback_stress(threads=args.threads, ops=args.ops, seed=args.seed)
+    with open(args.output, "w", encoding="utf-8") as fh:
+        json.dump(results, fh, indent=2)
+
+    logger.info(
+        f"📈 {results['threads']} threads: {results['ops_per_second']:.0f} ops/s, "
+        f"{results['snapshots_checked']} snapshots checked, "
+        f"{results['failures_recorded']}/{results['failures_issued']} failures recorded"
+    )
+    if results["violations"]:
+        for problem in results["violations"]:
+            logger.error(f"❌ {problem}")
+        return 1
+    logger.info(f"✅ No violations (results in {args.output})")
+    return 0
+
+
+__all__ = [
+    "check_snapshot",
+    "run_fallback_stress",
+    "main",
+]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,795 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+CORE PRINCIPLE: Multi-Model Ensemble → Weighted Decision Engine → Crisis Classification
+******************  CORE SYSTEM VISION (Never to be violated):  ****************
+Ash-NLP is a CRISIS DETECTION BACKEND that:
+1. PRIMARY: Uses BART Zero-Shot Classification for semantic crisis detection
+2. CONTEXTUAL: Enhances with sentiment, irony, and emotion model signals
+3. ENSEMBLE: Combines weighted model outputs through decision engine
+4. PURPOSE: Detect crisis messages in Discord community communications
+********************************************************************************
+Load-Test and Latency Benchmark Harness for Ash-NLP Service
+---
+FILE VERSION: v5.0-8-17.0-2
+LAST MODIFIED: 2026-02-16
+PHASE: Phase 8 Step 17.0 - Hedged BART Requests
+CLEAN ARCHITECTURE: v5.2.3 Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+
+RESPONSIBILITIES:
+- Drive EnsembleDecisionEngine.analyze / analyze_async with synthetic traffic
+- Drive the /analyze and /analyze/batch endpoints in-process (ASGI transport)
+- Collect per-stage latency from CrisisAssessment.timing (per-model
+  inference, scoring, consensus, conflicts, aggregation, explanation,
+  context, cache)
+- Report throughput and p50/p95/p99 per scenario and per stage
+- Write machine-readable JSON results and compare against a baseline
+
+USAGE:
+    # Default run (stub models with CPU-like latency)
+    python -m src.benchmark.harness --requests 500 --output bench.json
+
+    # Framework overhead only (zero-latency stubs)
+    python -m src.benchmark.harness --latency zero
+
+    # Compare against a previous commit's results
+    python -m src.benchmark.harness --compare baseline.json --threshold 10
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from src.ensemble.decision_engine import EnsembleDecisionEngine
+
+from .stubs import (
+    DEFAULT_LATENCY_PROFILES,
+    ZERO_LATENCY_PROFILES,
+    create_stub_model_loader,
+)
+from .traffic import (
+    SyntheticRequest,
+    TrafficProfile,
+    create_traffic_generator,
+)
+
+# Module version
+__version__ = "v5.0-8-17.0-2"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Scenarios understood by run_benchmark()
+SCENARIOS = ("engine_sync", "engine_async", "api_analyze", "api_batch")
+
+# Percentiles reported for every latency series
+PERCENTILES = (50, 95, 99)
+
+
+# =============================================================================
+# Statistics Helpers
+# =============================================================================
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    Linear-interpolated percentile (numpy 'linear' method).
+
+    Args:
+        values: Sample values (need not be sorted)
+        pct: Percentile in [0, 100]
+
+    Returns:
+        Percentile value (0.0 for empty input)
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (pct / 100.0) * (len(ordered) - 1)
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize_latencies(values: List[float]) -> Dict[str, float]:
+    """
+    Summarize a latency series in milliseconds.
+
+    Returns:
+        Dict with count, mean, min, max and p50/p95/p99
+    """
+    if not values:
+        return {"count": 0}
+    summary = {
+        "count": len(values),
+        "mean": round(sum(values) / len(values), 4),
+        "min": round(min(values), 4),
+        "max": round(max(values), 4),
+    }
+    for pct in PERCENTILES:
+        summary[f"p{pct}"] = round(percentile(values, pct), 4)
+    return summary
+
+
+# =============================================================================
+# Stage Recorder
+# =============================================================================
+
+
+class StageRecorder:
+    """
+    Collects per-stage latency samples in milliseconds.
+
+    list.append is atomic under the GIL, so executor threads and the
+    event loop can record concurrently without locking.
+    """
+
+    def __init__(self):
+        self._samples: Dict[str, List[float]] = {}
+
+    def record(self, stage: str, elapsed_ms: float) -> None:
+        """Record one sample for a stage."""
+        samples = self._samples.get(stage)
+        if samples is None:
+            samples = self._samples.setdefault(stage, [])
+        samples.append(elapsed_ms)
+
+    def reset(self) -> None:
+        """Drop all samples."""
+        self._samples = {}
+
+    def record_timing(self, timing: Optional[Dict[str, Any]]) -> None:
+        """Record a StageTimer.to_dict() breakdown (CrisisAssessment.timing)."""
+        if not timing:
+            return
+        for stage, elapsed_ms in timing.get("stages", {}).items():
+            self.record(stage, elapsed_ms)
+        for model, elapsed_ms in timing.get("models", {}).items():
+            self.record(f"inference.{model}", elapsed_ms)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Summarize every stage."""
+        return {
+            stage: summarize_latencies(samples)
+            for stage, samples in sorted(self._samples.items())
+        }
+
+
+# =============================================================================
+# Result Data Classes
+# =============================================================================
+
+
+@dataclass
+class ScenarioResult:
+    """
+    Result of one benchmark scenario.
+
+    Attributes:
+        name: Scenario name (engine_sync, engine_async, api_analyze, api_batch)
+        requests: Number of analyzed messages
+        concurrency: Concurrent in-flight requests
+        wall_time_s: Total wall-clock time
+        latency_ms: End-to-end latency summary (per call)
+        stages_ms: Per-stage latency summaries
+        cache_hits: Engine cache hits during the scenario
+        errors: Failed calls
+    """
+
+    name: str
+    requests: int
+    concurrency: int
+    wall_time_s: float
+    latency_ms: Dict[str, float]
+    stages_ms: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    cache_hits: int = 0
+    errors: int = 0
+
+    @property
+    def throughput_rps(self) -> float:
+        """Analyzed messages per second."""
+        return self.requests / self.wall_time_s if self.wall_time_s > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "name": self.name,
+            "requests": self.requests,
+            "concurrency": self.concurrency,
+            "wall_time_s": round(self.wall_time_s, 4),
+            "throughput_rps": round(self.throughput_rps, 2),
+            "latency_ms": self.latency_ms,
+            "stages_ms": self.stages_ms,
+            "cache_hits": self.cache_hits,
+            "errors": self.errors,
+        }
+
+
+@dataclass
+class BenchmarkReport:
+    """
+    Complete benchmark report (written as JSON).
+
+    Attributes:
+        metadata: Environment, commit, traffic and latency profile
+        scenarios: Scenario name → ScenarioResult
+    """
+
+    metadata: Dict[str, Any]
+    scenarios: Dict[str, ScenarioResult] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "metadata": self.metadata,
+            "scenarios": {
+                name: result.to_dict() for name, result in self.scenarios.items()
+            },
+        }
+
+    def write_json(self, path: str) -> None:
+        """Write report to a JSON file."""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(self.to_dict(), fh, indent=2, sort_keys=True)
+        logger.info(f"💾 Benchmark results written to {path}")
+
+
+# =============================================================================
+# Benchmark Harness
+# =============================================================================
+
+
+class BenchmarkHarness:
+    """
+    Offline load-test harness for the decision engine and API.
+
+    Clean Architecture v5.1 Compliance:
+    - Factory function: create_benchmark_harness()
+    - Dependency injection (engine is passed in)
+    """
+
+    def __init__(
+        self,
+        engine: EnsembleDecisionEngine,
+        recorder: Optional[StageRecorder] = None,
+    ):
+        """
+        Initialize harness.
+
+        Args:
+            engine: Decision engine under test
+            recorder: Stage recorder (created if omitted)
+        """
+        self.engine = engine
+        self.recorder = recorder or StageRecorder()
+
+    # =========================================================================
+    # Helpers
+    # =========================================================================
+
+    def _begin(self) -> int:
+        """Reset per-scenario state; return starting cache-hit count."""
+        self.recorder.reset()
+        self.engine.clear_cache()
+        return self.engine._cache_hits
+
+    def _finish(
+        self,
+        name: str,
+        requests: int,
+        concurrency: int,
+        wall_time_s: float,
+        latencies: List[float],
+        errors: int,
+        start_hits: int,
+    ) -> ScenarioResult:
+        result = ScenarioResult(
+            name=name,
+            requests=requests,
+            concurrency=concurrency,
+            wall_time_s=wall_time_s,
+            latency_ms=summarize_latencies(latencies),
+            stages_ms=self.recorder.summary(),
+            cache_hits=self.engine._cache_hits - start_hits,
+            errors=errors,
+        )
+        logger.info(
+            f"📈 {name}: {result.throughput_rps:.1f} req/s, "
+            f"p50={result.latency_ms.get('p50', 0):.2f}ms "
+            f"p95={result.latency_ms.get('p95', 0):.2f}ms "
+            f"p99={result.latency_ms.get('p99', 0):.2f}ms"
+        )
+        return result
+
+    # =========================================================================
+    # Engine Scenarios
+    # =========================================================================
+
+    def run_engine_sync(self, requests: List[SyntheticRequest]) -> ScenarioResult:
+        """Sequentially call engine.analyze() for every request."""
+        start_hits = self._begin()
+        latencies: List[float] = []
+        errors = 0
+
+        wall_start = time.perf_counter()
+        for req in requests:
+            start = time.perf_counter()
+            assessment = self.engine.analyze(
+                req.message, message_history=req.message_history
+            )
+            latencies.append((time.perf_counter() - start) * 1000)
+            self.recorder.record_timing(assessment.timing)
+            if assessment.recommended_action == "error":
+                errors += 1
+        wall_time = time.perf_counter() - wall_start
+
+        return self._finish(
+            "engine_sync", len(requests), 1, wall_time, latencies, errors, start_hits
+        )
+
+    async def run_engine_async(
+        self, requests: List[SyntheticRequest], concurrency: int = 8
+    ) -> ScenarioResult:
+        """Call engine.analyze_async() with bounded concurrency."""
+        start_hits = self._begin()
+        latencies: List[float] = []
+        errors = 0
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(req: SyntheticRequest) -> None:
+            nonlocal errors
+            async with semaphore:
+                start = time.perf_counter()
+                assessment = await self.engine.analyze_async(
+                    req.message, message_history=req.message_history
+                )
+                latencies.append((time.perf_counter() - start) * 1000)
+                self.recorder.record_timing(assessment.timing)
+                if assessment.recommended_action == "error":
+                    errors += 1
+
+        wall_start = time.perf_counter()
+        await asyncio.gather(*(one(req) for req in requests))
+        wall_time = time.perf_counter() - wall_start
+
+        return self._finish(
+            "engine_async",
+            len(requests),
+            concurrency,
+            wall_time,
+            latencies,
+            errors,
+            start_hits,
+        )
+
+    # =========================================================================
+    # API Scenarios
+    # =========================================================================
+
+    def _build_app(self) -> Any:
+        """Build the FastAPI app with the benchmark engine attached."""
+        from src.api.app import create_app
+
+        app = create_app(enable_rate_limiting=False)
+        app.state.engine = self.engine
+        app.state.start_time = time.time()
+        return app
+
+    async def _run_api(
+        self,
+        name: str,
+        path: str,
+        payloads: List[Dict[str, Any]],
+        messages_per_call: List[int],
+        concurrency: int,
+    ) -> ScenarioResult:
+        import httpx
+
+        app = self._build_app()
+        start_hits = self._begin()
+        latencies: List[float] = []
+        errors = 0
+        semaphore = asyncio.Semaphore(concurrency)
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://benchmark"
+        ) as client:
+
+            async def one(payload: Dict[str, Any]) -> None:
+                nonlocal errors
+                async with semaphore:
+                    start = time.perf_counter()
+                    response = await client.post(path, json=payload)
+                    latencies.append((time.perf_counter() - start) * 1000)
+                    if response.status_code != 200:
+                        errors += 1
+                    elif payload.get("include_timing"):
+                        self.recorder.record_timing(response.json().get("timing"))
+
+            wall_start = time.perf_counter()
+            await asyncio.gather(*(one(p) for p in payloads))
+            wall_time = time.perf_counter() - wall_start
+
+        return self._finish(
+            name,
+            sum(messages_per_call),
+            concurrency,
+            wall_time,
+            latencies,
+            errors,
+            start_hits,
+        )
+
+    async def run_api_analyze(
+        self, requests: List[SyntheticRequest], concurrency: int = 8
+    ) -> ScenarioResult:
+        """POST every request to /analyze."""
+        payloads = [
+            {**req.to_api_payload(), "include_timing": True} for req in requests
+        ]
+        return await self._run_api(
+            "api_analyze", "/analyze", payloads, [1] * len(payloads), concurrency
+        )
+
+    async def run_api_batch(
+        self,
+        requests: List[SyntheticRequest],
+        batch_size: int = 25,
+        concurrency: int = 2,
+    ) -> ScenarioResult:
+        """POST requests to /analyze/batch in chunks of batch_size."""
+        batch_size = max(1, min(100, batch_size))
+        payloads: List[Dict[str, Any]] = []
+        sizes: List[int] = []
+        for i in range(0, len(requests), batch_size):
+            chunk = requests[i : i + batch_size]
+            payloads.append({"messages": [req.message for req in chunk]})
+            sizes.append(len(chunk))
+        return await self._run_api(
+            "api_batch", "/analyze/batch", payloads, sizes, concurrency
+        )
+
+
+# =============================================================================
+# Report Comparison
+# =============================================================================
+
+
+def compare_reports(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold_pct: float = 10.0,
+) -> List[Dict[str, Any]]:
+    """
+    Compare two benchmark JSON reports.
+
+    A regression is any end-to-end or stage percentile that grew by more
+    than threshold_pct, or a throughput that dropped by more than it.
+
+    Args:
+        baseline: Baseline report dict (from a previous commit)
+        current: Current report dict
+        threshold_pct: Allowed change in percent
+
+    Returns:
+        List of regression dicts (empty when nothing regressed)
+    """
+    regressions: List[Dict[str, Any]] = []
+
+    def check(scenario: str, metric: str, old: float, new: float, lower_is_better: bool):
+        if not old:
+            return
+        change_pct = (new - old) / old * 100.0
+        worse = change_pct > threshold_pct if lower_is_better else change_pct < -threshold_pct
+        if worse:
+            regressions.append(
+                {
+                    "scenario": scenario,
+                    "metric": metric,
+                    "baseline": old,
+                    "current": new,
+                    "change_pct": round(change_pct, 2),
+                }
+            )
+
+    base_scenarios = baseline.get("scenarios", {})
+    for name, cur in current.get("scenarios", {}).items():
+        base = base_scenarios.get(name)
+        if not base:
+            continue
+        check(name, "throughput_rps", base.get("throughput_rps", 0), cur.get("throughput_rps", 0), False)
+        for pct in PERCENTILES:
+            key = f"p{pct}"
+            check(
+                name,
+                f"latency.{key}",
+                base.get("latency_ms", {}).get(key, 0),
+                cur.get("latency_ms", {}).get(key, 0),
+                True,
+            )
+        for stage, stats in cur.get("stages_ms", {}).items():
+            base_stats = base.get("stages_ms", {}).get(stage, {})
+            check(name, f"stage.{stage}.p95", base_stats.get("p95", 0), stats.get("p95", 0), True)
+
+    return regressions
+
+
+# =============================================================================
+# Orchestration
+# =============================================================================
+
+
+def _git_commit() -> Optional[str]:
+    """Best-effort current git commit hash."""
+    try:
+        return (
+            subprocess.check_output(
+                ["git", "rev-parse", "--short", "HEAD"],
+                stderr=subprocess.DEVNULL,
+                timeout=5,
+            )
+            .decode()
+            .strip()
+        )
+    except Exception:
+        return None
+
+
+def create_benchmark_engine(
+    latency: str = "default",
+    cache_enabled: bool = True,
+    async_inference: bool = True,
+    phase4_enabled: bool = True,
+    phase5_enabled: bool = True,
+    config_manager: Optional[Any] = None,
+    seed: int = 0,
+    bart_replicas: int = 1,
+    latency_profiles: Optional[Dict[str, Any]] = None,
+) -> EnsembleDecisionEngine:
+    """
+    Build a decision engine backed by stub models.
+
+    Vigil and the Discord alerter are disabled so the benchmark never
+    leaves the process.
+
+    Args:
+        latency: "default" (CPU-like stubs) or "zero" (overhead only)
+        cache_enabled: Enable the response cache (the config's
+            performance.cache_enabled can still turn it off)
+        async_inference: Parallel model inference
+        phase4_enabled: Enable Phase 4 processing
+        phase5_enabled: Enable Phase 5 context analysis
+        config_manager: Optional ConfigManager
+        seed: Seed for stub latency jitter
+        bart_replicas: BART replicas (more than one enables hedging)
+        latency_profiles: Explicit stub profiles (overrides latency)
+
+    Returns:
+        EnsembleDecisionEngine ready for analyze()
+    """
+    if config_manager is not None:
+        perf_config = config_manager.get_performance_config() or {}
+        cache_enabled = cache_enabled and perf_config.get("cache_enabled", True)
+
+    profiles = latency_profiles or (
+        ZERO_LATENCY_PROFILES if latency == "zero" else DEFAULT_LATENCY_PROFILES
+    )
+    loader = create_stub_model_loader(
+        latency_profiles=profiles,
+        seed=seed,
+        config_manager=config_manager,
+        bart_replicas=bart_replicas,
+    )
+    return EnsembleDecisionEngine(
+        config_manager=config_manager,
+        model_loader=loader,
+        async_inference=async_inference,
+        cache_enabled=cache_enabled,
+        vigil_enabled=False,
+        alerter=None,
+        phase4_enabled=phase4_enabled,
+        phase5_enabled=phase5_enabled,
+    )
+
+
+def create_benchmark_harness(
+    engine: Optional[EnsembleDecisionEngine] = None,
+    latency: str = "default",
+    **engine_kwargs,
+) -> BenchmarkHarness:
+    """
+    Factory function for BenchmarkHarness.
+
+    Args:
+        engine: Engine under test (stub-backed engine built if omitted)
+        latency: Stub latency profile name when building an engine
+        **engine_kwargs: Passed to create_benchmark_engine()
+
+    Returns:
+        Configured BenchmarkHarness instance
+    """
+    if engine is None:
+        engine = create_benchmark_engine(latency=latency, **engine_kwargs)
+    return BenchmarkHarness(engine=engine)
+
+
+def run_benchmark(
+    requests: int = 500,
+    concurrency: int = 8,
+    batch_size: int = 25,
+    scenarios: Optional[List[str]] = None,
+    latency: str = "default",
+    profile: Optional[TrafficProfile] = None,
+    warmup: int = 20,
+    engine_kwargs: Optional[Dict[str, Any]] = None,
+) -> BenchmarkReport:
+    """
+    Run the selected benchmark scenarios.
+
+    Every scenario replays the same synthetic request list so results
+    are comparable between scenarios and across commits.
+
+    Args:
+        requests: Messages per scenario
+        concurrency: In-flight requests for async/API scenarios
+        batch_size: Messages per /analyze/batch call
+        scenarios: Scenario names (default: all)
+        latency: Stub latency profile ("default" or "zero")
+        profile: Synthetic traffic profile
+        warmup: Untimed warmup calls before the first scenario
+        engine_kwargs: Passed to create_benchmark_engine()
+
+    Returns:
+        BenchmarkReport
+    """
+    selected = list(scenarios or SCENARIOS)
+    unknown = [name for name in selected if name not in SCENARIOS]
+    if unknown:
+        raise ValueError(f"Unknown scenarios: {unknown}. Valid: {list(SCENARIOS)}")
+
+    profile = profile or TrafficProfile()
+    traffic = create_traffic_generator(profile=profile).generate(requests)
+
+    harness = create_benchmark_harness(latency=latency, **(engine_kwargs or {}))
+
+    # Warmup (first-call imports, lazy config, allocator)
+    for req in create_traffic_generator(seed=profile.seed + 1).generate(warmup):
+        harness.engine.analyze(req.message, use_cache=False)
+
+    report = BenchmarkReport(
+        metadata={
+            "harness_version": __version__,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_commit": _git_commit(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "latency_profile": latency,
+            "requests": requests,
+            "concurrency": concurrency,
+            "batch_size": batch_size,
+            "traffic": profile.to_dict(),
+        }
+    )
+
+    for name in selected:
+        logger.info(f"🏁 Running scenario: {name}")
+        if name == "engine_sync":
+            result = harness.run_engine_sync(traffic)
+        elif name == "engine_async":
+            result = asyncio.run(harness.run_engine_async(traffic, concurrency))
+        elif name == "api_analyze":
+            result = asyncio.run(harness.run_api_analyze(traffic, concurrency))
+        else:
+            result = asyncio.run(
+                harness.run_api_batch(traffic, batch_size, max(1, concurrency // 4))
+            )
+        report.scenarios[name] = result
+
+    harness.engine.shutdown()
+    return report
+
+
+# =============================================================================
+# Main Entry Point
+# =============================================================================
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point.
+
+    Returns:
+        Exit code (0 = success, 1 = regression detected)
+    """
+    parser = argparse.ArgumentParser(
+        description="Ash-NLP offline load-test and latency benchmark"
+    )
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--batch-size", type=int, default=25)
+    parser.add_argument(
+        "--scenarios",
+        default=",".join(SCENARIOS),
+        help=f"Comma-separated subset of: {', '.join(SCENARIOS)}",
+    )
+    parser.add_argument("--latency", choices=["default", "zero"], default="default")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat-rate", type=float, default=None)
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--compare", default=None, help="Baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=10.0)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    # Engine components log at INFO per request; keep benchmark output readable
+    for noisy in ("src.ensemble", "src.context", "src.models", "src.api", "src.utils", "httpx"):
+        logging.getLogger(noisy).setLevel(logging.WARNING)
+
+    profile = TrafficProfile(seed=args.seed)
+    if args.repeat_rate is not None:
+        profile.repeat_rate = args.repeat_rate
+
+    report = run_benchmark(
+        requests=args.requests,
+        concurrency=args.concurrency,
+        batch_size=args.batch_size,
+        scenarios=[s.strip() for s in args.scenarios.split(",") if s.strip()],
+        latency=args.latency,
+        profile=profile,
+        engine_kwargs={"cache_enabled": not args.no_cache},
+    )
+    report.write_json(args.output)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        regressions = compare_reports(baseline, report.to_dict(), args.threshold)
+        if regressions:
+            for reg in regressions:
+                logger.warning(
+                    f"⚠️ Regression {reg['scenario']} {reg['metric']}: "
+                    f"{reg['baseline']} → {reg['current']} ({reg['change_pct']:+.1f}%)"
+                )
+            return 1
+        logger.info(f"✅ No regressions beyond {args.threshold}%")
+
+    return 0
+
+
+__all__ = [
+    "SCENARIOS",
+    "percentile",
+    "summarize_latencies",
+    "StageRecorder",
+    "ScenarioResult",
+    "BenchmarkReport",
+    "BenchmarkHarness",
+    "compare_reports",
+    "create_benchmark_engine",
+    "create_benchmark_harness",
+    "run_benchmark",
+    "main",
+]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+CORE PRINCIPLE: Multi-Model Ensemble → Weighted Decision Engine → Crisis Classification
+******************  CORE SYSTEM VISION (Never to be violated):  ****************
+Ash-NLP is a CRISIS DETECTION BACKEND that:
+1. PRIMARY: Uses BART Zero-Shot Classification for semantic crisis detection
+2. CONTEXTUAL: Enhances with sentiment, irony, and emotion model signals
+3. ENSEMBLE: Combines weighted model outputs through decision engine
+4. PURPOSE: Detect crisis messages in Discord community communications
+********************************************************************************
+Hedged BART Benchmark for Ash-NLP Service
+---
+FILE VERSION: v5.0-8-17.0-1
+LAST MODIFIED: 2026-02-16
+PHASE: Phase 8 Step 17.0 - Hedged BART Requests
+CLEAN ARCHITECTURE: v5.2.3 Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+
+RESPONSIBILITIES:
+- Measure end-to-end analyze() latency with 1 vs N BART replicas
+- Use CPU-like stubs where BART occasionally stalls (the tail that
+  hedging targets)
+- Report p50/p95/p99 per replica count plus hedge rate and wins
+- Write machine-readable JSON results (same layout style as the harness)
+
+USAGE:
+    python -m src.benchmark.hedge_bench --requests 600 --output hedge.json
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from dataclasses import replace
+from typing import Any, Dict, List, Optional
+
+from .harness import create_benchmark_engine, summarize_latencies
+from .stubs import DEFAULT_LATENCY_PROFILES
+from .traffic import create_traffic_generator
+
+# Module version
+__version__ = "v5.0-8-17.0-1"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# BART stalls simulated by default
+DEFAULT_STALL_PROBABILITY = 0.03
+DEFAULT_STALL_MS = 300.0
+
+
+def build_stall_profiles(stall_probability: float, stall_ms: float) -> Dict[str, Any]:
+    """Default stub profiles with occasional BART stalls."""
+    profiles = dict(DEFAULT_LATENCY_PROFILES)
+    profiles["bart"] = replace(
+        profiles["bart"], stall_probability=stall_probability, stall_ms=stall_ms
+    )
+    return profiles
+
+
+# =============================================================================
+# Benchmark
+# =============================================================================
+
+
+def run_hedge_benchmark(
+    requests: int = 600,
+    warmup: int = 50,
+    replicas: Optional[List[int]] = None,
+    stall_probability: float = DEFAULT_STALL_PROBABILITY,
+    stall_ms: float = DEFAULT_STALL_MS,
+    seed: int = 7,
+) -> Dict[str, Any]:
+    """
+    Time analyze() for each BART replica count.
+
+    The response cache is disabled so every request reaches inference.
+
+    Args:
+        requests: Timed requests per replica count
+        warmup: Untimed requests first (fills the hedge latency window)
+        replicas: BART replica counts to compare (default: 1 and 2)
+        stall_probability: Chance a BART call stalls
+        stall_ms: Extra latency of a stalled call
+        seed: Traffic and stub jitter seed
+
+    Returns:
+        JSON-friendly results dict
+    """
+    replicas = replicas or [1, 2]
+    profiles = build_stall_profiles(stall_probability, stall_ms)
+    messages = [
+        item.message
+        for item in create_traffic_generator(seed=seed).generate(warmup + requests)
+    ]
+    results: Dict[str, Any] = {
+        "requests": requests,
+        "warmup": warmup,
+        "stall_probability": stall_probability,
+        "stall_ms": stall_ms,
+        "replicas": {},
+    }
+
+    for count in replicas:
+        engine = create_benchmark_engine(
+            cache_enabled=False,
+            seed=seed,
+            bart_replicas=count,
+            latency_profiles=profiles,
+        )
+        latencies: List[float] = []
+        try:
+            for i, message in enumerate(messages):
+                start = time.perf_counter()
+                engine.analyze(message)
+                if i >= warmup:
+                    latencies.append((time.perf_counter() - start) * 1000)
+            hedging = engine.get_status().get("hedging")
+        finally:
+            engine.shutdown()
+
+        summary = summarize_latencies(latencies)
+        results["replicas"][str(count)] = {"latency_ms": summary, "hedging": hedging}
+        logger.info(
+            f"📈 replicas={count}: p50={summary['p50']:.2f}ms "
+            f"p95={summary['p95']:.2f}ms p99={summary['p99']:.2f}ms"
+            + (
+                f" | hedge rate={hedging['hedge_rate']:.2%} "
+                f"wins={hedging['hedge_wins']}/{hedging['hedged']}"
+                if hedging
+                else ""
+            )
+        )
+
+    return results
+
+
+# =============================================================================
+# Main Entry Point
+# =============================================================================
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point.
+
+    Returns:
+        Exit code (0 = success)
+    """
+    parser = argparse.ArgumentParser(
+        description="Ash-NLP hedged BART benchmark (1 vs N replicas)"
+    )
+    parser.add_argument("--requests", type=int, default=600)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument(
+        "--replicas", default="1,2", help="Comma-separated BART replica counts"
+    )
+    parser.add_argument("--stall-probability", type=float, default=DEFAULT_STALL_PROBABILITY)
+    parser.add_argument("--stall-ms", type=float, default=DEFAULT_STALL_MS)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", default="hedge-benchmark-results.json")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    # Per-request logs would dominate the measurement
+    logging.getLogger("src").setLevel(logging.WARNING)
+
+    results = run_hedge_benchmark(
+        requests=args.requests,
+        warmup=args.warmup,
+        replicas=[int(r) for r in args.replicas.split(",") if r.strip()],
+        stall_probability=args.stall_probability,
+        stall_ms=args.stall_ms,
+        seed=args.seed,
+    )
+    with open(args.output, "w", encoding="utf-8") as fh:
+        json.dump(results, fh, indent=2)
+    logger.info(f"💾 Hedge benchmark results written to {args.output}")
+    return 0
+
+
+__all__ = [
+    "build_stall_profiles",
+    "run_hedge_benchmark",
+    "main",
+]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,240 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+CORE PRINCIPLE: Multi-Model Ensemble → Weighted Decision Engine → Crisis Classification
+******************  CORE SYSTEM VISION (Never to be violated):  ****************
+Ash-NLP is a CRISIS DETECTION BACKEND that:
+1. PRIMARY: Uses BART Zero-Shot Classification for semantic crisis detection
+2. CONTEXTUAL: Enhances with sentiment, irony, and emotion model signals
+3. ENSEMBLE: Combines weighted model outputs through decision engine
+4. PURPOSE: Detect crisis messages in Discord community communications
+********************************************************************************
+Middleware Overhead Benchmark for Ash-NLP Service
+---
+FILE VERSION: v5.0-8-12.0-1
+LAST MODIFIED: 2026-02-11
+PHASE: Phase 8 Step 12.0 - Fused ASGI Middleware
+CLEAN ARCHITECTURE: v5.2.3 Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+
+RESPONSIBILITIES:
+- Measure per-request middleware overhead on /healthz and /analyze
+- Compare three stacks over the same app and stub engine:
+    none    - no custom middleware (baseline)
+    fused   - AshMiddleware (current)
+    layered - five pass-through BaseHTTPMiddleware layers, the shape of
+              the former stack (request ID, rate limit, logging, errors,
+              metrics) with none of their work, so a lower bound on its cost
+- Write machine-readable JSON results (same layout style as the harness)
+
+USAGE:
+    python -m src.benchmark.middleware_bench --requests 2000 --output mw.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from src.api.middleware import AshMiddleware
+
+from .harness import create_benchmark_engine, summarize_latencies
+
+# Module version
+__version__ = "v5.0-8-12.0-1"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Middleware stacks compared
+STACKS = ("none", "fused", "layered")
+
+# Layers in the former BaseHTTPMiddleware stack
+LAYERED_DEPTH = 5
+
+# Endpoints measured: name → (method, path, JSON body)
+ENDPOINTS = {
+    "healthz": ("GET", "/healthz", None),
+    "analyze": ("POST", "/analyze", {"message": "having a rough week but hanging in"}),
+}
+
+
+class _PassThroughMiddleware(BaseHTTPMiddleware):
+    """BaseHTTPMiddleware layer that only forwards the request."""
+
+    async def dispatch(self, request, call_next):
+        return await call_next(request)
+
+
+# =============================================================================
+# App Construction
+# =============================================================================
+
+
+def build_app(stack: str, engine: Any) -> Any:
+    """
+    Build the production app with the given custom middleware stack.
+
+    Rate limiting is disabled so every request reaches the endpoint.
+
+    Args:
+        stack: One of STACKS
+        engine: Decision engine attached to app.state
+
+    Returns:
+        FastAPI application
+    """
+    from src.api.app import create_app
+
+    app = create_app(enable_rate_limiting=False)
+    app.state.engine = engine
+    app.state.start_time = time.time()
+
+    # The middleware stack is built on first request, so it can still be edited
+    app.user_middleware = [m for m in app.user_middleware if m.cls is not AshMiddleware]
+    if stack == "fused":
+        app.user_middleware.insert(0, Middleware(AshMiddleware))
+    elif stack == "layered":
+        for _ in range(LAYERED_DEPTH):
+            app.user_middleware.insert(0, Middleware(_PassThroughMiddleware))
+    return app
+
+
+# =============================================================================
+# Benchmark
+# =============================================================================
+
+
+async def _time_endpoint(app: Any, endpoint: str, requests: int, warmup: int) -> List[float]:
+    """Issue sequential requests and return per-request latencies (ms)."""
+    import httpx
+
+    method, path, body = ENDPOINTS[endpoint]
+    transport = httpx.ASGITransport(app=app)
+    latencies: List[float] = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        for i in range(warmup + requests):
+            start = time.perf_counter()
+            response = await client.request(method, path, json=body)
+            elapsed = (time.perf_counter() - start) * 1000
+            if response.status_code != 200:
+                raise RuntimeError(f"{method} {path} returned {response.status_code}")
+            if i >= warmup:
+                latencies.append(elapsed)
+    return latencies
+
+
+def run_middleware_benchmark(
+    requests: int = 2000,
+    warmup: int = 100,
+    endpoints: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Time each endpoint under each middleware stack.
+
+    Args:
+        requests: Timed requests per endpoint and stack
+        warmup: Untimed requests first (also fills the response cache)
+        endpoints: Endpoint names (default: all of ENDPOINTS)
+
+    Returns:
+        JSON-friendly results dict
+    """
+    endpoints = list(endpoints or ENDPOINTS)
+    engine = create_benchmark_engine(latency="zero")
+    results: Dict[str, Any] = {
+        "requests": requests,
+        "warmup": warmup,
+        "layered_depth": LAYERED_DEPTH,
+        "endpoints": {},
+    }
+
+    try:
+        for endpoint in endpoints:
+            timings: Dict[str, Dict[str, float]] = {}
+            for stack in STACKS:
+                app = build_app(stack, engine)
+                latencies = asyncio.run(_time_endpoint(app, endpoint, requests, warmup))
+                timings[stack] = summarize_latencies(latencies)
+
+            base = timings["none"]["p50"]
+            overhead = {
+                stack: round(timings[stack]["p50"] - base, 4)
+                for stack in STACKS if stack != "none"
+            }
+            results["endpoints"][endpoint] = {
+                "stacks": timings,
+                "overhead_p50_ms": overhead,
+            }
+            logger.info(
+                f"📈 {endpoint}: "
+                + ", ".join(f"{s} p50={timings[s]['p50']:.3f}ms" for s in STACKS)
+                + f" | overhead fused={overhead['fused']:.3f}ms "
+                f"layered={overhead['layered']:.3f}ms"
+            )
+    finally:
+        engine.shutdown()
+
+    return results
+
+
+# =============================================================================
+# Main Entry Point
+# =============================================================================
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point.
+
+    Returns:
+        Exit code (0 = success)
+    """
+    parser = argparse.ArgumentParser(
+        description="Ash-NLP middleware overhead benchmark (fused ASGI vs layered)"
+    )
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument(
+        "--endpoints",
+        default=",".join(ENDPOINTS),
+        help="Comma-separated endpoint names",
+    )
+    parser.add_argument("--output", default="middleware-benchmark-results.json")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    # Per-request logs would dominate the measurement
+    for noisy in ("src", "httpx"):
+        logging.getLogger(noisy).setLevel(logging.WARNING)
+
+    results = run_middleware_benchmark(
+        requests=args.requests,
+        warmup=args.warmup,
+        endpoints=[e for e in args.endpoints.split(",") if e.strip()],
+    )
+    with open(args.output, "w", encoding="utf-8") as fh:
+        json.dump(results, fh, indent=2)
+    logger.info(f"💾 Middleware benchmark results written to {args.output}")
+    return 0
+
+
+__all__ = [
+    "STACKS",
+    "ENDPOINTS",
+    "build_app",
+    "run_middleware_benchmark",
+    "main",
+]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,245 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+CORE PRINCIPLE: Multi-Model Ensemble → Weighted Decision Engine → Crisis Classification
+******************  CORE SYSTEM VISION (Never to be violated):  ****************
+Ash-NLP is a CRISIS DETECTION BACKEND that:
+1. PRIMARY: Uses BART Zero-Shot Classification for semantic crisis detection
+2. CONTEXTUAL: Enhances with sentiment, irony, and emotion model signals
+3. ENSEMBLE: Combines weighted model outputs through decision engine
+4. PURPOSE: Detect crisis messages in Discord community communications
+********************************************************************************
+Shared-Premise Parity Benchmark for Ash-NLP Service
+---
+FILE VERSION: v5.0-8-23.0-1
+LAST MODIFIED: 2026-02-22
+PHASE: Phase 8 Step 23.0 - Shared-Premise Encoder Reuse
+CLEAN ARCHITECTURE: v5.2.3 Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+
+RESPONSIBILITIES:
+- Score a fixed corpus (seeded synthetic traffic) with the standard
+  zero-shot pipeline and with SharedPremiseScorer on the same model
+- Report per-label score differences, top-label agreement, BART crisis
+  score differences and the latency of both paths
+- Fail (exit code 1) when the largest score difference exceeds --max-delta
+
+Unlike the other benchmarks this one needs the real model (transformers,
+torch and the facebook/bart-large-mnli weights); stubs cannot show parity.
+
+USAGE:
+    python -m src.benchmark.premise_parity --messages 200 --max-delta 0.05
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from src.models import create_bart_classifier, create_shared_premise_scorer
+
+from .harness import summarize_latencies
+from .traffic import create_traffic_generator
+
+# Module version
+__version__ = "v5.0-8-23.0-1"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Largest per-label score difference accepted by default
+DEFAULT_MAX_DELTA = 0.05
+
+
+# =============================================================================
+# Benchmark
+# =============================================================================
+
+
+def run_premise_parity(
+    messages: int = 200,
+    seed: int = 7,
+    multi_label: bool = False,
+    model_id: Optional[str] = None,
+    pipeline: Any = None,
+) -> Dict[str, Any]:
+    """
+    Compare the standard pipeline and shared-premise scoring on one corpus.
+
+    Args:
+        messages: Corpus size (synthetic traffic, fixed by seed)
+        seed: Traffic seed
+        multi_label: Score labels independently
+        model_id: BART model to load (default: the classifier default)
+        pipeline: Already loaded zero-shot pipeline (skips loading)
+
+    Returns:
+        JSON-friendly results dict
+
+    Raises:
+        RuntimeError: If the model cannot be loaded or torch is missing
+    """
+    classifier = create_bart_classifier(config={"model_id": model_id} if model_id else None)
+    if pipeline is None:
+        if not classifier.load():
+            raise RuntimeError(f"Failed to load {classifier.model_id}")
+        pipeline = classifier._pipeline
+
+    scorer = create_shared_premise_scorer(pipeline, cache_size=0)
+    if scorer is None:
+        raise RuntimeError("Shared-premise scoring is not available for this model")
+
+    label_set = classifier.get_label_set()
+    labels = list(label_set.labels)
+    template = label_set.hypothesis_template
+    corpus = [
+        item.message for item in create_traffic_generator(seed=seed).generate(messages)
+    ]
+
+    standard_ms: List[float] = []
+    shared_ms: List[float] = []
+    deltas: List[float] = []
+    crisis_deltas: List[float] = []
+    top_label_matches = 0
+    worst: Dict[str, Any] = {"delta": 0.0}
+
+    for text in corpus:
+        start = time.perf_counter()
+        standard = pipeline(
+            text, candidate_labels=labels, hypothesis_template=template, multi_label=multi_label
+        )
+        standard_ms.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        shared = scorer(
+            text,
+            candidate_labels=labels,
+            hypothesis_template=template,
+            multi_label=multi_label,
+        )
+        shared_ms.append((time.perf_counter() - start) * 1000)
+
+        standard_scores = dict(zip(standard["labels"], standard["scores"]))
+        shared_scores = dict(zip(shared["labels"], shared["scores"]))
+        message_delta = max(
+            abs(standard_scores[label] - shared_scores[label]) for label in labels
+        )
+        deltas.append(message_delta)
+        crisis_deltas.append(
+            abs(
+                label_set.crisis_score(standard_scores)
+                - label_set.crisis_score(shared_scores)
+            )
+        )
+        if standard["labels"][0] == shared["labels"][0]:
+            top_label_matches += 1
+        if message_delta > worst["delta"]:
+            worst = {
+                "delta": message_delta,
+                "message": text[:120],
+                "standard_top": standard["labels"][0],
+                "shared_top": shared["labels"][0],
+            }
+
+    standard_summary = summarize_latencies(standard_ms)
+    shared_summary = summarize_latencies(shared_ms)
+    results = {
+        "model_id": classifier.model_id,
+        "messages": len(corpus),
+        "labels": len(labels),
+        "multi_label": multi_label,
+        "score_delta": {
+            "max": round(max(deltas), 6),
+            "mean": round(sum(deltas) / len(deltas), 6),
+        },
+        "crisis_score_delta": {
+            "max": round(max(crisis_deltas), 6),
+            "mean": round(sum(crisis_deltas) / len(crisis_deltas), 6),
+        },
+        "top_label_agreement": round(top_label_matches / len(corpus), 4),
+        "worst": worst,
+        "latency_ms": {"standard": standard_summary, "shared_premise": shared_summary},
+        "speedup": (
+            round(standard_summary["mean"] / shared_summary["mean"], 3)
+            if shared_summary.get("mean")
+            else None
+        ),
+        "scorer": scorer.get_stats(),
+    }
+
+    logger.info(
+        f"📈 {len(corpus)} messages × {len(labels)} labels: "
+        f"max |Δscore|={results['score_delta']['max']:.4f} "
+        f"mean={results['score_delta']['mean']:.4f} | "
+        f"top-label agreement={results['top_label_agreement']:.2%} | "
+        f"standard={standard_summary['mean']:.1f}ms "
+        f"shared={shared_summary['mean']:.1f}ms (×{results['speedup']})"
+    )
+    return results
+
+
+# =============================================================================
+# Main Entry Point
+# =============================================================================
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point.
+
+    Returns:
+        Exit code (0 = parity within --max-delta, 1 = exceeded, 2 = unavailable)
+    """
+    parser = argparse.ArgumentParser(
+        description="Ash-NLP shared-premise BART parity check (needs the real model)"
+    )
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--multi-label", action="store_true")
+    parser.add_argument("--model-id", default=None)
+    parser.add_argument("--max-delta", type=float, default=DEFAULT_MAX_DELTA)
+    parser.add_argument("--output", default="premise-parity-results.json")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    logging.getLogger("src").setLevel(logging.WARNING)
+
+    try:
+        results = run_premise_parity(
+            messages=args.messages,
+            seed=args.seed,
+            multi_label=args.multi_label,
+            model_id=args.model_id,
+        )
+    except RuntimeError as e:
+        logger.error(f"❌ Parity check unavailable: {e}")
+        return 2
+
+    results["max_delta"] = args.max_delta
+    results["passed"] = results["score_delta"]["max"] <= args.max_delta
+    with open(args.output, "w", encoding="utf-8") as fh:
+        json.dump(results, fh, indent=2)
+    logger.info(f"💾 Parity results written to {args.output}")
+
+    if not results["passed"]:
+        logger.error(
+            f"❌ Score difference {results['score_delta']['max']:.4f} "
+            f"exceeds {args.max_delta}"
+        )
+        return 1
+    return 0
+
+
+__all__ = [
+    "run_premise_parity",
+    "main",
+    "DEFAULT_MAX_DELTA",
+]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
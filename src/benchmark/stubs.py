@@ -0,0 +1,390 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+CORE PRINCIPLE: Multi-Model Ensemble → Weighted Decision Engine → Crisis Classification
+******************  CORE SYSTEM VISION (Never to be violated):  ****************
+Ash-NLP is a CRISIS DETECTION BACKEND that:
+1. PRIMARY: Uses BART Zero-Shot Classification for semantic crisis detection
+2. CONTEXTUAL: Enhances with sentiment, irony, and emotion model signals
+3. ENSEMBLE: Combines weighted model outputs through decision engine
+4. PURPOSE: Detect crisis messages in Discord community communications
+********************************************************************************
+Stub Model Pipelines for Ash-NLP Benchmarks
+---
+FILE VERSION: v5.0-8-17.0-1
+LAST MODIFIED: 2026-02-16
+PHASE: Phase 8 Step 17.0 - Hedged BART Requests
+CLEAN ARCHITECTURE: v5.2.3 Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+
+RESPONSIBILITIES:
+- Provide offline stand-ins for the four HuggingFace pipelines
+- Emit output in the exact shape each real pipeline returns
+- Simulate inference latency (base + per-character cost + jitter, plus
+  an optional occasional stall for tail latency)
+- Build a ModelLoader pre-populated with the REAL wrapper classes
+  (optionally with extra BART replicas)
+
+The stubs replace only the HuggingFace pipeline object. Everything above it
+(BaseModelWrapper.analyze, truncation, _process_output, scoring, Phase 4/5)
+is the production code path, so benchmark numbers reflect real overhead.
+"""
+
+import hashlib
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from src.models import (
+    create_bart_classifier,
+    create_sentiment_analyzer,
+    create_irony_detector,
+    create_emotions_classifier,
+    GOEMOTION_LABELS,
+)
+from src.ensemble.model_loader import REPLICATED_MODEL, ModelLoader
+
+# Module version
+__version__ = "v5.0-8-17.0-1"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Keyword Lexicons (drive deterministic stub scores)
+# =============================================================================
+
+CRISIS_KEYWORDS = (
+    "kill myself",
+    "end it",
+    "suicide",
+    "can't go on",
+    "hopeless",
+    "worthless",
+    "hurt myself",
+    "no point",
+    "give up",
+    "alone",
+)
+
+NEGATIVE_KEYWORDS = (
+    "sad",
+    "tired",
+    "awful",
+    "hate",
+    "angry",
+    "scared",
+    "crying",
+    "lonely",
+)
+
+IRONY_KEYWORDS = ("lol", "lmao", "/s", "jk", "literally dying")
+
+
+# =============================================================================
+# Latency Profile
+# =============================================================================
+
+
+@dataclass
+class StubLatencyProfile:
+    """
+    Simulated inference latency for a stub pipeline.
+
+    Attributes:
+        base_ms: Fixed cost per call
+        per_char_ms: Additional cost per input character
+        jitter_ms: Uniform random jitter added to each call
+        per_label_ms: Extra cost per candidate label (zero-shot only)
+        stall_probability: Chance a call stalls (CPU contention, swap)
+        stall_ms: Extra cost of a stalled call
+    """
+
+    base_ms: float = 0.0
+    per_char_ms: float = 0.0
+    jitter_ms: float = 0.0
+    per_label_ms: float = 0.0
+    stall_probability: float = 0.0
+    stall_ms: float = 0.0
+
+    def delay_seconds(self, text: str, rng: random.Random, labels: int = 0) -> float:
+        """Compute the simulated delay for one call."""
+        delay_ms = (
+            self.base_ms
+            + self.per_char_ms * len(text)
+            + self.per_label_ms * labels
+            + (rng.uniform(0.0, self.jitter_ms) if self.jitter_ms > 0 else 0.0)
+        )
+        if self.stall_probability > 0 and rng.random() < self.stall_probability:
+            delay_ms += self.stall_ms
+        return max(0.0, delay_ms) / 1000.0
+
+
+# Rough CPU-only latencies observed for the production models
+DEFAULT_LATENCY_PROFILES: Dict[str, StubLatencyProfile] = {
+    "bart": StubLatencyProfile(base_ms=40.0, per_char_ms=0.05, jitter_ms=10.0, per_label_ms=4.0),
+    "sentiment": StubLatencyProfile(base_ms=8.0, per_char_ms=0.01, jitter_ms=3.0),
+    "irony": StubLatencyProfile(base_ms=8.0, per_char_ms=0.01, jitter_ms=3.0),
+    "emotions": StubLatencyProfile(base_ms=10.0, per_char_ms=0.01, jitter_ms=3.0),
+}
+
+# Zero latency profile: measures pure framework overhead
+ZERO_LATENCY_PROFILES: Dict[str, StubLatencyProfile] = {
+    name: StubLatencyProfile() for name in DEFAULT_LATENCY_PROFILES
+}
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def _stable_fraction(text: str, salt: str) -> float:
+    """Deterministic pseudo-random fraction in [0, 1) derived from text."""
+    digest = hashlib.md5(f"{salt}:{text}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:4], "big") / 2**32
+
+
+def _keyword_hits(text: str, keywords: tuple) -> int:
+    """Count keyword occurrences in lowercased text."""
+    lowered = text.lower()
+    return sum(1 for kw in keywords if kw in lowered)
+
+
+# =============================================================================
+# Stub Pipelines
+# =============================================================================
+
+
+class StubPipeline:
+    """
+    Base class for stub HuggingFace pipelines.
+
+    Subclasses implement _build_output() returning the same structure as
+    the real pipeline. Latency is simulated with time.sleep, which releases
+    the GIL exactly like real torch inference does.
+    """
+
+    def __init__(
+        self,
+        latency: Optional[StubLatencyProfile] = None,
+        seed: int = 0,
+    ):
+        self.latency = latency or StubLatencyProfile()
+        self._rng = random.Random(seed)
+        self.calls: int = 0
+
+    def _sleep(self, text: str, labels: int = 0) -> None:
+        delay = self.latency.delay_seconds(text, self._rng, labels)
+        if delay > 0:
+            time.sleep(delay)
+
+    def __call__(self, text: Any, **kwargs) -> Any:
+        self.calls += 1
+        # Batched input: one output per text, like HuggingFace pipelines
+        if isinstance(text, list):
+            return [self._build_output(item, **kwargs) for item in text]
+        return self._build_output(text, **kwargs)
+
+    def _build_output(self, text: str, **kwargs) -> Any:
+        raise NotImplementedError
+
+
+class StubZeroShotPipeline(StubPipeline):
+    """Stub for the BART zero-shot-classification pipeline."""
+
+    def _build_output(
+        self,
+        text: str,
+        candidate_labels: Optional[List[str]] = None,
+        multi_label: bool = False,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        labels = list(candidate_labels or [])
+        self._sleep(text, labels=len(labels))
+
+        crisis_hits = _keyword_hits(text, CRISIS_KEYWORDS)
+        raw: Dict[str, float] = {}
+        for label in labels:
+            base = 0.05 + 0.25 * _stable_fraction(text, label)
+            is_safe = label in _SAFE_LABELS
+            if crisis_hits and not is_safe:
+                base += 0.6 * min(1.0, crisis_hits / 2)
+            elif not crisis_hits and is_safe:
+                base += 0.5
+            raw[label] = base
+
+        total = sum(raw.values()) or 1.0
+        ranked = sorted(raw.items(), key=lambda kv: kv[1], reverse=True)
+
+        return {
+            "sequence": text,
+            "labels": [label for label, _ in ranked],
+            "scores": [score / total for _, score in ranked],
+        }
+
+
+class StubSentimentPipeline(StubPipeline):
+    """Stub for the Cardiff sentiment text-classification pipeline."""
+
+    def _build_output(self, text: str, **kwargs) -> List[Dict[str, Any]]:
+        self._sleep(text)
+        negative = min(
+            0.95,
+            0.15
+            + 0.3 * _keyword_hits(text, NEGATIVE_KEYWORDS)
+            + 0.4 * _keyword_hits(text, CRISIS_KEYWORDS)
+            + 0.1 * _stable_fraction(text, "neg"),
+        )
+        positive = (1.0 - negative) * (0.3 + 0.4 * _stable_fraction(text, "pos"))
+        neutral = max(0.0, 1.0 - negative - positive)
+        return [
+            {"label": "LABEL_0", "score": negative},
+            {"label": "LABEL_1", "score": neutral},
+            {"label": "LABEL_2", "score": positive},
+        ]
+
+
+class StubIronyPipeline(StubPipeline):
+    """Stub for the Cardiff irony text-classification pipeline."""
+
+    def _build_output(self, text: str, **kwargs) -> List[Dict[str, Any]]:
+        self._sleep(text)
+        irony = min(
+            0.95,
+            0.05
+            + 0.35 * _keyword_hits(text, IRONY_KEYWORDS)
+            + 0.1 * _stable_fraction(text, "irony"),
+        )
+        return [
+            {"label": "LABEL_0", "score": 1.0 - irony},
+            {"label": "LABEL_1", "score": irony},
+        ]
+
+
+class StubEmotionsPipeline(StubPipeline):
+    """Stub for the RoBERTa GoEmotions text-classification pipeline."""
+
+    def _build_output(self, text: str, **kwargs) -> List[Dict[str, Any]]:
+        self._sleep(text)
+        negative = _keyword_hits(text, NEGATIVE_KEYWORDS) + _keyword_hits(
+            text, CRISIS_KEYWORDS
+        )
+        raw = {
+            label: 0.01 + 0.05 * _stable_fraction(text, label)
+            for label in GOEMOTION_LABELS
+        }
+        if negative:
+            raw["sadness"] += 0.4 * min(1.0, negative / 2)
+            raw["grief"] += 0.2 * min(1.0, negative / 2)
+        else:
+            raw["neutral"] += 0.5
+        total = sum(raw.values())
+        ranked = sorted(raw.items(), key=lambda kv: kv[1], reverse=True)
+        return [{"label": label, "score": score / total} for label, score in ranked]
+
+
+# Safe labels as used by BARTCrisisClassifier.is_crisis_label()
+_SAFE_LABELS = {
+    "casual conversation",
+    "positive sharing",
+    "seeking information",
+    "general discussion",
+}
+
+STUB_PIPELINES = {
+    "bart": StubZeroShotPipeline,
+    "sentiment": StubSentimentPipeline,
+    "irony": StubIronyPipeline,
+    "emotions": StubEmotionsPipeline,
+}
+
+MODEL_WRAPPER_FACTORIES = {
+    "bart": create_bart_classifier,
+    "sentiment": create_sentiment_analyzer,
+    "irony": create_irony_detector,
+    "emotions": create_emotions_classifier,
+}
+
+
+# =============================================================================
+# FACTORY FUNCTION - Clean Architecture v5.1 Compliance (Rule #1)
+# =============================================================================
+
+
+def create_stub_model_loader(
+    latency_profiles: Optional[Dict[str, StubLatencyProfile]] = None,
+    seed: int = 0,
+    config_manager: Optional[Any] = None,
+    bart_replicas: int = 1,
+) -> ModelLoader:
+    """
+    Factory function for a ModelLoader backed by stub pipelines.
+
+    The real wrapper classes are instantiated and their pipeline is
+    swapped for a stub, so the engine exercises the production
+    analyze() path without transformers, torch or model downloads.
+
+    Args:
+        latency_profiles: Per-model simulated latency (default: CPU-like)
+        seed: Seed for latency jitter
+        config_manager: ConfigManager for wrapper settings (labels, weights)
+        bart_replicas: BART instances, each with its own stub pipeline
+
+    Returns:
+        ModelLoader with all four models "loaded"
+
+    Example:
+        >>> loader = create_stub_model_loader(ZERO_LATENCY_PROFILES)
+        >>> engine = EnsembleDecisionEngine(model_loader=loader)
+    """
+    profiles = latency_profiles or DEFAULT_LATENCY_PROFILES
+
+    # lazy_load=True so the constructor does not try to load real models;
+    # get_model() returns pre-populated entries before any lazy load.
+    loader = ModelLoader(
+        config_manager=config_manager,
+        lazy_load=True,
+        warmup_on_load=False,
+        bart_replicas=bart_replicas,
+    )
+
+    def build(name: str, factory: Any, pipeline_seed: int) -> Any:
+        model = factory(config_manager=config_manager)
+        model._pipeline = STUB_PIPELINES[name](
+            latency=profiles.get(name), seed=pipeline_seed
+        )
+        model._is_loaded = True
+        model._actual_device = "stub"
+        return model
+
+    for offset, (name, factory) in enumerate(MODEL_WRAPPER_FACTORIES.items()):
+        loader._models[name] = build(name, factory, seed + offset)
+        loader._models_loaded += 1
+
+    loader._replicas[REPLICATED_MODEL] = [
+        build(REPLICATED_MODEL, MODEL_WRAPPER_FACTORIES[REPLICATED_MODEL], seed + 100 + i)
+        for i in range(loader.bart_replicas - 1)
+    ]
+
+    loader._is_initialized = True
+
+    logger.info(f"🧪 Stub ModelLoader ready ({len(loader._models)} stub models)")
+
+    return loader
+
+
+__all__ = [
+    "StubLatencyProfile",
+    "StubPipeline",
+    "StubZeroShotPipeline",
+    "StubSentimentPipeline",
+    "StubIronyPipeline",
+    "StubEmotionsPipeline",
+    "DEFAULT_LATENCY_PROFILES",
+    "ZERO_LATENCY_PROFILES",
+    "create_stub_model_loader",
+]
@@ -0,0 +1,316 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+CORE PRINCIPLE: Multi-Model Ensemble → Weighted Decision Engine → Crisis Classification
+******************  CORE SYSTEM VISION (Never to be violated):  ****************
+Ash-NLP is a CRISIS DETECTION BACKEND that:
+1. PRIMARY: Uses BART Zero-Shot Classification for semantic crisis detection
+2. CONTEXTUAL: Enhances with sentiment, irony, and emotion model signals
+3. ENSEMBLE: Combines weighted model outputs through decision engine
+4. PURPOSE: Detect crisis messages in Discord community communications
+********************************************************************************
+Synthetic Discord Traffic Generator for Ash-NLP Benchmarks
+---
+FILE VERSION: v5.0-8-1.0-1
+LAST MODIFIED: 2026-02-02
+PHASE: Phase 8 Step 1.0 - Performance Benchmark Harness
+CLEAN ARCHITECTURE: v5.2.3 Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+
+RESPONSIBILITIES:
+- Generate reproducible Discord-like message streams
+- Model message length distribution (log-normal, capped)
+- Model repeat rate (copy/paste, "same" replies) to exercise the cache
+- Attach per-user message_history with realistic sizes and timestamps
+- Mix in a configurable share of crisis-flavoured messages
+"""
+
+import logging
+import math
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+# Module version
+__version__ = "v5.0-8-1.0-1"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Vocabulary
+# =============================================================================
+
+_CASUAL_FRAGMENTS = [
+    "anyone up for a game tonight",
+    "just finished my shift",
+    "that new episode was wild",
+    "lol same",
+    "good morning everyone",
+    "has anyone tried the new update",
+    "my cat knocked over my coffee again",
+    "thanks for the help earlier",
+    "what are we doing this weekend",
+    "ngl that build is kind of cracked",
+    "brb grabbing food",
+    "i love this server",
+]
+
+_NEGATIVE_FRAGMENTS = [
+    "i'm so tired of everything",
+    "today was awful",
+    "i feel really sad and i don't know why",
+    "i hate how lonely it gets at night",
+    "i've been crying all day",
+    "everyone is angry at me",
+]
+
+_CRISIS_FRAGMENTS = [
+    "i feel hopeless and worthless",
+    "there's no point anymore",
+    "i just want to give up",
+    "i can't go on like this",
+    "i think about how to end it",
+    "i want to hurt myself",
+]
+
+
+# =============================================================================
+# Traffic Profile
+# =============================================================================
+
+
+@dataclass
+class TrafficProfile:
+    """
+    Shape of the synthetic traffic.
+
+    Attributes:
+        seed: RNG seed (same seed → same stream)
+        users: Number of distinct users posting
+        length_median: Median message length in characters
+        length_sigma: Log-normal sigma for message length
+        length_max: Hard cap on message length (API allows 10000)
+        repeat_rate: Probability a message repeats a recent message verbatim
+        negative_rate: Probability a message is negative (non-crisis)
+        crisis_rate: Probability a message contains crisis language
+        history_sizes: Candidate history sizes per request
+        history_weights: Relative weight of each candidate history size
+        history_scored_rate: Probability a history item carries crisis_score
+        mean_gap_minutes: Mean minutes between a user's messages
+    """
+
+    seed: int = 42
+    users: int = 200
+    length_median: int = 60
+    length_sigma: float = 0.9
+    length_max: int = 2000
+    repeat_rate: float = 0.15
+    negative_rate: float = 0.15
+    crisis_rate: float = 0.05
+    history_sizes: List[int] = field(default_factory=lambda: [0, 3, 10, 20])
+    history_weights: List[float] = field(default_factory=lambda: [0.4, 0.3, 0.2, 0.1])
+    history_scored_rate: float = 1.0
+    mean_gap_minutes: float = 12.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON results."""
+        return {
+            "seed": self.seed,
+            "users": self.users,
+            "length_median": self.length_median,
+            "length_sigma": self.length_sigma,
+            "length_max": self.length_max,
+            "repeat_rate": self.repeat_rate,
+            "negative_rate": self.negative_rate,
+            "crisis_rate": self.crisis_rate,
+            "history_sizes": list(self.history_sizes),
+            "history_weights": list(self.history_weights),
+            "history_scored_rate": self.history_scored_rate,
+            "mean_gap_minutes": self.mean_gap_minutes,
+        }
+
+
+@dataclass
+class SyntheticRequest:
+    """
+    One synthetic /analyze request.
+
+    Attributes:
+        message: Message text
+        user_id: Discord-like user ID
+        message_history: History dicts in the engine's expected format
+        is_repeat: Whether the message repeats an earlier one
+        kind: casual, negative or crisis
+    """
+
+    message: str
+    user_id: str
+    message_history: List[Dict[str, Any]] = field(default_factory=list)
+    is_repeat: bool = False
+    kind: str = "casual"
+
+    def to_api_payload(self) -> Dict[str, Any]:
+        """Build the JSON body for POST /analyze."""
+        payload: Dict[str, Any] = {
+            "message": self.message,
+            "user_id": self.user_id,
+        }
+        if self.message_history:
+            payload["message_history"] = self.message_history
+        return payload
+
+
+# =============================================================================
+# Generator
+# =============================================================================
+
+
+class SyntheticTrafficGenerator:
+    """
+    Reproducible Discord-like traffic generator.
+
+    Clean Architecture v5.1 Compliance:
+    - Factory function: create_traffic_generator()
+    """
+
+    _RECENT_WINDOW = 50
+
+    def __init__(self, profile: Optional[TrafficProfile] = None):
+        """
+        Initialize generator.
+
+        Args:
+            profile: Traffic profile (defaults to TrafficProfile())
+        """
+        self.profile = profile or TrafficProfile()
+        self._rng = random.Random(self.profile.seed)
+        self._recent: List[str] = []
+        self._clock = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+        logger.debug(f"🎲 SyntheticTrafficGenerator initialized (seed={self.profile.seed})")
+
+    def _target_length(self) -> int:
+        """Sample a message length from the log-normal distribution."""
+        mu = math.log(max(1, self.profile.length_median))
+        length = int(self._rng.lognormvariate(mu, self.profile.length_sigma))
+        return max(2, min(self.profile.length_max, length))
+
+    def _compose(self, kind: str) -> str:
+        """Compose a message of the given kind near a sampled length."""
+        pool = {
+            "crisis": _CRISIS_FRAGMENTS,
+            "negative": _NEGATIVE_FRAGMENTS,
+        }.get(kind, _CASUAL_FRAGMENTS)
+
+        target = self._target_length()
+        parts = [self._rng.choice(pool)]
+        while sum(len(p) + 1 for p in parts) < target:
+            # Crisis/negative messages are mostly padded with casual text
+            filler_pool = pool if self._rng.random() < 0.3 else _CASUAL_FRAGMENTS
+            parts.append(self._rng.choice(filler_pool))
+        text = ". ".join(parts)
+        return text[: self.profile.length_max]
+
+    def _sample_kind(self) -> str:
+        roll = self._rng.random()
+        if roll < self.profile.crisis_rate:
+            return "crisis"
+        if roll < self.profile.crisis_rate + self.profile.negative_rate:
+            return "negative"
+        return "casual"
+
+    def _sample_history_size(self) -> int:
+        return self._rng.choices(
+            self.profile.history_sizes, weights=self.profile.history_weights, k=1
+        )[0]
+
+    def _build_history(self, size: int) -> List[Dict[str, Any]]:
+        """Build history items oldest → newest, ending before the clock."""
+        history: List[Dict[str, Any]] = []
+        ts = self._clock
+        for _ in range(size):
+            gap = self._rng.expovariate(1.0 / self.profile.mean_gap_minutes)
+            ts = ts - timedelta(minutes=max(0.1, gap))
+            kind = self._sample_kind()
+            item: Dict[str, Any] = {
+                "message": self._compose(kind),
+                "timestamp": ts.isoformat(),
+            }
+            if self._rng.random() < self.profile.history_scored_rate:
+                base = {"crisis": 0.75, "negative": 0.4}.get(kind, 0.1)
+                item["crisis_score"] = round(
+                    max(0.0, min(1.0, base + self._rng.uniform(-0.1, 0.1))), 4
+                )
+            history.append(item)
+        history.reverse()
+        return history
+
+    def next_request(self) -> SyntheticRequest:
+        """Generate the next synthetic request."""
+        self._clock += timedelta(seconds=self._rng.expovariate(1.0 / 5.0))
+        user_id = f"user_{self._rng.randrange(self.profile.users):05d}"
+
+        if self._recent and self._rng.random() < self.profile.repeat_rate:
+            message = self._rng.choice(self._recent)
+            kind = "repeat"
+            is_repeat = True
+        else:
+            kind = self._sample_kind()
+            message = self._compose(kind)
+            is_repeat = False
+            self._recent.append(message)
+            if len(self._recent) > self._RECENT_WINDOW:
+                self._recent.pop(0)
+
+        return SyntheticRequest(
+            message=message,
+            user_id=user_id,
+            message_history=self._build_history(self._sample_history_size()),
+            is_repeat=is_repeat,
+            kind=kind,
+        )
+
+    def generate(self, count: int) -> List[SyntheticRequest]:
+        """Generate a list of synthetic requests."""
+        return [self.next_request() for _ in range(count)]
+
+    def stream(self, count: int) -> Iterator[SyntheticRequest]:
+        """Yield synthetic requests lazily."""
+        for _ in range(count):
+            yield self.next_request()
+
+
+# =============================================================================
+# FACTORY FUNCTION - Clean Architecture v5.1 Compliance (Rule #1)
+# =============================================================================
+
+
+def create_traffic_generator(
+    profile: Optional[TrafficProfile] = None,
+    seed: Optional[int] = None,
+) -> SyntheticTrafficGenerator:
+    """
+    Factory function for SyntheticTrafficGenerator.
+
+    Args:
+        profile: Traffic profile (optional)
+        seed: Override the profile seed (optional)
+
+    Returns:
+        Configured SyntheticTrafficGenerator instance
+    """
+    profile = profile or TrafficProfile()
+    if seed is not None:
+        profile.seed = seed
+    return SyntheticTrafficGenerator(profile=profile)
+
+
+__all__ = [
+    "TrafficProfile",
+    "SyntheticRequest",
+    "SyntheticTrafficGenerator",
+    "create_traffic_generator",
+]
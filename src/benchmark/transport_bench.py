@@ -0,0 +1,409 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+CORE PRINCIPLE: Multi-Model Ensemble → Weighted Decision Engine → Crisis Classification
+******************  CORE SYSTEM VISION (Never to be violated):  ****************
+Ash-NLP is a CRISIS DETECTION BACKEND that:
+1. PRIMARY: Uses BART Zero-Shot Classification for semantic crisis detection
+2. CONTEXTUAL: Enhances with sentiment, irony, and emotion model signals
+3. ENSEMBLE: Combines weighted model outputs through decision engine
+4. PURPOSE: Detect crisis messages in Discord community communications
+********************************************************************************
+Transport Encoding Benchmark for Ash-NLP Service
+---
+FILE VERSION: v5.0-8-14.0-1
+LAST MODIFIED: 2026-02-13
+PHASE: Phase 8 Step 14.0 - MessagePack Content Negotiation
+CLEAN ARCHITECTURE: v5.2.3 Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+
+RESPONSIBILITIES:
+- Compare JSON and MessagePack for the bot ↔ NLP hop:
+    payload size, encode and decode time per document
+- Documents: /analyze requests with 0-200 history items, full and
+  compact /analyze responses, a 100-message /analyze/batch response
+- Round-trip check: decode(encode(doc)) == doc for both encodings, and
+  /analyze answers the same document over JSON and MessagePack
+- End-to-end /analyze latency per encoding through the ASGI app
+- Write machine-readable JSON results (same layout style as the harness)
+
+Exits non-zero when any round trip differs.
+
+USAGE:
+    python -m src.benchmark.transport_bench --iterations 2000 --output transport.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.api.serialization import (
+    MSGPACK_AVAILABLE,
+    MSGPACK_MEDIA_TYPE,
+    ORJSON_AVAILABLE,
+    build_analyze_payload,
+    dumps,
+    packb,
+    resolve_projection,
+    unpackb,
+)
+
+from .harness import create_benchmark_engine, summarize_latencies
+
+# Module version
+__version__ = "v5.0-8-14.0-1"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# History lengths for request documents
+HISTORY_SIZES = (0, 20, 100, 200)
+
+# Messages in the batch response document
+BATCH_SIZE = 100
+
+# Response fields that legitimately differ between two requests
+VOLATILE_FIELDS = ("timestamp", "processing_time_ms", "request_id")
+
+
+def _json_loads() -> Callable[[bytes], Any]:
+    """Fastest available JSON decoder."""
+    if ORJSON_AVAILABLE:
+        import orjson
+
+        return orjson.loads
+    return json.loads
+
+
+# =============================================================================
+# Documents
+# =============================================================================
+
+
+def build_request(history: int) -> Dict[str, Any]:
+    """Build an /analyze request body with the given history length."""
+    now = datetime(2026, 2, 13, 12, 0, tzinfo=timezone.utc)
+    return {
+        "message": "I don't know if I can keep going anymore",
+        "user_id": "user_12345",
+        "channel_id": "general",
+        "user_timezone": "America/New_York",
+        "message_history": [
+            {
+                "message": f"history message {i}: not having the best day honestly",
+                "timestamp": (now - timedelta(minutes=15 * (history - i))).isoformat(),
+                "crisis_score": round(0.1 + 0.8 * i / max(1, history), 4),
+            }
+            for i in range(history)
+        ],
+    }
+
+
+def build_documents(engine: Any) -> Dict[str, Any]:
+    """
+    Build the documents compared.
+
+    Args:
+        engine: Decision engine used to produce realistic responses
+
+    Returns:
+        Document name → JSON-compatible document
+    """
+    documents: Dict[str, Any] = {}
+    for size in HISTORY_SIZES:
+        documents[f"request_history_{size}"] = build_request(size)
+
+    request = build_request(20)
+    assessment = engine.analyze(
+        message=request["message"],
+        message_history=request["message_history"],
+        use_cache=False,
+    )
+    documents["response_full"] = build_analyze_payload(assessment, request_id="req_bench")
+    documents["response_compact"] = build_analyze_payload(
+        assessment,
+        request_id="req_bench",
+        fields=resolve_projection(compact=True),
+    )
+
+    results = []
+    for idx in range(BATCH_SIZE):
+        item = engine.analyze(message=f"batch message {idx}", include_explanation=False)
+        results.append({
+            "index": idx,
+            "message_preview": f"batch message {idx}",
+            "crisis_detected": item.crisis_detected,
+            "severity": item.severity.value,
+            "crisis_score": item.crisis_score,
+            "requires_intervention": item.requires_intervention,
+            "requires_review": False,
+            "vigil_status": None,
+            "explanation_summary": None,
+        })
+    documents["response_batch"] = {
+        "total_messages": BATCH_SIZE,
+        "crisis_count": sum(1 for r in results if r["crisis_detected"]),
+        "critical_count": 0,
+        "high_count": 0,
+        "review_count": 0,
+        "results": results,
+        "processing_time_ms": 0.0,
+        "request_id": "req_bench",
+        "timestamp": "2026-02-13T12:00:00",
+    }
+    return documents
+
+
+# =============================================================================
+# Codec Benchmark
+# =============================================================================
+
+
+def _time_codec(
+    document: Any,
+    encode: Callable[[Any], bytes],
+    decode: Callable[[bytes], Any],
+    iterations: int,
+) -> Dict[str, Any]:
+    """Time encode/decode of one document and check the round trip."""
+    encoded = encode(document)
+    round_trip = decode(encoded) == document
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        encode(document)
+    encode_us = (time.perf_counter() - start) / iterations * 1e6
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        decode(encoded)
+    decode_us = (time.perf_counter() - start) / iterations * 1e6
+
+    return {
+        "bytes": len(encoded),
+        "encode_us": round(encode_us, 2),
+        "decode_us": round(decode_us, 2),
+        "round_trip": round_trip,
+    }
+
+
+def run_codec_benchmark(documents: Dict[str, Any], iterations: int) -> Dict[str, Any]:
+    """
+    Compare JSON and MessagePack on each document.
+
+    Returns:
+        Document name → {"json": {...}, "msgpack": {...}, "size_ratio": float}
+    """
+    codecs: List[Tuple[str, Callable[[Any], bytes], Callable[[bytes], Any]]] = [
+        ("json", dumps, _json_loads()),
+    ]
+    if MSGPACK_AVAILABLE:
+        codecs.append(("msgpack", packb, unpackb))
+
+    results: Dict[str, Any] = {}
+    for name, document in documents.items():
+        entry = {
+            codec: _time_codec(document, encode, decode, iterations)
+            for codec, encode, decode in codecs
+        }
+        if "msgpack" in entry:
+            entry["size_ratio"] = round(entry["msgpack"]["bytes"] / entry["json"]["bytes"], 3)
+        results[name] = entry
+        logger.info(
+            f"📦 {name}: "
+            + ", ".join(
+                f"{codec} {entry[codec]['bytes']}B "
+                f"enc={entry[codec]['encode_us']:.1f}us dec={entry[codec]['decode_us']:.1f}us"
+                for codec, _, _ in codecs
+            )
+        )
+    return results
+
+
+# =============================================================================
+# End-to-End Benchmark
+# =============================================================================
+
+
+async def _time_analyze(
+    app: Any,
+    body: Dict[str, Any],
+    encoding: str,
+    requests: int,
+    warmup: int,
+) -> Tuple[List[float], Dict[str, Any]]:
+    """Issue /analyze requests in one encoding; return latencies and last response."""
+    import httpx
+
+    if encoding == "msgpack":
+        content = packb(body)
+        headers = {"content-type": MSGPACK_MEDIA_TYPE, "accept": MSGPACK_MEDIA_TYPE}
+        decode = unpackb
+    else:
+        content = dumps(body)
+        headers = {"content-type": "application/json", "accept": "application/json"}
+        decode = _json_loads()
+
+    transport = httpx.ASGITransport(app=app)
+    latencies: List[float] = []
+    document: Dict[str, Any] = {}
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        for i in range(warmup + requests):
+            start = time.perf_counter()
+            response = await client.post("/analyze", content=content, headers=headers)
+            document = decode(response.content)
+            elapsed = (time.perf_counter() - start) * 1000
+            if response.status_code != 200:
+                raise RuntimeError(f"/analyze ({encoding}) returned {response.status_code}")
+            if i >= warmup:
+                latencies.append(elapsed)
+    return latencies, document
+
+
+def run_endpoint_benchmark(
+    engine: Any,
+    requests: int,
+    warmup: int,
+    history: int = 100,
+) -> Dict[str, Any]:
+    """
+    Time /analyze over each encoding and compare the decoded responses.
+
+    Returns:
+        {"encodings": {encoding: latency summary}, "round_trip": bool}
+    """
+    from src.api.app import create_app
+
+    app = create_app(enable_rate_limiting=False)
+    app.state.engine = engine
+    app.state.start_time = time.time()
+
+    body = build_request(history)
+    encodings = ["json", "msgpack"] if MSGPACK_AVAILABLE else ["json"]
+    timings: Dict[str, Dict[str, float]] = {}
+    documents: Dict[str, Dict[str, Any]] = {}
+    for encoding in encodings:
+        latencies, document = asyncio.run(
+            _time_analyze(app, body, encoding, requests, warmup)
+        )
+        timings[encoding] = summarize_latencies(latencies)
+        documents[encoding] = {
+            k: v for k, v in document.items() if k not in VOLATILE_FIELDS
+        }
+
+    round_trip = all(doc == documents["json"] for doc in documents.values())
+    logger.info(
+        f"📈 /analyze (history={history}): "
+        + ", ".join(f"{e} p50={timings[e]['p50']:.3f}ms" for e in encodings)
+        + f" | same document: {round_trip}"
+    )
+    return {
+        "history": history,
+        "requests": requests,
+        "encodings": timings,
+        "round_trip": round_trip,
+    }
+
+
+def run_transport_benchmark(
+    iterations: int = 2000,
+    requests: int = 300,
+    warmup: int = 30,
+) -> Dict[str, Any]:
+    """
+    Run the codec and end-to-end comparisons.
+
+    Args:
+        iterations: Encode/decode repetitions per document
+        requests: Timed /analyze requests per encoding
+        warmup: Untimed /analyze requests first
+
+    Returns:
+        JSON-friendly results dict
+    """
+    engine = create_benchmark_engine(latency="zero")
+    try:
+        documents = build_documents(engine)
+        results: Dict[str, Any] = {
+            "orjson": ORJSON_AVAILABLE,
+            "msgpack": MSGPACK_AVAILABLE,
+            "iterations": iterations,
+            "documents": run_codec_benchmark(documents, iterations),
+            "endpoint": run_endpoint_benchmark(engine, requests, warmup),
+        }
+    finally:
+        engine.shutdown()
+
+    results["round_trip_ok"] = results["endpoint"]["round_trip"] and all(
+        codec["round_trip"]
+        for entry in results["documents"].values()
+        for key, codec in entry.items()
+        if key != "size_ratio"
+    )
+    return results
+
+
+# =============================================================================
+# Main Entry Point
+# =============================================================================
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point.
+
+    Returns:
+        Exit code (0 = success, 1 = round trip mismatch)
+    """
+    parser = argparse.ArgumentParser(
+        description="Ash-NLP transport encoding benchmark (JSON vs MessagePack)"
+    )
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--warmup", type=int, default=30)
+    parser.add_argument("--output", default="transport-benchmark-results.json")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    # Per-request logs would dominate the measurement
+    for noisy in ("src", "httpx"):
+        logging.getLogger(noisy).setLevel(logging.WARNING)
+
+    if not MSGPACK_AVAILABLE:
+        logger.warning("⚠️ msgpack not installed - reporting JSON only")
+
+    results = run_transport_benchmark(
+        iterations=args.iterations,
+        requests=args.requests,
+        warmup=args.warmup,
+    )
+    with open(args.output, "w", encoding="utf-8") as fh:
+        json.dump(results, fh, indent=2)
+    logger.info(f"💾 Transport benchmark results written to {args.output}")
+
+    if not results["round_trip_ok"]:
+        logger.error("❌ Round trip mismatch - see results file")
+        return 1
+    return 0
+
+
+__all__ = [
+    "HISTORY_SIZES",
+    "build_request",
+    "build_documents",
+    "run_codec_benchmark",
+    "run_endpoint_benchmark",
+    "run_transport_benchmark",
+    "main",
+]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,9 +13,9 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Ash-Vigil HTTP Client - Mental Health Risk Detection Integration
 ----------------------------------------------------------------------------
-FILE VERSION: v5.0-3-1.0-2
-LAST MODIFIED: 2026-01-31
-PHASE: Phase 3 - Ash-Vigil Integration
+FILE VERSION: v5.0-8-3.0-1
+LAST MODIFIED: 2026-02-03
+PHASE: Phase 8 Step 3.0 - Live Request Path Metrics
 CLEAN ARCHITECTURE: v5.2.3 Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-nlp
 ============================================================================
@@ -28,6 +28,7 @@ Features:
 - Circuit breaker pattern for fault tolerance
 - Retry logic with exponential backoff
 - Comprehensive logging with Charter-compliant colorization
+- Prometheus call counts by status and latency histogram (Phase 8)
 
 The client is designed to fail gracefully - if Vigil is unavailable,
 Ash-NLP continues with base ensemble scoring while flagging the message
@@ -55,11 +56,13 @@ from typing import Any, Dict, Optional, TYPE_CHECKING
 
 import httpx
 
+from src.utils.metrics import record_vigil_request
+
 if TYPE_CHECKING:
     from src.managers.config_manager import ConfigManager
 
 # Module version
-__version__ = "v5.0-3-1.0-2"
+__version__ = "v5.0-8-3.0-1"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -519,6 +522,7 @@ class VigilClient:
         if not self._circuit_breaker.should_allow_call():
             self._last_status = VigilStatus.CIRCUIT_OPEN
             self._failed_requests += 1
+            record_vigil_request(VigilStatus.CIRCUIT_OPEN.value)
             logger.debug(f"Vigil call blocked by circuit breaker")
             return None
         
@@ -534,6 +538,9 @@ class VigilClient:
                 self._last_status = VigilStatus.USED
                 self._successful_requests += 1
                 self._total_latency_ms += result.inference_time_ms
+                record_vigil_request(
+                    VigilStatus.USED.value, result.inference_time_ms
+                )
                 
                 return result
                 
@@ -578,6 +585,7 @@ class VigilClient:
         # Update status based on circuit state after failure
         if self._circuit_breaker.is_open:
             self._last_status = VigilStatus.CIRCUIT_OPEN
+        record_vigil_request(self._last_status.value)
         
         logger.warning(
             f"❌ Vigil call failed after {self.retry_attempts + 1} attempts: "
@@ -60,7 +60,7 @@ USAGE:
 """
 
 # Module version
-__version__ = "v5.0-5-1.0-1"
+__version__ = "v5.0-8-7.0-1"
 
 # =============================================================================
 # Context Analyzer (Main Interface)
@@ -129,6 +129,34 @@ from .trend_analyzer import (
     create_trend_analyzer,
 )
 
+# =============================================================================
+# User History Store (Phase 8)
+# =============================================================================
+
+from .history_store import (
+    UserHistoryStore,
+    create_user_history_store,
+)
+
+# =============================================================================
+# Incremental Context Window (Phase 8)
+# =============================================================================
+
+from .context_window import (
+    ContextWindow,
+    create_context_window,
+)
+
+# =============================================================================
+# Background Escalation Sweep (Phase 8)
+# =============================================================================
+
+from .escalation_sweep import (
+    EscalationSweeper,
+    SweepAlert,
+    create_escalation_sweeper,
+)
+
 # =============================================================================
 # Public API
 # =============================================================================
@@ -186,4 +214,14 @@ __all__ = [
     "TrendAnalysis",
     "TrendAnalyzer",
     "create_trend_analyzer",
+    # History store
+    "UserHistoryStore",
+    "create_user_history_store",
+    # Incremental context window
+    "ContextWindow",
+    "create_context_window",
+    # Background escalation sweep
+    "EscalationSweeper",
+    "SweepAlert",
+    "create_escalation_sweeper",
 ]
@@ -10,9 +10,9 @@ Ash-NLP is a CRISIS DETECTION BACKEND that:
 ********************************************************************************
 Context Analyzer for Ash-NLP Service - Phase 5 (Main Orchestrator)
 ---
-FILE VERSION: v5.0-5-1.0-1
-LAST MODIFIED: 2026-01-01
-PHASE: Phase 5 - Context History Analysis
+FILE VERSION: v5.0-8-13.0-1
+LAST MODIFIED: 2026-02-12
+PHASE: Phase 8 Step 13.0 - Fast Response Serialization
 CLEAN ARCHITECTURE: v5.1 Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-nlp
 Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
@@ -25,10 +25,18 @@ RESPONSIBILITIES:
 - Manage message history processing
 
 KEY ARCHITECTURAL DECISION:
-Ash-NLP remains STATELESS. Message history is provided by Ash-Bot in each request.
+Ash-NLP remains STATELESS by default. Message history is provided by Ash-Bot in
+each request. Phase 8: when a UserHistoryStore is configured and a request
+carries user_id without message_history, the stored (timestamp, score) buffer
+is used instead. Request-supplied history always takes precedence.
+Phase 8 Step 7: store-backed users keep an incremental ContextWindow so each
+request updates O(1) accumulators instead of rescanning the whole history.
 """
 
 import logging
+import threading
+import time
+from collections import OrderedDict
 from enum import Enum
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass, field
@@ -60,9 +68,19 @@ from .trend_analyzer import (
     TrendVelocity,
     TrendAnalysis,
 )
+from .history_store import (
+    UserHistoryStore,
+    create_user_history_store,
+    to_epoch,
+    from_epoch,
+)
+from .context_window import (
+    ContextWindow,
+    create_context_window,
+)
 
 # Module version
-__version__ = "v5.0-5-1.0-2"
+__version__ = "v5.0-8-13.0-1"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -182,6 +200,8 @@ class TemporalResult:
     time_risk_modifier: float = 1.0
     hour_of_day: int = 12
     is_weekend: bool = False
+    user_timezone: Optional[str] = None  # FE-001
+    local_hour: Optional[int] = None  # FE-001
 
 
 @dataclass
@@ -218,6 +238,9 @@ class HistoryMetadata:
     message_count: int = 0
     time_span_hours: float = 0.0
     analysis_timestamp: Optional[datetime] = None
+    history_source: str = "request"
+    scores_computed: int = 0
+    scores_cached: int = 0
 
 
 @dataclass
@@ -257,11 +280,16 @@ class ContextAnalysisResult:
                 "late_night_risk": self.temporal.late_night_risk,
                 "rapid_posting": self.temporal.rapid_posting,
                 "time_risk_modifier": self.temporal.time_risk_modifier,
+                "hour_of_day": self.temporal.hour_of_day,
+                "is_weekend": self.temporal.is_weekend,
+                "user_timezone": self.temporal.user_timezone,
+                "local_hour": self.temporal.local_hour,
             },
             
             "trajectory": {
                 "start_score": self.trajectory.start_score,
                 "end_score": self.trajectory.end_score,
+                "peak_score": self.trajectory.max_score,
                 "scores": self.trajectory.scores,
             },
             
@@ -269,6 +297,17 @@ class ContextAnalysisResult:
                 "urgency": self.intervention.urgency,
                 "recommended_point": self.intervention.recommended_point,
                 "intervention_delayed": self.intervention.intervention_delayed,
+                "reason": self.intervention.reason,
+            },
+            
+            "history_analyzed": {
+                "message_count": self.metadata.message_count,
+                "time_span_hours": self.metadata.time_span_hours,
+                "oldest_timestamp": None,
+                "newest_timestamp": None,
+                "source": self.metadata.history_source,
+                "scores_computed": self.metadata.scores_computed,
+                "scores_cached": self.metadata.scores_cached,
             },
         }
 
@@ -300,6 +339,7 @@ class ContextAnalyzer:
         escalation_detector: Optional[EscalationDetector] = None,
         temporal_detector: Optional[TemporalDetector] = None,
         trend_analyzer: Optional[TrendAnalyzer] = None,
+        history_store: Optional[UserHistoryStore] = None,
     ):
         """
         Initialize ContextAnalyzer.
@@ -309,6 +349,7 @@ class ContextAnalyzer:
             escalation_detector: Optional injected escalation detector
             temporal_detector: Optional injected temporal detector
             trend_analyzer: Optional injected trend analyzer
+            history_store: Optional per-user history store (None = stateless)
             
         Note:
             Use create_context_analyzer() factory function instead.
@@ -327,10 +368,21 @@ class ContextAnalyzer:
         self._trend_analyzer = trend_analyzer or create_trend_analyzer(
             context_config_manager
         )
+        self._history_store = history_store
+        
+        # Incremental per-user windows mirroring the store (Phase 8)
+        self._windows: "OrderedDict[str, ContextWindow]" = OrderedDict()
+        self._windows_lock = threading.Lock()
+        self._window_capacity = 0
+        if history_store is not None:
+            self._window_capacity = (
+                min(self._config.max_history_size, history_store.max_entries_per_user) + 1
+            )
         
         logger.info(
             f"✅ ContextAnalyzer v{__version__} initialized "
-            f"(enabled={self._config.enabled}, max_history={self._config.max_history_size})"
+            f"(enabled={self._config.enabled}, max_history={self._config.max_history_size}, "
+            f"history_store={'on' if history_store is not None else 'off'})"
         )
     
     def analyze(
@@ -339,15 +391,23 @@ class ContextAnalyzer:
         current_score: float,
         message_history: Optional[List[MessageHistoryItem]] = None,
         current_timestamp: Optional[datetime] = None,
+        user_id: Optional[str] = None,
+        user_timezone: Optional[str] = None,
     ) -> ContextAnalysisResult:
         """
         Perform complete context analysis.
         
+        When a history store is configured and user_id is given, the current
+        score is recorded for that user. If message_history is empty the
+        stored history is analyzed instead.
+        
         Args:
             current_message: The current message being analyzed
             current_score: Crisis score for the current message
             message_history: List of previous messages with scores
             current_timestamp: Timestamp of current message (default: now)
+            user_id: Optional user identifier for the history store
+            user_timezone: User's timezone for late night detection (FE-001)
             
         Returns:
             ContextAnalysisResult with all analysis results
@@ -370,14 +430,41 @@ class ContextAnalyzer:
             message_history = message_history[-self._config.max_history_size:]
             logger.debug(f"Trimmed history to {self._config.max_history_size} messages")
         
-        # Build score and timestamp sequences (history + current)
-        scores, timestamps = self._build_sequences(
-            message_history, current_score, current_timestamp
-        )
+        store = self._history_store if user_id else None
+        history_source = "request"
+        
+        if store is not None and not message_history:
+            result = self._analyze_window(
+                user_id, current_score, current_timestamp, user_timezone
+            )
+            if result is not None:
+                return result
+            
+            # Server-side history: already scored and normalized to naive UTC
+            scores, timestamps = store.get_sequences(
+                user_id, limit=self._config.max_history_size
+            )
+            scores.append(current_score)
+            timestamps.append(_normalize_timestamp(current_timestamp))
+            history_source = "store"
+        else:
+            # Build score and timestamp sequences (history + current)
+            scores, timestamps = self._build_sequences(
+                message_history, current_score, current_timestamp
+            )
+            if store is not None:
+                store.seed(user_id, zip(timestamps[:-1], scores[:-1]))
+        
+        if store is not None:
+            store.record(user_id, timestamps[-1], current_score)
+            if history_source == "request":
+                self._drop_window(user_id)
         
         # Run individual analyzers
         escalation_analysis = self._run_escalation_analysis(scores, timestamps)
-        temporal_analysis = self._run_temporal_analysis(timestamps, current_timestamp)
+        temporal_analysis = self._run_temporal_analysis(
+            timestamps, current_timestamp, user_timezone
+        )
         trend_analysis = self._run_trend_analysis(scores, timestamps)
         
         # Build unified result
@@ -389,6 +476,7 @@ class ContextAnalyzer:
             timestamps=timestamps,
             current_score=current_score,
         )
+        result.metadata.history_source = history_source
         
         logger.debug(
             f"Context analysis complete: "
@@ -399,6 +487,124 @@ class ContextAnalyzer:
         
         return result
     
+    # =========================================================================
+    # Incremental Window Path (Phase 8)
+    # =========================================================================
+    
+    def _analyze_window(
+        self,
+        user_id: str,
+        current_score: float,
+        current_timestamp: datetime,
+        user_timezone: Optional[str] = None,
+    ) -> Optional[ContextAnalysisResult]:
+        """
+        Analyze a store-backed user through their incremental ContextWindow.
+        
+        The window is rebuilt from the store whenever the store's revision
+        for the user differs from the one the window last mirrored (restart,
+        eviction, seeding, another replica's snapshot) or the user's timezone
+        changed. Otherwise only the new message is pushed and expired or
+        overflowing entries are evicted.
+        
+        Args:
+            user_id: User identifier
+            current_score: Crisis score for the current message
+            current_timestamp: Timestamp of current message
+            user_timezone: User's timezone for late night detection
+            
+        Returns:
+            ContextAnalysisResult, or None to fall back to the batch path
+        """
+        store = self._history_store
+        normalized_current = _normalize_timestamp(current_timestamp)
+        current_epoch = to_epoch(normalized_current)
+        history_limit = self._window_capacity - 1
+        
+        try:
+            with self._windows_lock:
+                window = self._windows.get(user_id)
+                if (
+                    window is None
+                    or window.revision != store.get_revision(user_id)
+                    or window.timezone != (user_timezone or None)
+                ):
+                    window = self._rebuild_window(user_id, history_limit, user_timezone)
+                    if window is None:
+                        return None
+                else:
+                    self._windows.move_to_end(user_id)
+                    window.expire(time.time() - store.ttl_seconds)
+                    window.trim(history_limit)
+                
+                if not window.push(normalized_current, current_epoch, current_score):
+                    # Out-of-order or repeated timestamp: let the batch path sort it out
+                    self._windows.pop(user_id, None)
+                    return None
+                
+                if store.record(user_id, normalized_current, current_score):
+                    window.revision = store.get_revision(user_id)
+                else:
+                    self._windows.pop(user_id, None)
+                
+                escalation_analysis = self._escalation_detector.analyze_window(window)
+                temporal_analysis = self._temporal_detector.analyze_window(
+                    window, normalized_current, user_timezone
+                )
+                trend_analysis = self._trend_analyzer.analyze_window(window)
+                scores = window.scores()
+                timestamps = window.timestamps()
+        except Exception as e:
+            logger.error(f"Incremental context analysis failed, using batch path: {e}")
+            self._drop_window(user_id)
+            return None
+        
+        result = self._build_result(
+            escalation_analysis=escalation_analysis,
+            temporal_analysis=temporal_analysis,
+            trend_analysis=trend_analysis,
+            scores=scores,
+            timestamps=timestamps,
+            current_score=current_score,
+        )
+        result.metadata.history_source = "store"
+        return result
+    
+    def _rebuild_window(
+        self,
+        user_id: str,
+        history_limit: int,
+        user_timezone: Optional[str] = None,
+    ) -> Optional[ContextWindow]:
+        """
+        Replace a user's window with one rebuilt from the store (lock held).
+        
+        Returns:
+            The new window, or None if the stored history has timestamp ties
+            (the window requires strictly increasing timestamps)
+        """
+        entries, revision = self._history_store.get_entries(user_id, limit=history_limit)
+        
+        window = create_context_window(
+            self._window_capacity, self._temporal_detector, user_timezone or None
+        )
+        for epoch, score in entries:
+            if not window.push(from_epoch(epoch), epoch, score):
+                self._windows.pop(user_id, None)
+                return None
+        window.revision = revision
+        
+        self._windows[user_id] = window
+        self._windows.move_to_end(user_id)
+        while len(self._windows) > self._history_store.max_users:
+            self._windows.popitem(last=False)
+        return window
+    
+    def _drop_window(self, user_id: str) -> None:
+        """Forget a user's incremental window (next request rebuilds it)."""
+        with self._windows_lock:
+            self._windows.pop(user_id, None)
+    
     def analyze_from_sequence(self, sequence: MessageSequence) -> ContextAnalysisResult:
         """
         Analyze a complete message sequence.
@@ -479,6 +685,7 @@ class ContextAnalyzer:
         self,
         timestamps: List[datetime],
         current_timestamp: datetime,
+        user_timezone: Optional[str] = None,
     ) -> TemporalAnalysis:
         """
         Run temporal pattern detection.
@@ -486,6 +693,7 @@ class ContextAnalyzer:
         Args:
             timestamps: Timestamp sequence (should be normalized)
             current_timestamp: Current message timestamp
+            user_timezone: User's timezone for late night detection (FE-001)
             
         Returns:
             TemporalAnalysis result
@@ -493,7 +701,9 @@ class ContextAnalyzer:
         try:
             # Normalize current_timestamp in case it wasn't done earlier
             normalized_current = _normalize_timestamp(current_timestamp)
-            return self._temporal_detector.analyze(timestamps, normalized_current)
+            return self._temporal_detector.analyze(
+                timestamps, normalized_current, user_timezone
+            )
         except Exception as e:
             logger.error(f"Temporal analysis failed: {e}")
             return TemporalAnalysis()
@@ -557,6 +767,8 @@ class ContextAnalyzer:
             time_risk_modifier=temporal_analysis.risk_modifier,
             hour_of_day=temporal_analysis.hour_of_day,
             is_weekend=temporal_analysis.is_weekend,
+            user_timezone=temporal_analysis.user_timezone,
+            local_hour=temporal_analysis.local_hour,
         )
         
         # Build trend result
@@ -711,6 +923,51 @@ class ContextAnalyzer:
     def get_max_history_size(self) -> int:
         """Get maximum history size setting."""
         return self._config.max_history_size
+    
+    def get_history_store(self) -> Optional[UserHistoryStore]:
+        """Get the per-user history store (None when stateless)."""
+        return self._history_store
+    
+    def get_config_manager(self) -> ContextConfigManager:
+        """Get the context configuration manager."""
+        return self._config_manager
+    
+    def get_escalation_detector(self) -> EscalationDetector:
+        """Get the escalation detector used by this analyzer."""
+        return self._escalation_detector
+    
+    def get_trend_analyzer(self) -> TrendAnalyzer:
+        """Get the trend analyzer used by this analyzer."""
+        return self._trend_analyzer
+    
+    def assess_intervention(
+        self,
+        escalation_analysis: EscalationAnalysis,
+        trend_analysis: TrendAnalysis,
+        current_score: float,
+        temporal_analysis: Optional[TemporalAnalysis] = None,
+    ) -> InterventionInfo:
+        """
+        Calculate intervention urgency outside a request (Phase 8).
+        
+        Used by the background escalation sweep, which has no current
+        message and therefore no temporal analysis of its own.
+        
+        Args:
+            escalation_analysis: Escalation detection results
+            trend_analysis: Trend analysis results
+            current_score: Latest crisis score
+            temporal_analysis: Optional temporal results (default: neutral)
+            
+        Returns:
+            InterventionInfo with urgency and recommendations
+        """
+        return self._calculate_intervention(
+            escalation_analysis,
+            temporal_analysis or TemporalAnalysis(),
+            trend_analysis,
+            current_score,
+        )
 
 
 # =============================================================================
@@ -722,6 +979,7 @@ def create_context_analyzer(
     escalation_detector: Optional[EscalationDetector] = None,
     temporal_detector: Optional[TemporalDetector] = None,
     trend_analyzer: Optional[TrendAnalyzer] = None,
+    history_store: Optional[UserHistoryStore] = None,
 ) -> ContextAnalyzer:
     """
     Factory function for ContextAnalyzer (Clean Architecture v5.1 Pattern).
@@ -731,6 +989,7 @@ def create_context_analyzer(
         escalation_detector: Optional injected escalation detector
         temporal_detector: Optional injected temporal detector
         trend_analyzer: Optional injected trend analyzer
+        history_store: Optional history store (default: created from config)
         
     Returns:
         Configured ContextAnalyzer instance
@@ -755,11 +1014,16 @@ def create_context_analyzer(
     if context_config_manager is None:
         context_config_manager = create_context_config_manager()
     
+    # Create history store from config if not provided (None when disabled)
+    if history_store is None:
+        history_store = create_user_history_store(context_config_manager)
+    
     return ContextAnalyzer(
         context_config_manager=context_config_manager,
         escalation_detector=escalation_detector,
         temporal_detector=temporal_detector,
         trend_analyzer=trend_analyzer,
+        history_store=history_store,
     )
 
 
@@ -0,0 +1,521 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+CORE PRINCIPLE: Multi-Model Ensemble → Weighted Decision Engine → Crisis Classification
+******************  CORE SYSTEM VISION (Never to be violated):  ****************
+Ash-NLP is a CRISIS DETECTION BACKEND that:
+1. PRIMARY: Uses BART Zero-Shot Classification for semantic crisis detection
+2. CONTEXTUAL: Enhances with sentiment, irony, and emotion model signals
+3. ENSEMBLE: Combines weighted model outputs through decision engine
+4. PURPOSE: Detect crisis messages in Discord community communications
+********************************************************************************
+Incremental Context Window for Ash-NLP Service - Phase 8
+---
+FILE VERSION: v5.0-8-9.0-1
+LAST MODIFIED: 2026-02-08
+PHASE: Phase 8 Step 9.0 - Timezone Resolution Cache
+CLEAN ARCHITECTURE: v5.2.3 Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+
+RESPONSIBILITIES:
+- Hold one user's sliding (timestamp, score) window
+- Maintain escalation, trend and temporal accumulators in O(1) amortized
+  per push / evict, so analysis no longer rescans the whole history
+- Expose the same summary values the batch detectors derive from lists
+
+INVARIANTS:
+- Timestamps are strictly increasing (push() rejects anything else)
+- Every quantity is computed with the same float expressions as the batch
+  detectors (sum() for window means, since sum() may compensate), so
+  analyze_window() results are identical
+
+INDEXING:
+Elements carry absolute indices. The window covers [base, base + len - 1].
+With n >= 3 elements the 3-point moving average has two edge values
+(base, last) and n - 2 interior values that never change once computed.
+Trend deltas between two interior values are accumulated; the two edge
+deltas are evaluated on demand.
+"""
+
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Deque, List, Optional, Tuple
+
+from .escalation_detector import (
+    UPWARD_NOISE_TOLERANCE,
+    CONSISTENCY_DIP_TOLERANCE,
+    INTERVENTION_THRESHOLD,
+)
+from .trend_analyzer import (
+    CONSISTENCY_TOLERANCE,
+    INFLECTION_TOLERANCE,
+)
+from .temporal_detector import resolve_timezone
+
+# Module version
+__version__ = "v5.0-8-9.0-1"
+
+
+def _direction(delta: float, tolerance: float) -> int:
+    """Classify a delta as 1 (up), -1 (down) or 0 (flat) around tolerance."""
+    if delta > tolerance:
+        return 1
+    if delta < -tolerance:
+        return -1
+    return 0
+
+
+# =============================================================================
+# Context Window
+# =============================================================================
+
+class ContextWindow:
+    """
+    Sliding window with incremental escalation/trend/temporal accumulators.
+
+    Not thread-safe; the owner (ContextAnalyzer) serializes access.
+
+    Attributes:
+        capacity: Maximum elements kept (oldest evicted on push)
+        revision: Owner-managed marker of the history this window mirrors
+        timezone: Timezone the late-night flags were computed in (None = UTC)
+    """
+
+    __slots__ = (
+        "capacity",
+        "revision",
+        "timezone",
+        "_is_late_night",
+        "_local_hour",
+        "_rapid_window",
+        "_base",
+        "_scores",
+        "_timestamps",
+        "_epochs",
+        # Escalation (raw adjacent transitions)
+        "_increases",
+        "_decreases",
+        "_consistent",
+        "_high",
+        # Trend (smoothed interior values and deltas)
+        "_interior",
+        "_interior_min",
+        "_interior_max",
+        "_trend_up",
+        "_trend_down",
+        "_nonflat",
+        "_inflections",
+        # Temporal
+        "_late_flags",
+        "_late_count",
+        "_recent",
+    )
+
+    def __init__(
+        self,
+        capacity: int,
+        is_late_night: Callable[[int], bool],
+        rapid_window_minutes: float,
+        local_hour: Optional[Callable[[datetime], int]] = None,
+        timezone: Optional[str] = None,
+    ):
+        """
+        Initialize ContextWindow.
+
+        Args:
+            capacity: Maximum elements kept in the window
+            is_late_night: Hour → late-night predicate (TemporalDetector's)
+            rapid_window_minutes: Rapid posting window length
+            local_hour: Timestamp → local hour (default: UTC hour)
+            timezone: Timezone name local_hour converts to (for bookkeeping)
+
+        Note:
+            Use create_context_window() factory function instead.
+        """
+        self.capacity = max(1, capacity)
+        self.revision: int = -1
+        self.timezone = timezone
+        self._is_late_night = is_late_night
+        self._local_hour = local_hour
+        self._rapid_window = timedelta(minutes=rapid_window_minutes)
+
+        self._base = 0
+        self._scores: Deque[float] = deque()
+        self._timestamps: Deque[datetime] = deque()
+        self._epochs: Deque[float] = deque()
+
+        self._increases = 0
+        self._decreases = 0
+        self._consistent = 0
+        self._high: Deque[int] = deque()
+
+        self._interior: Deque[float] = deque()
+        self._interior_min: Deque[Tuple[int, float]] = deque()
+        self._interior_max: Deque[Tuple[int, float]] = deque()
+        self._trend_up = 0
+        self._trend_down = 0
+        self._nonflat: Deque[Tuple[int, int]] = deque()
+        self._inflections: Deque[int] = deque()
+
+        self._late_flags: Deque[bool] = deque()
+        self._late_count = 0
+        self._recent: Deque[Tuple[int, datetime]] = deque()
+
+    # =========================================================================
+    # Mutation
+    # =========================================================================
+
+    def push(self, timestamp: datetime, epoch: float, score: float) -> bool:
+        """
+        Append one scored message, evicting the oldest beyond capacity.
+
+        Args:
+            timestamp: Naive UTC timestamp
+            epoch: Same instant as epoch seconds (used for TTL expiry)
+            score: Crisis score
+
+        Returns:
+            False (window unchanged) if timestamp is not after the last one
+        """
+        if self._epochs and epoch <= self._epochs[-1]:
+            return False
+
+        index = self._base + len(self._scores)
+        n = len(self._scores)
+
+        if n:
+            prev = self._scores[-1]
+            self._add_transition(prev, score)
+            # Previous last element becomes interior once it has two neighbours
+            if n >= 2:
+                self._push_interior(
+                    index - 1, sum((self._scores[-2], prev, score)) / 3
+                )
+
+        if score >= INTERVENTION_THRESHOLD:
+            self._high.append(index)
+
+        hour = self._local_hour(timestamp) if self._local_hour else timestamp.hour
+        late = self._is_late_night(hour)
+        self._late_flags.append(late)
+        self._late_count += late
+
+        self._recent.append((index, timestamp))
+        window_start = timestamp - self._rapid_window
+        while self._recent[0][1] < window_start:
+            self._recent.popleft()
+
+        self._scores.append(score)
+        self._timestamps.append(timestamp)
+        self._epochs.append(epoch)
+
+        while len(self._scores) > self.capacity:
+            self.pop_left()
+        return True
+
+    def pop_left(self) -> None:
+        """Evict the oldest element."""
+        n = len(self._scores)
+        if not n:
+            return
+
+        index = self._base
+        if n >= 2:
+            self._remove_transition(self._scores[0], self._scores[1])
+        # Element base+1 stops being interior (it becomes the left edge)
+        if n >= 3:
+            self._pop_interior(index + 1)
+
+        if self._high and self._high[0] == index:
+            self._high.popleft()
+        if self._recent and self._recent[0][0] == index:
+            self._recent.popleft()
+
+        self._late_count -= self._late_flags.popleft()
+        self._scores.popleft()
+        self._timestamps.popleft()
+        self._epochs.popleft()
+        self._base += 1
+
+    def trim(self, max_len: int) -> None:
+        """Evict oldest elements until at most max_len remain."""
+        while len(self._scores) > max_len:
+            self.pop_left()
+
+    def expire(self, cutoff_epoch: float) -> int:
+        """
+        Evict elements older than cutoff (same rule as UserHistoryStore).
+
+        Returns:
+            Number of elements evicted
+        """
+        evicted = 0
+        while self._epochs and self._epochs[0] < cutoff_epoch:
+            self.pop_left()
+            evicted += 1
+        return evicted
+
+    # =========================================================================
+    # Escalation Accumulators (raw scores)
+    # =========================================================================
+
+    def _add_transition(self, prev: float, score: float) -> None:
+        direction = _direction(score - prev, UPWARD_NOISE_TOLERANCE)
+        if direction > 0:
+            self._increases += 1
+        elif direction < 0:
+            self._decreases += 1
+        if score >= prev - CONSISTENCY_DIP_TOLERANCE:
+            self._consistent += 1
+
+    def _remove_transition(self, prev: float, score: float) -> None:
+        direction = _direction(score - prev, UPWARD_NOISE_TOLERANCE)
+        if direction > 0:
+            self._increases -= 1
+        elif direction < 0:
+            self._decreases -= 1
+        if score >= prev - CONSISTENCY_DIP_TOLERANCE:
+            self._consistent -= 1
+
+    # =========================================================================
+    # Trend Accumulators (smoothed interior)
+    # =========================================================================
+
+    def _push_interior(self, index: int, value: float) -> None:
+        if self._interior:
+            delta_index = index  # delta between index-1 and index
+            delta = value - self._interior[-1]
+            self._count_trend_delta(delta, +1)
+            direction = _direction(delta, INFLECTION_TOLERANCE)
+            if direction:
+                if self._nonflat and self._nonflat[-1][1] != direction:
+                    self._inflections.append(delta_index)
+                self._nonflat.append((delta_index, direction))
+
+        self._interior.append(value)
+        while self._interior_min and self._interior_min[-1][1] > value:
+            self._interior_min.pop()
+        self._interior_min.append((index, value))
+        while self._interior_max and self._interior_max[-1][1] < value:
+            self._interior_max.pop()
+        self._interior_max.append((index, value))
+
+    def _pop_interior(self, index: int) -> None:
+        value = self._interior.popleft()
+        if self._interior:
+            # Drop the delta between index and index+1
+            delta_index = index + 1
+            self._count_trend_delta(self._interior[0] - value, -1)
+            if self._nonflat and self._nonflat[0][0] == delta_index:
+                self._nonflat.popleft()
+                # The new first non-flat delta has no predecessor any more
+                if (
+                    self._nonflat
+                    and self._inflections
+                    and self._inflections[0] == self._nonflat[0][0]
+                ):
+                    self._inflections.popleft()
+
+        if self._interior_min and self._interior_min[0][0] == index:
+            self._interior_min.popleft()
+        if self._interior_max and self._interior_max[0][0] == index:
+            self._interior_max.popleft()
+
+    def _count_trend_delta(self, delta: float, sign: int) -> None:
+        direction = _direction(delta, CONSISTENCY_TOLERANCE)
+        if direction > 0:
+            self._trend_up += sign
+        elif direction < 0:
+            self._trend_down += sign
+
+    def _edges(self) -> Tuple[float, float]:
+        """Smoothed values of the first and last element (n >= 3)."""
+        s = self._scores
+        return sum((s[0], s[1])) / 2, sum((s[-2], s[-1])) / 2
+
+    # =========================================================================
+    # Summary: Shared
+    # =========================================================================
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    @property
+    def first_score(self) -> float:
+        return self._scores[0]
+
+    @property
+    def last_score(self) -> float:
+        return self._scores[-1]
+
+    @property
+    def last_epoch(self) -> Optional[float]:
+        return self._epochs[-1] if self._epochs else None
+
+    def scores(self) -> List[float]:
+        """Materialize window scores (oldest first)."""
+        return list(self._scores)
+
+    def timestamps(self) -> List[datetime]:
+        """Materialize window timestamps (oldest first)."""
+        return list(self._timestamps)
+
+    def timestamp_bounds(self) -> List[datetime]:
+        """First and last timestamp ([first] for one element, [] if empty)."""
+        if len(self._timestamps) >= 2:
+            return [self._timestamps[0], self._timestamps[-1]]
+        return list(self._timestamps)
+
+    # =========================================================================
+    # Summary: Escalation
+    # =========================================================================
+
+    @property
+    def increases(self) -> int:
+        return self._increases
+
+    @property
+    def decreases(self) -> int:
+        return self._decreases
+
+    @property
+    def consistent_transitions(self) -> int:
+        return self._consistent
+
+    def intervention_point(self) -> Optional[int]:
+        """Window-relative index of the first score >= intervention threshold."""
+        return self._high[0] - self._base if self._high else None
+
+    # =========================================================================
+    # Summary: Trend
+    # =========================================================================
+
+    def smoothed_scores(self) -> List[float]:
+        """Materialize the 3-point moving average (same as TrendAnalyzer)."""
+        if len(self._scores) <= 2:
+            return list(self._scores)
+        first, last = self._edges()
+        return [first, *self._interior, last]
+
+    def smoothed_bounds(self) -> Tuple[float, float, float, float]:
+        """(first, last, min, max) of the smoothed series."""
+        if len(self._scores) <= 2:
+            values = self._scores
+            return values[0], values[-1], min(values), max(values)
+
+        first, last = self._edges()
+        low = min(first, self._interior_min[0][1], last)
+        high = max(first, self._interior_max[0][1], last)
+        return first, last, low, high
+
+    def trend_counts(self) -> Tuple[int, int]:
+        """(up, down) smoothed transitions beyond the consistency tolerance."""
+        n = len(self._scores)
+        if n < 2:
+            return 0, 0
+        if n == 2:
+            direction = _direction(self._scores[1] - self._scores[0], CONSISTENCY_TOLERANCE)
+            return int(direction > 0), int(direction < 0)
+
+        up, down = self._trend_up, self._trend_down
+        first, last = self._edges()
+        for delta in (self._interior[0] - first, last - self._interior[-1]):
+            direction = _direction(delta, CONSISTENCY_TOLERANCE)
+            up += direction > 0
+            down += direction < 0
+        return up, down
+
+    def inflection_points(self) -> List[int]:
+        """Window-relative inflection indices (same as TrendAnalyzer)."""
+        n = len(self._scores)
+        if n < 3:
+            return []
+
+        base = self._base
+        last_index = base + n - 1
+        first, last = self._edges()
+        left = _direction(self._interior[0] - first, INFLECTION_TOLERANCE)
+        right = _direction(last - self._interior[-1], INFLECTION_TOLERANCE)
+
+        points: List[int] = []
+        # Predecessor of the first interior non-flat delta is the left edge
+        prev = left or None
+        if self._nonflat:
+            first_index, first_direction = self._nonflat[0]
+            if prev is not None and first_direction != prev:
+                points.append(first_index - base - 1)
+            points.extend(i - base - 1 for i in self._inflections)
+            prev = self._nonflat[-1][1]
+        if right and prev is not None and right != prev:
+            points.append(last_index - base - 1)
+        return points
+
+    # =========================================================================
+    # Summary: Temporal
+    # =========================================================================
+
+    @property
+    def late_night_count(self) -> int:
+        return self._late_count
+
+    @property
+    def messages_in_rapid_window(self) -> int:
+        return len(self._recent)
+
+    def average_gap_minutes(self) -> float:
+        """Average gap between messages (telescoped: (last - first) / (n - 1))."""
+        n = len(self._timestamps)
+        if n < 2:
+            return 0.0
+        return ((self._timestamps[-1] - self._timestamps[0]) / (n - 1)).total_seconds() / 60.0
+
+    def __repr__(self) -> str:
+        return (
+            f"ContextWindow(len={len(self)}/{self.capacity}, "
+            f"revision={self.revision}, tz={self.timezone})"
+        )
+
+
+# =============================================================================
+# Factory Function
+# =============================================================================
+
+def create_context_window(
+    capacity: int,
+    temporal_detector,
+    user_timezone: Optional[str] = None,
+) -> ContextWindow:
+    """
+    Factory function for ContextWindow (Clean Architecture v5.1 Pattern).
+
+    Args:
+        capacity: Maximum elements kept in the window
+        temporal_detector: TemporalDetector supplying late-night rules
+        user_timezone: Timezone for late-night flags (None = UTC)
+
+    Returns:
+        Empty ContextWindow
+    """
+    local_hour = None
+    zone = resolve_timezone(user_timezone) if user_timezone else None
+    if zone is not None:
+        def local_hour(ts: datetime) -> int:
+            return ts.replace(tzinfo=timezone.utc).astimezone(zone).hour
+
+    return ContextWindow(
+        capacity=capacity,
+        is_late_night=temporal_detector.is_late_night_hour,
+        rapid_window_minutes=temporal_detector.get_config().rapid_posting_threshold_minutes,
+        local_hour=local_hour,
+        timezone=user_timezone,
+    )
+
+
+# =============================================================================
+# Export public interface
+# =============================================================================
+
+__all__ = [
+    "ContextWindow",
+    "create_context_window",
+]
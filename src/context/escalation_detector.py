@@ -10,9 +10,9 @@ Ash-NLP is a CRISIS DETECTION BACKEND that:
 ********************************************************************************
 Escalation Detector for Ash-NLP Service - Phase 5
 ---
-FILE VERSION: v5.0-6-3.0-1
-LAST MODIFIED: 2026-01-02
-PHASE: Phase 6 - Sprint 3 (FE-005: Per-Severity Thresholds)
+FILE VERSION: v5.0-8-8.0-1
+LAST MODIFIED: 2026-02-07
+PHASE: Phase 8 Step 8.0 - Vectorized Context Primitives
 CLEAN ARCHITECTURE: v5.1 Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-nlp
 Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
@@ -23,11 +23,13 @@ RESPONSIBILITIES:
 - Calculate escalation confidence scores
 - Identify intervention points in the sequence
 - Match against known escalation patterns
+- Phase 8: Analyze an incremental ContextWindow without rescanning history
+- Phase 8: Transition loops via context primitives (NumPy for long histories)
 """
 
 import logging
 from enum import Enum
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, TYPE_CHECKING
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 
@@ -38,12 +40,24 @@ from src.managers import (
     SeverityThreshold,
 )
 
+from .primitives import count_transitions, count_non_dips
+
+if TYPE_CHECKING:
+    from .context_window import ContextWindow
+
 # Module version
-__version__ = "v5.0-6-3.0-1"
+__version__ = "v5.0-8-8.0-1"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+# Transition tolerances (shared with ContextWindow accumulators)
+UPWARD_NOISE_TOLERANCE = 0.01
+CONSISTENCY_DIP_TOLERANCE = 0.05
+
+# Medium severity: where intervention should have occurred
+INTERVENTION_THRESHOLD = 0.5
+
 
 # =============================================================================
 # Enums
@@ -292,16 +306,8 @@ class EscalationDetector:
         if len(scores) < 2:
             return False
         
-        # Count increasing vs decreasing transitions
-        increases = 0
-        decreases = 0
-        
-        for i in range(1, len(scores)):
-            delta = scores[i] - scores[i-1]
-            if delta > 0.01:  # Small tolerance for noise
-                increases += 1
-            elif delta < -0.01:
-                decreases += 1
+        # Count increasing vs decreasing transitions (small tolerance for noise)
+        increases, decreases = count_transitions(scores, UPWARD_NOISE_TOLERANCE)
         
         # Need more increases than decreases
         # and final score higher than initial
@@ -348,21 +354,45 @@ class EscalationDetector:
             time_span_hours: Time span in hours
             escalation_type: Classified escalation type
             
+        Returns:
+            Confidence score 0.0-1.0
+        """
+        return self._combine_confidence(
+            score_delta=score_delta,
+            score_increase_threshold=self._config.score_increase_threshold,
+            consistency=self._calculate_trend_consistency(scores),
+            final_score=scores[-1] if scores else 0.0,
+        )
+    
+    def _combine_confidence(
+        self,
+        score_delta: float,
+        score_increase_threshold: float,
+        consistency: float,
+        final_score: float,
+    ) -> float:
+        """
+        Combine confidence factors (shared by batch and window analysis).
+        
+        Args:
+            score_delta: Total score change
+            score_increase_threshold: Threshold the delta is measured against
+            consistency: Trend consistency 0.0-1.0
+            final_score: Last score in the sequence
+            
         Returns:
             Confidence score 0.0-1.0
         """
         # Factor 1: Score delta relative to threshold (0-0.4)
         delta_factor = min(
-            score_delta / (self._config.score_increase_threshold * 2),
+            score_delta / (score_increase_threshold * 2),
             0.4
         )
         
         # Factor 2: Trend consistency (0-0.3)
-        consistency = self._calculate_trend_consistency(scores)
         consistency_factor = consistency * 0.3
         
         # Factor 3: Final score severity (0-0.3)
-        final_score = scores[-1] if scores else 0.0
         severity_factor = min(final_score, 1.0) * 0.3
         
         # Combine factors
@@ -385,10 +415,7 @@ class EscalationDetector:
         
         # Count transitions that go in expected direction
         expected_increases = len(scores) - 1
-        actual_increases = sum(
-            1 for i in range(1, len(scores))
-            if scores[i] >= scores[i-1] - 0.05  # Allow small dips
-        )
+        actual_increases = count_non_dips(scores, CONSISTENCY_DIP_TOLERANCE)  # Allow small dips
         
         return actual_increases / expected_increases
     
@@ -405,10 +432,8 @@ class EscalationDetector:
         Returns:
             Index of intervention point, or None if not reached
         """
-        intervention_threshold = 0.5  # Medium severity
-        
         for i, score in enumerate(scores):
-            if score >= intervention_threshold:
+            if score >= INTERVENTION_THRESHOLD:
                 return i
         
         return None
@@ -514,6 +539,73 @@ class EscalationDetector:
             distance = abs(1.0 - ratio)
             return 1.0 - distance
     
+    # =========================================================================
+    # Phase 8: Incremental Window Analysis
+    # =========================================================================
+    
+    def analyze_window(self, window: "ContextWindow") -> EscalationAnalysis:
+        """
+        Analyze an incremental ContextWindow (Phase 8).
+        
+        Produces the same EscalationAnalysis as analyze(window.scores(),
+        window.timestamps()) using the window's running transition counts
+        instead of rescanning the sequence.
+        
+        Args:
+            window: ContextWindow holding the user's recent scores
+            
+        Returns:
+            EscalationAnalysis with detection results
+        """
+        n = len(window)
+        
+        if not self._config.enabled or n < self._config.minimum_messages:
+            return EscalationAnalysis(scores=window.scores())
+        
+        # Calculate basic metrics
+        time_span = self._calculate_time_span(window.timestamp_bounds())
+        score_delta = window.last_score - window.first_score
+        rate_per_hour = self._calculate_rate_per_hour(score_delta, time_span)
+        
+        # Detect escalation (same gates as _detect_escalation)
+        detected = False
+        escalation_type = EscalationType.NONE
+        confidence = 0.0
+        is_upward = (
+            n >= 2
+            and window.increases > window.decreases
+            and window.last_score > window.first_score
+        )
+        if score_delta >= self._config.score_increase_threshold and is_upward:
+            detected = True
+            escalation_type = self._classify_escalation_type(time_span)
+            confidence = self._combine_confidence(
+                score_delta=score_delta,
+                score_increase_threshold=self._config.score_increase_threshold,
+                consistency=window.consistent_transitions / (n - 1),
+                final_score=window.last_score,
+            )
+        
+        # Match against known patterns
+        matched_pattern, pattern_confidence = self._match_pattern(
+            escalation_type=escalation_type,
+            time_span_hours=time_span,
+            score_delta=score_delta,
+        )
+        
+        return EscalationAnalysis(
+            detected=detected,
+            escalation_type=escalation_type,
+            confidence=confidence,
+            score_delta=score_delta,
+            time_span_hours=time_span,
+            intervention_point=window.intervention_point(),
+            matched_pattern=matched_pattern,
+            pattern_confidence=pattern_confidence,
+            scores=window.scores(),
+            rate_per_hour=rate_per_hour,
+        )
+    
     def is_enabled(self) -> bool:
         """Check if escalation detection is enabled."""
         return self._config.enabled
@@ -714,24 +806,12 @@ class EscalationDetector:
         Returns:
             Confidence score 0.0-1.0
         """
-        # Factor 1: Score delta relative to severity threshold (0-0.4)
-        delta_factor = min(
-            score_delta / (threshold.score_increase_threshold * 2),
-            0.4
+        return self._combine_confidence(
+            score_delta=score_delta,
+            score_increase_threshold=threshold.score_increase_threshold,
+            consistency=self._calculate_trend_consistency(scores),
+            final_score=scores[-1] if scores else 0.0,
         )
-        
-        # Factor 2: Trend consistency (0-0.3)
-        consistency = self._calculate_trend_consistency(scores)
-        consistency_factor = consistency * 0.3
-        
-        # Factor 3: Final score severity (0-0.3)
-        final_score = scores[-1] if scores else 0.0
-        severity_factor = min(final_score, 1.0) * 0.3
-        
-        # Combine factors
-        confidence = delta_factor + consistency_factor + severity_factor
-        
-        return min(confidence, 1.0)
     
     def get_available_severities(self) -> List[str]:
         """
@@ -786,6 +866,9 @@ def create_escalation_detector(
 # =============================================================================
 
 __all__ = [
+    "UPWARD_NOISE_TOLERANCE",
+    "CONSISTENCY_DIP_TOLERANCE",
+    "INTERVENTION_THRESHOLD",
     "EscalationType",
     "EscalationAnalysis",
     "EscalationDetector",
@@ -0,0 +1,576 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+CORE PRINCIPLE: Multi-Model Ensemble → Weighted Decision Engine → Crisis Classification
+******************  CORE SYSTEM VISION (Never to be violated):  ****************
+Ash-NLP is a CRISIS DETECTION BACKEND that:
+1. PRIMARY: Uses BART Zero-Shot Classification for semantic crisis detection
+2. CONTEXTUAL: Enhances with sentiment, irony, and emotion model signals
+3. ENSEMBLE: Combines weighted model outputs through decision engine
+4. PURPOSE: Detect crisis messages in Discord community communications
+********************************************************************************
+Background Escalation Sweep for Ash-NLP Service - Phase 8
+---
+FILE VERSION: v5.0-8-20.0-2
+LAST MODIFIED: 2026-02-19
+PHASE: Phase 8 Step 20.0 - Hot Configuration Reload
+CLEAN ARCHITECTURE: v5.2.3 Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+
+RESPONSIBILITIES:
+- Periodically re-screen stored user histories for escalation, so a user
+  trending upward is flagged even if they have not posted again
+- Only re-evaluate users whose history changed since the last sweep
+- Prefilter each batch on columnar (first, last, length) arrays before
+  running the full detectors
+- Stay within a per-tick compute budget; unfinished users carry over
+- Send escalation alerts through DiscordAlerter with a per-user cooldown
+  (started only by a delivered alert; the alerter throttles sweep alerts
+  per user, not with the shared escalation cooldown)
+- Follow a reloaded ContextAnalyzer (set_context_analyzer) so sweeps use
+  the new detector thresholds
+
+SWEEP PIPELINE (per tick):
+    pop dirty users (batch_size) → fetch entries (no LRU touch)
+        → prefilter: length >= minimum_messages and
+                     last - first >= score_increase_threshold
+                     (per-severity thresholds of the latest score)
+        → EscalationDetector.analyze_with_severity + TrendAnalyzer.analyze
+        → alert when escalation is detected and the trend is worsening
+
+The prefilter applies the detector's own necessary conditions with the
+same float operations, so it never drops a user the detector would flag.
+
+USAGE:
+    sweeper = create_escalation_sweeper(context_analyzer, alerter=alerter)
+    if sweeper:
+        sweeper.start()
+        ...
+        await sweeper.stop()
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.managers import ContextConfigManager
+
+from .context_analyzer import ContextAnalyzer, InterventionInfo
+from .escalation_detector import EscalationAnalysis
+from .history_store import from_epoch
+from .primitives import NUMPY_AVAILABLE, VECTORIZE_MIN_LENGTH
+from .trend_analyzer import TrendAnalysis, TrendDirection
+
+# Module version
+__version__ = "v5.0-8-20.0-2"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+else:
+    np = None
+
+# Severity floors for the latest score (mirrors CrisisSeverity.from_score
+# defaults; highest first)
+SEVERITY_FLOORS: Tuple[Tuple[str, float], ...] = (
+    ("critical", 0.85),
+    ("high", 0.70),
+    ("medium", 0.50),
+    ("low", 0.30),
+)
+
+# Preview text used in alerts (there is no current message)
+SWEEP_MESSAGE_PREVIEW = "(background sweep)"
+
+
+def severity_for_score(score: float) -> str:
+    """
+    Map a crisis score to the severity name used for escalation thresholds.
+
+    Args:
+        score: Crisis score (0.0-1.0)
+
+    Returns:
+        critical, high, medium, low or safe
+    """
+    for name, floor in SEVERITY_FLOORS:
+        if score >= floor:
+            return name
+    return "safe"
+
+
+# =============================================================================
+# Data Classes
+# =============================================================================
+
+@dataclass
+class SweepAlert:
+    """
+    Escalation found by a sweep, pending delivery.
+
+    Attributes:
+        user_id: User whose history escalated
+        crisis_score: Latest stored score
+        escalation: Escalation analysis for the stored history
+        trend: Trend analysis for the stored history
+        intervention: Intervention urgency assessment
+    """
+    user_id: str
+    crisis_score: float
+    escalation: EscalationAnalysis
+    trend: TrendAnalysis
+    intervention: InterventionInfo
+
+
+# =============================================================================
+# Escalation Sweeper
+# =============================================================================
+
+class EscalationSweeper:
+    """
+    Background cross-user escalation screening over the history store.
+
+    sweep_once() is synchronous CPU work and runs in a worker thread;
+    alert delivery happens on the event loop. Sweeps never overlap.
+
+    Clean Architecture v5.1 Compliance:
+    - Factory function: create_escalation_sweeper()
+    - Dependencies injected (analyzer, alerter)
+    """
+
+    def __init__(
+        self,
+        context_analyzer: ContextAnalyzer,
+        alerter: Optional[Any] = None,
+        interval_seconds: float = 60.0,
+        tick_budget_ms: float = 50.0,
+        batch_size: int = 256,
+        alert_on_detection: bool = True,
+        alert_cooldown_seconds: float = 300.0,
+    ):
+        """
+        Initialize EscalationSweeper.
+
+        Args:
+            context_analyzer: Analyzer owning the history store and detectors
+            alerter: Optional DiscordAlerter for escalation alerts
+            interval_seconds: Seconds between sweeps
+            tick_budget_ms: Compute budget per sweep
+            batch_size: Users fetched from the store per batch
+            alert_on_detection: Send alerts (False = count detections only)
+            alert_cooldown_seconds: Minimum seconds between alerts per user
+
+        Note:
+            Use create_escalation_sweeper() factory function instead.
+        """
+        history_store = context_analyzer.get_history_store()
+        if history_store is None:
+            raise ValueError("EscalationSweeper requires a history store")
+
+        self._store = history_store
+        self._alerter = alerter
+
+        self.interval_seconds = interval_seconds
+        self.tick_budget_ms = tick_budget_ms
+        self.batch_size = batch_size
+        self.alert_on_detection = alert_on_detection
+        self.alert_cooldown_seconds = alert_cooldown_seconds
+
+        self._severities = [name for name, _ in SEVERITY_FLOORS] + ["safe"]
+        self._bind(context_analyzer)
+
+        self._last_alert: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+
+        # Statistics
+        self._sweeps = 0
+        self._users_swept = 0
+        self._candidates = 0
+        self._evaluated = 0
+        self._detections = 0
+        self._alerts_sent = 0
+        self._alerts_suppressed = 0
+        self._alerts_undelivered = 0
+        self._deferred = 0
+        self._budget_exhausted = 0
+        self._vectorized_batches = 0
+        self._last_sweep_ms = 0.0
+
+        logger.info(
+            f"✅ EscalationSweeper v{__version__} initialized "
+            f"(interval={interval_seconds:.0f}s, budget={tick_budget_ms:.0f}ms, "
+            f"batch={batch_size}, alerts={'on' if alert_on_detection and alerter else 'off'})"
+        )
+
+    def _bind(self, context_analyzer: ContextAnalyzer) -> None:
+        """Take detectors and per-severity prefilter thresholds from an analyzer."""
+        self._analyzer = context_analyzer
+        self._escalation_detector = context_analyzer.get_escalation_detector()
+        self._trend_analyzer = context_analyzer.get_trend_analyzer()
+
+        # Per-severity (minimum_messages, score_increase_threshold), same
+        # order as SEVERITY_FLOORS plus "safe"
+        thresholds = [
+            self._escalation_detector.get_threshold_for_severity(name)
+            for name in self._severities
+        ]
+        self._min_messages = [t.minimum_messages for t in thresholds]
+        self._min_deltas = [t.score_increase_threshold for t in thresholds]
+        if NUMPY_AVAILABLE:
+            # Ascending floors for searchsorted; threshold arrays are indexed
+            # by the resulting level (safe, low, medium, high, critical)
+            self._np_floors = np.array([floor for _, floor in reversed(SEVERITY_FLOORS)])
+            self._np_min_messages = np.array(self._min_messages[::-1])
+            self._np_min_deltas = np.array(self._min_deltas[::-1])
+
+    def set_context_analyzer(self, context_analyzer: ContextAnalyzer) -> None:
+        """
+        Switch to a rebuilt analyzer after a configuration reload.
+
+        The analyzer must share this sweeper's history store.
+
+        Args:
+            context_analyzer: Rebuilt context analyzer
+        """
+        if context_analyzer.get_history_store() is not self._store:
+            raise ValueError("Reloaded analyzer must share the sweeper's history store")
+        self._bind(context_analyzer)
+        logger.info("🔁 Escalation sweep switched to reloaded context configuration")
+
+    # =========================================================================
+    # Sweep
+    # =========================================================================
+
+    def sweep_once(self, now: Optional[float] = None) -> List[SweepAlert]:
+        """
+        Screen dirty users until the store is clean or the budget runs out.
+
+        Args:
+            now: Current epoch seconds (default: time.time())
+
+        Returns:
+            Alerts to deliver (cooldown already applied)
+        """
+        started = time.perf_counter()
+        deadline = started + self.tick_budget_ms / 1000.0
+        now = now if now is not None else time.time()
+        limit = self._analyzer.get_max_history_size()
+        alerts: List[SweepAlert] = []
+
+        if not self._escalation_detector.is_enabled():
+            # Nothing could be detected; keep the dirty set from growing
+            self._store.pop_dirty()
+            return alerts
+
+        self._prune_cooldowns(now)
+
+        while time.perf_counter() < deadline:
+            user_ids = self._store.pop_dirty(self.batch_size)
+            if not user_ids:
+                break
+            self._users_swept += len(user_ids)
+
+            batch = []
+            for user_id in user_ids:
+                entries, _ = self._store.get_entries(
+                    user_id, limit=limit, now=now, touch=False
+                )
+                if entries:
+                    batch.append((user_id, entries))
+
+            candidates = self._prefilter(batch)
+            self._candidates += len(candidates)
+
+            for position, (user_id, entries) in enumerate(candidates):
+                if time.perf_counter() >= deadline:
+                    leftover = [uid for uid, _ in candidates[position:]]
+                    self._deferred += self._store.mark_dirty(leftover)
+                    self._budget_exhausted += 1
+                    break
+                alert = self._evaluate(user_id, entries, now)
+                if alert is not None:
+                    alerts.append(alert)
+
+        self._sweeps += 1
+        self._last_sweep_ms = (time.perf_counter() - started) * 1000
+        if alerts:
+            logger.info(
+                f"🔎 Escalation sweep flagged {len(alerts)} users "
+                f"({self._last_sweep_ms:.1f}ms)"
+            )
+        return alerts
+
+    def _prefilter(
+        self,
+        batch: List[Tuple[str, List[Tuple[float, float]]]],
+    ) -> List[Tuple[str, List[Tuple[float, float]]]]:
+        """
+        Keep users that can satisfy the escalation detector's preconditions.
+
+        Args:
+            batch: (user_id, [(epoch, score), ...]) pairs
+
+        Returns:
+            Subset of batch, same order
+        """
+        if not batch:
+            return []
+
+        if NUMPY_AVAILABLE and len(batch) >= VECTORIZE_MIN_LENGTH:
+            self._vectorized_batches += 1
+            first = np.fromiter((e[0][1] for _, e in batch), dtype=np.float64, count=len(batch))
+            last = np.fromiter((e[-1][1] for _, e in batch), dtype=np.float64, count=len(batch))
+            lengths = np.fromiter((len(e) for _, e in batch), dtype=np.int64, count=len(batch))
+            # 0 = safe ... 4 = critical (a score equal to a floor is in it)
+            level = np.searchsorted(self._np_floors, last, side="right")
+            keep = (lengths >= self._np_min_messages[level]) & (
+                (last - first) >= self._np_min_deltas[level]
+            )
+            return [batch[i] for i in np.flatnonzero(keep)]
+
+        kept = []
+        for user_id, entries in batch:
+            last = entries[-1][1]
+            level = self._severities.index(severity_for_score(last))
+            if (
+                len(entries) >= self._min_messages[level]
+                and last - entries[0][1] >= self._min_deltas[level]
+            ):
+                kept.append((user_id, entries))
+        return kept
+
+    def _evaluate(
+        self,
+        user_id: str,
+        entries: List[Tuple[float, float]],
+        now: float,
+    ) -> Optional[SweepAlert]:
+        """Run the full detectors for one user; return an alert if due."""
+        self._evaluated += 1
+        scores = [score for _, score in entries]
+        timestamps = [from_epoch(ts) for ts, _ in entries]
+        current_score = scores[-1]
+
+        escalation = self._escalation_detector.analyze_with_severity(
+            scores, timestamps, severity_for_score(current_score)
+        )
+        if not escalation.detected:
+            return None
+        trend = self._trend_analyzer.analyze(scores, timestamps)
+        if trend.direction != TrendDirection.WORSENING:
+            return None
+
+        self._detections += 1
+        last_alert = self._last_alert.get(user_id)
+        if last_alert is not None and now - last_alert < self.alert_cooldown_seconds:
+            self._alerts_suppressed += 1
+            return None
+
+        return SweepAlert(
+            user_id=user_id,
+            crisis_score=current_score,
+            escalation=escalation,
+            trend=trend,
+            intervention=self._analyzer.assess_intervention(
+                escalation, trend, current_score
+            ),
+        )
+
+    def _prune_cooldowns(self, now: float) -> None:
+        """Forget per-user alert times older than the cooldown."""
+        expired = [
+            uid for uid, ts in self._last_alert.items()
+            if now - ts >= self.alert_cooldown_seconds
+        ]
+        for uid in expired:
+            del self._last_alert[uid]
+
+    # =========================================================================
+    # Alert Delivery
+    # =========================================================================
+
+    async def run_once(self) -> int:
+        """
+        Run one sweep off the event loop and deliver its alerts.
+
+        Returns:
+            Number of alerts sent
+        """
+        alerts = await asyncio.to_thread(self.sweep_once)
+        if not alerts or not self.alert_on_detection or self._alerter is None:
+            return 0
+
+        sent = 0
+        undelivered = 0
+        for alert in alerts:
+            escalation = alert.escalation
+            try:
+                delivered = await self._alerter.send_escalation_alert(
+                    escalation_rate=escalation.escalation_type.value,
+                    pattern_name=escalation.matched_pattern,
+                    pattern_confidence=escalation.pattern_confidence,
+                    crisis_score=alert.crisis_score,
+                    score_delta=escalation.score_delta,
+                    time_span_hours=escalation.time_span_hours,
+                    intervention_urgency=alert.intervention.urgency,
+                    message_preview=SWEEP_MESSAGE_PREVIEW,
+                    user_id=alert.user_id,
+                    source="escalation_sweep",
+                    throttle_key=f"escalation_sweep:{alert.user_id}",
+                )
+            except Exception as e:
+                logger.warning(f"⚠️ Escalation sweep alert failed for {alert.user_id}: {e}")
+                delivered = False
+            if delivered:
+                # Cooldown starts only once the user's alert actually went out
+                self._last_alert[alert.user_id] = time.time()
+                sent += 1
+            else:
+                undelivered += 1
+
+        self._alerts_sent += sent
+        self._alerts_undelivered += undelivered
+        if undelivered:
+            logger.info(
+                f"🔕 {undelivered} of {len(alerts)} escalation sweep alerts "
+                f"not delivered (alerter disabled or throttled)"
+            )
+        return sent
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    def start(self) -> None:
+        """Start the periodic sweep task on the running event loop."""
+        if self._task is not None and not self._task.done():
+            return
+        self._running = True
+        self._task = asyncio.get_running_loop().create_task(self._run_loop())
+        logger.info(f"🔁 Escalation sweep started (every {self.interval_seconds:.0f}s)")
+
+    async def stop(self) -> None:
+        """Stop the periodic sweep task and wait for it to finish."""
+        self._running = False
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("🛑 Escalation sweep stopped")
+
+    async def _run_loop(self) -> None:
+        """Sleep, sweep, repeat; errors are logged and the loop continues."""
+        while self._running:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Escalation sweep failed: {e}", exc_info=True)
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the periodic sweep task is active."""
+        return self._task is not None and not self._task.done()
+
+    # =========================================================================
+    # Statistics
+    # =========================================================================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get sweep statistics.
+
+        Returns:
+            Dictionary with settings and counters
+        """
+        return {
+            "running": self.is_running,
+            "interval_seconds": self.interval_seconds,
+            "tick_budget_ms": self.tick_budget_ms,
+            "batch_size": self.batch_size,
+            "sweeps": self._sweeps,
+            "users_swept": self._users_swept,
+            "candidates": self._candidates,
+            "evaluated": self._evaluated,
+            "detections": self._detections,
+            "alerts_sent": self._alerts_sent,
+            "alerts_suppressed": self._alerts_suppressed,
+            "alerts_undelivered": self._alerts_undelivered,
+            "deferred": self._deferred,
+            "budget_exhausted": self._budget_exhausted,
+            "vectorized_batches": self._vectorized_batches,
+            "last_sweep_ms": round(self._last_sweep_ms, 3),
+            "dirty_users": self._store.dirty_count(),
+        }
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"EscalationSweeper(interval={self.interval_seconds}s, "
+            f"budget={self.tick_budget_ms}ms, running={self.is_running})"
+        )
+
+
+# =============================================================================
+# Factory Function
+# =============================================================================
+
+def create_escalation_sweeper(
+    context_analyzer: Optional[ContextAnalyzer],
+    alerter: Optional[Any] = None,
+    context_config_manager: Optional[ContextConfigManager] = None,
+) -> Optional[EscalationSweeper]:
+    """
+    Factory function for EscalationSweeper.
+
+    Args:
+        context_analyzer: Analyzer owning the history store and detectors
+        alerter: Optional DiscordAlerter for escalation alerts
+        context_config_manager: Config manager (default: the analyzer's)
+
+    Returns:
+        EscalationSweeper, or None when disabled or no history store exists
+    """
+    if context_analyzer is None or context_analyzer.get_history_store() is None:
+        return None
+
+    config_manager = context_config_manager or context_analyzer.get_config_manager()
+    sweep_config = config_manager.get_escalation_sweep_config()
+    if not sweep_config.enabled:
+        logger.debug("Escalation sweep disabled by configuration")
+        return None
+
+    escalation_config = config_manager.get_escalation_detection_config()
+    return EscalationSweeper(
+        context_analyzer=context_analyzer,
+        alerter=alerter,
+        interval_seconds=sweep_config.interval_seconds,
+        tick_budget_ms=sweep_config.tick_budget_ms,
+        batch_size=sweep_config.batch_size,
+        alert_on_detection=escalation_config.alert_on_detection,
+        alert_cooldown_seconds=escalation_config.alert_cooldown_seconds,
+    )
+
+
+# =============================================================================
+# Export public interface
+# =============================================================================
+
+__all__ = [
+    "EscalationSweeper",
+    "create_escalation_sweeper",
+    "SweepAlert",
+    "SEVERITY_FLOORS",
+    "severity_for_score",
+]
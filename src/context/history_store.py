@@ -0,0 +1,567 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+CORE PRINCIPLE: Multi-Model Ensemble → Weighted Decision Engine → Crisis Classification
+******************  CORE SYSTEM VISION (Never to be violated):  ****************
+Ash-NLP is a CRISIS DETECTION BACKEND that:
+1. PRIMARY: Uses BART Zero-Shot Classification for semantic crisis detection
+2. CONTEXTUAL: Enhances with sentiment, irony, and emotion model signals
+3. ENSEMBLE: Combines weighted model outputs through decision engine
+4. PURPOSE: Detect crisis messages in Discord community communications
+********************************************************************************
+User History Store for Ash-NLP Service - Phase 8
+---
+FILE VERSION: v5.0-8-10.0-2
+LAST MODIFIED: 2026-02-09
+PHASE: Phase 8 Step 10.0 - Background Escalation Sweep
+CLEAN ARCHITECTURE: v5.2.3 Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+
+RESPONSIBILITIES:
+- Keep a bounded rolling (timestamp, crisis_score) buffer per user
+- Expire entries older than the TTL
+- Evict least-recently-seen users beyond max_users
+- Optionally snapshot to / restore from disk across restarts
+- Track a per-user revision so incremental context windows can tell
+  whether they still mirror the stored history
+- Track which users changed since the last escalation sweep (dirty set)
+
+PRIVACY:
+Only epoch timestamps and crisis scores are kept. Message text is never
+stored, in memory or on disk.
+
+STORAGE:
+    OrderedDict[user_id → deque[(epoch_seconds, score)]]
+    - deque(maxlen=max_entries_per_user) gives the per-user ring buffer
+    - OrderedDict order is user recency (LRU across users)
+    OrderedDict[user_id → None] dirty set, oldest change first
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.managers import ContextConfigManager, create_context_config_manager
+
+# Module version
+__version__ = "v5.0-8-10.0-2"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Naive UTC epoch (context analysis works in naive UTC datetimes)
+_EPOCH = datetime(1970, 1, 1)
+
+# Snapshot format version
+SNAPSHOT_VERSION = 1
+
+
+def to_epoch(dt: datetime) -> float:
+    """Convert a datetime (aware or naive UTC) to epoch seconds."""
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return (dt - _EPOCH).total_seconds()
+
+
+def from_epoch(ts: float) -> datetime:
+    """Convert epoch seconds to a naive UTC datetime."""
+    return _EPOCH + timedelta(seconds=ts)
+
+
+# =============================================================================
+# User History Store
+# =============================================================================
+
+class UserHistoryStore:
+    """
+    In-process bounded per-user score history.
+
+    Thread-safe. All operations are O(1) amortized except get_sequences(),
+    which is O(entries for that user) and bounded by max_entries_per_user.
+
+    Clean Architecture v5.1 Compliance:
+    - Factory function: create_user_history_store()
+    """
+
+    def __init__(
+        self,
+        max_users: int = 10000,
+        max_entries_per_user: int = 50,
+        ttl_seconds: float = 72 * 3600.0,
+        snapshot_path: Optional[str] = None,
+    ):
+        """
+        Initialize UserHistoryStore.
+
+        Args:
+            max_users: Users kept before least-recently-seen are evicted
+            max_entries_per_user: Ring buffer size per user
+            ttl_seconds: Entries older than this are dropped
+            snapshot_path: Optional JSON snapshot file (loaded if present)
+
+        Note:
+            Use create_user_history_store() factory function instead.
+        """
+        self.max_users = max_users
+        self.max_entries_per_user = max_entries_per_user
+        self.ttl_seconds = ttl_seconds
+        self.snapshot_path = snapshot_path or None
+
+        self._users: "OrderedDict[str, deque]" = OrderedDict()
+        self._revisions: Dict[str, int] = {}
+        self._mutations = 0
+        self._dirty: "OrderedDict[str, None]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Statistics
+        self._records = 0
+        self._reads = 0
+        self._hits = 0
+        self._user_evictions = 0
+        self._expired_entries = 0
+
+        if self.snapshot_path and os.path.exists(self.snapshot_path):
+            self.load_snapshot()
+
+        logger.info(
+            f"✅ UserHistoryStore v{__version__} initialized "
+            f"(max_users={max_users}, per_user={max_entries_per_user}, "
+            f"ttl={ttl_seconds / 3600:.1f}h, snapshot={'on' if self.snapshot_path else 'off'})"
+        )
+
+    # =========================================================================
+    # Core Operations
+    # =========================================================================
+
+    def record(self, user_id: str, timestamp: datetime, crisis_score: float) -> bool:
+        """
+        Append one scored message for a user.
+
+        Args:
+            user_id: User identifier
+            timestamp: Message timestamp (aware or naive UTC)
+            crisis_score: Crisis score for the message
+
+        Returns:
+            False if the entry duplicated the user's latest one (not stored)
+        """
+        return self._record_epoch(user_id, to_epoch(timestamp), float(crisis_score))
+
+    def _record_epoch(self, user_id: str, ts: float, score: float) -> bool:
+        """Append (ts, score), keeping the buffer sorted by time."""
+        with self._lock:
+            entries = self._users.get(user_id)
+            if entries is None:
+                entries = deque(maxlen=self.max_entries_per_user)
+                self._users[user_id] = entries
+                while len(self._users) > self.max_users:
+                    evicted, _ = self._users.popitem(last=False)
+                    self._revisions.pop(evicted, None)
+                    self._dirty.pop(evicted, None)
+                    self._user_evictions += 1
+            else:
+                self._users.move_to_end(user_id)
+
+            if not entries or ts > entries[-1][0]:
+                entries.append((ts, score))
+            elif entries[-1] == (ts, score):
+                # Retried request for the same message
+                return False
+            else:
+                # Out-of-order arrival (rare): re-sort within the ring buffer
+                merged = sorted([*entries, (ts, score)])
+                entries.clear()
+                entries.extend(merged[-self.max_entries_per_user:])
+            self._records += 1
+            self._mutations += 1
+            self._revisions[user_id] = self._mutations
+            self._dirty[user_id] = None
+            return True
+
+    def seed(
+        self,
+        user_id: str,
+        items: Iterable[Tuple[datetime, float]],
+    ) -> int:
+        """
+        Seed an unknown user from caller-supplied history.
+
+        Used when a request carries both user_id and message_history for a
+        user the store has not seen (e.g. after a restart without snapshot).
+
+        Args:
+            user_id: User identifier
+            items: (timestamp, crisis_score) pairs
+
+        Returns:
+            Number of entries seeded (0 if the user already exists)
+        """
+        with self._lock:
+            if user_id in self._users:
+                return 0
+
+        count = 0
+        for timestamp, score in items:
+            self.record(user_id, timestamp, score)
+            count += 1
+        return count
+
+    def get_sequences(
+        self,
+        user_id: str,
+        limit: Optional[int] = None,
+        now: Optional[float] = None,
+    ) -> Tuple[List[float], List[datetime]]:
+        """
+        Get a user's recent history as parallel score/timestamp lists.
+
+        Args:
+            user_id: User identifier
+            limit: Most recent N entries (default: all)
+            now: Current epoch seconds (default: time.time())
+
+        Returns:
+            (scores, naive UTC timestamps), oldest first
+        """
+        snapshot, _ = self.get_entries(user_id, limit=limit, now=now)
+
+        return (
+            [score for _, score in snapshot],
+            [from_epoch(ts) for ts, _ in snapshot],
+        )
+
+    def get_entries(
+        self,
+        user_id: str,
+        limit: Optional[int] = None,
+        now: Optional[float] = None,
+        touch: bool = True,
+    ) -> Tuple[List[Tuple[float, float]], int]:
+        """
+        Get a user's unexpired raw entries and current revision.
+
+        Args:
+            user_id: User identifier
+            limit: Most recent N entries (default: all)
+            now: Current epoch seconds (default: time.time())
+            touch: Count the read and refresh user recency (False for
+                background readers such as the escalation sweep)
+
+        Returns:
+            ([(epoch_seconds, score), ...] oldest first, revision)
+        """
+        cutoff = (now if now is not None else time.time()) - self.ttl_seconds
+
+        with self._lock:
+            if touch:
+                self._reads += 1
+            entries = self._users.get(user_id)
+            if entries is None:
+                return [], 0
+
+            # Entries are time-ordered: expire from the left
+            while entries and entries[0][0] < cutoff:
+                entries.popleft()
+                self._expired_entries += 1
+            if not entries:
+                del self._users[user_id]
+                self._revisions.pop(user_id, None)
+                self._dirty.pop(user_id, None)
+                return [], 0
+
+            if touch:
+                self._users.move_to_end(user_id)
+                self._hits += 1
+            snapshot = list(entries)
+            revision = self._revisions.get(user_id, 0)
+
+        if limit is not None and len(snapshot) > limit:
+            snapshot = snapshot[-limit:]
+
+        return snapshot, revision
+
+    def get_revision(self, user_id: str) -> int:
+        """
+        Get a user's revision (changes on every stored mutation, 0 if unknown).
+
+        TTL expiry does not change the revision: readers apply the same
+        cutoff themselves.
+        """
+        with self._lock:
+            return self._revisions.get(user_id, 0)
+
+    def has_user(self, user_id: str) -> bool:
+        """Check whether a user has stored history."""
+        with self._lock:
+            return user_id in self._users
+
+    def forget(self, user_id: str) -> bool:
+        """
+        Drop all history for a user.
+
+        Returns:
+            True if the user had history
+        """
+        with self._lock:
+            self._revisions.pop(user_id, None)
+            self._dirty.pop(user_id, None)
+            return self._users.pop(user_id, None) is not None
+
+    def clear(self) -> int:
+        """
+        Drop all history.
+
+        Returns:
+            Number of users cleared
+        """
+        with self._lock:
+            count = len(self._users)
+            self._users.clear()
+            self._revisions.clear()
+            self._dirty.clear()
+        logger.info(f"User history store cleared ({count} users)")
+        return count
+
+    def evict_expired(self, now: Optional[float] = None) -> int:
+        """
+        Drop expired entries and users with no remaining history.
+
+        Returns:
+            Number of users removed
+        """
+        cutoff = (now if now is not None else time.time()) - self.ttl_seconds
+        removed = 0
+
+        with self._lock:
+            for user_id in list(self._users.keys()):
+                entries = self._users[user_id]
+                while entries and entries[0][0] < cutoff:
+                    entries.popleft()
+                    self._expired_entries += 1
+                if not entries:
+                    del self._users[user_id]
+                    self._revisions.pop(user_id, None)
+                    self._dirty.pop(user_id, None)
+                    removed += 1
+
+        if removed:
+            logger.debug(f"Evicted {removed} expired users from history store")
+        return removed
+
+    # =========================================================================
+    # Dirty Tracking (escalation sweep)
+    # =========================================================================
+
+    def pop_dirty(self, limit: Optional[int] = None) -> List[str]:
+        """
+        Take users whose history changed since they were last popped.
+
+        Args:
+            limit: Most users to take (default: all)
+
+        Returns:
+            User IDs, oldest change first (removed from the dirty set)
+        """
+        with self._lock:
+            count = len(self._dirty) if limit is None else min(limit, len(self._dirty))
+            return [self._dirty.popitem(last=False)[0] for _ in range(count)]
+
+    def mark_dirty(self, user_ids: Iterable[str]) -> int:
+        """
+        Put popped users back at the front of the dirty set.
+
+        Used by the sweep for users it could not evaluate within its
+        tick budget. Users no longer in the store are skipped.
+
+        Args:
+            user_ids: Users to requeue (in pop order)
+
+        Returns:
+            Number of users requeued
+        """
+        count = 0
+        with self._lock:
+            for user_id in reversed(list(user_ids)):
+                if user_id in self._users:
+                    self._dirty[user_id] = None
+                    self._dirty.move_to_end(user_id, last=False)
+                    count += 1
+        return count
+
+    def dirty_count(self) -> int:
+        """Number of users changed since they were last swept."""
+        with self._lock:
+            return len(self._dirty)
+
+    # =========================================================================
+    # Snapshot Persistence
+    # =========================================================================
+
+    def save_snapshot(self, path: Optional[str] = None) -> int:
+        """
+        Write all unexpired history to a JSON snapshot (atomic replace).
+
+        Args:
+            path: Snapshot file (default: configured snapshot_path)
+
+        Returns:
+            Number of users written (0 if no path configured)
+        """
+        path = path or self.snapshot_path
+        if not path:
+            return 0
+
+        self.evict_expired()
+        with self._lock:
+            users = {uid: [list(entry) for entry in entries] for uid, entries in self._users.items()}
+
+        payload = {
+            "version": SNAPSHOT_VERSION,
+            "saved_at": time.time(),
+            "users": users,
+        }
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(payload, f, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.error(f"❌ Failed to write history snapshot {path}: {e}")
+            return 0
+
+        logger.info(f"💾 History snapshot saved ({len(users)} users) → {path}")
+        return len(users)
+
+    def load_snapshot(self, path: Optional[str] = None) -> int:
+        """
+        Restore history from a JSON snapshot, dropping expired entries.
+
+        Args:
+            path: Snapshot file (default: configured snapshot_path)
+
+        Returns:
+            Number of users restored
+        """
+        path = path or self.snapshot_path
+        if not path or not os.path.exists(path):
+            return 0
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error(f"❌ Failed to read history snapshot {path}: {e}")
+            return 0
+
+        if payload.get("version") != SNAPSHOT_VERSION:
+            logger.warning(
+                f"⚠️ Ignoring history snapshot with version {payload.get('version')}"
+            )
+            return 0
+
+        cutoff = time.time() - self.ttl_seconds
+        restored = 0
+        for user_id, entries in payload.get("users", {}).items():
+            kept = [(float(ts), float(score)) for ts, score in entries if ts >= cutoff]
+            if not kept:
+                continue
+            for ts, score in sorted(kept):
+                self._record_epoch(user_id, ts, score)
+            restored += 1
+
+        logger.info(f"📂 History snapshot restored ({restored} users) ← {path}")
+        return restored
+
+    # =========================================================================
+    # Statistics
+    # =========================================================================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get store statistics.
+
+        Returns:
+            Dictionary with sizes and counters
+        """
+        with self._lock:
+            entries = sum(len(e) for e in self._users.values())
+            return {
+                "users": len(self._users),
+                "entries": entries,
+                "max_users": self.max_users,
+                "max_entries_per_user": self.max_entries_per_user,
+                "ttl_hours": round(self.ttl_seconds / 3600.0, 2),
+                "snapshot_path": self.snapshot_path,
+                "records": self._records,
+                "reads": self._reads,
+                "hits": self._hits,
+                "hit_rate": round(self._hits / self._reads, 4) if self._reads else 0.0,
+                "user_evictions": self._user_evictions,
+                "expired_entries": self._expired_entries,
+                "dirty_users": len(self._dirty),
+            }
+
+    def __len__(self) -> int:
+        """Return number of users with history."""
+        with self._lock:
+            return len(self._users)
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"UserHistoryStore(users={len(self)}/{self.max_users}, "
+            f"per_user={self.max_entries_per_user})"
+        )
+
+
+# =============================================================================
+# Factory Function
+# =============================================================================
+
+def create_user_history_store(
+    context_config_manager: Optional[ContextConfigManager] = None,
+) -> Optional[UserHistoryStore]:
+    """
+    Factory function for UserHistoryStore (Clean Architecture v5.1 Pattern).
+
+    Args:
+        context_config_manager: Context configuration manager (default: create new)
+
+    Returns:
+        Configured UserHistoryStore, or None if disabled in configuration
+    """
+    if context_config_manager is None:
+        context_config_manager = create_context_config_manager()
+
+    config = context_config_manager.get_history_store_config()
+    if not config.enabled:
+        logger.info("ℹ️  User history store disabled by configuration")
+        return None
+
+    return UserHistoryStore(
+        max_users=config.max_users,
+        max_entries_per_user=config.max_entries_per_user,
+        ttl_seconds=config.ttl_hours * 3600.0,
+        snapshot_path=config.snapshot_path or None,
+    )
+
+
+# =============================================================================
+# Export public interface
+# =============================================================================
+
+__all__ = [
+    "UserHistoryStore",
+    "create_user_history_store",
+    "to_epoch",
+    "from_epoch",
+    "SNAPSHOT_VERSION",
+]
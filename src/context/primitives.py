@@ -0,0 +1,257 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+CORE PRINCIPLE: Multi-Model Ensemble → Weighted Decision Engine → Crisis Classification
+******************  CORE SYSTEM VISION (Never to be violated):  ****************
+Ash-NLP is a CRISIS DETECTION BACKEND that:
+1. PRIMARY: Uses BART Zero-Shot Classification for semantic crisis detection
+2. CONTEXTUAL: Enhances with sentiment, irony, and emotion model signals
+3. ENSEMBLE: Combines weighted model outputs through decision engine
+4. PURPOSE: Detect crisis messages in Discord community communications
+********************************************************************************
+Vectorized Context Primitives for Ash-NLP Service
+---
+FILE VERSION: v5.0-8-8.0-1
+LAST MODIFIED: 2026-02-07
+PHASE: Phase 8 Step 8.0 - Vectorized Context Primitives
+CLEAN ARCHITECTURE: v5.1 Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+
+RESPONSIBILITIES:
+- Provide the per-element loops shared by the context detectors
+  (smoothing, transition counting, inflection points, dip consistency)
+- Use NumPy array operations for long histories when NumPy is installed
+- Fall back to pure Python for short histories or when NumPy is absent
+
+USAGE:
+    from src.context.primitives import smooth_scores, count_transitions
+
+    smoothed = smooth_scores(scores)
+    up, down = count_transitions(smoothed, tolerance=0.02)
+
+NOTE: NumPy is OPTIONAL (it ships with transformers/torch in production).
+Below VECTORIZE_MIN_LENGTH elements the array conversion costs more than
+the loop it replaces, so short sequences always take the Python path.
+Both paths perform the same float operations per element; smoothing may
+differ from the Python path in the last bit on interpreters whose sum()
+uses compensated summation (Python 3.12+).
+"""
+
+import logging
+from typing import List, Sequence, Tuple
+
+# Module version
+__version__ = "v5.0-8-8.0-1"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Flag for numpy availability
+NUMPY_AVAILABLE = False
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    logger.debug("numpy not installed - context primitives use pure Python")
+
+# Shortest sequence worth converting to an array
+VECTORIZE_MIN_LENGTH = 64
+
+# Process-wide switch (benchmarks compare both paths through the detectors)
+_vectorize_enabled = True
+
+
+def set_vectorize_enabled(enabled: bool) -> bool:
+    """
+    Enable or disable the NumPy path process-wide.
+
+    Args:
+        enabled: False forces pure Python everywhere
+
+    Returns:
+        Whether the NumPy path is now in effect (False without NumPy)
+    """
+    global _vectorize_enabled
+    _vectorize_enabled = bool(enabled)
+    return _vectorize_enabled and NUMPY_AVAILABLE
+
+
+def _use_numpy(values: Sequence[float], vectorize: bool) -> bool:
+    """True when the NumPy path should handle this sequence."""
+    return (
+        vectorize
+        and _vectorize_enabled
+        and NUMPY_AVAILABLE
+        and len(values) >= VECTORIZE_MIN_LENGTH
+    )
+
+
+# =============================================================================
+# Smoothing
+# =============================================================================
+
+def smooth_scores(scores: Sequence[float], vectorize: bool = True) -> List[float]:
+    """
+    Centered 3-point moving average (2-point at the edges).
+
+    Args:
+        scores: Raw score sequence
+        vectorize: Allow the NumPy path (False forces pure Python)
+
+    Returns:
+        Smoothed scores (same length; a copy when len <= 2)
+    """
+    n = len(scores)
+    if n <= 2:
+        return list(scores)
+
+    if _use_numpy(scores, vectorize):
+        arr = np.asarray(scores, dtype=np.float64)
+        smoothed = np.empty(n, dtype=np.float64)
+        smoothed[1:-1] = (arr[:-2] + arr[1:-1] + arr[2:]) / 3
+        smoothed[0] = (arr[0] + arr[1]) / 2
+        smoothed[-1] = (arr[-2] + arr[-1]) / 2
+        return smoothed.tolist()
+
+    smoothed = [sum((scores[0], scores[1])) / 2]
+    smoothed.extend(
+        sum((scores[i - 1], scores[i], scores[i + 1])) / 3 for i in range(1, n - 1)
+    )
+    smoothed.append(sum((scores[-2], scores[-1])) / 2)
+    return smoothed
+
+
+# =============================================================================
+# Transitions
+# =============================================================================
+
+def count_transitions(
+    values: Sequence[float],
+    tolerance: float,
+    vectorize: bool = True,
+) -> Tuple[int, int]:
+    """
+    Count adjacent deltas above +tolerance and below -tolerance.
+
+    Args:
+        values: Score sequence
+        tolerance: Deltas within ±tolerance count as flat
+        vectorize: Allow the NumPy path
+
+    Returns:
+        Tuple of (up, down) transition counts
+    """
+    if len(values) < 2:
+        return 0, 0
+
+    if _use_numpy(values, vectorize):
+        deltas = np.diff(np.asarray(values, dtype=np.float64))
+        return int(np.count_nonzero(deltas > tolerance)), int(
+            np.count_nonzero(deltas < -tolerance)
+        )
+
+    up = 0
+    down = 0
+    prev = values[0]
+    for value in values[1:]:
+        delta = value - prev
+        if delta > tolerance:
+            up += 1
+        elif delta < -tolerance:
+            down += 1
+        prev = value
+    return up, down
+
+
+def count_non_dips(
+    values: Sequence[float],
+    dip_tolerance: float,
+    vectorize: bool = True,
+) -> int:
+    """
+    Count transitions that do not dip by more than dip_tolerance.
+
+    Args:
+        values: Score sequence
+        dip_tolerance: Largest allowed drop between neighbours
+        vectorize: Allow the NumPy path
+
+    Returns:
+        Number of i with values[i] >= values[i-1] - dip_tolerance
+    """
+    if len(values) < 2:
+        return 0
+
+    if _use_numpy(values, vectorize):
+        arr = np.asarray(values, dtype=np.float64)
+        return int(np.count_nonzero(arr[1:] >= arr[:-1] - dip_tolerance))
+
+    return sum(
+        1 for prev, value in zip(values, values[1:]) if value >= prev - dip_tolerance
+    )
+
+
+def find_inflection_points(
+    values: Sequence[float],
+    tolerance: float,
+    vectorize: bool = True,
+) -> List[int]:
+    """
+    Find indices where the direction of non-flat deltas reverses.
+
+    Flat deltas (within ±tolerance) are skipped; a reversal between two
+    non-flat deltas is reported at the index where the later delta starts.
+
+    Args:
+        values: Score sequence
+        tolerance: Deltas within ±tolerance count as flat
+        vectorize: Allow the NumPy path
+
+    Returns:
+        List of inflection indices, ascending
+    """
+    if len(values) < 3:
+        return []
+
+    if _use_numpy(values, vectorize):
+        deltas = np.diff(np.asarray(values, dtype=np.float64))
+        signs = (deltas > tolerance).astype(np.int8) - (deltas < -tolerance).astype(np.int8)
+        moving = np.flatnonzero(signs)
+        if len(moving) < 2:
+            return []
+        directions = signs[moving]
+        reversals = np.flatnonzero(directions[1:] != directions[:-1])
+        return moving[reversals + 1].tolist()
+
+    points = []
+    prev_direction = 0
+    for i in range(1, len(values)):
+        delta = values[i] - values[i - 1]
+        if delta > tolerance:
+            direction = 1
+        elif delta < -tolerance:
+            direction = -1
+        else:
+            continue
+        if prev_direction and direction != prev_direction:
+            points.append(i - 1)
+        prev_direction = direction
+    return points
+
+
+# =============================================================================
+# Export public interface
+# =============================================================================
+
+__all__ = [
+    "NUMPY_AVAILABLE",
+    "VECTORIZE_MIN_LENGTH",
+    "set_vectorize_enabled",
+    "smooth_scores",
+    "count_transitions",
+    "count_non_dips",
+    "find_inflection_points",
+]
@@ -10,9 +10,9 @@ Ash-NLP is a CRISIS DETECTION BACKEND that:
 ********************************************************************************
 Temporal Detector for Ash-NLP Service - Phase 5
 ---
-FILE VERSION: v5.0-6-2.0-1
-LAST MODIFIED: 2026-01-02
-PHASE: Phase 6 - Sprint 2 (FE-001: Timezone Support)
+FILE VERSION: v5.0-8-9.0-1
+LAST MODIFIED: 2026-02-08
+PHASE: Phase 8 Step 9.0 - Timezone Resolution Cache
 CLEAN ARCHITECTURE: v5.1 Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-nlp
 Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
@@ -24,13 +24,17 @@ RESPONSIBILITIES:
 - Identify weekend patterns
 - Provide temporal context for crisis assessment
 - FE-001: Support user timezone for accurate local time detection
+- Phase 8: Analyze an incremental ContextWindow without rescanning history
+- Phase 8: Resolve each timezone name once per process and convert the whole
+  timestamp sequence to local hour/weekday fields in one pass
 """
 
 import logging
 from enum import Enum
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple, TYPE_CHECKING
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta, timezone, tzinfo
 
 try:
     from zoneinfo import ZoneInfo
@@ -43,12 +47,75 @@ from src.managers import (
     TemporalDetectionConfig,
 )
 
+if TYPE_CHECKING:
+    from .context_window import ContextWindow
+
 # Module version
-__version__ = "v5.0-6-2.0-1"
+__version__ = "v5.0-8-9.0-1"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+# Distinct timezone names kept resolved (names come from requests: bounded)
+ZONE_CACHE_SIZE = 512
+
+_EPOCH = datetime(1970, 1, 1)
+_ONE_SECOND = timedelta(seconds=1)
+
+
+# =============================================================================
+# Timezone Registry (Phase 8)
+# =============================================================================
+
+@lru_cache(maxsize=ZONE_CACHE_SIZE)
+def resolve_timezone(timezone_str: str) -> Optional[tzinfo]:
+    """
+    Resolve an IANA timezone name, memoized (invalid names cache as None).
+    
+    Args:
+        timezone_str: IANA timezone string (e.g., 'America/New_York')
+        
+    Returns:
+        tzinfo for the zone, or None if the name is invalid
+    """
+    try:
+        return ZoneInfo(timezone_str)
+    except Exception as e:
+        logger.warning(f"Failed to resolve timezone '{timezone_str}': {e}")
+        return None
+
+
+def local_time_fields(
+    timestamps: List[datetime],
+    zone: Optional[tzinfo],
+) -> Tuple[List[int], List[int]]:
+    """
+    Convert a timestamp sequence to local hour and weekday lists in one pass.
+    
+    Args:
+        timestamps: Timestamps in UTC (naive timestamps are assumed UTC)
+        zone: Resolved target zone (None = use timestamps as given)
+        
+    Returns:
+        Tuple of (hours 0-23, weekdays 0=Monday..6=Sunday)
+    """
+    if zone is None:
+        return [ts.hour for ts in timestamps], [ts.weekday() for ts in timestamps]
+    
+    hours = []
+    weekdays = []
+    from_timestamp = datetime.fromtimestamp
+    for ts in timestamps:
+        if ts.tzinfo is None:
+            # Whole epoch seconds: cheaper than replace(tzinfo=utc), and
+            # hour/weekday boundaries fall on whole seconds
+            local = from_timestamp((ts - _EPOCH) // _ONE_SECOND, zone)
+        else:
+            local = ts.astimezone(zone)
+        hours.append(local.hour)
+        weekdays.append(local.weekday())
+    return hours, weekdays
+
 
 # =============================================================================
 # Enums
@@ -169,32 +236,23 @@ class TemporalDetector:
             logger.debug("No timestamps provided for temporal analysis")
             return TemporalAnalysis()
         
-        # Use last timestamp as current if not provided
-        if current_timestamp is None:
-            current_timestamp = timestamps[-1]
-        
-        # FE-001: Convert to user's local time if timezone provided
-        local_timestamp = current_timestamp
-        local_hour = None
-        if user_timezone:
-            local_timestamp = self._convert_to_local_time(current_timestamp, user_timezone)
-            if local_timestamp:
-                local_hour = local_timestamp.hour
-                logger.debug(
-                    f"Timezone conversion: UTC hour {current_timestamp.hour} -> "
-                    f"{user_timezone} hour {local_hour}"
-                )
-            else:
-                # Invalid timezone, fall back to UTC
-                local_timestamp = current_timestamp
-                logger.warning(f"Invalid timezone '{user_timezone}', using UTC")
+        zone = self._resolve_zone(user_timezone)
+        
+        # One conversion pass over the sequence, shared by every check below
+        hours, weekdays = local_time_fields(timestamps, zone)
         
-        # Use local time for late night analysis
-        analysis_timestamp = local_timestamp if local_timestamp else current_timestamp
+        # Use last timestamp as current if not provided
+        if current_timestamp is None or current_timestamp == timestamps[-1]:
+            current_hour, current_weekday = hours[-1], weekdays[-1]
+        else:
+            (current_hour,), (current_weekday,) = local_time_fields(
+                [current_timestamp], zone
+            )
+        local_hour = current_hour if zone is not None else None
         
         # Analyze late night patterns (using local time)
         late_night_detected, late_night_count = self._analyze_late_night(
-            timestamps, analysis_timestamp, user_timezone
+            hours, current_hour
         )
         
         # Analyze posting frequency
@@ -202,8 +260,124 @@ class TemporalDetector:
             timestamps
         )
         
+        return self._build_analysis(
+            hour=current_hour,
+            weekday=current_weekday,
+            local_hour=local_hour,
+            user_timezone=user_timezone,
+            late_night_detected=late_night_detected,
+            late_night_count=late_night_count,
+            rapid_posting_detected=rapid_posting_detected,
+            messages_in_window=messages_in_window,
+            average_gap=self._calculate_average_gap(timestamps),
+        )
+    
+    def analyze_window(
+        self,
+        window: "ContextWindow",
+        current_timestamp: Optional[datetime] = None,
+        user_timezone: Optional[str] = None,
+    ) -> TemporalAnalysis:
+        """
+        Analyze an incremental ContextWindow (Phase 8).
+        
+        Produces the same TemporalAnalysis as analyze(window.timestamps(),
+        ...) from the window's late-night count, rapid-window size and
+        telescoped average gap.
+        
+        Args:
+            window: ContextWindow holding the user's recent timestamps
+            current_timestamp: Timestamp of current message (default: last)
+            user_timezone: User's timezone for local time detection
+            
+        Returns:
+            TemporalAnalysis with detection results
+        """
+        if not self._config.enabled:
+            return TemporalAnalysis()
+        
+        if not len(window):
+            return TemporalAnalysis()
+        
+        # Late-night flags were computed in the window's timezone
+        if window.timezone != (user_timezone or None):
+            return self.analyze(window.timestamps(), current_timestamp, user_timezone)
+        
+        if current_timestamp is None:
+            current_timestamp = window.timestamp_bounds()[-1]
+        
+        zone = self._resolve_zone(user_timezone)
+        (current_hour,), (current_weekday,) = local_time_fields([current_timestamp], zone)
+        local_hour = current_hour if zone is not None else None
+        
+        messages_in_window = window.messages_in_rapid_window if len(window) >= 2 else len(window)
+        rapid_posting_detected = (
+            len(window) >= 2
+            and messages_in_window >= self._config.rapid_posting_message_count
+        )
+        
+        return self._build_analysis(
+            hour=current_hour,
+            weekday=current_weekday,
+            local_hour=local_hour,
+            user_timezone=user_timezone,
+            late_night_detected=self._is_late_night_hour(current_hour),
+            late_night_count=window.late_night_count,
+            rapid_posting_detected=rapid_posting_detected,
+            messages_in_window=messages_in_window,
+            average_gap=window.average_gap_minutes(),
+        )
+    
+    def _resolve_zone(self, user_timezone: Optional[str]) -> Optional[tzinfo]:
+        """
+        Resolve the user's timezone for time-of-day analysis (FE-001).
+        
+        Args:
+            user_timezone: User's timezone, if any
+            
+        Returns:
+            Resolved zone, or None to analyze in UTC
+        """
+        if not user_timezone:
+            return None
+        
+        zone = resolve_timezone(user_timezone)
+        if zone is None:
+            # Invalid timezone, fall back to UTC
+            logger.warning(f"Invalid timezone '{user_timezone}', using UTC")
+        return zone
+    
+    def _build_analysis(
+        self,
+        hour: int,
+        weekday: int,
+        local_hour: Optional[int],
+        user_timezone: Optional[str],
+        late_night_detected: bool,
+        late_night_count: int,
+        rapid_posting_detected: bool,
+        messages_in_window: int,
+        average_gap: float,
+    ) -> TemporalAnalysis:
+        """
+        Classify and assemble a TemporalAnalysis (shared by both paths).
+        
+        Args:
+            hour: Current message hour (local if timezone given)
+            weekday: Current message weekday (local if timezone given)
+            local_hour: Hour in user's local timezone (FE-001)
+            user_timezone: User's timezone if provided (FE-001)
+            late_night_detected: Whether current message is late night
+            late_night_count: Late night messages in history
+            rapid_posting_detected: Whether rapid posting was detected
+            messages_in_window: Messages in the rapid posting window
+            average_gap: Average gap between messages in minutes
+            
+        Returns:
+            TemporalAnalysis
+        """
         # Classify time of day risk (using local time - FE-001)
-        time_of_day_risk = self._classify_time_of_day(analysis_timestamp)
+        time_of_day_risk = self._classify_hour(hour)
         
         # Classify posting frequency
         posting_frequency = self._classify_posting_frequency(
@@ -212,10 +386,7 @@ class TemporalDetector:
         )
         
         # Check weekend (using local time - FE-001)
-        is_weekend = self._is_weekend(analysis_timestamp)
-        
-        # Calculate average gap
-        average_gap = self._calculate_average_gap(timestamps)
+        is_weekend = weekday >= 5
         
         # Calculate combined risk modifier
         risk_modifier = self._calculate_risk_modifier(
@@ -233,7 +404,7 @@ class TemporalDetector:
             posting_frequency=posting_frequency,
             risk_modifier=risk_modifier,
             is_weekend=is_weekend,
-            hour_of_day=analysis_timestamp.hour,  # Now uses local time if timezone provided
+            hour_of_day=hour,  # Now uses local time if timezone provided
             average_gap_minutes=average_gap,
             user_timezone=user_timezone,  # FE-001
             local_hour=local_hour,  # FE-001
@@ -241,43 +412,40 @@ class TemporalDetector:
     
     def _analyze_late_night(
         self,
-        timestamps: List[datetime],
-        current_timestamp: datetime,
-        user_timezone: Optional[str] = None,
+        hours: List[int],
+        current_hour: int,
     ) -> tuple[bool, int]:
         """
         Analyze for late night posting patterns.
         
         Args:
-            timestamps: List of message timestamps
-            current_timestamp: Current message timestamp (in local time if timezone provided)
-            user_timezone: User's timezone for converting historical timestamps (FE-001)
+            hours: Local hour of each message (FE-001: user's timezone if given)
+            current_hour: Current message hour (local time if timezone provided)
             
         Returns:
             Tuple of (is_late_night, late_night_message_count)
         """
         # Check if current message is late night (already in local time)
-        is_late_night = self._is_late_night_hour(current_timestamp.hour)
+        is_late_night = self._is_late_night_hour(current_hour)
         
         # Count how many messages in history are late night
-        # FE-001: Convert each timestamp to user's local time if timezone provided
-        late_night_count = 0
-        for ts in timestamps:
-            if user_timezone:
-                local_ts = self._convert_to_local_time(ts, user_timezone)
-                if local_ts:
-                    if self._is_late_night_hour(local_ts.hour):
-                        late_night_count += 1
-                else:
-                    # Fallback to UTC if conversion fails
-                    if self._is_late_night_hour(ts.hour):
-                        late_night_count += 1
-            else:
-                if self._is_late_night_hour(ts.hour):
-                    late_night_count += 1
+        is_late = self._is_late_night_hour
+        late_night_count = sum(1 for hour in hours if is_late(hour))
         
         return is_late_night, late_night_count
     
+    def is_late_night_hour(self, hour: int) -> bool:
+        """Check if an hour falls within the configured late night window."""
+        return self._is_late_night_hour(hour)
+    
+    def convert_to_local_time(
+        self,
+        utc_timestamp: datetime,
+        timezone_str: str,
+    ) -> Optional[datetime]:
+        """Convert a UTC timestamp to local time (None if timezone invalid)."""
+        return self._convert_to_local_time(utc_timestamp, timezone_str)
+    
     def _is_late_night_hour(self, hour: int) -> bool:
         """
         Check if an hour falls within late night window.
@@ -322,9 +490,11 @@ class TemporalDetector:
             ... )
             datetime(2025, 12, 31, 22, 0)  # 10 PM EST (previous day)
         """
+        tz = resolve_timezone(timezone_str)
+        if tz is None:
+            return None
+        
         try:
-            tz = ZoneInfo(timezone_str)
-            
             # Ensure timestamp is timezone-aware (assume UTC if naive)
             if utc_timestamp.tzinfo is None:
                 utc_aware = utc_timestamp.replace(tzinfo=timezone.utc)
@@ -350,11 +520,7 @@ class TemporalDetector:
         Returns:
             True if timezone is valid
         """
-        try:
-            ZoneInfo(timezone_str)
-            return True
-        except Exception:
-            return False
+        return resolve_timezone(timezone_str) is not None
     
     def _analyze_posting_frequency(
         self,
@@ -401,8 +567,10 @@ class TemporalDetector:
         Returns:
             TimeOfDayRisk classification
         """
-        hour = timestamp.hour
-        
+        return self._classify_hour(timestamp.hour)
+    
+    def _classify_hour(self, hour: int) -> TimeOfDayRisk:
+        """Classify time of day risk level from an hour (0-23)."""
         if self._is_late_night_hour(hour):
             # Late night: 10PM - 4AM (default)
             return TimeOfDayRisk.LATE_NIGHT
@@ -462,11 +630,8 @@ class TemporalDetector:
         if len(timestamps) < 2:
             return 0.0
         
-        total_gap = timedelta()
-        
-        for i in range(1, len(timestamps)):
-            gap = timestamps[i] - timestamps[i-1]
-            total_gap += gap
+        # Adjacent gaps telescope: their sum is last - first (exact in timedelta)
+        total_gap = timestamps[-1] - timestamps[0]
         
         avg_gap = total_gap / (len(timestamps) - 1)
         return avg_gap.total_seconds() / 60.0
@@ -552,4 +717,6 @@ __all__ = [
     "TemporalAnalysis",
     "TemporalDetector",
     "create_temporal_detector",
+    "resolve_timezone",
+    "local_time_fields",
 ]
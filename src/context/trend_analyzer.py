@@ -10,9 +10,9 @@ Ash-NLP is a CRISIS DETECTION BACKEND that:
 ********************************************************************************
 Trend Analyzer for Ash-NLP Service - Phase 5
 ---
-FILE VERSION: v5.0-5-1.0-1
-LAST MODIFIED: 2026-01-01
-PHASE: Phase 5 - Context History Analysis
+FILE VERSION: v5.0-8-8.0-1
+LAST MODIFIED: 2026-02-07
+PHASE: Phase 8 Step 8.0 - Vectorized Context Primitives
 CLEAN ARCHITECTURE: v5.1 Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-nlp
 Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
@@ -22,11 +22,14 @@ RESPONSIBILITIES:
 - Calculate trend velocity (how fast things are changing)
 - Provide trajectory information for visualization
 - Detect trend reversals and inflection points
+- Phase 8: Analyze an incremental ContextWindow without rescanning history
+- Phase 8: Smoothing/transition/inflection loops via context primitives
+  (NumPy-vectorized for long histories)
 """
 
 import logging
 from enum import Enum
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, TYPE_CHECKING
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -35,12 +38,25 @@ from src.managers import (
     TrendAnalysisConfig,
 )
 
+from .primitives import (
+    smooth_scores,
+    count_transitions,
+    find_inflection_points,
+)
+
+if TYPE_CHECKING:
+    from .context_window import ContextWindow
+
 # Module version
-__version__ = "v5.0-5-1.0-1"
+__version__ = "v5.0-8-8.0-1"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+# Smoothed-transition tolerances (shared with ContextWindow accumulators)
+CONSISTENCY_TOLERANCE = 0.02
+INFLECTION_TOLERANCE = 0.03
+
 
 # =============================================================================
 # Enums
@@ -169,20 +185,92 @@ class TrendAnalyzer:
             return TrendAnalysis()
         
         # Calculate time span if timestamps provided
-        time_span_hours = 0.0
-        if timestamps and len(timestamps) >= 2:
-            delta = timestamps[-1] - timestamps[0]
-            time_span_hours = max(delta.total_seconds() / 3600.0, 0.0167)
+        time_span_hours = self._calculate_time_span(timestamps)
         
         # Smooth scores to reduce noise
         smoothed_scores = self._smooth_scores(scores)
         
-        # Calculate basic metrics
-        start_score = smoothed_scores[0]
-        end_score = smoothed_scores[-1]
+        return self._build_analysis(
+            smoothed_scores=smoothed_scores,
+            start_score=smoothed_scores[0],
+            end_score=smoothed_scores[-1],
+            min_score=min(smoothed_scores),
+            max_score=max(smoothed_scores),
+            transition_counts=self._count_transitions(smoothed_scores),
+            inflection_points=self._find_inflection_points(smoothed_scores),
+            time_span_hours=time_span_hours,
+        )
+    
+    def analyze_window(self, window: "ContextWindow") -> TrendAnalysis:
+        """
+        Analyze an incremental ContextWindow (Phase 8).
+        
+        Produces the same TrendAnalysis as analyze(window.scores(),
+        window.timestamps()) from the window's smoothed-series accumulators.
+        
+        Args:
+            window: ContextWindow holding the user's recent scores
+            
+        Returns:
+            TrendAnalysis with detection results
+        """
+        if not self._config.enabled:
+            return TrendAnalysis()
+        
+        if len(window) < 2:
+            return self.analyze(window.scores())
+        
+        start_score, end_score, min_score, max_score = window.smoothed_bounds()
+        
+        return self._build_analysis(
+            smoothed_scores=window.smoothed_scores(),
+            start_score=start_score,
+            end_score=end_score,
+            min_score=min_score,
+            max_score=max_score,
+            transition_counts=window.trend_counts(),
+            inflection_points=window.inflection_points(),
+            time_span_hours=self._calculate_time_span(window.timestamp_bounds()),
+        )
+    
+    def _calculate_time_span(self, timestamps: Optional[List[datetime]]) -> float:
+        """Time span in hours between first and last timestamp (min 1 minute)."""
+        if timestamps and len(timestamps) >= 2:
+            delta = timestamps[-1] - timestamps[0]
+            return max(delta.total_seconds() / 3600.0, 0.0167)
+        return 0.0
+    
+    def _build_analysis(
+        self,
+        smoothed_scores: List[float],
+        start_score: float,
+        end_score: float,
+        min_score: float,
+        max_score: float,
+        transition_counts: Tuple[int, int],
+        inflection_points: List[int],
+        time_span_hours: float,
+    ) -> TrendAnalysis:
+        """
+        Derive a TrendAnalysis from smoothed-series summary values.
+        
+        Shared by analyze() and analyze_window() so both paths classify
+        identically.
+        
+        Args:
+            smoothed_scores: Smoothed score list
+            start_score: First smoothed score
+            end_score: Last smoothed score
+            min_score: Minimum smoothed score
+            max_score: Maximum smoothed score
+            transition_counts: (up, down) transitions beyond CONSISTENCY_TOLERANCE
+            inflection_points: Indices where direction changed
+            time_span_hours: Time span analyzed
+            
+        Returns:
+            TrendAnalysis
+        """
         score_delta = end_score - start_score
-        min_score = min(smoothed_scores)
-        max_score = max(smoothed_scores)
         
         # Calculate rate per hour
         rate_per_hour = 0.0
@@ -190,19 +278,17 @@ class TrendAnalyzer:
             rate_per_hour = score_delta / time_span_hours
         
         # Determine direction and velocity
-        direction = self._determine_direction(score_delta, smoothed_scores)
+        direction = self._determine_direction(score_delta, transition_counts)
         velocity = self._determine_velocity(rate_per_hour)
         
-        # Find inflection points
-        inflection_points = self._find_inflection_points(smoothed_scores)
-        
         # Adjust direction for volatile patterns
         if len(inflection_points) >= 2 and abs(score_delta) < self._config.worsening_threshold:
             direction = TrendDirection.VOLATILE
         
         # Calculate confidence
         confidence = self._calculate_confidence(
-            scores=smoothed_scores,
+            data_points=len(smoothed_scores),
+            transition_counts=transition_counts,
             direction=direction,
             score_delta=score_delta,
         )
@@ -235,35 +321,19 @@ class TrendAnalyzer:
         Returns:
             Smoothed score list (same length)
         """
-        if len(scores) <= 2:
-            return scores.copy()
-        
-        smoothed = []
-        window_size = min(3, len(scores))
-        
-        for i in range(len(scores)):
-            # Calculate window bounds
-            start = max(0, i - window_size // 2)
-            end = min(len(scores), i + window_size // 2 + 1)
-            
-            # Calculate average in window
-            window = scores[start:end]
-            avg = sum(window) / len(window)
-            smoothed.append(avg)
-        
-        return smoothed
+        return smooth_scores(scores)
     
     def _determine_direction(
         self, 
         score_delta: float,
-        scores: List[float],
+        transition_counts: Tuple[int, int],
     ) -> TrendDirection:
         """
         Determine overall trend direction.
         
         Args:
             score_delta: Total score change
-            scores: Score list for consistency check
+            transition_counts: (up, down) counts for consistency check
             
         Returns:
             TrendDirection classification
@@ -271,14 +341,14 @@ class TrendAnalyzer:
         # Check against thresholds
         if score_delta >= self._config.worsening_threshold:
             # Verify consistent upward movement
-            if self._is_consistent_trend(scores, increasing=True):
+            if self._is_consistent_counts(transition_counts, increasing=True):
                 return TrendDirection.WORSENING
             else:
                 return TrendDirection.VOLATILE
         
         elif score_delta <= self._config.improving_threshold:
             # Verify consistent downward movement
-            if self._is_consistent_trend(scores, increasing=False):
+            if self._is_consistent_counts(transition_counts, increasing=False):
                 return TrendDirection.IMPROVING
             else:
                 return TrendDirection.VOLATILE
@@ -306,23 +376,37 @@ class TrendAnalyzer:
         if len(scores) < 2:
             return True
         
-        # Count transitions in expected vs opposite direction
-        expected = 0
-        opposite = 0
+        return self._is_consistent_counts(self._count_transitions(scores), increasing)
+    
+    def _count_transitions(self, scores: List[float]) -> Tuple[int, int]:
+        """
+        Count up/down transitions beyond CONSISTENCY_TOLERANCE.
         
-        for i in range(1, len(scores)):
-            delta = scores[i] - scores[i-1]
+        Args:
+            scores: Score list
             
-            if increasing:
-                if delta > 0.02:  # Small tolerance
-                    expected += 1
-                elif delta < -0.02:
-                    opposite += 1
-            else:
-                if delta < -0.02:
-                    expected += 1
-                elif delta > 0.02:
-                    opposite += 1
+        Returns:
+            Tuple of (up, down) transition counts
+        """
+        return count_transitions(scores, CONSISTENCY_TOLERANCE)
+    
+    def _is_consistent_counts(
+        self,
+        transition_counts: Tuple[int, int],
+        increasing: bool,
+    ) -> bool:
+        """
+        Check trend consistency from (up, down) transition counts.
+        
+        Args:
+            transition_counts: (up, down) transition counts
+            increasing: True to check for upward trend
+            
+        Returns:
+            True if trend is consistent
+        """
+        up, down = transition_counts
+        expected, opposite = (up, down) if increasing else (down, up)
         
         # Consider consistent if majority moves in expected direction
         total = expected + opposite
@@ -365,36 +449,13 @@ class TrendAnalyzer:
         Returns:
             List of indices where direction changed
         """
-        if len(scores) < 3:
-            return []
-        
-        inflection_points = []
-        tolerance = 0.03  # Ignore tiny fluctuations
-        
-        # Track current direction
-        prev_direction = None  # True=up, False=down, None=flat
-        
-        for i in range(1, len(scores)):
-            delta = scores[i] - scores[i-1]
-            
-            if delta > tolerance:
-                current_direction = True
-            elif delta < -tolerance:
-                current_direction = False
-            else:
-                continue  # Flat, no direction change
-            
-            # Check for direction reversal
-            if prev_direction is not None and current_direction != prev_direction:
-                inflection_points.append(i - 1)
-            
-            prev_direction = current_direction
-        
-        return inflection_points
+        # Ignore tiny fluctuations
+        return find_inflection_points(scores, INFLECTION_TOLERANCE)
     
     def _calculate_confidence(
         self,
-        scores: List[float],
+        data_points: int,
+        transition_counts: Tuple[int, int],
         direction: TrendDirection,
         score_delta: float,
     ) -> float:
@@ -407,7 +468,8 @@ class TrendAnalyzer:
         - Number of data points
         
         Args:
-            scores: Score list
+            data_points: Number of scores analyzed
+            transition_counts: (up, down) transition counts
             direction: Detected direction
             score_delta: Total score change
             
@@ -415,7 +477,7 @@ class TrendAnalyzer:
             Confidence score 0.0-1.0
         """
         # Factor 1: Data points (more = higher confidence, up to 0.3)
-        data_factor = min(len(scores) / 10.0, 0.3)
+        data_factor = min(data_points / 10.0, 0.3)
         
         # Factor 2: Magnitude of change (larger = higher confidence, up to 0.4)
         if direction in (TrendDirection.WORSENING, TrendDirection.IMPROVING):
@@ -430,7 +492,7 @@ class TrendAnalyzer:
             consistency_factor = 0.1
         else:
             increasing = direction == TrendDirection.WORSENING
-            is_consistent = self._is_consistent_trend(scores, increasing)
+            is_consistent = self._is_consistent_counts(transition_counts, increasing)
             consistency_factor = 0.3 if is_consistent else 0.15
         
         confidence = data_factor + magnitude_factor + consistency_factor
@@ -507,6 +569,8 @@ def create_trend_analyzer(
 # =============================================================================
 
 __all__ = [
+    "CONSISTENCY_TOLERANCE",
+    "INFLECTION_TOLERANCE",
     "TrendDirection",
     "TrendVelocity",
     "TrendAnalysis",
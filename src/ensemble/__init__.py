@@ -110,10 +110,16 @@ from .fallback import (
     CircuitBreaker,
     CircuitState,
     ModelFailureInfo,
+    FallbackSnapshot,
     CriticalModelFailure,
     EnsembleDegradedError,
 )
 
+from .hedging import (
+    HedgedInference,
+    create_hedged_inference,
+)
+
 # =============================================================================
 # Phase 4: Consensus Algorithms
 # =============================================================================
@@ -124,6 +130,7 @@ from .consensus import (
     AgreementLevel,
     # Data classes
     ConsensusResult,
+    ConsensusPlan,
     # Algorithm functions
     weighted_voting_consensus,
     majority_voting_consensus,
@@ -192,11 +199,21 @@ from .explainability import (
     ModelContribution,
     RecommendedAction as ExplainabilityRecommendedAction,
     Explanation,
+    LazyExplanation,
     # Generator class
     ExplainabilityGenerator,
     create_explainability_generator,
 )
 
+# =============================================================================
+# Phase 8: Compiled Decision Plan
+# =============================================================================
+
+from .decision_plan import (
+    DecisionPlan,
+    create_decision_plan,
+)
+
 # =============================================================================
 # Public API
 # =============================================================================
@@ -234,8 +251,13 @@ __all__ = [
     "CircuitBreaker",
     "CircuitState",
     "ModelFailureInfo",
+    "FallbackSnapshot",
     "CriticalModelFailure",
     "EnsembleDegradedError",
+
+    # Hedging
+    "HedgedInference",
+    "create_hedged_inference",
     
     # =========================================================================
     # PHASE 4 COMPONENTS
@@ -245,6 +267,7 @@ __all__ = [
     "ConsensusAlgorithm",
     "AgreementLevel",
     "ConsensusResult",
+    "ConsensusPlan",
     "weighted_voting_consensus",
     "majority_voting_consensus",
     "unanimous_consensus",
@@ -280,6 +303,11 @@ __all__ = [
     "ModelContribution",
     "ExplainabilityRecommendedAction",
     "Explanation",
+    "LazyExplanation",
     "ExplainabilityGenerator",
     "create_explainability_generator",
+
+    # Decision Plan (Phase 8)
+    "DecisionPlan",
+    "create_decision_plan",
 ]
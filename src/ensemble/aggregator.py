@@ -10,9 +10,9 @@ Ash-NLP is a CRISIS DETECTION BACKEND that:
 ********************************************************************************
 Result Aggregator for Ash-NLP Ensemble Service
 ---
-FILE VERSION: v5.0-4-3.1-1
-LAST MODIFIED: 2026-01-01
-PHASE: Phase 4 Step 3 - Result Aggregation
+FILE VERSION: v5.0-8-15.0-1
+LAST MODIFIED: 2026-02-14
+PHASE: Phase 8 Step 15.0 - Lazy Explanations
 CLEAN ARCHITECTURE: v5.1 Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-nlp
 Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
@@ -38,7 +38,7 @@ import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Mapping, Optional, TYPE_CHECKING
 
 from .consensus import ConsensusResult, AgreementLevel
 from .conflict_detector import ConflictReport
@@ -48,7 +48,7 @@ if TYPE_CHECKING:
     from src.managers.config_manager import ConfigManager
 
 # Module version
-__version__ = "v5.0-4-3.1-1"
+__version__ = "v5.0-8-15.0-1"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -199,8 +199,8 @@ class AggregatedResult:
     conflict_report: Optional[ConflictReport] = None
     resolution: Optional[ResolutionResult] = None
 
-    # Explanation
-    explanation: Dict[str, Any] = field(default_factory=dict)
+    # Explanation (dict or LazyExplanation view)
+    explanation: Mapping[str, Any] = field(default_factory=dict)
 
     # Performance
     processing_time_ms: float = 0.0
@@ -244,7 +244,7 @@ class AggregatedResult:
                 "report": self.conflict_report.to_dict() if self.conflict_report else None,
                 "resolution": self.resolution.to_dict() if self.resolution else None,
             },
-            "explanation": self.explanation,
+            "explanation": dict(self.explanation),
             "performance": {
                 "total_latency_ms": round(self.processing_time_ms, 2),
                 "per_model_latency": {
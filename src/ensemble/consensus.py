@@ -10,10 +10,10 @@ Ash-NLP is a CRISIS DETECTION BACKEND that:
 ********************************************************************************
 Consensus Algorithms for Ash-NLP Ensemble Service
 ---
-FILE VERSION: v5.0-4-1.1-3
-LAST MODIFIED: 2026-01-02
-PHASE: Phase 4 Step 1 - Consensus Algorithms
-CLEAN ARCHITECTURE: v5.1 Compliant
+FILE VERSION: v5.0-8-19.0-1
+LAST MODIFIED: 2026-02-18
+PHASE: Phase 8 Step 19.0 - Compiled Decision Plan
+CLEAN ARCHITECTURE: v5.2.3 Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-nlp
 Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
 
@@ -30,18 +30,27 @@ Each algorithm serves different use cases:
 - majority_voting: Best for clear binary crisis/no-crisis decisions
 - unanimous: Most conservative, minimizes false positives
 - conflict_aware: Best when human review is available
+
+PHASE 8 CONSENSUS PLAN:
+- ConsensusSelector compiles its algorithm, weights and thresholds into an
+  immutable ConsensusPlan (one pre-bound runner per algorithm) when they
+  change; select_and_run reads the current plan once and calls the runner
+- Setters build a new plan and swap it in; in-flight calls keep theirs
 """
 
 import logging
+import threading
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from functools import partial
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.managers.config_manager import ConfigManager
 
 # Module version
-__version__ = "v5.0-4-1.1-3"
+__version__ = "v5.0-8-19.0-1"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -63,6 +72,8 @@ def _safe_float(value: Any, default: float = 0.0) -> float:
     Returns:
         Float value
     """
+    if type(value) is float:
+        return value
     if isinstance(value, (int, float)):
         return float(value)
     if isinstance(value, str):
@@ -90,6 +101,12 @@ class ConsensusAlgorithm(Enum):
     CONFLICT_AWARE = "conflict_aware"
 
 
+# Algorithm lookup by config/API name (avoids enum parsing per request)
+CONSENSUS_ALGORITHMS_BY_NAME: Mapping[str, "ConsensusAlgorithm"] = MappingProxyType(
+    {algo.value: algo for algo in ConsensusAlgorithm}
+)
+
+
 class AgreementLevel(Enum):
     """Level of agreement between models."""
 
@@ -660,6 +677,111 @@ def _calculate_confidence_from_agreement(
     return max(0.0, min(1.0, confidence))
 
 
+# =============================================================================
+# Consensus Plan
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class ConsensusPlan:
+    """
+    Immutable compiled consensus configuration.
+
+    Attributes:
+        default_algorithm: Algorithm used when a call names none
+        weights: Model weights (floats)
+        thresholds: Threshold values (floats)
+        runners: Algorithm -> callable taking only model_signals
+        version: Increments with every recompile
+    """
+
+    default_algorithm: ConsensusAlgorithm
+    weights: Mapping[str, float]
+    thresholds: Mapping[str, float]
+    runners: Mapping[ConsensusAlgorithm, Callable[[Dict[str, float]], ConsensusResult]]
+    version: int = 0
+
+    @classmethod
+    def compile(
+        cls,
+        default_algorithm: ConsensusAlgorithm,
+        weights: Dict[str, float],
+        thresholds: Dict[str, float],
+        version: int = 0,
+    ) -> "ConsensusPlan":
+        """
+        Compile a plan from already-coerced weights and thresholds.
+
+        Args:
+            default_algorithm: Default algorithm
+            weights: Model weights
+            thresholds: crisis, majority, unanimous, disagreement thresholds
+            version: Plan version
+
+        Returns:
+            ConsensusPlan with every runner bound to its parameters
+        """
+        frozen_weights = MappingProxyType(dict(weights))
+        crisis = thresholds.get("crisis", 0.5)
+        runners = {
+            ConsensusAlgorithm.WEIGHTED_VOTING: partial(
+                weighted_voting_consensus,
+                weights=frozen_weights,
+                crisis_threshold=crisis,
+            ),
+            ConsensusAlgorithm.MAJORITY_VOTING: partial(
+                majority_voting_consensus,
+                crisis_threshold=crisis,
+                majority_threshold=thresholds.get("majority", 0.5),
+            ),
+            ConsensusAlgorithm.UNANIMOUS: partial(
+                unanimous_consensus,
+                crisis_threshold=thresholds.get("unanimous", 0.6),
+            ),
+            ConsensusAlgorithm.CONFLICT_AWARE: partial(
+                conflict_aware_consensus,
+                weights=frozen_weights,
+                disagreement_threshold=thresholds.get("disagreement", 0.15),
+                crisis_threshold=crisis,
+            ),
+        }
+        return cls(
+            default_algorithm=default_algorithm,
+            weights=frozen_weights,
+            thresholds=MappingProxyType(dict(thresholds)),
+            runners=MappingProxyType(runners),
+            version=version,
+        )
+
+    def run(
+        self,
+        model_signals: Dict[str, float],
+        algorithm: Optional[ConsensusAlgorithm] = None,
+    ) -> ConsensusResult:
+        """
+        Run an algorithm (default if None) on model signals.
+
+        Args:
+            model_signals: Dict of model_name -> crisis_signal
+            algorithm: Algorithm to use (None = default)
+
+        Returns:
+            ConsensusResult from the selected algorithm
+        """
+        algo = algorithm or self.default_algorithm
+        runner = self.runners.get(algo)
+        if runner is None:
+            logger.warning(
+                f"Unknown algorithm {algo}, falling back to weighted_voting"
+            )
+            algo = ConsensusAlgorithm.WEIGHTED_VOTING
+            runner = self.runners[algo]
+
+        logger.debug(f"Running consensus algorithm: {algo.value}")
+
+        return runner(model_signals=model_signals)
+
+
 # =============================================================================
 # Consensus Selector
 # =============================================================================
@@ -671,6 +793,7 @@ class ConsensusSelector:
 
     Manages selection and execution of consensus algorithms.
     Allows runtime switching between algorithms.
+    Runs through a compiled ConsensusPlan, rebuilt only by the setters.
 
     Clean Architecture v5.1 Compliance:
     - Factory function: create_consensus_selector()
@@ -717,13 +840,11 @@ class ConsensusSelector:
                 default_thresholds[k] = _safe_float(v, default_thresholds.get(k, 0.5))
         self.thresholds = default_thresholds
 
-        # Algorithm implementations
-        self._algorithms = {
-            ConsensusAlgorithm.WEIGHTED_VOTING: self._run_weighted_voting,
-            ConsensusAlgorithm.MAJORITY_VOTING: self._run_majority_voting,
-            ConsensusAlgorithm.UNANIMOUS: self._run_unanimous,
-            ConsensusAlgorithm.CONFLICT_AWARE: self._run_conflict_aware,
-        }
+        # Compiled plan (swapped whole by the setters)
+        self._lock = threading.Lock()
+        self._plan = ConsensusPlan.compile(
+            default_algorithm, self.weights, self.thresholds
+        )
 
         logger.info(
             f"📊 ConsensusSelector initialized "
@@ -745,71 +866,42 @@ class ConsensusSelector:
         Returns:
             ConsensusResult from selected algorithm
         """
-        algo = algorithm or self.default_algorithm
-
-        if algo not in self._algorithms:
-            logger.warning(
-                f"Unknown algorithm {algo}, falling back to weighted_voting"
-            )
-            algo = ConsensusAlgorithm.WEIGHTED_VOTING
-
-        logger.debug(f"Running consensus algorithm: {algo.value}")
-
-        return self._algorithms[algo](model_signals)
-
-    def _run_weighted_voting(
-        self, model_signals: Dict[str, float]
-    ) -> ConsensusResult:
-        """Run weighted voting consensus."""
-        return weighted_voting_consensus(
-            model_signals=model_signals,
-            weights=self.weights,
-            crisis_threshold=self.thresholds.get("crisis", 0.5),
-        )
-
-    def _run_majority_voting(
-        self, model_signals: Dict[str, float]
-    ) -> ConsensusResult:
-        """Run majority voting consensus."""
-        return majority_voting_consensus(
-            model_signals=model_signals,
-            crisis_threshold=self.thresholds.get("crisis", 0.5),
-            majority_threshold=self.thresholds.get("majority", 0.5),
+        return self._plan.run(model_signals, algorithm)
+
+    def _recompile(self) -> None:
+        """Build a plan from the current settings and swap it in (lock held)."""
+        self._plan = ConsensusPlan.compile(
+            self.default_algorithm,
+            self.weights,
+            self.thresholds,
+            version=self._plan.version + 1,
         )
 
-    def _run_unanimous(self, model_signals: Dict[str, float]) -> ConsensusResult:
-        """Run unanimous consensus."""
-        return unanimous_consensus(
-            model_signals=model_signals,
-            crisis_threshold=self.thresholds.get("unanimous", 0.6),
-        )
-
-    def _run_conflict_aware(
-        self, model_signals: Dict[str, float]
-    ) -> ConsensusResult:
-        """Run conflict-aware consensus."""
-        return conflict_aware_consensus(
-            model_signals=model_signals,
-            weights=self.weights,
-            disagreement_threshold=self.thresholds.get("disagreement", 0.15),
-            crisis_threshold=self.thresholds.get("crisis", 0.5),
-        )
+    def get_plan(self) -> ConsensusPlan:
+        """Get the current compiled plan."""
+        return self._plan
 
     def set_algorithm(self, algorithm: ConsensusAlgorithm) -> None:
         """Set the default algorithm."""
-        self.default_algorithm = algorithm
+        with self._lock:
+            self.default_algorithm = algorithm
+            self._recompile()
         logger.info(f"Default algorithm set to: {algorithm.value}")
 
     def set_weights(self, weights: Dict[str, float]) -> None:
         """Update model weights."""
-        for k, v in weights.items():
-            self.weights[k] = _safe_float(v, self.weights.get(k, 0.0))
+        with self._lock:
+            for k, v in weights.items():
+                self.weights[k] = _safe_float(v, self.weights.get(k, 0.0))
+            self._recompile()
         logger.info(f"Updated weights: {self.weights}")
 
     def set_thresholds(self, thresholds: Dict[str, float]) -> None:
         """Update threshold values."""
-        for k, v in thresholds.items():
-            self.thresholds[k] = _safe_float(v, self.thresholds.get(k, 0.5))
+        with self._lock:
+            for k, v in thresholds.items():
+                self.thresholds[k] = _safe_float(v, self.thresholds.get(k, 0.5))
+            self._recompile()
         logger.info(f"Updated thresholds: {self.thresholds}")
 
     def get_algorithm(self) -> ConsensusAlgorithm:
@@ -827,6 +919,7 @@ class ConsensusSelector:
             "weights": self.weights.copy(),
             "thresholds": self.thresholds.copy(),
             "available_algorithms": self.get_available_algorithms(),
+            "plan_version": self._plan.version,
         }
 
 
@@ -932,8 +1025,10 @@ __all__ = [
     # Enums
     "ConsensusAlgorithm",
     "AgreementLevel",
+    "CONSENSUS_ALGORITHMS_BY_NAME",
     # Data classes
     "ConsensusResult",
+    "ConsensusPlan",
     # Algorithm functions
     "weighted_voting_consensus",
     "majority_voting_consensus",
@@ -10,9 +10,9 @@ Ash-NLP is a CRISIS DETECTION BACKEND that:
 ********************************************************************************
 Ensemble Decision Engine for Ash-NLP Service
 ---
-FILE VERSION: v5.0-3-8.0-5
-LAST MODIFIED: 2026-01-31
-PHASE: Phase 3.8 - Ash-NLP Deployment
+FILE VERSION: v5.0-8-25.0-5
+LAST MODIFIED: 2026-02-24
+PHASE: Phase 8 Step 25.0 - Background Alert Delivery
 CLEAN ARCHITECTURE: v5.2.3 Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-nlp
 Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
@@ -66,16 +66,90 @@ PERFORMANCE OPTIMIZATIONS (Phase 3.7):
 - 3.7.1: Model warmup on startup with alerting
 - 3.7.2: Async parallel inference with asyncio.gather()
 - 3.7.4: Response caching for repeated messages
+
+PHASE 8 INSTRUMENTATION:
+- StageTimer attributes latency to cache, inference, scoring, vigil,
+  consensus, conflict_detection, conflict_resolution, aggregation,
+  explanation, context and assembly
+- processing_time_ms is stamped after Phase 4/5 (was captured before)
+- Stage histograms exported via src.utils.metrics.record_stage_timings
+- CrisisAssessment.timing carries the breakdown for debug responses
+- Engine outcomes (inference, cache_hit, error) and crisis detections
+  recorded via src.utils.metrics
+
+PHASE 8 CONTEXT:
+- user_id forwarded to the ContextAnalyzer's server-side history store
+- user_timezone (FE-001) forwarded to the ContextAnalyzer's temporal detector
+- History items without crisis_score are resolved from the history score
+  cache / response cache; misses are scored in the same batched pipeline
+  call as the current message (one call per model)
+
+PHASE 8 EXPLANATIONS:
+- Explanations are LazyExplanation views (rendered only when read), so
+  cached assessments carry them cheaply and unread ones cost no formatting
+
+PHASE 8 DEADLINES:
+- Inference waits for each model only until its FallbackStrategy deadline;
+  late secondaries are dropped (the scorer renormalizes over the models
+  that answered) and the per-request pool no longer blocks on them
+- Secondary error results count as failures, and call latencies feed the
+  p95 latency circuits
+- With models.bart_replicas > 1, BART calls go through HedgedInference: a
+  duplicate runs on an idle replica once the call outlives the hedge
+  percentile, and the first successful result wins (stats under "hedging")
+- Each request reads one FallbackSnapshot after inference, so its
+  is_degraded / degradation_reason come from the same state
+
+PHASE 8 DECISION PLAN:
+- Severity bounds, the compiled consensus plan and algorithm/verbosity
+  name lookups live in one immutable DecisionPlan, read once per request
+- The plan is rebuilt only by configuration setters (set_consensus_algorithm,
+  set_explainability_verbosity, set_severity_thresholds) or an explicit
+  refresh_decision_plan() after changing a component directly; each rebuild
+  moves the caches to the next config_version
+
+PHASE 8 HOT RELOAD:
+- reload_config() rebuilds only the components whose configuration
+  sections changed (scorer, consensus selector, conflict detector and
+  resolver, aggregator, context analyzer; BART labels and fallback base
+  weights are updated in place), then
+  publishes them in one new DecisionPlan with the next config_version
+- Models stay loaded; response and history-score cache entries from older
+  config versions become misses
+- Sections not covered (models, api, performance, ...) still need a restart
+
+PHASE 8 LABEL SETS:
+- Response and history-score cache keys include the BART label set hash;
+  a label change moves lookups to a new namespace instead of flushing, so
+  switching back to an earlier set reuses its entries
+- A result whose label set changed mid-request is not cached
+
+PHASE 8 NEAR-DUPLICATES:
+- With performance.near_duplicate_enabled, an exact cache miss looks the
+  message up in a NearDuplicateIndex (MinHash over normalized shingles);
+  a strict match reuses the matched message's cached assessment as a copy
+  flagged with near_duplicate (similarity, word_changes)
+- Cached messages are indexed when their assessment is cached, in the
+  same label set namespace; TTL and config version still apply
+
+PHASE 8 ALERT OUTBOX:
+- With an AlertOutbox running (started by the API lifespan), conflict and
+  model failure alerts raised during analysis are only enqueued; webhook
+  delivery, retries and rate limits are handled by the outbox task
+- Queue depth, drops and delivery latency appear under "alerting"
 """
 
 import asyncio
 import copy
 import logging
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass, field
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from functools import partial
+from dataclasses import dataclass, field, replace
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+from typing import Any, Dict, List, Mapping, Optional, Tuple, TYPE_CHECKING
 
 from src.models import ModelResult
 
@@ -88,14 +162,18 @@ from .scoring import (
 )
 from .fallback import (
     FallbackStrategy,
+    FallbackSnapshot,
     create_fallback_strategy,
     CriticalModelFailure,
 )
+from .hedging import HedgedInference, create_hedged_inference
+from .decision_plan import DecisionPlan, create_decision_plan
 
 # Phase 4 imports
 from .consensus import (
     ConsensusSelector,
     ConsensusAlgorithm,
+    ConsensusPlan,
     ConsensusResult,
     create_consensus_selector,
 )
@@ -120,7 +198,7 @@ from .aggregator import (
 from .explainability import (
     ExplainabilityGenerator,
     VerbosityLevel,
-    Explanation,
+    LazyExplanation,
     create_explainability_generator,
 )
 
@@ -130,6 +208,7 @@ from src.context import (
     create_context_analyzer,
     MessageHistoryItem,
     ContextAnalysisResult,
+    UserHistoryStore,
 )
 
 # Phase 3 Vigil imports
@@ -140,13 +219,23 @@ from src.clients.vigil_client import (
     create_vigil_client,
 )
 
+# Phase 8 timing imports
+from src.utils.timing import StageTimer
+from src.utils.near_duplicate import NearDuplicateIndex, create_near_duplicate_index
+from src.utils.metrics import (
+    record_crisis_detection,
+    record_engine_request,
+    record_stage_timings,
+)
+
 if TYPE_CHECKING:
     from src.managers.config_manager import ConfigManager
+    from src.managers.context_config_manager import ContextConfigManager
     from src.utils.cache import ResponseCache
     from src.utils.alerting import DiscordAlerter
 
 # Module version
-__version__ = "v5.0-3-8.0-6"
+__version__ = "v5.0-8-25.0-5"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -198,6 +287,31 @@ class WarmupResult:
         }
 
 
+# =============================================================================
+# Phase 8: History Scoring Plan
+# =============================================================================
+
+
+@dataclass
+class HistoryScoringPlan:
+    """
+    Unscored message history resolved for one request (Phase 8).
+
+    Attributes:
+        history: Message history dicts (trimmed to max_history_size)
+        scores: Message text → resolved crisis score
+        pending: Unique texts still needing inference
+        computed: Texts scored by inference in this request
+        label_set_hash: BART label set the scores come from
+    """
+
+    history: List[Dict[str, Any]]
+    scores: Dict[str, float] = field(default_factory=dict)
+    pending: List[str] = field(default_factory=list)
+    computed: set = field(default_factory=set)
+    label_set_hash: str = ""
+
+
 # =============================================================================
 # Phase 3 Vigil: Vigil Response Dataclass
 # =============================================================================
@@ -277,13 +391,18 @@ class CrisisAssessment:
         requires_review: True if CRT review recommended
 
         # Phase 4 Enhanced Fields
-        explanation: Human-readable explanation (Phase 4)
+        explanation: Human-readable explanation (Phase 4; LazyExplanation view)
         conflict_report: Conflict detection report (Phase 4)
         consensus_result: Consensus algorithm result (Phase 4)
         aggregated_result: Full aggregated result (Phase 4)
 
         # Phase 5 Enhanced Fields
         context_analysis: Context history analysis result (Phase 5)
+
+        # Phase 8 Fields
+        timing: Per-stage latency breakdown (StageTimer.to_dict())
+        near_duplicate: Set when reused from a near-duplicate message's
+            cached assessment (similarity, word_changes)
     """
 
     crisis_detected: bool
@@ -305,7 +424,7 @@ class CrisisAssessment:
     requires_review: bool = False
 
     # Phase 4 Enhanced Fields
-    explanation: Optional[Dict[str, Any]] = None
+    explanation: Optional[Mapping[str, Any]] = None
     conflict_report: Optional[Dict[str, Any]] = None
     consensus_result: Optional[Dict[str, Any]] = None
     aggregated_result: Optional[AggregatedResult] = None
@@ -313,6 +432,10 @@ class CrisisAssessment:
     # Phase 5 Enhanced Fields
     context_analysis: Optional[ContextAnalysisResult] = None
 
+    # Phase 8 Fields
+    timing: Optional[Dict[str, Any]] = None
+    near_duplicate: Optional[Dict[str, Any]] = None
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for API response."""
         result = {
@@ -336,7 +459,7 @@ class CrisisAssessment:
 
         # Include Phase 4 fields if present
         if self.explanation:
-            result["explanation"] = self.explanation
+            result["explanation"] = dict(self.explanation)
         if self.conflict_report:
             result["conflict_analysis"] = self.conflict_report
         if self.consensus_result:
@@ -346,6 +469,10 @@ class CrisisAssessment:
         if self.context_analysis:
             result["context_analysis"] = self.context_analysis.to_dict()
 
+        # Include Phase 8 near-duplicate flag if present
+        if self.near_duplicate:
+            result["near_duplicate"] = self.near_duplicate
+
         return result
 
     def to_enhanced_dict(self) -> Dict[str, Any]:
@@ -455,6 +582,9 @@ class EnsembleDecisionEngine:
     - Resilient error handling (Rule #5)
     """
 
+    # Models run per request (BART first)
+    INFERENCE_MODELS = ("bart", "sentiment", "irony", "emotions")
+
     # =========================================================================
     # Default Vigil Amplification Configuration
     # =========================================================================
@@ -489,6 +619,7 @@ class EnsembleDecisionEngine:
         cache_enabled: bool = True,
         cache_ttl: float = 300.0,
         cache_max_size: int = 1000,
+        near_duplicate_index: Optional[NearDuplicateIndex] = None,
         # Phase 3 Vigil components
         vigil_client: Optional[VigilClient] = None,
         vigil_enabled: bool = True,
@@ -517,6 +648,8 @@ class EnsembleDecisionEngine:
             cache_enabled: Enable response caching
             cache_ttl: Cache time-to-live in seconds
             cache_max_size: Maximum cache entries
+            near_duplicate_index: Pre-configured near-duplicate index
+                (optional; default from performance.near_duplicate_*)
 
             # Phase 3 Vigil components
             vigil_client: Pre-configured Vigil client (optional)
@@ -566,6 +699,28 @@ class EnsembleDecisionEngine:
         else:
             self._cache = None
 
+        # Score-only cache for history messages scored in batch (Phase 8)
+        if cache_enabled:
+            from src.utils.cache import create_response_cache
+
+            self._history_score_cache = create_response_cache(
+                max_size=cache_max_size,
+                ttl_seconds=cache_ttl,
+                config_manager=config_manager,
+            )
+        else:
+            self._history_score_cache = None
+
+        # Near-duplicate lookups over cached messages (Phase 8)
+        if not cache_enabled:
+            self._near_duplicates: Optional[NearDuplicateIndex] = None
+        elif near_duplicate_index is not None:
+            self._near_duplicates = near_duplicate_index
+        else:
+            self._near_duplicates = create_near_duplicate_index(
+                config_manager=config_manager
+            )
+
         # Alerter for notifications (Phase 3.7.1)
         self._alerter = alerter
 
@@ -658,6 +813,20 @@ class EnsembleDecisionEngine:
         if async_inference:
             self._executor = ThreadPoolExecutor(max_workers=4)
 
+        # Phase 8: Hedged BART calls when more than one replica is configured
+        self._hedger: Optional[HedgedInference] = None
+        bart_replicas = getattr(self.model_loader, "bart_replicas", 1)
+        if bart_replicas > 1:
+            self._hedger = create_hedged_inference(
+                bart_replicas, config_manager=config_manager
+            )
+
+        # Phase 8: Compiled decision configuration (swapped on config change)
+        self._plan_lock = threading.Lock()
+        self._config_version = 0
+        self._config_reloads = 0
+        self._decision_plan = self._build_decision_plan(version=0)
+
         logger.info(
             f"🧠 EnsembleDecisionEngine initialized "
             f"(async={async_inference}, cache={cache_enabled}, "
@@ -999,6 +1168,8 @@ class EnsembleDecisionEngine:
         consensus_algorithm: Optional[str] = None,
         message_history: Optional[List[Dict]] = None,
         include_context_analysis: bool = True,
+        user_id: Optional[str] = None,
+        user_timezone: Optional[str] = None,
     ) -> CrisisAssessment:
         """
         Analyze a message for crisis signals.
@@ -1014,86 +1185,117 @@ class EnsembleDecisionEngine:
             consensus_algorithm: Override consensus algorithm (Phase 4)
             message_history: List of prior messages with timestamps/scores (Phase 5)
             include_context_analysis: Include context analysis in response (Phase 5)
+            user_id: User identifier for the server-side history store (Phase 8)
+            user_timezone: User's timezone for late night detection (FE-001)
 
         Returns:
             CrisisAssessment with complete analysis
         """
         start_time = time.perf_counter()
+        timer = StageTimer(start_time)
         per_model_latency: Dict[str, float] = {}
 
         try:
+            # Phase 8: Cache keys are namespaced by the BART label set
+            label_set_hash = self.model_loader.get_label_set_hash()
+
             # Check cache first (Phase 3.7.4)
-            if use_cache and self._cache is not None and self.cache_enabled:
-                cached_result = self._cache.get(message)
+            use_cache = self._response_cache_usable(
+                use_cache, include_context_analysis, message_history, user_id
+            )
+            if use_cache:
+                with timer.stage("cache"):
+                    cached_result = self._get_cached_assessment(message, label_set_hash)
                 if cached_result is not None:
                     self._cache_hits += 1
                     self._total_requests += 1
-                    # Update timing for cached response
-                    cached_result.processing_time_ms = (
-                        time.perf_counter() - start_time
-                    ) * 1000
-                    cached_result.cached = True
+                    cached_result = self._cache_hit_copy(cached_result, timer)
+                    record_engine_request(
+                        "cache_hit", cached_result.processing_time_ms
+                    )
+                    self._record_user_history(user_id, cached_result.crisis_score)
                     logger.debug(
                         f"Cache hit for message (hash: {hash(message) % 10000})"
                     )
                     return cached_result
 
-            # Run inference on all models
-            inference_start = time.perf_counter()
-            if self.async_inference and self._executor:
-                results, per_model_latency = self._run_parallel_inference_with_timing(
-                    message
-                )
-            else:
-                results, per_model_latency = self._run_sequential_inference_with_timing(
-                    message
+            # Phase 8: Resolve unscored history from cache before inference
+            with timer.stage("history_scoring"):
+                history_plan = self._plan_history_scoring(
+                    message_history, include_context_analysis, label_set_hash
                 )
+            history_texts = history_plan.pending if history_plan else None
+            history_results: Dict[str, List[ModelResult]] = {}
+
+            # Run inference on all models (history misses batched in)
+            with timer.stage("inference"):
+                if self.async_inference and self._executor:
+                    results, per_model_latency = (
+                        self._run_parallel_inference_with_timing(
+                            message, history_texts, history_results
+                        )
+                    )
+                else:
+                    results, per_model_latency = (
+                        self._run_sequential_inference_with_timing(
+                            message, history_texts, history_results
+                        )
+                    )
+            timer.set_models(per_model_latency)
+
+            # Phase 8: One fallback snapshot and decision plan for the request
+            fallback_state = self.fallback.get_snapshot()
+            plan = self._decision_plan
+
+            if history_plan and history_plan.pending:
+                with timer.stage("history_scoring"):
+                    self._score_history_batch(history_plan, history_results, plan)
 
             # Calculate ensemble score (Phase 3 scoring)
             # This gives us base_score (before irony) and irony_dampening factor
-            ensemble_score = self.scorer.calculate_score(
-                bart_result=results.get("bart"),
-                sentiment_result=results.get("sentiment"),
-                irony_result=results.get("irony"),
-                emotions_result=results.get("emotions"),
-            )
+            with timer.stage("scoring"):
+                ensemble_score = plan.scorer.calculate_score(
+                    bart_result=results.get("bart"),
+                    sentiment_result=results.get("sentiment"),
+                    irony_result=results.get("irony"),
+                    emotions_result=results.get("emotions"),
+                )
 
-            # =================================================================
-            # Phase 3 Vigil: Apply amplification BEFORE irony dampening
-            # =================================================================
+                # =============================================================
+                # Phase 3 Vigil: Apply amplification BEFORE irony dampening
+                # =============================================================
 
-            # Get base score (before irony dampening was applied by scorer)
-            base_score = ensemble_score.base_score
-            irony_dampening = ensemble_score.irony_dampening
+                # Get base score (before irony dampening was applied by scorer)
+                base_score = ensemble_score.base_score
+                irony_dampening = ensemble_score.irony_dampening
 
-            # Determine preliminary severity from base score
-            preliminary_severity = CrisisSeverity.from_score(
-                base_score, self.scorer.get_thresholds()
-            )
+                # Determine preliminary severity from base score
+                preliminary_severity = plan.severity(base_score)
 
             # Apply Vigil amplification (sync version)
             vigil_response: VigilResponse
-            if self.vigil_enabled:
-                amplified_score, vigil_response = self._apply_vigil_amplification_sync(
-                    base_score=base_score,
-                    base_severity=preliminary_severity,
-                    text=message,
-                )
-            else:
-                amplified_score = base_score
-                vigil_response = VigilResponse(
-                    status=VigilStatus.DISABLED,
-                    base_score=base_score,
-                )
+            with timer.stage("vigil"):
+                if self.vigil_enabled:
+                    amplified_score, vigil_response = (
+                        self._apply_vigil_amplification_sync(
+                            base_score=base_score,
+                            base_severity=preliminary_severity,
+                            text=message,
+                        )
+                    )
+                else:
+                    amplified_score = base_score
+                    vigil_response = VigilResponse(
+                        status=VigilStatus.DISABLED,
+                        base_score=base_score,
+                    )
 
             # Apply irony dampening AFTER Vigil amplification
             final_score = amplified_score * irony_dampening
             final_score = max(0.0, min(1.0, final_score))
 
             # Recalculate final severity
-            final_severity = CrisisSeverity.from_score(
-                final_score, self.scorer.get_thresholds()
-            )
+            final_severity = plan.severity(final_score)
 
             # Determine if review required
             requires_review = self._determine_requires_review(
@@ -1114,9 +1316,6 @@ class EnsembleDecisionEngine:
                 CrisisSeverity.HIGH,
             )
 
-            # Calculate processing time
-            processing_time_ms = (time.perf_counter() - start_time) * 1000
-
             # =========================================================
             # Phase 4: Enhanced Processing
             # =========================================================
@@ -1125,50 +1324,42 @@ class EnsembleDecisionEngine:
             conflict_report: Optional[ConflictReport] = None
             resolution_result: Optional[ResolutionResult] = None
             aggregated_result: Optional[AggregatedResult] = None
-            explanation: Optional[Explanation] = None
+            explanation: Optional[LazyExplanation] = None
 
             if self.phase4_enabled:
-                # Extract crisis signals for consensus
-                crisis_scores = {
-                    name: signal.crisis_signal
-                    for name, signal in ensemble_score.signals.items()
-                }
+                with timer.stage("consensus"):
+                    # Extract crisis signals for consensus
+                    crisis_scores = {
+                        name: signal.crisis_signal
+                        for name, signal in ensemble_score.signals.items()
+                    }
 
-                # Build signals dict for conflict detection
-                signals_dict = {
-                    name: {
-                        "crisis_signal": signal.crisis_signal,
-                        "label": signal.label,
-                        "raw_score": signal.raw_score,
-                        "score": signal.raw_score,
-                        "metadata": signal.metadata,
+                    # Build signals dict for conflict detection
+                    signals_dict = {
+                        name: {
+                            "crisis_signal": signal.crisis_signal,
+                            "label": signal.label,
+                            "raw_score": signal.raw_score,
+                            "score": signal.raw_score,
+                            "metadata": signal.metadata,
+                        }
+                        for name, signal in ensemble_score.signals.items()
                     }
-                    for name, signal in ensemble_score.signals.items()
-                }
 
-                # Run consensus algorithm
-                if self.consensus_selector:
-                    algo = None
-                    if consensus_algorithm:
-                        try:
-                            algo = ConsensusAlgorithm(consensus_algorithm)
-                        except ValueError:
-                            logger.warning(
-                                f"Invalid consensus algorithm: {consensus_algorithm}"
-                            )
-
-                    consensus_result = self.consensus_selector.select_and_run(
-                        model_signals=crisis_scores,
-                        algorithm=algo,
-                    )
+                    # Run consensus algorithm
+                    if self.consensus_selector:
+                        consensus_result = self._run_consensus(
+                            plan, crisis_scores, consensus_algorithm
+                        )
 
                 # Run conflict detection
-                if self.conflict_detector:
-                    model_signals = ModelSignals.from_ensemble_signals(signals_dict)
-                    conflict_report = self.conflict_detector.detect_conflicts(
-                        model_signals=model_signals,
-                        crisis_scores=crisis_scores,
-                    )
+                if plan.conflict_detector:
+                    with timer.stage("conflict_detection"):
+                        model_signals = ModelSignals.from_ensemble_signals(signals_dict)
+                        conflict_report = plan.conflict_detector.detect_conflicts(
+                            model_signals=model_signals,
+                            crisis_scores=crisis_scores,
+                        )
 
                     if conflict_report.has_conflicts:
                         self._conflicts_detected += 1
@@ -1179,26 +1370,28 @@ class EnsembleDecisionEngine:
                     and conflict_report
                     and conflict_report.has_conflicts
                 ):
-                    resolution_result = self.conflict_resolver.resolve(
-                        crisis_scores=crisis_scores,
-                        conflict_report=conflict_report,
-                        message_preview=message[:100],
-                    )
-
-                # Aggregate results
-                if self.result_aggregator:
-                    aggregated_result = self.result_aggregator.aggregate(
-                        model_signals=signals_dict,
-                        consensus_result=consensus_result,
-                        conflict_report=conflict_report,
-                        resolution_result=resolution_result,
-                        processing_time_ms=processing_time_ms,
-                        per_model_latency=per_model_latency,
-                        is_degraded=self.fallback.is_degraded(),
-                        degradation_reason=self.fallback.get_degradation_reason(),
-                        message=message,
-                        cached=False,
-                    )
+                    with timer.stage("conflict_resolution"):
+                        resolution_result = self.conflict_resolver.resolve(
+                            crisis_scores=crisis_scores,
+                            conflict_report=conflict_report,
+                            message_preview=message[:100],
+                        )
+
+                # Aggregate results (processing time is finalized below)
+                if plan.result_aggregator:
+                    with timer.stage("aggregation"):
+                        aggregated_result = plan.result_aggregator.aggregate(
+                            model_signals=signals_dict,
+                            consensus_result=consensus_result,
+                            conflict_report=conflict_report,
+                            resolution_result=resolution_result,
+                            processing_time_ms=timer.elapsed_ms(),
+                            per_model_latency=per_model_latency,
+                            is_degraded=fallback_state.is_degraded,
+                            degradation_reason=fallback_state.degradation_reason,
+                            message=message,
+                            cached=False,
+                        )
 
                 # Generate explanation
                 if (
@@ -1206,20 +1399,17 @@ class EnsembleDecisionEngine:
                     and self.explainability_generator
                     and aggregated_result
                 ):
-                    verbosity_level = None
-                    if verbosity:
-                        try:
-                            verbosity_level = VerbosityLevel(verbosity)
-                        except ValueError:
-                            pass
-
-                    explanation = self.explainability_generator.generate(
-                        result=aggregated_result,
-                        verbosity=verbosity_level,
-                    )
+                    with timer.stage("explanation"):
+                        verbosity_level = plan.verbosity(verbosity)
 
-                    # Attach explanation to aggregated result
-                    aggregated_result.explanation = explanation.to_dict()
+                        # Lazy view: rendered only if a caller reads it
+                        explanation = self.explainability_generator.generate_lazy(
+                            result=aggregated_result,
+                            verbosity=verbosity_level,
+                        )
+
+                        # Attach explanation to aggregated result
+                        aggregated_result.explanation = explanation
 
             # =========================================================
             # Phase 5: Context History Analysis
@@ -1230,21 +1420,31 @@ class EnsembleDecisionEngine:
             if (
                 self.phase5_enabled
                 and include_context_analysis
-                and self.context_analyzer
+                and plan.context_analyzer
             ):
                 try:
-                    # Convert message history to MessageHistoryItem objects
-                    history_items: List[MessageHistoryItem] = []
-                    if message_history:
-                        for item in message_history:
-                            history_items.append(MessageHistoryItem.from_dict(item))
-
-                    # Run context analysis with current message score
-                    context_analysis_result = self.context_analyzer.analyze(
-                        current_message=message,
-                        current_score=final_score,
-                        message_history=history_items,
-                    )
+                    with timer.stage("context"):
+                        # Convert message history to MessageHistoryItem objects
+                        # (Phase 8: with batch-scored crisis scores filled in)
+                        history_items: List[MessageHistoryItem] = []
+                        if history_plan is not None:
+                            message_history = self._apply_history_scores(history_plan)
+                        if message_history:
+                            for item in message_history:
+                                history_items.append(MessageHistoryItem.from_dict(item))
+
+                        # Run context analysis with current message score
+                        context_analysis_result = plan.context_analyzer.analyze(
+                            current_message=message,
+                            current_score=final_score,
+                            message_history=history_items,
+                            user_id=user_id,
+                            user_timezone=user_timezone,
+                        )
+                        if history_plan is not None:
+                            self._annotate_history_scoring(
+                                history_plan, context_analysis_result
+                            )
 
                     logger.debug(
                         f"Context analysis: escalation={context_analysis_result.escalation.detected}, "
@@ -1257,24 +1457,32 @@ class EnsembleDecisionEngine:
                     # Continue without context analysis - non-critical failure
 
             # Build assessment
-            assessment = self._build_assessment_enhanced(
-                ensemble_score=ensemble_score,
-                results=results,
-                message=message,
-                processing_time_ms=processing_time_ms,
-                vigil_response=vigil_response,
-                requires_review=requires_review,
-                consensus_result=consensus_result,
-                conflict_report=conflict_report,
-                resolution_result=resolution_result,
-                aggregated_result=aggregated_result,
-                explanation=explanation,
-                context_analysis_result=context_analysis_result,
-            )
+            with timer.stage("assembly"):
+                assessment = self._build_assessment_enhanced(
+                    ensemble_score=ensemble_score,
+                    results=results,
+                    message=message,
+                    processing_time_ms=timer.elapsed_ms(),
+                    vigil_response=vigil_response,
+                    requires_review=requires_review,
+                    consensus_result=consensus_result,
+                    conflict_report=conflict_report,
+                    resolution_result=resolution_result,
+                    aggregated_result=aggregated_result,
+                    explanation=explanation,
+                    context_analysis_result=context_analysis_result,
+                    fallback_state=fallback_state,
+                )
 
             # Store in cache (Phase 3.7.4)
-            if use_cache and self._cache is not None and self.cache_enabled:
-                self._cache.set(message, assessment)
+            if use_cache:
+                with timer.stage("cache"):
+                    self._cache_assessment(message, assessment, plan, label_set_hash)
+
+            # Finalize timing now that every stage (incl. Phase 4/5) has run
+            processing_time_ms = self._finalize_timing(
+                timer, assessment, aggregated_result
+            )
 
             # Update stats
             self._total_requests += 1
@@ -1294,6 +1502,7 @@ class EnsembleDecisionEngine:
                     self._alerter.alert_model_failure("bart", str(e), is_critical=True)
                 )
 
+            record_engine_request("error", processing_time_ms)
             return CrisisAssessment.create_error(
                 error=str(e),
                 message=message,
@@ -1303,6 +1512,7 @@ class EnsembleDecisionEngine:
         except Exception as e:
             processing_time_ms = (time.perf_counter() - start_time) * 1000
             logger.error(f"❌ Analysis failed: {e}")
+            record_engine_request("error", processing_time_ms)
             return CrisisAssessment.create_error(
                 error=str(e),
                 message=message,
@@ -1318,6 +1528,8 @@ class EnsembleDecisionEngine:
         consensus_algorithm: Optional[str] = None,
         message_history: Optional[List[Dict]] = None,
         include_context_analysis: bool = True,
+        user_id: Optional[str] = None,
+        user_timezone: Optional[str] = None,
     ) -> CrisisAssessment:
         """
         Async version of analyze using asyncio.gather for parallel inference.
@@ -1333,74 +1545,105 @@ class EnsembleDecisionEngine:
             consensus_algorithm: Override consensus algorithm (Phase 4)
             message_history: List of prior messages with timestamps/scores (Phase 5)
             include_context_analysis: Include context analysis in response (Phase 5)
+            user_id: User identifier for the server-side history store (Phase 8)
+            user_timezone: User's timezone for late night detection (FE-001)
 
         Returns:
             CrisisAssessment with complete analysis
         """
         start_time = time.perf_counter()
+        timer = StageTimer(start_time)
         per_model_latency: Dict[str, float] = {}
 
         try:
+            # Phase 8: Cache keys are namespaced by the BART label set
+            label_set_hash = self.model_loader.get_label_set_hash()
+
             # Check cache first (Phase 3.7.4)
-            if use_cache and self._cache is not None and self.cache_enabled:
-                cached_result = self._cache.get(message)
+            use_cache = self._response_cache_usable(
+                use_cache, include_context_analysis, message_history, user_id
+            )
+            if use_cache:
+                with timer.stage("cache"):
+                    cached_result = self._get_cached_assessment(message, label_set_hash)
                 if cached_result is not None:
                     self._cache_hits += 1
                     self._total_requests += 1
-                    cached_result.processing_time_ms = (
-                        time.perf_counter() - start_time
-                    ) * 1000
-                    cached_result.cached = True
+                    cached_result = self._cache_hit_copy(cached_result, timer)
+                    record_engine_request(
+                        "cache_hit", cached_result.processing_time_ms
+                    )
+                    self._record_user_history(user_id, cached_result.crisis_score)
                     return cached_result
 
+            # Phase 8: Resolve unscored history from cache before inference
+            with timer.stage("history_scoring"):
+                history_plan = self._plan_history_scoring(
+                    message_history, include_context_analysis, label_set_hash
+                )
+            history_texts = history_plan.pending if history_plan else None
+            history_results: Dict[str, List[ModelResult]] = {}
+
             # Run parallel inference with asyncio.gather (Phase 3.7.2)
-            (
-                results,
-                per_model_latency,
-            ) = await self._run_async_parallel_inference_with_timing(message)
+            with timer.stage("inference"):
+                (
+                    results,
+                    per_model_latency,
+                ) = await self._run_async_parallel_inference_with_timing(
+                    message, history_texts, history_results
+                )
+            timer.set_models(per_model_latency)
+
+            # Phase 8: One fallback snapshot and decision plan for the request
+            fallback_state = self.fallback.get_snapshot()
+            plan = self._decision_plan
+
+            if history_plan and history_plan.pending:
+                with timer.stage("history_scoring"):
+                    self._score_history_batch(history_plan, history_results, plan)
 
             # Calculate ensemble score
-            ensemble_score = self.scorer.calculate_score(
-                bart_result=results.get("bart"),
-                sentiment_result=results.get("sentiment"),
-                irony_result=results.get("irony"),
-                emotions_result=results.get("emotions"),
-            )
+            with timer.stage("scoring"):
+                ensemble_score = plan.scorer.calculate_score(
+                    bart_result=results.get("bart"),
+                    sentiment_result=results.get("sentiment"),
+                    irony_result=results.get("irony"),
+                    emotions_result=results.get("emotions"),
+                )
 
-            # =================================================================
-            # Phase 3 Vigil: Apply amplification BEFORE irony dampening
-            # =================================================================
+                # =============================================================
+                # Phase 3 Vigil: Apply amplification BEFORE irony dampening
+                # =============================================================
 
-            base_score = ensemble_score.base_score
-            irony_dampening = ensemble_score.irony_dampening
+                base_score = ensemble_score.base_score
+                irony_dampening = ensemble_score.irony_dampening
 
-            preliminary_severity = CrisisSeverity.from_score(
-                base_score, self.scorer.get_thresholds()
-            )
+                preliminary_severity = plan.severity(base_score)
 
             # Apply Vigil amplification (async version)
             vigil_response: VigilResponse
-            if self.vigil_enabled:
-                amplified_score, vigil_response = await self._apply_vigil_amplification(
-                    base_score=base_score,
-                    base_severity=preliminary_severity,
-                    text=message,
-                )
-            else:
-                amplified_score = base_score
-                vigil_response = VigilResponse(
-                    status=VigilStatus.DISABLED,
-                    base_score=base_score,
-                )
+            with timer.stage("vigil"):
+                if self.vigil_enabled:
+                    amplified_score, vigil_response = (
+                        await self._apply_vigil_amplification(
+                            base_score=base_score,
+                            base_severity=preliminary_severity,
+                            text=message,
+                        )
+                    )
+                else:
+                    amplified_score = base_score
+                    vigil_response = VigilResponse(
+                        status=VigilStatus.DISABLED,
+                        base_score=base_score,
+                    )
 
             # Apply irony dampening AFTER Vigil amplification
             final_score = amplified_score * irony_dampening
             final_score = max(0.0, min(1.0, final_score))
 
             # Recalculate final severity
-            final_severity = CrisisSeverity.from_score(
-                final_score, self.scorer.get_thresholds()
-            )
+            final_severity = plan.severity(final_score)
 
             # Determine if review required
             requires_review = self._determine_requires_review(
@@ -1420,9 +1663,6 @@ class EnsembleDecisionEngine:
                 CrisisSeverity.HIGH,
             )
 
-            # Calculate processing time
-            processing_time_ms = (time.perf_counter() - start_time) * 1000
-
             # =========================================================
             # Phase 4: Enhanced Processing (Async)
             # =========================================================
@@ -1431,47 +1671,41 @@ class EnsembleDecisionEngine:
             conflict_report: Optional[ConflictReport] = None
             resolution_result: Optional[ResolutionResult] = None
             aggregated_result: Optional[AggregatedResult] = None
-            explanation: Optional[Explanation] = None
+            explanation: Optional[LazyExplanation] = None
 
             if self.phase4_enabled:
-                # Extract crisis signals
-                crisis_scores = {
-                    name: signal.crisis_signal
-                    for name, signal in ensemble_score.signals.items()
-                }
+                with timer.stage("consensus"):
+                    # Extract crisis signals
+                    crisis_scores = {
+                        name: signal.crisis_signal
+                        for name, signal in ensemble_score.signals.items()
+                    }
 
-                signals_dict = {
-                    name: {
-                        "crisis_signal": signal.crisis_signal,
-                        "label": signal.label,
-                        "raw_score": signal.raw_score,
-                        "score": signal.raw_score,
-                        "metadata": signal.metadata,
+                    signals_dict = {
+                        name: {
+                            "crisis_signal": signal.crisis_signal,
+                            "label": signal.label,
+                            "raw_score": signal.raw_score,
+                            "score": signal.raw_score,
+                            "metadata": signal.metadata,
+                        }
+                        for name, signal in ensemble_score.signals.items()
                     }
-                    for name, signal in ensemble_score.signals.items()
-                }
 
-                # Run consensus
-                if self.consensus_selector:
-                    algo = None
-                    if consensus_algorithm:
-                        try:
-                            algo = ConsensusAlgorithm(consensus_algorithm)
-                        except ValueError:
-                            pass
-
-                    consensus_result = self.consensus_selector.select_and_run(
-                        model_signals=crisis_scores,
-                        algorithm=algo,
-                    )
+                    # Run consensus
+                    if self.consensus_selector:
+                        consensus_result = self._run_consensus(
+                            plan, crisis_scores, consensus_algorithm
+                        )
 
                 # Run conflict detection
-                if self.conflict_detector:
-                    model_signals = ModelSignals.from_ensemble_signals(signals_dict)
-                    conflict_report = self.conflict_detector.detect_conflicts(
-                        model_signals=model_signals,
-                        crisis_scores=crisis_scores,
-                    )
+                if plan.conflict_detector:
+                    with timer.stage("conflict_detection"):
+                        model_signals = ModelSignals.from_ensemble_signals(signals_dict)
+                        conflict_report = plan.conflict_detector.detect_conflicts(
+                            model_signals=model_signals,
+                            crisis_scores=crisis_scores,
+                        )
 
                     if conflict_report.has_conflicts:
                         self._conflicts_detected += 1
@@ -1482,26 +1716,28 @@ class EnsembleDecisionEngine:
                     and conflict_report
                     and conflict_report.has_conflicts
                 ):
-                    resolution_result = await self.conflict_resolver.resolve_async(
-                        crisis_scores=crisis_scores,
-                        conflict_report=conflict_report,
-                        message_preview=message[:100],
-                    )
-
-                # Aggregate results
-                if self.result_aggregator:
-                    aggregated_result = self.result_aggregator.aggregate(
-                        model_signals=signals_dict,
-                        consensus_result=consensus_result,
-                        conflict_report=conflict_report,
-                        resolution_result=resolution_result,
-                        processing_time_ms=processing_time_ms,
-                        per_model_latency=per_model_latency,
-                        is_degraded=self.fallback.is_degraded(),
-                        degradation_reason=self.fallback.get_degradation_reason(),
-                        message=message,
-                        cached=False,
-                    )
+                    with timer.stage("conflict_resolution"):
+                        resolution_result = await self.conflict_resolver.resolve_async(
+                            crisis_scores=crisis_scores,
+                            conflict_report=conflict_report,
+                            message_preview=message[:100],
+                        )
+
+                # Aggregate results (processing time is finalized below)
+                if plan.result_aggregator:
+                    with timer.stage("aggregation"):
+                        aggregated_result = plan.result_aggregator.aggregate(
+                            model_signals=signals_dict,
+                            consensus_result=consensus_result,
+                            conflict_report=conflict_report,
+                            resolution_result=resolution_result,
+                            processing_time_ms=timer.elapsed_ms(),
+                            per_model_latency=per_model_latency,
+                            is_degraded=fallback_state.is_degraded,
+                            degradation_reason=fallback_state.degradation_reason,
+                            message=message,
+                            cached=False,
+                        )
 
                 # Generate explanation
                 if (
@@ -1509,19 +1745,15 @@ class EnsembleDecisionEngine:
                     and self.explainability_generator
                     and aggregated_result
                 ):
-                    verbosity_level = None
-                    if verbosity:
-                        try:
-                            verbosity_level = VerbosityLevel(verbosity)
-                        except ValueError:
-                            pass
-
-                    explanation = self.explainability_generator.generate(
-                        result=aggregated_result,
-                        verbosity=verbosity_level,
-                    )
+                    with timer.stage("explanation"):
+                        verbosity_level = plan.verbosity(verbosity)
 
-                    aggregated_result.explanation = explanation.to_dict()
+                        explanation = self.explainability_generator.generate_lazy(
+                            result=aggregated_result,
+                            verbosity=verbosity_level,
+                        )
+
+                        aggregated_result.explanation = explanation
 
             # =========================================================
             # Phase 5: Context History Analysis (Async)
@@ -1532,21 +1764,31 @@ class EnsembleDecisionEngine:
             if (
                 self.phase5_enabled
                 and include_context_analysis
-                and self.context_analyzer
+                and plan.context_analyzer
             ):
                 try:
-                    # Convert message history to MessageHistoryItem objects
-                    history_items: List[MessageHistoryItem] = []
-                    if message_history:
-                        for item in message_history:
-                            history_items.append(MessageHistoryItem.from_dict(item))
-
-                    # Run context analysis with current message score
-                    context_analysis_result = self.context_analyzer.analyze(
-                        current_message=message,
-                        current_score=final_score,
-                        message_history=history_items,
-                    )
+                    with timer.stage("context"):
+                        # Convert message history to MessageHistoryItem objects
+                        # (Phase 8: with batch-scored crisis scores filled in)
+                        history_items: List[MessageHistoryItem] = []
+                        if history_plan is not None:
+                            message_history = self._apply_history_scores(history_plan)
+                        if message_history:
+                            for item in message_history:
+                                history_items.append(MessageHistoryItem.from_dict(item))
+
+                        # Run context analysis with current message score
+                        context_analysis_result = plan.context_analyzer.analyze(
+                            current_message=message,
+                            current_score=final_score,
+                            message_history=history_items,
+                            user_id=user_id,
+                            user_timezone=user_timezone,
+                        )
+                        if history_plan is not None:
+                            self._annotate_history_scoring(
+                                history_plan, context_analysis_result
+                            )
 
                     logger.debug(
                         f"Context analysis (async): escalation={context_analysis_result.escalation.detected}, "
@@ -1559,24 +1801,32 @@ class EnsembleDecisionEngine:
                     # Continue without context analysis - non-critical failure
 
             # Build assessment
-            assessment = self._build_assessment_enhanced(
-                ensemble_score=ensemble_score,
-                results=results,
-                message=message,
-                processing_time_ms=processing_time_ms,
-                vigil_response=vigil_response,
-                requires_review=requires_review,
-                consensus_result=consensus_result,
-                conflict_report=conflict_report,
-                resolution_result=resolution_result,
-                aggregated_result=aggregated_result,
-                explanation=explanation,
-                context_analysis_result=context_analysis_result,
-            )
+            with timer.stage("assembly"):
+                assessment = self._build_assessment_enhanced(
+                    ensemble_score=ensemble_score,
+                    results=results,
+                    message=message,
+                    processing_time_ms=timer.elapsed_ms(),
+                    vigil_response=vigil_response,
+                    requires_review=requires_review,
+                    consensus_result=consensus_result,
+                    conflict_report=conflict_report,
+                    resolution_result=resolution_result,
+                    aggregated_result=aggregated_result,
+                    explanation=explanation,
+                    context_analysis_result=context_analysis_result,
+                    fallback_state=fallback_state,
+                )
 
             # Store in cache
-            if use_cache and self._cache is not None and self.cache_enabled:
-                self._cache.set(message, assessment)
+            if use_cache:
+                with timer.stage("cache"):
+                    self._cache_assessment(message, assessment, plan, label_set_hash)
+
+            # Finalize timing now that every stage (incl. Phase 4/5) has run
+            processing_time_ms = self._finalize_timing(
+                timer, assessment, aggregated_result
+            )
 
             # Update stats
             self._total_requests += 1
@@ -1595,6 +1845,7 @@ class EnsembleDecisionEngine:
                     "bart", str(e), is_critical=True
                 )
 
+            record_engine_request("error", processing_time_ms)
             return CrisisAssessment.create_error(
                 error=str(e),
                 message=message,
@@ -1604,129 +1855,528 @@ class EnsembleDecisionEngine:
         except Exception as e:
             processing_time_ms = (time.perf_counter() - start_time) * 1000
             logger.error(f"❌ Analysis failed: {e}")
+            record_engine_request("error", processing_time_ms)
             return CrisisAssessment.create_error(
                 error=str(e),
                 message=message,
                 processing_time_ms=processing_time_ms,
             )
 
+    # =========================================================================
+    # Timing (Phase 8)
+    # =========================================================================
+
+    def _run_consensus(
+        self,
+        plan: DecisionPlan,
+        crisis_scores: Dict[str, float],
+        consensus_algorithm: Optional[str],
+    ) -> ConsensusResult:
+        """Run consensus through the request's plan (selector if uncompiled)."""
+        algo = plan.consensus_algorithm(consensus_algorithm)
+        if plan.consensus is not None:
+            return plan.consensus.run(crisis_scores, algo)
+        return self.consensus_selector.select_and_run(
+            model_signals=crisis_scores,
+            algorithm=algo,
+        )
+
+    def _finalize_timing(
+        self,
+        timer: StageTimer,
+        assessment: CrisisAssessment,
+        aggregated_result: Optional[AggregatedResult],
+    ) -> float:
+        """
+        Stamp end-to-end and per-stage timing onto the assessment.
+
+        processing_time_ms covers every stage including Phase 4/5.
+        Stage durations, the end-to-end time and the detection outcome
+        are also exported to metrics.
+
+        Returns:
+            Total processing time in milliseconds
+        """
+        processing_time_ms = timer.elapsed_ms()
+        assessment.processing_time_ms = processing_time_ms
+        if aggregated_result is not None:
+            aggregated_result.processing_time_ms = processing_time_ms
+        assessment.timing = timer.to_dict(processing_time_ms)
+        record_stage_timings(timer.stages)
+        record_engine_request("inference", processing_time_ms)
+        record_crisis_detection(
+            severity=assessment.severity.value,
+            score=assessment.crisis_score,
+            detected=assessment.crisis_detected,
+        )
+        return processing_time_ms
+
     # =========================================================================
     # Inference Methods with Timing
     # =========================================================================
 
-    def _run_sequential_inference_with_timing(
-        self, message: str
-    ) -> tuple[Dict[str, Optional[ModelResult]], Dict[str, float]]:
-        """Run sequential inference with per-model timing."""
-        results: Dict[str, Optional[ModelResult]] = {}
-        latencies: Dict[str, float] = {}
-        model_names = ["bart", "sentiment", "irony", "emotions"]
+    def _run_model(
+        self,
+        model: Any,
+        model_name: str,
+        message: str,
+        history_texts: Optional[List[str]],
+        history_results: Optional[Dict[str, List[ModelResult]]],
+    ) -> ModelResult:
+        """
+        Run one model on the message, batching in history texts if any.
 
-        for model_name in model_names:
-            if self.fallback.can_call_model(model_name):
-                model_start = time.perf_counter()
-                try:
-                    model = self.model_loader.get_model(model_name)
-                    if model:
-                        results[model_name] = model.analyze(message)
-                        self.fallback.handle_model_success(model_name)
-                except Exception as e:
-                    self.fallback.handle_model_failure(model_name, str(e))
-                finally:
-                    latencies[model_name] = (time.perf_counter() - model_start) * 1000
+        Phase 8: With history_texts the model sees [message, *history_texts]
+        in a single pipeline call; history results land in history_results.
+        BART calls are hedged across replicas when a hedger is configured.
+        """
+        if self._hedger is not None and model_name == self.fallback.PRIMARY_MODEL:
+            replicas = self.model_loader.get_replicas(model_name)
+            if len(replicas) > 1:
+                return self._run_model_hedged(
+                    replicas, model_name, message, history_texts, history_results
+                )
+        return self._run_model_once(
+            model, model_name, message, history_texts, history_results
+        )
 
-        return results, latencies
+    def _run_model_hedged(
+        self,
+        replicas: List[Any],
+        model_name: str,
+        message: str,
+        history_texts: Optional[List[str]],
+        history_results: Optional[Dict[str, List[ModelResult]]],
+    ) -> ModelResult:
+        """Run one model through the hedger; only the winner's history lands."""
+
+        def attempt(replica: Any) -> tuple:
+            batch: Dict[str, List[ModelResult]] = {}
+            result = self._run_model_once(
+                replica, model_name, message, history_texts, batch
+            )
+            return result, batch
 
-    def _run_parallel_inference_with_timing(
-        self, message: str
+        result, batch = self._hedger.call(
+            replicas, attempt, accept=lambda outcome: outcome[0].success
+        )
+        if history_results is not None and model_name in batch:
+            history_results[model_name] = batch[model_name]
+        return result
+
+    def _run_model_once(
+        self,
+        model: Any,
+        model_name: str,
+        message: str,
+        history_texts: Optional[List[str]],
+        history_results: Optional[Dict[str, List[ModelResult]]],
+    ) -> ModelResult:
+        """Run one model instance on the message (and history texts)."""
+        if not history_texts:
+            return model.analyze(message)
+
+        batch = model.analyze_batch([message, *history_texts])
+        if history_results is not None:
+            history_results[model_name] = batch[1:]
+        return batch[0]
+
+    def _run_sequential_inference_with_timing(
+        self,
+        message: str,
+        history_texts: Optional[List[str]] = None,
+        history_results: Optional[Dict[str, List[ModelResult]]] = None,
+        enforce_deadlines: bool = True,
     ) -> tuple[Dict[str, Optional[ModelResult]], Dict[str, float]]:
-        """Run parallel inference with per-model timing."""
+        """
+        Run sequential inference with per-model timing.
+
+        Phase 8: Nothing can be preempted here, so with enforce_deadlines a
+        secondary model is skipped when its deadline has already passed
+        before its turn (not counted against it - the budget went to the
+        models ahead of it). Latencies feed the latency circuits.
+        """
         results: Dict[str, Optional[ModelResult]] = {}
         latencies: Dict[str, float] = {}
+        inference_start = time.perf_counter()
 
-        def run_model(model_name: str) -> tuple:
+        for model_name in self.INFERENCE_MODELS:
             if not self.fallback.can_call_model(model_name):
-                return (model_name, None, 0.0)
+                continue
+
+            elapsed_ms = (time.perf_counter() - inference_start) * 1000
+            if enforce_deadlines and elapsed_ms >= self.fallback.get_deadline_ms(model_name):
+                logger.warning(
+                    f"⏱️ {model_name} skipped: inference budget spent "
+                    f"({elapsed_ms:.0f}ms)"
+                )
+                continue
 
             model_start = time.perf_counter()
             try:
                 model = self.model_loader.get_model(model_name)
                 if model:
-                    result = model.analyze(message)
-                    self.fallback.handle_model_success(model_name)
+                    result = self._run_model(
+                        model, model_name, message, history_texts, history_results
+                    )
                     latency = (time.perf_counter() - model_start) * 1000
-                    return (model_name, result, latency)
-                return (model_name, None, 0.0)
+                    if self._is_failed_secondary(model_name, result):
+                        if history_results is not None:
+                            history_results.pop(model_name, None)
+                        self.fallback.handle_model_failure(
+                            model_name, result.error or "Model returned an error"
+                        )
+                    else:
+                        results[model_name] = result
+                        if enforce_deadlines and result.success:
+                            self.fallback.record_latency(model_name, latency)
+                        self.fallback.handle_model_success(model_name)
             except Exception as e:
                 self.fallback.handle_model_failure(model_name, str(e))
-                latency = (time.perf_counter() - model_start) * 1000
-                return (model_name, None, latency)
+            finally:
+                latencies[model_name] = (time.perf_counter() - model_start) * 1000
+
+        return results, latencies
 
-        model_names = ["bart", "sentiment", "irony", "emotions"]
+    def _run_parallel_inference_with_timing(
+        self,
+        message: str,
+        history_texts: Optional[List[str]] = None,
+        history_results: Optional[Dict[str, List[ModelResult]]] = None,
+    ) -> tuple[Dict[str, Optional[ModelResult]], Dict[str, float]]:
+        """
+        Run parallel inference with per-model timing and deadline budgets.
 
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            futures = {executor.submit(run_model, name): name for name in model_names}
+        Phase 8: Results are collected in deadline order. A secondary model
+        still running at its deadline is dropped from the request, and the
+        pool is released without waiting for it (it finishes in the
+        background and its latency still reaches its circuit).
+        """
+        results: Dict[str, Optional[ModelResult]] = {}
+        latencies: Dict[str, float] = {}
+        inference_start = time.perf_counter()
 
-            for future in futures:
-                model_name = futures[future]
+        executor = ThreadPoolExecutor(max_workers=len(self.INFERENCE_MODELS))
+        try:
+            futures = {
+                name: executor.submit(
+                    self._call_model_timed, name, message, history_texts
+                )
+                for name in self.INFERENCE_MODELS
+                if self.fallback.can_call_model(name)
+            }
+
+            for model_name in sorted(futures, key=self.fallback.get_deadline_ms):
                 try:
-                    name, result, latency = future.result(timeout=30)
-                    if result:
-                        results[name] = result
-                    latencies[name] = latency
+                    outcome = futures[model_name].result(
+                        timeout=self._deadline_remaining(model_name, inference_start)
+                    )
+                except FuturesTimeoutError:
+                    self._drop_late_model(model_name, inference_start, latencies)
+                    continue
                 except Exception as e:
                     logger.error(f"Parallel inference failed for {model_name}: {e}")
+                    continue
+                self._accept_model_outcome(
+                    model_name, outcome, results, latencies, history_results
+                )
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
         return results, latencies
 
     async def _run_async_parallel_inference_with_timing(
-        self, message: str
+        self,
+        message: str,
+        history_texts: Optional[List[str]] = None,
+        history_results: Optional[Dict[str, List[ModelResult]]] = None,
     ) -> tuple[Dict[str, Optional[ModelResult]], Dict[str, float]]:
-        """Run async parallel inference with per-model timing."""
+        """
+        Run async parallel inference with per-model timing and deadline
+        budgets (same rules as _run_parallel_inference_with_timing).
+        """
         loop = asyncio.get_event_loop()
+        results: Dict[str, Optional[ModelResult]] = {}
+        latencies: Dict[str, float] = {}
+        inference_start = time.perf_counter()
 
-        async def run_model_async(model_name: str) -> tuple:
-            if not self.fallback.can_call_model(model_name):
-                return (model_name, None, 0.0)
+        futures = {
+            name: loop.run_in_executor(
+                self._executor,
+                partial(self._call_model_timed, name, message, history_texts),
+            )
+            for name in self.INFERENCE_MODELS
+            if self.fallback.can_call_model(name)
+        }
 
-            model_start = time.perf_counter()
+        for model_name in sorted(futures, key=self.fallback.get_deadline_ms):
             try:
-                model = self.model_loader.get_model(model_name)
-                if model:
-                    result = await loop.run_in_executor(
-                        self._executor,
-                        model.analyze,
-                        message,
-                    )
-                    self.fallback.handle_model_success(model_name)
-                    latency = (time.perf_counter() - model_start) * 1000
-                    return (model_name, result, latency)
-                return (model_name, None, 0.0)
+                outcome = await asyncio.wait_for(
+                    futures[model_name],
+                    timeout=self._deadline_remaining(model_name, inference_start),
+                )
+            except asyncio.TimeoutError:
+                self._drop_late_model(model_name, inference_start, latencies)
+                continue
             except Exception as e:
-                self.fallback.handle_model_failure(model_name, str(e))
-                logger.warning(f"Model {model_name} failed: {e}")
-                latency = (time.perf_counter() - model_start) * 1000
-                return (model_name, None, latency)
+                logger.error(f"Async inference exception: {e}")
+                continue
+            self._accept_model_outcome(
+                model_name, outcome, results, latencies, history_results
+            )
 
-        model_names = ["bart", "sentiment", "irony", "emotions"]
-        tasks = [run_model_async(name) for name in model_names]
+        return results, latencies
 
-        results_list = await asyncio.gather(*tasks, return_exceptions=True)
+    # =========================================================================
+    # Phase 8: Deadline Budget Helpers
+    # =========================================================================
 
-        results: Dict[str, Optional[ModelResult]] = {}
-        latencies: Dict[str, float] = {}
+    def _call_model_timed(
+        self,
+        model_name: str,
+        message: str,
+        history_texts: Optional[List[str]],
+    ) -> tuple:
+        """
+        Run one model on a worker thread for the parallel paths.
+
+        Success and failure are reported by the waiting side, which may
+        already have dropped this model; only the latency is recorded here
+        so late calls still count toward the model's p95.
+
+        Returns:
+            (result, history batch, latency_ms, error message)
+        """
+        model_start = time.perf_counter()
+        history_batch: Dict[str, List[ModelResult]] = {}
+        try:
+            model = self.model_loader.get_model(model_name)
+            if not model:
+                return (None, None, 0.0, None)
+            result = self._run_model(
+                model, model_name, message, history_texts, history_batch
+            )
+        except Exception as e:
+            latency = (time.perf_counter() - model_start) * 1000
+            return (None, None, latency, str(e))
+
+        latency = (time.perf_counter() - model_start) * 1000
+        if result.success:
+            self.fallback.record_latency(model_name, latency)
+        return (result, history_batch.get(model_name), latency, None)
+
+    def _accept_model_outcome(
+        self,
+        model_name: str,
+        outcome: tuple,
+        results: Dict[str, Optional[ModelResult]],
+        latencies: Dict[str, float],
+        history_results: Optional[Dict[str, List[ModelResult]]],
+    ) -> None:
+        """Record a model call that finished within its deadline."""
+        result, history_batch, latency, error = outcome
+        latencies[model_name] = latency
+
+        if error is not None:
+            self._record_parallel_failure(model_name, error)
+            return
+        if result is None:
+            return
+        if self._is_failed_secondary(model_name, result):
+            self._record_parallel_failure(
+                model_name, result.error or "Model returned an error"
+            )
+            return
+
+        results[model_name] = result
+        if history_batch is not None and history_results is not None:
+            history_results[model_name] = history_batch
+        self.fallback.handle_model_success(model_name)
+
+    def _is_failed_secondary(self, model_name: str, result: ModelResult) -> bool:
+        """
+        Check for a secondary model's error result.
+
+        Wrappers turn inference exceptions into error results; counting
+        them as failures lets the circuit open and drops a zero signal
+        that would otherwise keep its full weight in the score.
+        """
+        return not result.success and model_name != self.fallback.PRIMARY_MODEL
+
+    def _record_parallel_failure(self, model_name: str, error: str) -> None:
+        """Report a failure; the parallel paths go on without BART's result."""
+        try:
+            self.fallback.handle_model_failure(model_name, error)
+        except CriticalModelFailure as e:
+            logger.error(f"Parallel inference failed for {model_name}: {e}")
+
+    def _deadline_remaining(self, model_name: str, inference_start: float) -> float:
+        """Seconds left before model_name's deadline (never negative)."""
+        deadline_s = self.fallback.get_deadline_ms(model_name) / 1000
+        return max(0.0, deadline_s - (time.perf_counter() - inference_start))
+
+    def _drop_late_model(
+        self,
+        model_name: str,
+        inference_start: float,
+        latencies: Dict[str, float],
+    ) -> None:
+        """Drop a model that missed its deadline from this request."""
+        elapsed_ms = (time.perf_counter() - inference_start) * 1000
+        latencies[model_name] = elapsed_ms
+
+        if model_name == self.fallback.PRIMARY_MODEL:
+            logger.error(f"⏱️ Primary model {model_name} timed out after {elapsed_ms:.0f}ms")
+            return
 
-        for item in results_list:
-            if isinstance(item, Exception):
-                logger.error(f"Async inference exception: {item}")
+        logger.warning(
+            f"⏱️ {model_name} dropped: over "
+            f"{self.fallback.get_deadline_ms(model_name):.0f}ms budget"
+        )
+        self.fallback.handle_deadline_miss(model_name, elapsed_ms)
+
+    # =========================================================================
+    # Phase 8: Batched History Scoring
+    # =========================================================================
+
+    def _plan_history_scoring(
+        self,
+        message_history: Optional[List[Dict]],
+        include_context_analysis: bool,
+        label_set_hash: str = "",
+    ) -> Optional[HistoryScoringPlan]:
+        """
+        Resolve unscored history items from cache and collect the misses.
+
+        Lookup order per message: history score cache, then response cache.
+
+        Args:
+            message_history: Raw history dicts from the request
+            include_context_analysis: Whether context analysis will run
+            label_set_hash: BART label set the scores must come from
+
+        Returns:
+            HistoryScoringPlan, or None if no history item lacks a score
+        """
+        if not (
+            message_history
+            and include_context_analysis
+            and self.phase5_enabled
+            and self.context_analyzer
+            and self.context_analyzer.is_enabled()
+        ):
+            return None
+
+        # Only score what the analyzer will keep
+        max_history = self.context_analyzer.get_max_history_size()
+        history = message_history[-max_history:]
+
+        plan = HistoryScoringPlan(history=history, label_set_hash=label_set_hash)
+        for item in history:
+            text = item.get("message")
+            if item.get("crisis_score") is not None or not text:
+                continue
+            if text in plan.scores or text in plan.pending:
                 continue
-            if isinstance(item, tuple) and len(item) == 3:
-                model_name, result, latency = item
-                if result is not None:
-                    results[model_name] = result
-                latencies[model_name] = latency
 
-        return results, latencies
+            score = self._lookup_history_score(text, label_set_hash)
+            if score is not None:
+                plan.scores[text] = score
+            else:
+                plan.pending.append(text)
+
+        if not plan.scores and not plan.pending:
+            return None
+
+        return plan
+
+    def _lookup_history_score(
+        self, text: str, label_set_hash: str = ""
+    ) -> Optional[float]:
+        """Look up a cached crisis score for a history message."""
+        if self._history_score_cache is not None:
+            score = self._history_score_cache.get(text, namespace=label_set_hash)
+            if score is not None:
+                return score
+        if self._cache is not None and self.cache_enabled:
+            cached = self._cache.get(text, namespace=label_set_hash)
+            if cached is not None:
+                return cached.crisis_score
+        return None
+
+    def _score_history_batch(
+        self,
+        plan: HistoryScoringPlan,
+        history_results: Dict[str, List[ModelResult]],
+        decision_plan: DecisionPlan,
+    ) -> None:
+        """
+        Score batch inference results for pending history messages.
+
+        Uses the Phase 3 ensemble scorer (irony-dampened). Vigil and Phase 4
+        are not applied to history. Items without a successful BART result
+        stay unscored and are skipped by the context analyzer.
+        """
+        bart_results = history_results.get("bart") or []
+
+        for index, text in enumerate(plan.pending):
+            if index >= len(bart_results) or not bart_results[index].success:
+                continue
+
+            def result_for(model_name: str) -> Optional[ModelResult]:
+                model_results = history_results.get(model_name)
+                return model_results[index] if model_results else None
+
+            ensemble_score = decision_plan.scorer.calculate_score(
+                bart_result=bart_results[index],
+                sentiment_result=result_for("sentiment"),
+                irony_result=result_for("irony"),
+                emotions_result=result_for("emotions"),
+            )
+            score = max(0.0, min(1.0, ensemble_score.crisis_score))
+
+            plan.scores[text] = score
+            plan.computed.add(text)
+            if self._history_score_cache is not None and self._label_set_unchanged(
+                plan.label_set_hash
+            ):
+                self._history_score_cache.set(
+                    text,
+                    score,
+                    version=decision_plan.config_version,
+                    namespace=plan.label_set_hash,
+                )
+
+    def _apply_history_scores(self, plan: HistoryScoringPlan) -> List[Dict[str, Any]]:
+        """Return history dicts with resolved crisis scores filled in."""
+        history: List[Dict[str, Any]] = []
+        for item in plan.history:
+            if item.get("crisis_score") is None and item.get("message") in plan.scores:
+                item = {**item, "crisis_score": plan.scores[item["message"]]}
+            history.append(item)
+        return history
+
+    def _annotate_history_scoring(
+        self,
+        plan: HistoryScoringPlan,
+        context_result: Optional[ContextAnalysisResult],
+    ) -> None:
+        """Record computed vs cached history score counts on the result."""
+        if context_result is None:
+            return
+
+        computed = cached = 0
+        for item in plan.history:
+            text = item.get("message")
+            if item.get("crisis_score") is not None or text not in plan.scores:
+                continue
+            if text in plan.computed:
+                computed += 1
+            else:
+                cached += 1
+
+        context_result.metadata.scores_computed = computed
+        context_result.metadata.scores_cached = cached
 
     # =========================================================================
     # Assessment Building
@@ -1744,8 +2394,9 @@ class EnsembleDecisionEngine:
         conflict_report: Optional[ConflictReport] = None,
         resolution_result: Optional[ResolutionResult] = None,
         aggregated_result: Optional[AggregatedResult] = None,
-        explanation: Optional[Explanation] = None,
+        explanation: Optional[LazyExplanation] = None,
         context_analysis_result: Optional[ContextAnalysisResult] = None,
+        fallback_state: Optional[FallbackSnapshot] = None,
     ) -> CrisisAssessment:
         """
         Build CrisisAssessment with Phase 3 Vigil, Phase 4, and Phase 5 enhancements.
@@ -1761,12 +2412,14 @@ class EnsembleDecisionEngine:
             conflict_report: Phase 4 conflict report
             resolution_result: Phase 4 resolution result
             aggregated_result: Phase 4 aggregated result
-            explanation: Phase 4 explanation
+            explanation: Phase 4 explanation (lazy view)
             context_analysis_result: Phase 5 context analysis result
+            fallback_state: Fallback snapshot taken for this request
 
         Returns:
             Complete CrisisAssessment with Phase 3 Vigil, Phase 4, and Phase 5 data
         """
+        fallback_state = fallback_state or self.fallback.get_snapshot()
         # Use resolved score if available, otherwise ensemble score
         final_crisis_score = ensemble_score.crisis_score
         if resolution_result and resolution_result.was_modified:
@@ -1806,13 +2459,13 @@ class EnsembleDecisionEngine:
             signals=signals,
             processing_time_ms=processing_time_ms,
             models_used=models_used,
-            is_degraded=self.fallback.is_degraded(),
-            degradation_reason=self.fallback.get_degradation_reason(),
+            is_degraded=fallback_state.is_degraded,
+            degradation_reason=fallback_state.degradation_reason,
             message=message,
             # Phase 3 Vigil fields
             vigil=vigil_response,
             # Phase 4 fields
-            explanation=explanation.to_dict() if explanation else None,
+            explanation=explanation,
             conflict_report=conflict_report.to_dict() if conflict_report else None,
             consensus_result=consensus_result.to_dict() if consensus_result else None,
             aggregated_result=aggregated_result,
@@ -1866,10 +2519,18 @@ class EnsembleDecisionEngine:
             self._executor.shutdown(wait=True)
             self._executor = None
 
+        if self._hedger:
+            self._hedger.shutdown()
+
         # Clear cache
         if self._cache:
             self._cache.clear()
 
+        # Persist user history store (Phase 8)
+        history_store = self.get_history_store()
+        if history_store is not None:
+            history_store.save_snapshot()
+
         logger.info("✅ Decision Engine shutdown complete")
 
     def warmup(self, sample_text: str = "Hello, how are you today?") -> WarmupResult:
@@ -1904,7 +2565,7 @@ class EnsembleDecisionEngine:
             # Run warmup analysis (bypass cache, no explanations)
             # Use sequential inference to get accurate per-model timing
             results, per_model_latency = self._run_sequential_inference_with_timing(
-                sample_text
+                sample_text, enforce_deadlines=False
             )
 
             total_latency_ms = (time.perf_counter() - start_time) * 1000
@@ -2043,6 +2704,7 @@ class EnsembleDecisionEngine:
             try:
                 algo = ConsensusAlgorithm(algorithm)
                 self.consensus_selector.set_algorithm(algo)
+                self.refresh_decision_plan()
                 logger.info(f"Consensus algorithm set to: {algorithm}")
             except ValueError:
                 logger.warning(f"Invalid consensus algorithm: {algorithm}")
@@ -2063,10 +2725,92 @@ class EnsembleDecisionEngine:
             try:
                 level = VerbosityLevel(verbosity)
                 self.explainability_generator.set_verbosity(level)
+                self.refresh_decision_plan()
                 logger.info(f"Explainability verbosity set to: {verbosity}")
             except ValueError:
                 logger.warning(f"Invalid verbosity level: {verbosity}")
 
+    def set_crisis_labels(
+        self, labels: List[str], safe_labels: Optional[List[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Switch BART (all replicas) to a new crisis label set.
+
+        Cached results are keyed by label set hash, so nothing is flushed:
+        switching back to an earlier set reuses its entries.
+
+        Args:
+            labels: Candidate labels
+            safe_labels: Safe labels (default: keep the current ones)
+
+        Returns:
+            The new label set summary, or None if BART is not loaded
+        """
+        if not self.model_loader.set_crisis_labels(labels, safe_labels):
+            return None
+        return self.get_label_set_info()
+
+    def get_label_set_info(self) -> Optional[Dict[str, Any]]:
+        """Get the BART label set in use (hash, version, sizes)."""
+        bart = self.model_loader.get_model("bart")
+        label_set = getattr(bart, "label_set", None)
+        return label_set.to_dict() if label_set is not None else None
+
+    def set_severity_thresholds(self, thresholds: Dict[str, float]) -> None:
+        """Update severity thresholds (critical, high, medium, low)."""
+        self.scorer.set_thresholds(thresholds)
+        self.refresh_decision_plan()
+
+    def refresh_decision_plan(self) -> DecisionPlan:
+        """
+        Rebuild the decision plan from the current component configuration.
+
+        Called by the configuration setters; call it directly after changing
+        the scorer or consensus selector outside the engine.
+
+        Cached results from before the change become misses, as after a
+        configuration reload.
+
+        Returns:
+            The new plan (requests already running keep the old one)
+        """
+        with self._plan_lock:
+            self._config_version += 1
+            plan = self._build_decision_plan(self._decision_plan.version + 1)
+            self._decision_plan = plan
+        self._set_cache_versions(plan.config_version)
+        logger.debug(f"Decision plan rebuilt (v{plan.version})")
+        return plan
+
+    def _set_cache_versions(self, config_version: int) -> None:
+        """Point the response and history-score caches at a config version."""
+        for cache in (self._cache, self._history_score_cache):
+            if cache is not None:
+                cache.set_version(config_version)
+
+    def _build_decision_plan(self, version: int) -> DecisionPlan:
+        """Compile a plan from the engine's current components."""
+        return create_decision_plan(
+            self.scorer,
+            self._consensus_plan(),
+            version=version,
+            conflict_detector=self.conflict_detector,
+            result_aggregator=self.result_aggregator,
+            context_analyzer=self.context_analyzer,
+            config_version=self._config_version,
+        )
+
+    def get_decision_plan(self) -> DecisionPlan:
+        """Get the current decision plan."""
+        return self._decision_plan
+
+    def _consensus_plan(self) -> Optional[ConsensusPlan]:
+        """Compiled plan of the consensus selector, if it provides one."""
+        if self.consensus_selector is None:
+            return None
+        get_plan = getattr(self.consensus_selector, "get_plan", None)
+        return get_plan() if get_plan is not None else None
+
     def get_consensus_config(self) -> Optional[Dict[str, Any]]:
         """Get current consensus configuration."""
         if self.consensus_selector:
@@ -2091,12 +2835,35 @@ class EnsembleDecisionEngine:
             Context configuration dictionary or None if disabled
         """
         if self.context_analyzer and self.phase5_enabled:
+            history_store = self.context_analyzer.get_history_store()
             return {
                 "enabled": self.context_analyzer.is_enabled(),
                 "max_history_size": self.context_analyzer.get_max_history_size(),
+                "history_store": (
+                    history_store.get_stats() if history_store is not None else None
+                ),
             }
         return None
 
+    def get_history_store(self) -> Optional[UserHistoryStore]:
+        """
+        Get the server-side user history store (Phase 8).
+
+        Returns:
+            UserHistoryStore or None if context analysis is stateless
+        """
+        if self.context_analyzer:
+            return self.context_analyzer.get_history_store()
+        return None
+
+    def _record_user_history(self, user_id: Optional[str], crisis_score: float) -> None:
+        """Record a score for a user on paths that skip context analysis."""
+        if not user_id:
+            return
+        history_store = self.get_history_store()
+        if history_store is not None:
+            history_store.record(user_id, datetime.utcnow(), crisis_score)
+
     def is_context_analysis_enabled(self) -> bool:
         """
         Check if context analysis is enabled.
@@ -2108,10 +2875,300 @@ class EnsembleDecisionEngine:
             return self.context_analyzer.is_enabled()
         return False
 
+    # =========================================================================
+    # Phase 8 Configuration Reload
+    # =========================================================================
+
+    # Config sections applied by reload_config() (everything else needs a restart)
+    RELOADABLE_SECTIONS = ("thresholds", "crisis_labels")
+
+    def reload_config(
+        self,
+        config_manager: "ConfigManager",
+        context_config_manager: Optional["ContextConfigManager"] = None,
+    ) -> Dict[str, Any]:
+        """
+        Apply a reloaded configuration without reloading models.
+
+        Only components whose inputs changed are rebuilt. They are published
+        together in one new DecisionPlan, so each request sees either the
+        old or the new configuration, never a mix. Cached responses and
+        history scores from the old configuration become misses.
+
+        Args:
+            config_manager: Freshly loaded configuration manager
+            context_config_manager: Freshly loaded context configuration
+                (None = leave context analysis as is)
+
+        Returns:
+            Summary: config_version, changed, rebuilt, restart_required
+        """
+        changed, restart_required = self._diff_config(
+            config_manager, context_config_manager
+        )
+        summary: Dict[str, Any] = {
+            "config_version": self._config_version,
+            "changed": sorted(changed),
+            "rebuilt": [],
+            "restart_required": sorted(restart_required),
+        }
+        if restart_required:
+            logger.warning(
+                f"⚠️ Config sections changed that need a restart: "
+                f"{', '.join(sorted(restart_required))}"
+            )
+        if not changed:
+            return summary
+
+        rebuilt: List[str] = []
+        scoring_changed = bool(changed & {"thresholds", "weights"})
+
+        scorer = self.scorer
+        if scoring_changed:
+            scorer = create_weighted_scorer(config_manager=config_manager)
+            rebuilt.append("scorer")
+
+        consensus_selector = self.consensus_selector
+        conflict_detector = self.conflict_detector
+        conflict_resolver = self.conflict_resolver
+        result_aggregator = self.result_aggregator
+        if self.phase4_enabled:
+            if changed & {"consensus", "weights"}:
+                consensus_selector = create_consensus_selector(
+                    config_manager=config_manager
+                )
+                rebuilt.append("consensus_selector")
+            if "conflict_detection" in changed:
+                conflict_detector = create_conflict_detector(
+                    config_manager=config_manager
+                )
+                rebuilt.append("conflict_detector")
+            if changed & {"conflict_resolution", "conflict_alerting"}:
+                conflict_resolver = create_conflict_resolver(
+                    config_manager=config_manager,
+                    alerter=self._alerter,
+                )
+                if self.conflict_resolver is not None:
+                    # Keep the alert cooldown across the reload
+                    conflict_resolver._last_alert_time = (
+                        self.conflict_resolver._last_alert_time
+                    )
+                    conflict_resolver._alert_count = self.conflict_resolver._alert_count
+                rebuilt.append("conflict_resolver")
+            if scoring_changed:
+                result_aggregator = create_result_aggregator(
+                    config_manager=config_manager
+                )
+                rebuilt.append("result_aggregator")
+
+        context_analyzer = self.context_analyzer
+        if "context" in changed and context_analyzer is not None:
+            # Same history store: per-user histories survive the reload
+            context_analyzer = create_context_analyzer(
+                context_config_manager=context_config_manager,
+                history_store=context_analyzer.get_history_store(),
+            )
+            rebuilt.append("context_analyzer")
+
+        if "crisis_labels" in changed:
+            updated = self.model_loader.apply_config(config_manager)
+            rebuilt.append(f"bart_labels({updated})")
+
+        fallback_weights = None
+        if "weights" in changed and self.fallback is not None:
+            fallback_weights = config_manager.get_model_weights()
+            rebuilt.append("fallback_weights")
+
+        # Label changes move cache keys to a new namespace on their own
+        bump_version = bool(changed - {"crisis_labels"})
+
+        with self._plan_lock:
+            self.config_manager = config_manager
+            self.scorer = scorer
+            self.consensus_selector = consensus_selector
+            self.conflict_detector = conflict_detector
+            self.conflict_resolver = conflict_resolver
+            self.result_aggregator = result_aggregator
+            self.context_analyzer = context_analyzer
+            if fallback_weights is not None:
+                self.fallback.set_base_weights(fallback_weights)
+            if bump_version:
+                self._config_version += 1
+            self._config_reloads += 1
+            self._decision_plan = self._build_decision_plan(
+                self._decision_plan.version + 1
+            )
+            config_version = self._config_version
+
+        self._set_cache_versions(config_version)
+
+        summary["config_version"] = config_version
+        summary["rebuilt"] = rebuilt
+        logger.info(
+            f"🔁 Configuration reloaded (v{config_version}): "
+            f"changed={', '.join(sorted(changed))}; rebuilt={', '.join(rebuilt)}"
+        )
+        return summary
+
+    def _diff_config(
+        self,
+        config_manager: "ConfigManager",
+        context_config_manager: Optional["ContextConfigManager"],
+    ) -> Tuple[set, set]:
+        """
+        Compare a reloaded configuration with the one in use.
+
+        Returns:
+            (changed reloadable inputs, changed sections needing a restart)
+        """
+        changed = set()
+        restart_required = set()
+        current = self.config_manager
+
+        if current is None:
+            changed.update(
+                {
+                    "thresholds",
+                    "weights",
+                    "consensus",
+                    "conflict_detection",
+                    "conflict_resolution",
+                    "conflict_alerting",
+                    "crisis_labels",
+                }
+            )
+        else:
+            getters = {
+                "thresholds": "get_thresholds",
+                "weights": "get_model_weights",
+                "consensus": "get_consensus_config",
+                "conflict_detection": "get_conflict_detection_config",
+                "conflict_resolution": "get_conflict_resolution_config",
+                "conflict_alerting": "get_conflict_alerting_config",
+                "crisis_labels": "get_crisis_labels",
+            }
+            for name, getter in getters.items():
+                if getattr(current, getter)() != getattr(config_manager, getter)():
+                    changed.add(name)
+
+            old_sections = current.to_dict()
+            new_sections = config_manager.to_dict()
+            for section in set(old_sections) | set(new_sections):
+                if section in self.RELOADABLE_SECTIONS or section.startswith("_"):
+                    continue
+                old = old_sections.get(section)
+                new = new_sections.get(section)
+                if section.startswith("model_") and isinstance(old, dict) and isinstance(new, dict):
+                    # Weights are reloadable; anything else about a model is not
+                    old = {k: v for k, v in old.items() if k != "weight"}
+                    new = {k: v for k, v in new.items() if k != "weight"}
+                if old != new:
+                    restart_required.add(section)
+
+        if context_config_manager is not None and self.context_analyzer is not None:
+            current_context = self.context_analyzer.get_config_manager()
+            if current_context.to_dict() != context_config_manager.to_dict():
+                changed.add("context")
+
+        return changed, restart_required
+
+    def get_config_version(self) -> int:
+        """Get the configuration version (increments on every reload or setter)."""
+        return self._config_version
+
     # =========================================================================
     # Cache Management
     # =========================================================================
 
+    def _response_cache_usable(
+        self,
+        use_cache: bool,
+        include_context_analysis: bool,
+        message_history: Optional[List[Dict]],
+        user_id: Optional[str],
+    ) -> bool:
+        """
+        Check whether a request may read and write the response cache.
+
+        The cache is keyed on the message text alone, so an assessment
+        carrying one user's context analysis (history or server-side
+        store) must never be served to another user.
+        """
+        if not (use_cache and self._cache is not None and self.cache_enabled):
+            return False
+        per_user_context = (
+            self.phase5_enabled
+            and include_context_analysis
+            and self.context_analyzer is not None
+            and bool(user_id or message_history)
+        )
+        return not per_user_context
+
+    @staticmethod
+    def _cache_hit_copy(
+        cached: CrisisAssessment, timer: StageTimer
+    ) -> CrisisAssessment:
+        """Copy of a cached assessment with this request's timing."""
+        processing_time_ms = timer.elapsed_ms()
+        return replace(
+            cached,
+            processing_time_ms=processing_time_ms,
+            cached=True,
+            timing=timer.to_dict(processing_time_ms),
+        )
+
+    def _get_cached_assessment(
+        self, message: str, label_set_hash: str
+    ) -> Optional[CrisisAssessment]:
+        """
+        Cached assessment for a message, or for a near-duplicate of it.
+
+        A near-duplicate hit returns a copy of the matched message's
+        assessment carrying this message and the near_duplicate flag (the
+        cached original is left unchanged).
+        """
+        cached = self._cache.get(message, namespace=label_set_hash)
+        if cached is not None or self._near_duplicates is None:
+            return cached
+
+        match = self._near_duplicates.lookup(message, namespace=label_set_hash)
+        if match is None:
+            return None
+        original = self._cache.get(match.text, namespace=label_set_hash)
+        if original is None:
+            return None
+        logger.debug(f"Near-duplicate cache hit (similarity {match.similarity:.3f})")
+        return replace(
+            original, message=message, near_duplicate=match.to_dict()
+        )
+
+    def _cache_assessment(
+        self,
+        message: str,
+        assessment: CrisisAssessment,
+        plan: DecisionPlan,
+        label_set_hash: str,
+    ) -> None:
+        """Cache an assessment under the label set it was computed with."""
+        if self._label_set_unchanged(label_set_hash):
+            self._cache.set(
+                message,
+                assessment,
+                version=plan.config_version,
+                namespace=label_set_hash,
+            )
+            if self._near_duplicates is not None:
+                self._near_duplicates.add(message, namespace=label_set_hash)
+
+    def _label_set_unchanged(self, label_set_hash: str) -> bool:
+        """
+        Check the BART label set is still the one a request started with.
+
+        A label change during inference leaves the result matching neither
+        set's cache key, so it is not cached.
+        """
+        return self.model_loader.get_label_set_hash() == label_set_hash
+
     def clear_cache(self) -> int:
         """
         Clear the response cache.
@@ -2119,6 +3176,8 @@ class EnsembleDecisionEngine:
         Returns:
             Number of entries cleared
         """
+        if self._near_duplicates is not None:
+            self._near_duplicates.clear()
         if self._cache:
             return self._cache.clear()
         return 0
@@ -2176,9 +3235,21 @@ class EnsembleDecisionEngine:
             },
             "models": self.model_loader.get_status(),
             "weights": self.scorer.get_weights(),
-            "thresholds": self.scorer.get_thresholds(),
+            "thresholds": dict(self._decision_plan.thresholds),
+            "decision_plan": self._decision_plan.to_dict(),
+            "config_reloads": self._config_reloads,
+            "label_set": self.get_label_set_info(),
+            "bart_two_stage": self.model_loader.get_two_stage_stats(),
+            "bart_shared_premise": self.model_loader.get_shared_premise_stats(),
             "fallback": self.fallback.get_status(),
             "cache": self.get_cache_stats(),
+            "near_duplicates": (
+                self._near_duplicates.get_stats()
+                if self._near_duplicates is not None
+                else None
+            ),
+            "hedging": self._hedger.get_stats() if self._hedger else None,
+            "alerting": self._alerter.get_status() if self._alerter else None,
         }
 
         # Add Phase 3 Vigil component status
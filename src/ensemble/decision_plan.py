@@ -0,0 +1,190 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+CORE PRINCIPLE: Multi-Model Ensemble → Weighted Decision Engine → Crisis Classification
+******************  CORE SYSTEM VISION (Never to be violated):  ****************
+Ash-NLP is a CRISIS DETECTION BACKEND that:
+1. PRIMARY: Uses BART Zero-Shot Classification for semantic crisis detection
+2. CONTEXTUAL: Enhances with sentiment, irony, and emotion model signals
+3. ENSEMBLE: Combines weighted model outputs through decision engine
+4. PURPOSE: Detect crisis messages in Discord community communications
+********************************************************************************
+Compiled Decision Plan for Ash-NLP Ensemble Service
+---
+FILE VERSION: v5.0-8-20.0-2
+LAST MODIFIED: 2026-02-19
+PHASE: Phase 8 Step 20.0 - Hot Configuration Reload
+CLEAN ARCHITECTURE: v5.2.3 Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+
+RESPONSIBILITIES:
+- Hold the per-request decision configuration in one immutable object:
+    - severity thresholds compiled to bisect bounds
+    - the consensus selector's compiled ConsensusPlan
+    - name lookups for consensus algorithms and verbosity levels
+    - the config-built components a request uses after inference (scorer,
+      conflict detector, aggregator, context analyzer) and the config
+      version they were built from
+- Built once at startup and rebuilt only when configuration changes
+  (the engine swaps the whole plan; requests read it once, so a hot
+  reload never mixes old and new components within one request)
+"""
+
+import logging
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from src.context import ContextAnalyzer
+
+from .aggregator import ResultAggregator
+from .conflict_detector import ConflictDetector
+from .consensus import CONSENSUS_ALGORITHMS_BY_NAME, ConsensusAlgorithm, ConsensusPlan
+from .explainability import VerbosityLevel
+from .scoring import CrisisSeverity, WeightedScorer
+
+# Module version
+__version__ = "v5.0-8-20.0-2"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Verbosity lookup by API name (avoids enum parsing per request)
+VERBOSITY_LEVELS_BY_NAME: Mapping[str, VerbosityLevel] = MappingProxyType(
+    {level.value: level for level in VerbosityLevel}
+)
+
+
+# =============================================================================
+# Decision Plan
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class DecisionPlan:
+    """
+    Immutable compiled decision configuration for one engine.
+
+    Attributes:
+        thresholds: Severity thresholds the bounds were compiled from
+        severity_bounds: Ascending low/medium/high/critical bounds
+        scorer: Weighted scorer the thresholds came from
+        consensus: Compiled consensus plan (None when Phase 4 is off)
+        conflict_detector: Conflict detector (None when Phase 4 is off)
+        result_aggregator: Result aggregator (None when Phase 4 is off)
+        context_analyzer: Context analyzer (None when Phase 5 is off)
+        version: Increments with every rebuild
+        config_version: Increments with every reload or configuration setter
+    """
+
+    thresholds: Mapping[str, float]
+    severity_bounds: Tuple[float, ...]
+    scorer: WeightedScorer
+    consensus: Optional[ConsensusPlan] = None
+    conflict_detector: Optional[ConflictDetector] = None
+    result_aggregator: Optional[ResultAggregator] = None
+    context_analyzer: Optional[ContextAnalyzer] = None
+    version: int = 0
+    config_version: int = 0
+
+    def severity(self, score: float) -> CrisisSeverity:
+        """Map a score to severity (same result as CrisisSeverity.from_score)."""
+        return CrisisSeverity.from_bounds(score, self.severity_bounds)
+
+    @staticmethod
+    def consensus_algorithm(name: Optional[str]) -> Optional[ConsensusAlgorithm]:
+        """
+        Resolve a consensus algorithm name.
+
+        Returns:
+            ConsensusAlgorithm, or None when name is empty or unknown
+        """
+        if not name:
+            return None
+        algo = CONSENSUS_ALGORITHMS_BY_NAME.get(name)
+        if algo is None:
+            logger.warning(f"Invalid consensus algorithm: {name}")
+        return algo
+
+    @staticmethod
+    def verbosity(name: Optional[str]) -> Optional[VerbosityLevel]:
+        """Resolve a verbosity name (None when empty or unknown)."""
+        if not name:
+            return None
+        return VERBOSITY_LEVELS_BY_NAME.get(name)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for status output."""
+        return {
+            "version": self.version,
+            "config_version": self.config_version,
+            "severity_bounds": dict(
+                zip(("low", "medium", "high", "critical"), self.severity_bounds)
+            ),
+            "consensus_algorithm": (
+                self.consensus.default_algorithm.value if self.consensus else None
+            ),
+            "consensus_plan_version": (
+                self.consensus.version if self.consensus else None
+            ),
+        }
+
+
+# =============================================================================
+# FACTORY FUNCTION - Clean Architecture v5.1 Compliance (Rule #1)
+# =============================================================================
+
+
+def create_decision_plan(
+    scorer: WeightedScorer,
+    consensus_plan: Optional[ConsensusPlan] = None,
+    version: int = 0,
+    conflict_detector: Optional[ConflictDetector] = None,
+    result_aggregator: Optional[ResultAggregator] = None,
+    context_analyzer: Optional[ContextAnalyzer] = None,
+    config_version: int = 0,
+) -> DecisionPlan:
+    """
+    Factory function for DecisionPlan.
+
+    Compiles the plan from the engine's live components.
+
+    Args:
+        scorer: Weighted scorer holding the severity thresholds
+        consensus_plan: Consensus selector's current plan (optional)
+        version: Plan version
+        conflict_detector: Conflict detector (optional)
+        result_aggregator: Result aggregator (optional)
+        context_analyzer: Context analyzer (optional)
+        config_version: Configuration version the components came from
+
+    Returns:
+        Compiled DecisionPlan
+
+    Example:
+        >>> plan = create_decision_plan(scorer, selector.get_plan())
+        >>> plan.severity(0.72)
+        <CrisisSeverity.HIGH: 'high'>
+    """
+    return DecisionPlan(
+        thresholds=MappingProxyType(scorer.get_thresholds()),
+        severity_bounds=scorer.get_severity_bounds(),
+        scorer=scorer,
+        consensus=consensus_plan,
+        conflict_detector=conflict_detector,
+        result_aggregator=result_aggregator,
+        context_analyzer=context_analyzer,
+        version=version,
+        config_version=config_version,
+    )
+
+
+# =============================================================================
+# Export public interface
+# =============================================================================
+
+__all__ = [
+    "DecisionPlan",
+    "create_decision_plan",
+    "VERBOSITY_LEVELS_BY_NAME",
+]
@@ -10,9 +10,9 @@ Ash-NLP is a CRISIS DETECTION BACKEND that:
 ********************************************************************************
 Explainability Layer for Ash-NLP Ensemble Service
 ---
-FILE VERSION: v5.0-4-4.1-1
-LAST MODIFIED: 2026-01-01
-PHASE: Phase 4 Step 4 - Explainability Layer
+FILE VERSION: v5.0-8-15.0-1
+LAST MODIFIED: 2026-02-14
+PHASE: Phase 8 Step 15.0 - Lazy Explanations
 CLEAN ARCHITECTURE: v5.1 Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-nlp
 Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
@@ -30,12 +30,21 @@ Explanations should:
 - Highlight the most important factors in the decision
 - Provide actionable recommendations
 - Support different verbosity levels for different contexts
+
+LAZY RENDERING (Phase 8):
+Most explanations are never read. generate_lazy() returns a LazyExplanation:
+a read-only mapping with the same keys as Explanation.to_dict(), whose
+values are rendered from the AggregatedResult the first time they are
+read and then kept. Decision summaries and recommendations come from
+templates prebuilt per crisis level. generate() is the eager form of the
+same view, so both always produce the same text.
 """
 
 import logging
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, Iterator, List, Optional, TYPE_CHECKING
 
 from .aggregator import (
     AggregatedResult,
@@ -50,7 +59,7 @@ if TYPE_CHECKING:
     from src.managers.config_manager import ConfigManager
 
 # Module version
-__version__ = "v5.0-4-4.1-1"
+__version__ = "v5.0-8-15.0-1"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -69,6 +78,77 @@ class VerbosityLevel(Enum):
     DETAILED = "detailed"  # Full breakdown with all model contributions
 
 
+# =============================================================================
+# Templates (built once per crisis level)
+# =============================================================================
+
+
+# Crisis level descriptions
+CRISIS_LEVEL_DESCRIPTIONS = {
+    CrisisLevel.CRITICAL: "CRITICAL",
+    CrisisLevel.HIGH: "HIGH CONCERN",
+    CrisisLevel.MEDIUM: "MODERATE CONCERN",
+    CrisisLevel.LOW: "LOW CONCERN",
+    CrisisLevel.SAFE: "NO CONCERN",
+}
+
+# Decision summary per crisis level ({confidence} = whole percent)
+_DECISION_TEMPLATES = {
+    CrisisLevel.CRITICAL: (
+        "CRITICAL: Significant crisis indicators detected "
+        "with {confidence}% confidence. Immediate attention required."
+    ),
+    CrisisLevel.HIGH: (
+        "HIGH CONCERN: Crisis indicators detected "
+        "with {confidence}% confidence. Priority response recommended."
+    ),
+    CrisisLevel.MEDIUM: (
+        "MODERATE CONCERN: Some crisis indicators present "
+        "with {confidence}% confidence. Monitoring recommended."
+    ),
+    CrisisLevel.LOW: (
+        "LOW CONCERN: Minor indicators detected "
+        "with {confidence}% confidence. Passive monitoring suggested."
+    ),
+    CrisisLevel.SAFE: (
+        "NO CONCERN: No significant crisis indicators detected. "
+        "Message appears safe ({confidence}% confidence)."
+    ),
+}
+
+# (action, escalation, rationale) per crisis level
+_RECOMMENDATION_TEMPLATES = {
+    CrisisLevel.CRITICAL: (
+        "Immediate outreach to community member",
+        "Alert senior moderators immediately",
+        "Critical crisis indicators require immediate human intervention",
+    ),
+    CrisisLevel.HIGH: (
+        "Check user history and consider direct outreach",
+        "Moderator review recommended",
+        "High-severity indicators warrant prompt attention",
+    ),
+    CrisisLevel.MEDIUM: (
+        "Monitor user activity and be prepared to engage",
+        "Flag for follow-up if pattern continues",
+        "Moderate indicators suggest watching for escalation",
+    ),
+    CrisisLevel.LOW: (
+        "Note and continue passive monitoring",
+        "No immediate escalation needed",
+        "Minor indicators do not require active intervention",
+    ),
+    CrisisLevel.SAFE: (
+        "No action required",
+        "None",
+        "No concerning indicators detected",
+    ),
+}
+
+# Escalation text when conflict resolution asks for review
+_REVIEW_ESCALATION = "Human review recommended due to model disagreement"
+
+
 # =============================================================================
 # Explanation Data Classes
 # =============================================================================
@@ -166,6 +246,164 @@ class Explanation:
         return result
 
 
+class LazyExplanation(Mapping):
+    """
+    Read-only explanation view rendered on demand.
+
+    Has the keys and values of Explanation.to_dict() for the same result
+    and verbosity. Each value is rendered on first read and kept, so an
+    explanation nobody reads costs only this object.
+
+    Attributes:
+        verbosity: Verbosity level used
+    """
+
+    __slots__ = ("verbosity", "_generator", "_result", "_keys", "_parts", "_values")
+
+    def __init__(
+        self,
+        generator: "ExplainabilityGenerator",
+        result: AggregatedResult,
+        verbosity: VerbosityLevel,
+    ):
+        """
+        Initialize LazyExplanation.
+
+        Args:
+            generator: Generator providing the renderers
+            result: AggregatedResult to explain
+            verbosity: Verbosity level
+
+        Note:
+            Use ExplainabilityGenerator.generate_lazy() instead.
+        """
+        self.verbosity = verbosity
+        self._generator = generator
+        self._result = result
+        self._parts: Dict[str, Any] = {}
+        self._values: Dict[str, Any] = {"verbosity": verbosity.value}
+
+        # Same keys, same order as Explanation.to_dict()
+        keys = ["verbosity", "decision_summary"]
+        if verbosity in (VerbosityLevel.STANDARD, VerbosityLevel.DETAILED):
+            keys.append("key_factors")
+            if generator.include_recommendations:
+                keys.append("recommended_action")
+        if verbosity == VerbosityLevel.DETAILED:
+            keys.append("confidence_summary")
+            keys.append("model_contributions")
+            if result.conflict_report and result.conflict_report.has_conflicts:
+                keys.append("conflict_summary")
+        keys.append("plain_text")
+        self._keys = tuple(keys)
+
+    # -------------------------------------------------------------------------
+    # Mapping interface
+    # -------------------------------------------------------------------------
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        if key not in self._keys:
+            raise KeyError(key)
+
+        part = self._part(key)
+        if key == "recommended_action":
+            value = part.to_dict()
+        elif key == "model_contributions":
+            value = [mc.to_dict() for mc in part]
+        else:
+            value = part
+        self._values[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return (
+            f"LazyExplanation(verbosity={self.verbosity.value}, "
+            f"rendered={sorted(self._parts)})"
+        )
+
+    # -------------------------------------------------------------------------
+    # Rendering
+    # -------------------------------------------------------------------------
+
+    def _part(self, name: str) -> Any:
+        """Render (once) one explanation component as its object form."""
+        try:
+            return self._parts[name]
+        except KeyError:
+            pass
+
+        generator = self._generator
+        result = self._result
+        if name == "decision_summary":
+            part = generator._generate_decision_summary(result)
+        elif name == "key_factors":
+            part = generator._identify_key_factors(result)
+        elif name == "recommended_action":
+            part = generator._generate_recommendation(result)
+        elif name == "confidence_summary":
+            part = generator._generate_confidence_summary(result)
+        elif name == "model_contributions":
+            part = (
+                generator._generate_model_contributions(result)
+                if generator.include_model_details else []
+            )
+        elif name == "conflict_summary":
+            part = generator._generate_conflict_summary(result.conflict_report)
+        elif name == "plain_text":
+            part = generator._generate_plain_text(self._build(), result)
+        else:
+            raise KeyError(name)
+
+        self._parts[name] = part
+        return part
+
+    def _build(self) -> Explanation:
+        """Explanation with every component except plain_text."""
+        keys = self._keys
+        return Explanation(
+            verbosity=self.verbosity,
+            decision_summary=self._part("decision_summary"),
+            confidence_summary=(
+                self._part("confidence_summary") if "confidence_summary" in keys else ""
+            ),
+            model_contributions=(
+                self._part("model_contributions") if "model_contributions" in keys else []
+            ),
+            key_factors=self._part("key_factors") if "key_factors" in keys else [],
+            recommended_action=(
+                self._part("recommended_action") if "recommended_action" in keys else None
+            ),
+            conflict_summary=(
+                self._part("conflict_summary") if "conflict_summary" in keys else ""
+            ),
+        )
+
+    @property
+    def rendered(self) -> List[str]:
+        """Components rendered so far."""
+        return [key for key in self._keys if key in self._parts]
+
+    def to_explanation(self) -> Explanation:
+        """Render everything into an Explanation."""
+        explanation = self._build()
+        explanation.plain_text = self._part("plain_text")
+        return explanation
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Render everything into the Explanation.to_dict() layout."""
+        return {key: self[key] for key in self._keys}
+
+
 # =============================================================================
 # Explainability Generator
 # =============================================================================
@@ -197,13 +435,7 @@ class ExplainabilityGenerator:
     }
 
     # Crisis level descriptions
-    CRISIS_LEVEL_DESCRIPTIONS = {
-        CrisisLevel.CRITICAL: "CRITICAL",
-        CrisisLevel.HIGH: "HIGH CONCERN",
-        CrisisLevel.MEDIUM: "MODERATE CONCERN",
-        CrisisLevel.LOW: "LOW CONCERN",
-        CrisisLevel.SAFE: "NO CONCERN",
-    }
+    CRISIS_LEVEL_DESCRIPTIONS = CRISIS_LEVEL_DESCRIPTIONS
 
     def __init__(
         self,
@@ -243,46 +475,24 @@ class ExplainabilityGenerator:
         Returns:
             Explanation with human-readable content
         """
-        active_verbosity = verbosity or self.default_verbosity
-
-        # Generate decision summary
-        decision_summary = self._generate_decision_summary(result)
+        return self.generate_lazy(result, verbosity).to_explanation()
 
-        # Initialize explanation
-        explanation = Explanation(
-            verbosity=active_verbosity,
-            decision_summary=decision_summary,
-        )
-
-        # Add components based on verbosity
-        if active_verbosity in (VerbosityLevel.STANDARD, VerbosityLevel.DETAILED):
-            # Key factors
-            explanation.key_factors = self._identify_key_factors(result)
-
-            # Recommended action
-            if self.include_recommendations:
-                explanation.recommended_action = self._generate_recommendation(result)
-
-        if active_verbosity == VerbosityLevel.DETAILED:
-            # Confidence summary
-            explanation.confidence_summary = self._generate_confidence_summary(result)
-
-            # Model contributions
-            if self.include_model_details:
-                explanation.model_contributions = self._generate_model_contributions(
-                    result
-                )
-
-            # Conflict summary
-            if result.conflict_report and result.conflict_report.has_conflicts:
-                explanation.conflict_summary = self._generate_conflict_summary(
-                    result.conflict_report
-                )
+    def generate_lazy(
+        self,
+        result: AggregatedResult,
+        verbosity: Optional[VerbosityLevel] = None,
+    ) -> LazyExplanation:
+        """
+        Create an explanation view rendered only when read.
 
-        # Generate full plain text
-        explanation.plain_text = self._generate_plain_text(explanation, result)
+        Args:
+            result: AggregatedResult from ResultAggregator
+            verbosity: Override verbosity level
 
-        return explanation
+        Returns:
+            LazyExplanation (Explanation.to_dict() layout)
+        """
+        return LazyExplanation(self, result, verbosity or self.default_verbosity)
 
     # =========================================================================
     # Decision Summary Generation
@@ -290,36 +500,12 @@ class ExplainabilityGenerator:
 
     def _generate_decision_summary(self, result: AggregatedResult) -> str:
         """Generate plain-English decision summary."""
-        level_desc = self.CRISIS_LEVEL_DESCRIPTIONS.get(
-            result.crisis_level, "UNKNOWN"
-        )
-        confidence_pct = int(result.confidence * 100)
-
-        if result.crisis_level == CrisisLevel.CRITICAL:
-            return (
-                f"{level_desc}: Significant crisis indicators detected "
-                f"with {confidence_pct}% confidence. Immediate attention required."
-            )
-        elif result.crisis_level == CrisisLevel.HIGH:
-            return (
-                f"{level_desc}: Crisis indicators detected "
-                f"with {confidence_pct}% confidence. Priority response recommended."
-            )
-        elif result.crisis_level == CrisisLevel.MEDIUM:
-            return (
-                f"{level_desc}: Some crisis indicators present "
-                f"with {confidence_pct}% confidence. Monitoring recommended."
-            )
-        elif result.crisis_level == CrisisLevel.LOW:
-            return (
-                f"{level_desc}: Minor indicators detected "
-                f"with {confidence_pct}% confidence. Passive monitoring suggested."
-            )
-        else:  # SAFE
-            return (
-                f"{level_desc}: No significant crisis indicators detected. "
-                f"Message appears safe ({confidence_pct}% confidence)."
+        template = _DECISION_TEMPLATES.get(result.crisis_level)
+        if template is None:
+            template = _DECISION_TEMPLATES[CrisisLevel.SAFE].replace(
+                CRISIS_LEVEL_DESCRIPTIONS[CrisisLevel.SAFE], "UNKNOWN", 1
             )
+        return template.format(confidence=int(result.confidence * 100))
 
     # =========================================================================
     # Key Factors Identification
@@ -362,40 +548,16 @@ class ExplainabilityGenerator:
 
     def _generate_recommendation(self, result: AggregatedResult) -> RecommendedAction:
         """Generate action recommendation based on assessment."""
-        priority = result.intervention_priority.value.upper()
-
-        # Generate action based on crisis level
-        if result.crisis_level == CrisisLevel.CRITICAL:
-            action = "Immediate outreach to community member"
-            escalation = "Alert senior moderators immediately"
-            rationale = "Critical crisis indicators require immediate human intervention"
-
-        elif result.crisis_level == CrisisLevel.HIGH:
-            action = "Check user history and consider direct outreach"
-            escalation = "Moderator review recommended"
-            rationale = "High-severity indicators warrant prompt attention"
-
-        elif result.crisis_level == CrisisLevel.MEDIUM:
-            action = "Monitor user activity and be prepared to engage"
-            escalation = "Flag for follow-up if pattern continues"
-            rationale = "Moderate indicators suggest watching for escalation"
-
-        elif result.crisis_level == CrisisLevel.LOW:
-            action = "Note and continue passive monitoring"
-            escalation = "No immediate escalation needed"
-            rationale = "Minor indicators do not require active intervention"
-
-        else:  # SAFE
-            action = "No action required"
-            escalation = "None"
-            rationale = "No concerning indicators detected"
+        action, escalation, rationale = _RECOMMENDATION_TEMPLATES.get(
+            result.crisis_level, _RECOMMENDATION_TEMPLATES[CrisisLevel.SAFE]
+        )
 
         # Adjust if review is required due to conflict
         if result.resolution and result.resolution.requires_review:
-            escalation = "Human review recommended due to model disagreement"
+            escalation = _REVIEW_ESCALATION
 
         return RecommendedAction(
-            priority=priority,
+            priority=result.intervention_priority.value.upper(),
             action=action,
             escalation=escalation,
             rationale=rationale,
@@ -701,6 +863,7 @@ __all__ = [
     "ModelContribution",
     "RecommendedAction",
     "Explanation",
+    "LazyExplanation",
     # Generator class
     "ExplainabilityGenerator",
     "create_explainability_generator",
@@ -10,9 +10,9 @@ Ash-NLP is a CRISIS DETECTION BACKEND that:
 ********************************************************************************
 Fallback Strategy for Ash-NLP Ensemble Service
 ---
-FILE VERSION: v5.0-3-4.3-3
-LAST MODIFIED: 2025-12-31
-PHASE: Phase 3 Step 4.3 - Ensemble Error Handling
+FILE VERSION: v5.0-8-18.0-2
+LAST MODIFIED: 2026-02-17
+PHASE: Phase 8 Step 18.0 - Thread-Safe Fallback State
 CLEAN ARCHITECTURE: v5.1 Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-nlp
 Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
@@ -21,6 +21,10 @@ RESPONSIBILITIES:
 - Handle model failures gracefully
 - Redistribute weights when models fail
 - Implement circuit breaker pattern
+- Open circuits on sustained p95 latency breaches, not just errors
+- Derive per-model deadline budgets from the inference SLO
+- Publish state as immutable snapshots safe to read from any thread
+- Take new base weights on configuration reload
 - Ensure operational continuity (Rule #5)
 - Alert on critical model failures
 
@@ -30,20 +34,50 @@ This system serves LIFE-SAVING crisis detection. Therefore:
 - Graceful degradation over system crash
 - Continue with reduced accuracy rather than fail completely
 - Comprehensive logging for post-incident analysis
+
+DEADLINE BUDGETS (Phase 8):
+    Every request gets an inference SLO (inference_slo_ms). Secondary
+    models (sentiment, irony, emotions) must answer within
+    slo * secondary_budget_ratio; a late secondary is dropped from that
+    request and handled as a failure (weights redistributed). BART is
+    never dropped on budget - it waits up to PRIMARY_TIMEOUT_MS.
+
+    A secondary whose rolling p95 latency exceeds its budget opens its
+    circuit, so a slow model stops being called until recovery_timeout
+    elapses (half-open probes then decide whether it closes again).
 """
 
 import logging
+import math
+import threading
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set
+from types import MappingProxyType
+from typing import Any, Deque, Dict, FrozenSet, List, Mapping, Optional, Set
 
 # Module version
-__version__ = "v5.0-3-4.3-3"
+__version__ = "v5.0-8-18.0-2"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+# Default inference SLO per request (milliseconds)
+DEFAULT_INFERENCE_SLO_MS = 2000.0
+
+# Share of the SLO granted to secondary models
+DEFAULT_SECONDARY_BUDGET_RATIO = 0.5
+
+# Hard wait for the primary model (milliseconds)
+PRIMARY_TIMEOUT_MS = 30000.0
+
+# Recent latencies kept per circuit breaker
+DEFAULT_LATENCY_WINDOW = 50
+
+# Samples required before the p95 can open a circuit
+LATENCY_MIN_SAMPLES = 20
+
 
 # =============================================================================
 # Exceptions
@@ -100,6 +134,10 @@ class CircuitBreaker:
         state: Current circuit state
         failure_count: Consecutive failures
         last_failure_time: Time of last failure
+        latency_threshold_ms: p95 latency that opens the circuit
+            (None = latency never opens it)
+        latency_window: Recent latencies kept for the p95
+        open_reason: Why the circuit last opened ("failures" or "latency")
     """
 
     model_name: str
@@ -109,53 +147,133 @@ class CircuitBreaker:
     failure_count: int = 0
     last_failure_time: float = 0.0
     success_count: int = 0
+    latency_threshold_ms: Optional[float] = None
+    latency_window: int = DEFAULT_LATENCY_WINDOW
+    open_reason: str = ""
+    latencies: Deque[float] = field(default_factory=deque, repr=False)
+    _lock: threading.RLock = field(
+        default_factory=threading.RLock, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Bound the latency window."""
+        self.latencies = deque(self.latencies, maxlen=max(1, self.latency_window))
 
     def record_success(self) -> None:
         """Record successful call."""
-        if self.state == CircuitState.HALF_OPEN:
-            self.success_count += 1
-            if self.success_count >= 2:  # Two successes to close
-                self._close()
-        else:
-            self.failure_count = 0
-            self.success_count = 0
+        with self._lock:
+            if self.state == CircuitState.HALF_OPEN:
+                self.success_count += 1
+                if self.success_count >= 2:  # Two successes to close
+                    self._close()
+            else:
+                self.failure_count = 0
+                self.success_count = 0
 
     def record_failure(self) -> None:
         """Record failed call."""
-        self.failure_count += 1
-        self.last_failure_time = time.time()
-        self.success_count = 0
+        with self._lock:
+            self.failure_count += 1
+            self.last_failure_time = time.time()
+            self.success_count = 0
+
+            if self.state == CircuitState.HALF_OPEN:
+                # Failed probe: reopen whatever opened the circuit first
+                self._open()
+            elif self.failure_count >= self.failure_threshold:
+                self.open_reason = "failures"
+                self._open()
 
-        if self.failure_count >= self.failure_threshold:
+    def record_latency(self, latency_ms: float) -> bool:
+        """
+        Record the latency of a completed call.
+
+        CLOSED: opens once the rolling p95 (at least LATENCY_MIN_SAMPLES
+        samples) exceeds latency_threshold_ms.
+        HALF_OPEN: a single probe over the threshold reopens.
+
+        Args:
+            latency_ms: Call latency in milliseconds
+
+        Returns:
+            True if this sample opened the circuit
+        """
+        with self._lock:
+            self.latencies.append(latency_ms)
+            if self.latency_threshold_ms is None or self.state == CircuitState.OPEN:
+                return False
+
+            if self.state == CircuitState.HALF_OPEN:
+                breached = latency_ms > self.latency_threshold_ms
+            else:
+                breached = (
+                    len(self.latencies) >= LATENCY_MIN_SAMPLES
+                    and self._p95_locked() > self.latency_threshold_ms
+                )
+            if not breached:
+                return False
+
+            self.last_failure_time = time.time()
+            self.success_count = 0
+            self.open_reason = "latency"
             self._open()
+            return True
+
+    def latency_p95(self) -> Optional[float]:
+        """Rolling p95 latency in milliseconds (None without samples)."""
+        with self._lock:
+            return self._p95_locked() if self.latencies else None
+
+    def _p95_locked(self) -> float:
+        """Nearest-rank p95 of the window (caller holds the lock)."""
+        ordered = sorted(self.latencies)
+        return ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)]
 
     def can_call(self) -> bool:
         """Check if model can be called."""
         if self.state == CircuitState.CLOSED:
             return True
 
-        if self.state == CircuitState.OPEN:
-            # Check if recovery timeout elapsed
-            elapsed = time.time() - self.last_failure_time
-            if elapsed >= self.recovery_timeout:
-                self._half_open()
-                return True
-            return False
+        with self._lock:
+            if self.state == CircuitState.OPEN:
+                # Check if recovery timeout elapsed
+                elapsed = time.time() - self.last_failure_time
+                if elapsed >= self.recovery_timeout:
+                    self._half_open()
+                    return True
+                return False
 
-        # HALF_OPEN - allow call for testing
+        # CLOSED or HALF_OPEN - allow call (half-open: testing)
         return True
 
+    def get_state(self) -> Dict[str, Any]:
+        """Consistent view of the breaker for status reports."""
+        with self._lock:
+            return {
+                "state": self.state.value,
+                "failure_count": self.failure_count,
+                "open_reason": self.open_reason,
+                "latency_p95_ms": self._p95_locked() if self.latencies else None,
+            }
+
     def _open(self) -> None:
         """Open the circuit (stop calling)."""
         self.state = CircuitState.OPEN
-        logger.warning(
-            f"🔴 Circuit OPEN for {self.model_name} ({self.failure_count} failures)"
-        )
+        if self.open_reason == "latency":
+            logger.warning(
+                f"🔴 Circuit OPEN for {self.model_name} "
+                f"(p95 latency over {self.latency_threshold_ms:.0f}ms)"
+            )
+        else:
+            logger.warning(
+                f"🔴 Circuit OPEN for {self.model_name} ({self.failure_count} failures)"
+            )
 
     def _half_open(self) -> None:
         """Half-open the circuit (test recovery)."""
         self.state = CircuitState.HALF_OPEN
         self.success_count = 0
+        self._clear_latencies()
         logger.info(f"🟡 Circuit HALF_OPEN for {self.model_name} (testing)")
 
     def _close(self) -> None:
@@ -163,14 +281,24 @@ class CircuitBreaker:
         self.state = CircuitState.CLOSED
         self.failure_count = 0
         self.success_count = 0
+        self.open_reason = ""
+        self._clear_latencies()
         logger.info(f"🟢 Circuit CLOSED for {self.model_name} (recovered)")
 
     def reset(self) -> None:
         """Reset circuit to initial state."""
-        self.state = CircuitState.CLOSED
-        self.failure_count = 0
-        self.success_count = 0
-        self.last_failure_time = 0.0
+        with self._lock:
+            self.state = CircuitState.CLOSED
+            self.failure_count = 0
+            self.success_count = 0
+            self.last_failure_time = 0.0
+            self.open_reason = ""
+            self._clear_latencies()
+
+    def _clear_latencies(self) -> None:
+        """Drop latency samples (stale once the circuit changes state)."""
+        with self._lock:
+            self.latencies.clear()
 
 
 # =============================================================================
@@ -189,6 +317,29 @@ class ModelFailureInfo:
     weight_lost: float
 
 
+@dataclass(frozen=True)
+class FallbackSnapshot:
+    """
+    Immutable view of the fallback state.
+
+    Published whole by FallbackStrategy on every change, so a request that
+    holds one never sees weights and failed models from different moments.
+
+    Attributes:
+        weights: Adjusted model weights (read-only mapping)
+        failed_models: Models currently excluded
+        is_degraded: Whether any model is excluded
+        degradation_reason: Human-readable reason (empty when healthy)
+        version: Increments with every published change
+    """
+
+    weights: Mapping[str, float]
+    failed_models: FrozenSet[str]
+    is_degraded: bool
+    degradation_reason: str
+    version: int
+
+
 class FallbackStrategy:
     """
     Fallback Strategy for Ensemble Resilience.
@@ -205,6 +356,14 @@ class FallbackStrategy:
     - System continues with degraded accuracy
     - All failures logged for analysis
 
+    Concurrency (Phase 8):
+    - Inference threads report failures and successes concurrently
+    - Changes are serialized by one lock and published as a new
+      FallbackSnapshot; readers take the current snapshot without locking
+    - Weights are recomputed from base weights and the failed set, so the
+      result does not depend on the order failures arrive in
+    - failure_history is a ring buffer of the last FAILURE_HISTORY_SIZE
+
     Clean Architecture v5.1 Compliance:
     - Factory function: create_fallback_strategy()
     - Resilient error handling (Rule #5)
@@ -219,11 +378,17 @@ class FallbackStrategy:
     # Minimum models required for safe operation
     MIN_MODELS_REQUIRED = 1  # At minimum, BART must work
 
+    # Failures kept for status reports
+    FAILURE_HISTORY_SIZE = 100
+
     def __init__(
         self,
         base_weights: Dict[str, float],
         failure_threshold: int = 3,
         recovery_timeout: float = 60.0,
+        inference_slo_ms: float = DEFAULT_INFERENCE_SLO_MS,
+        secondary_budget_ratio: float = DEFAULT_SECONDARY_BUDGET_RATIO,
+        latency_window: int = DEFAULT_LATENCY_WINDOW,
     ):
         """
         Initialize FallbackStrategy.
@@ -232,35 +397,182 @@ class FallbackStrategy:
             base_weights: Original model weights
             failure_threshold: Failures before circuit opens
             recovery_timeout: Seconds before retrying failed model
+            inference_slo_ms: Inference time budget per request
+            secondary_budget_ratio: Share of the SLO for secondary models
+            latency_window: Recent latencies kept per circuit breaker
         """
         self.base_weights = base_weights.copy()
-        self.current_weights = base_weights.copy()
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
+        self.inference_slo_ms = float(inference_slo_ms)
+        self.secondary_budget_ms = self.inference_slo_ms * secondary_budget_ratio
 
-        # Circuit breakers for each model
+        # Circuit breakers for each model (latency trips secondaries only)
         self.circuit_breakers: Dict[str, CircuitBreaker] = {
             name: CircuitBreaker(
                 model_name=name,
                 failure_threshold=failure_threshold,
                 recovery_timeout=recovery_timeout,
+                latency_threshold_ms=(
+                    None if name == self.PRIMARY_MODEL else self.secondary_budget_ms
+                ),
+                latency_window=latency_window,
             )
             for name in base_weights.keys()
         }
 
-        # Track failed models
-        self.failed_models: Set[str] = set()
-        self.failure_history: List[ModelFailureInfo] = []
-
-        # Degradation tracking
-        self._is_degraded: bool = False
-        self._degradation_reason: str = ""
+        # Writers hold the lock; readers use the published snapshot
+        self._lock = threading.Lock()
+        self.failure_history: Deque[ModelFailureInfo] = deque(
+            maxlen=self.FAILURE_HISTORY_SIZE
+        )
+        self._total_failures: int = 0
+        self._snapshot = FallbackSnapshot(
+            weights=MappingProxyType(self.base_weights.copy()),
+            failed_models=frozenset(),
+            is_degraded=False,
+            degradation_reason="",
+            version=0,
+        )
 
         logger.info(
             f"🛡️ FallbackStrategy initialized "
-            f"(threshold={failure_threshold}, timeout={recovery_timeout}s)"
+            f"(threshold={failure_threshold}, timeout={recovery_timeout}s, "
+            f"slo={self.inference_slo_ms:.0f}ms, "
+            f"secondary budget={self.secondary_budget_ms:.0f}ms)"
+        )
+
+    # =========================================================================
+    # Snapshot
+    # =========================================================================
+
+    def get_snapshot(self) -> FallbackSnapshot:
+        """
+        Get the current fallback state (immutable, no locking).
+
+        Returns:
+            FallbackSnapshot published by the last change
+        """
+        return self._snapshot
+
+    @property
+    def current_weights(self) -> Dict[str, float]:
+        """Current adjusted weights (copy of the snapshot's)."""
+        return dict(self._snapshot.weights)
+
+    @property
+    def failed_models(self) -> Set[str]:
+        """Currently failed models (copy of the snapshot's)."""
+        return set(self._snapshot.failed_models)
+
+    def _publish(self, failed_models: FrozenSet[str], reason: str) -> None:
+        """Publish a new snapshot (caller holds the lock)."""
+        weights = self._compute_weights(failed_models)
+        self._snapshot = FallbackSnapshot(
+            weights=MappingProxyType(weights),
+            failed_models=failed_models,
+            is_degraded=bool(failed_models),
+            degradation_reason=reason if failed_models else "",
+            version=self._snapshot.version + 1,
         )
 
+    def _compute_weights(self, failed_models: FrozenSet[str]) -> Dict[str, float]:
+        """
+        Weights with each failed model's base weight spread evenly over the
+        active scoring models.
+        """
+        weights = self.base_weights.copy()
+        active = [n for n in self.SCORING_MODELS if n not in failed_models]
+        for failed in failed_models:
+            if failed not in weights:
+                continue
+            lost_weight = self.base_weights[failed]
+            weights[failed] = 0.0
+            if active:
+                for model in active:
+                    weights[model] += lost_weight / len(active)
+        return weights
+
+    def set_base_weights(self, base_weights: Dict[str, float]) -> None:
+        """
+        Replace the base weights (configuration reload).
+
+        Circuit breakers and failed models are kept; the snapshot is
+        republished so redistribution uses the new weights. Adding or
+        removing models still needs a restart.
+
+        Args:
+            base_weights: New model weights
+        """
+        with self._lock:
+            self.base_weights = {
+                name: base_weights.get(name, weight)
+                for name, weight in self.base_weights.items()
+            }
+            snapshot = self._snapshot
+            self._publish(snapshot.failed_models, snapshot.degradation_reason)
+
+        logger.info(f"⚖️ Fallback base weights updated: {self.base_weights}")
+
+    # =========================================================================
+    # Deadline Budgets
+    # =========================================================================
+
+    def get_deadline_ms(self, model_name: str) -> float:
+        """
+        Get a model's deadline, in milliseconds from the start of inference.
+
+        Args:
+            model_name: Name of model
+
+        Returns:
+            PRIMARY_TIMEOUT_MS for BART, the secondary budget otherwise
+        """
+        if model_name == self.PRIMARY_MODEL:
+            return max(PRIMARY_TIMEOUT_MS, self.inference_slo_ms)
+        return self.secondary_budget_ms
+
+    def handle_deadline_miss(self, model_name: str, elapsed_ms: float) -> None:
+        """
+        Handle a secondary model that missed its deadline.
+
+        The model is dropped from the request and handled like a failure,
+        so its weight is redistributed until it answers in time again.
+
+        Args:
+            model_name: Name of late model
+            elapsed_ms: Time waited before giving up
+        """
+        if model_name == self.PRIMARY_MODEL:
+            return
+        self.handle_model_failure(
+            model_name,
+            f"Deadline exceeded ({elapsed_ms:.0f}ms > "
+            f"{self.get_deadline_ms(model_name):.0f}ms budget)",
+        )
+
+    def record_latency(self, model_name: str, latency_ms: float) -> None:
+        """
+        Record a completed call's latency (may open a latency circuit).
+
+        Args:
+            model_name: Name of model
+            latency_ms: Call latency in milliseconds
+        """
+        cb = self.circuit_breakers.get(model_name)
+        if cb is None or not cb.record_latency(latency_ms):
+            return
+
+        p95 = cb.latency_p95() or latency_ms
+        with self._lock:
+            self._record_failure_info(
+                model_name,
+                f"p95 latency {p95:.0f}ms over {cb.latency_threshold_ms:.0f}ms budget",
+                is_critical=False,
+            )
+            if model_name not in self._snapshot.failed_models:
+                self._redistribute_weights(model_name)
+
     # =========================================================================
     # Failure Handling
     # =========================================================================
@@ -284,17 +596,6 @@ class FallbackStrategy:
             CriticalModelFailure: If BART (primary) fails
         """
         is_critical = model_name == self.PRIMARY_MODEL
-        weight_lost = self.current_weights.get(model_name, 0.0)
-
-        # Record failure info
-        failure_info = ModelFailureInfo(
-            model_name=model_name,
-            error=error,
-            timestamp=time.time(),
-            is_critical=is_critical,
-            weight_lost=weight_lost,
-        )
-        self.failure_history.append(failure_info)
 
         # Update circuit breaker
         if model_name in self.circuit_breakers:
@@ -308,17 +609,36 @@ class FallbackStrategy:
         else:
             logger.error(f"❌ Model '{model_name}' failed: {error}")
 
+        with self._lock:
+            self._record_failure_info(model_name, error, is_critical)
+
+            # Mark as failed and redistribute weights
+            if not is_critical:
+                self._redistribute_weights(model_name)
+            snapshot = self._snapshot
+
         # Check if primary model failed
         if is_critical:
             raise CriticalModelFailure(
                 f"Primary model ({model_name}) unavailable: {error}"
             )
 
-        # Mark as failed and redistribute weights
-        self.failed_models.add(model_name)
-        self._redistribute_weights(model_name)
-
-        return self.current_weights.copy()
+        return dict(snapshot.weights)
+
+    def _record_failure_info(
+        self, model_name: str, error: str, is_critical: bool
+    ) -> None:
+        """Append to the failure ring buffer (caller holds the lock)."""
+        self.failure_history.append(
+            ModelFailureInfo(
+                model_name=model_name,
+                error=error,
+                timestamp=time.time(),
+                is_critical=is_critical,
+                weight_lost=self._snapshot.weights.get(model_name, 0.0),
+            )
+        )
+        self._total_failures += 1
 
     def handle_model_success(self, model_name: str) -> None:
         """
@@ -327,12 +647,12 @@ class FallbackStrategy:
         Args:
             model_name: Name of successful model
         """
-        if model_name in self.circuit_breakers:
-            self.circuit_breakers[model_name].record_success()
+        cb = self.circuit_breakers.get(model_name)
+        if cb is not None:
+            cb.record_success()
 
         # If model was failed, check if it recovered
-        if model_name in self.failed_models:
-            cb = self.circuit_breakers.get(model_name)
+        if model_name in self._snapshot.failed_models:
             if cb and cb.state == CircuitState.CLOSED:
                 self._recover_model(model_name)
 
@@ -340,42 +660,31 @@ class FallbackStrategy:
         """
         Redistribute weight from failed model to remaining models.
 
+        Caller holds the lock.
+
         Args:
             failed_model: Name of failed model
         """
-        if failed_model not in self.current_weights:
+        if failed_model not in self.base_weights:
             return
 
-        lost_weight = self.current_weights[failed_model]
-        self.current_weights[failed_model] = 0.0
-
-        # Get active models that can receive weight
-        active_models = [
-            name
-            for name in self.SCORING_MODELS
-            if name != failed_model and name not in self.failed_models
-        ]
+        failed_models = self._snapshot.failed_models | {failed_model}
+        if failed_models == self._snapshot.failed_models:
+            return
 
+        active_models = [n for n in self.SCORING_MODELS if n not in failed_models]
         if not active_models:
-            self._is_degraded = True
-            self._degradation_reason = "No active scoring models"
+            self._publish(failed_models, "No active scoring models")
             logger.warning("⚠️ No active models to redistribute weight to")
             return
 
-        # Redistribute proportionally
-        redistribution = lost_weight / len(active_models)
-
-        for model in active_models:
-            self.current_weights[model] += redistribution
-
-        self._is_degraded = True
-        self._degradation_reason = f"Model '{failed_model}' unavailable"
+        self._publish(failed_models, f"Model '{failed_model}' unavailable")
 
         logger.info(
-            f"⚖️ Redistributed {lost_weight:.2f} weight from {failed_model} "
-            f"to {active_models}"
+            f"⚖️ Redistributed {self.base_weights[failed_model]:.2f} weight "
+            f"from {failed_model} to {sorted(active_models)}"
         )
-        logger.info(f"New weights: {self.current_weights}")
+        logger.info(f"New weights: {dict(self._snapshot.weights)}")
 
     def _recover_model(self, model_name: str) -> None:
         """
@@ -384,39 +693,18 @@ class FallbackStrategy:
         Args:
             model_name: Name of recovered model
         """
-        if model_name not in self.failed_models:
-            return
-
-        self.failed_models.remove(model_name)
-
-        # Restore original weights
-        self._restore_weights()
+        with self._lock:
+            if model_name not in self._snapshot.failed_models:
+                return
+
+            # Restore weights for the remaining failed models
+            self._publish(
+                self._snapshot.failed_models - {model_name},
+                self._snapshot.degradation_reason,
+            )
 
         logger.info(f"✅ Model '{model_name}' recovered")
 
-        # Check if no longer degraded
-        if not self.failed_models:
-            self._is_degraded = False
-            self._degradation_reason = ""
-
-    def _restore_weights(self) -> None:
-        """Restore weights accounting for currently failed models."""
-        # Start with base weights
-        self.current_weights = self.base_weights.copy()
-
-        # Zero out failed models and redistribute
-        for failed in self.failed_models:
-            if failed in self.current_weights:
-                lost_weight = self.current_weights[failed]
-                self.current_weights[failed] = 0.0
-
-                # Redistribute to active models
-                active = [n for n in self.SCORING_MODELS if n not in self.failed_models]
-                if active:
-                    redistribution = lost_weight / len(active)
-                    for model in active:
-                        self.current_weights[model] += redistribution
-
     # =========================================================================
     # Circuit Breaker Checks
     # =========================================================================
@@ -456,44 +744,54 @@ class FallbackStrategy:
         Returns:
             Status dictionary
         """
-        circuit_status = {
-            name: {
-                "state": cb.state.value,
-                "failure_count": cb.failure_count,
+        circuit_status = {}
+        for name, cb in self.circuit_breakers.items():
+            state = cb.get_state()
+            circuit_status[name] = {
+                "state": state["state"],
+                "failure_count": state["failure_count"],
                 "can_call": cb.can_call(),
+                "open_reason": state["open_reason"],
+                "latency_p95_ms": state["latency_p95_ms"],
+                "deadline_ms": self.get_deadline_ms(name),
             }
-            for name, cb in self.circuit_breakers.items()
-        }
+
+        snapshot = self._snapshot
+        with self._lock:
+            total_failures = self._total_failures
+            recent = list(self.failure_history)[-5:]  # Last 5 failures
 
         return {
-            "is_degraded": self._is_degraded,
-            "degradation_reason": self._degradation_reason,
-            "failed_models": list(self.failed_models),
+            "is_degraded": snapshot.is_degraded,
+            "degradation_reason": snapshot.degradation_reason,
+            "failed_models": sorted(snapshot.failed_models),
             "base_weights": self.base_weights,
-            "current_weights": self.current_weights,
+            "current_weights": dict(snapshot.weights),
+            "state_version": snapshot.version,
             "circuit_breakers": circuit_status,
-            "total_failures": len(self.failure_history),
+            "inference_slo_ms": self.inference_slo_ms,
+            "total_failures": total_failures,
             "recent_failures": [
                 {
                     "model": f.model_name,
                     "error": f.error,
                     "critical": f.is_critical,
                 }
-                for f in self.failure_history[-5:]  # Last 5 failures
+                for f in recent
             ],
         }
 
     def get_current_weights(self) -> Dict[str, float]:
         """Get current adjusted weights."""
-        return self.current_weights.copy()
+        return dict(self._snapshot.weights)
 
     def is_degraded(self) -> bool:
         """Check if ensemble is in degraded state."""
-        return self._is_degraded
+        return self._snapshot.is_degraded
 
     def get_degradation_reason(self) -> str:
         """Get reason for degradation."""
-        return self._degradation_reason
+        return self._snapshot.degradation_reason
 
     def is_operational(self) -> bool:
         """
@@ -504,7 +802,7 @@ class FallbackStrategy:
         Returns:
             True if system can process requests
         """
-        return self.PRIMARY_MODEL not in self.failed_models
+        return self.PRIMARY_MODEL not in self._snapshot.failed_models
 
     # =========================================================================
     # Reset and Recovery
@@ -512,11 +810,10 @@ class FallbackStrategy:
 
     def reset(self) -> None:
         """Reset all state to initial."""
-        self.current_weights = self.base_weights.copy()
-        self.failed_models.clear()
-        self.failure_history.clear()
-        self._is_degraded = False
-        self._degradation_reason = ""
+        with self._lock:
+            self.failure_history.clear()
+            self._total_failures = 0
+            self._publish(frozenset(), "")
 
         for cb in self.circuit_breakers.values():
             cb.reset()
@@ -525,7 +822,8 @@ class FallbackStrategy:
 
     def clear_failure_history(self) -> None:
         """Clear failure history (keep other state)."""
-        self.failure_history.clear()
+        with self._lock:
+            self.failure_history.clear()
         logger.info("📋 Failure history cleared")
 
 
@@ -575,10 +873,20 @@ def create_fallback_strategy(
                 "emotions": 0.10,
             }
 
+    # Phase 8: Deadline budgets from performance config
+    perf_config: Dict[str, Any] = {}
+    if config_manager is not None:
+        perf_config = config_manager.get_performance_config() or {}
+
     return FallbackStrategy(
         base_weights=base_weights,
         failure_threshold=failure_threshold,
         recovery_timeout=recovery_timeout,
+        inference_slo_ms=perf_config.get("inference_slo_ms", DEFAULT_INFERENCE_SLO_MS),
+        secondary_budget_ratio=perf_config.get(
+            "secondary_budget_ratio", DEFAULT_SECONDARY_BUDGET_RATIO
+        ),
+        latency_window=perf_config.get("latency_window", DEFAULT_LATENCY_WINDOW),
     )
 
 
@@ -592,6 +900,10 @@ __all__ = [
     "CircuitBreaker",
     "CircuitState",
     "ModelFailureInfo",
+    "FallbackSnapshot",
     "CriticalModelFailure",
     "EnsembleDegradedError",
+    "DEFAULT_INFERENCE_SLO_MS",
+    "DEFAULT_SECONDARY_BUDGET_RATIO",
+    "PRIMARY_TIMEOUT_MS",
 ]
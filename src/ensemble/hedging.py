@@ -0,0 +1,344 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+CORE PRINCIPLE: Multi-Model Ensemble → Weighted Decision Engine → Crisis Classification
+******************  CORE SYSTEM VISION (Never to be violated):  ****************
+Ash-NLP is a CRISIS DETECTION BACKEND that:
+1. PRIMARY: Uses BART Zero-Shot Classification for semantic crisis detection
+2. CONTEXTUAL: Enhances with sentiment, irony, and emotion model signals
+3. ENSEMBLE: Combines weighted model outputs through decision engine
+4. PURPOSE: Detect crisis messages in Discord community communications
+********************************************************************************
+Hedged Primary Inference for Ash-NLP Ensemble Service
+---
+FILE VERSION: v5.0-8-17.0-2
+LAST MODIFIED: 2026-02-16
+PHASE: Phase 8 Step 17.0 - Hedged BART Requests
+CLEAN ARCHITECTURE: v5.2.3 Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+
+RESPONSIBILITIES:
+- Run a call on one replica of a model pool (one execution slot each)
+- Issue a duplicate (hedge) on a second idle replica when the first call
+  outlives the configured latency percentile
+- Return whichever finishes first with an accepted result
+- Track hedge rate, hedge wins and the current hedge delay
+
+HEDGING:
+    call → idle replica A ──(delay = p<hedge_percentile> of past calls)──┐
+                                                                      │
+          still running? → idle replica B (hedge) → first accepted wins
+
+    - No hedge while fewer than MIN_LATENCY_SAMPLES calls are recorded
+    - No hedge when no second replica is idle (never queues behind work)
+    - Every slot busy: the call runs inline on the first replica
+    - The loser is cancelled if it has not started; a running inference
+      cannot be interrupted, so it finishes on its own replica (keeping
+      that slot busy) and its result is discarded
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, Optional, Sequence, Set, TypeVar
+
+# Module version
+__version__ = "v5.0-8-17.0-2"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Defaults (performance config)
+DEFAULT_HEDGE_PERCENTILE = 95.0
+DEFAULT_HEDGE_MIN_DELAY_MS = 25.0
+
+# Recent call latencies kept for the hedge delay
+DEFAULT_HEDGE_WINDOW = 200
+
+# Calls recorded before hedging starts
+MIN_LATENCY_SAMPLES = 20
+
+
+# =============================================================================
+# Hedged Inference
+# =============================================================================
+
+
+class HedgedInference:
+    """
+    Hedged calls over a pool of interchangeable model replicas.
+
+    A replica is one execution slot: at most one call runs on it at a
+    time, so a hedge only ever goes to a replica that is idle.
+
+    Clean Architecture v5.2.3 Compliance:
+    - Factory function: create_hedged_inference()
+    - Configuration via ConfigManager
+    """
+
+    def __init__(
+        self,
+        max_replicas: int,
+        hedge_percentile: float = DEFAULT_HEDGE_PERCENTILE,
+        min_delay_ms: float = DEFAULT_HEDGE_MIN_DELAY_MS,
+        latency_window: int = DEFAULT_HEDGE_WINDOW,
+    ):
+        """
+        Initialize HedgedInference.
+
+        Args:
+            max_replicas: Replicas in the pool (sizes the worker pool)
+            hedge_percentile: Latency percentile after which to hedge
+            min_delay_ms: Lower bound on the hedge delay
+            latency_window: Recent call latencies kept
+
+        Note:
+            Use create_hedged_inference() factory function instead.
+        """
+        self.max_replicas = max(1, max_replicas)
+        self.hedge_percentile = min(100.0, max(1.0, hedge_percentile))
+        self.min_delay_ms = max(0.0, min_delay_ms)
+
+        # One worker per replica: a call only runs here while holding a slot
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_replicas, thread_name_prefix="ash-hedge"
+        )
+        self._busy: Set[int] = set()
+        self._latencies: Deque[float] = deque(maxlen=max(1, latency_window))
+        self._lock = threading.Lock()
+
+        # Statistics
+        self._calls = 0
+        self._hedged = 0
+        self._hedge_wins = 0
+        self._inline_calls = 0
+        self._no_spare_slot = 0
+
+        logger.info(
+            f"🏎️ HedgedInference initialized (replicas={self.max_replicas}, "
+            f"p{self.hedge_percentile:g}, min delay={self.min_delay_ms:.0f}ms)"
+        )
+
+    # =========================================================================
+    # Calls
+    # =========================================================================
+
+    def call(
+        self,
+        replicas: Sequence[Any],
+        fn: Callable[[Any], T],
+        accept: Optional[Callable[[T], bool]] = None,
+    ) -> T:
+        """
+        Run fn on a replica, hedging onto a second one if it runs long.
+
+        Args:
+            replicas: Interchangeable model instances
+            fn: Call to run, given the replica to use
+            accept: Predicate for a usable result (default: any result);
+                an unaccepted winner falls back to the other call
+
+        Returns:
+            Result of the first accepted call (or of the primary call)
+        """
+        first_replica = self._acquire(replicas)
+        if first_replica is None:
+            with self._lock:
+                self._inline_calls += 1
+            return fn(replicas[0])
+
+        with self._lock:
+            self._calls += 1
+        first = self._submit(fn, first_replica)
+
+        delay_ms = self.current_delay_ms()
+        if delay_ms is None:
+            return first.result()
+        done, _ = wait([first], timeout=delay_ms / 1000)
+        if done:
+            return first.result()
+
+        hedge_replica = self._acquire(replicas)
+        if hedge_replica is None:
+            with self._lock:
+                self._no_spare_slot += 1
+            return first.result()
+
+        with self._lock:
+            self._hedged += 1
+        hedge = self._submit(fn, hedge_replica)
+
+        winner = self._first_accepted(first, hedge, accept)
+        loser = hedge if winner is first else first
+        loser.cancel()
+        if winner is hedge:
+            with self._lock:
+                self._hedge_wins += 1
+        return winner.result()
+
+    def _first_accepted(
+        self,
+        first: Future,
+        hedge: Future,
+        accept: Optional[Callable[[Any], bool]],
+    ) -> Future:
+        """Pick the first call to finish with an accepted result."""
+        done, _ = wait([first, hedge], return_when=FIRST_COMPLETED)
+        winner = first if first in done else hedge
+        if self._is_accepted(winner, accept):
+            return winner
+
+        # Winner failed: the other call is the better bet, even if late
+        other = hedge if winner is first else first
+        wait([other])
+        return other if self._is_accepted(other, accept) else first
+
+    @staticmethod
+    def _is_accepted(future: Future, accept: Optional[Callable[[Any], bool]]) -> bool:
+        """Check a finished call for a usable result."""
+        if future.exception() is not None:
+            return False
+        return accept is None or bool(accept(future.result()))
+
+    def _submit(self, fn: Callable[[Any], T], replica: Any) -> Future:
+        """
+        Queue fn on a held replica.
+
+        A call that runs releases its slot in _run_on_slot; one cancelled
+        before it starts (a queued loser) never runs, so its slot is
+        released by a done-callback instead.
+        """
+        try:
+            future = self._pool.submit(self._run_on_slot, fn, replica)
+        except BaseException:
+            self._release(replica)
+            raise
+
+        def release_if_cancelled(done: Future) -> None:
+            if done.cancelled():
+                self._release(replica)
+
+        future.add_done_callback(release_if_cancelled)
+        return future
+
+    def _run_on_slot(self, fn: Callable[[Any], T], replica: Any) -> T:
+        """Run fn on a held replica, record its latency, release the slot."""
+        start = time.perf_counter()
+        try:
+            result = fn(replica)
+            with self._lock:
+                self._latencies.append((time.perf_counter() - start) * 1000)
+            return result
+        finally:
+            self._release(replica)
+
+    def _acquire(self, replicas: Sequence[Any]) -> Optional[Any]:
+        """Claim an idle replica (None when every slot is busy)."""
+        with self._lock:
+            for replica in replicas[: self.max_replicas]:
+                if id(replica) not in self._busy:
+                    self._busy.add(id(replica))
+                    return replica
+        return None
+
+    def _release(self, replica: Any) -> None:
+        """Return a replica's slot."""
+        with self._lock:
+            self._busy.discard(id(replica))
+
+    # =========================================================================
+    # Status
+    # =========================================================================
+
+    def current_delay_ms(self) -> Optional[float]:
+        """
+        Hedge delay: the configured percentile of recent call latencies.
+
+        Returns:
+            Delay in ms, or None until MIN_LATENCY_SAMPLES calls are recorded
+        """
+        with self._lock:
+            if len(self._latencies) < MIN_LATENCY_SAMPLES:
+                return None
+            ordered = sorted(self._latencies)
+        rank = max(0, math.ceil(self.hedge_percentile / 100 * len(ordered)) - 1)
+        return max(self.min_delay_ms, ordered[rank])
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hedging statistics."""
+        delay_ms = self.current_delay_ms()
+        with self._lock:
+            return {
+                "replicas": self.max_replicas,
+                "hedge_percentile": self.hedge_percentile,
+                "hedge_delay_ms": round(delay_ms, 3) if delay_ms is not None else None,
+                "calls": self._calls,
+                "hedged": self._hedged,
+                "hedge_rate": round(self._hedged / self._calls, 4) if self._calls else 0.0,
+                "hedge_wins": self._hedge_wins,
+                "hedge_win_rate": (
+                    round(self._hedge_wins / self._hedged, 4) if self._hedged else 0.0
+                ),
+                "inline_calls": self._inline_calls,
+                "no_spare_slot": self._no_spare_slot,
+            }
+
+    def shutdown(self) -> None:
+        """Stop the worker pool (in-flight calls finish)."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+# =============================================================================
+# FACTORY FUNCTION - Clean Architecture v5.1 Compliance (Rule #1)
+# =============================================================================
+
+
+def create_hedged_inference(
+    max_replicas: int,
+    config_manager: Optional[Any] = None,
+    hedge_percentile: float = DEFAULT_HEDGE_PERCENTILE,
+    min_delay_ms: float = DEFAULT_HEDGE_MIN_DELAY_MS,
+) -> HedgedInference:
+    """
+    Factory function for HedgedInference.
+
+    Args:
+        max_replicas: Replicas in the pool
+        config_manager: Configuration manager instance
+        hedge_percentile: Latency percentile after which to hedge
+        min_delay_ms: Lower bound on the hedge delay
+
+    Returns:
+        Configured HedgedInference instance
+
+    Example:
+        >>> hedger = create_hedged_inference(2, config_manager=config)
+        >>> result = hedger.call(loader.get_replicas("bart"), lambda m: m.analyze(text))
+    """
+    if config_manager is not None:
+        perf_config = config_manager.get_performance_config() or {}
+        hedge_percentile = perf_config.get("hedge_percentile", hedge_percentile)
+        min_delay_ms = perf_config.get("hedge_min_delay_ms", min_delay_ms)
+
+    return HedgedInference(
+        max_replicas=max_replicas,
+        hedge_percentile=hedge_percentile,
+        min_delay_ms=min_delay_ms,
+    )
+
+
+# =============================================================================
+# Export public interface
+# =============================================================================
+
+__all__ = [
+    "HedgedInference",
+    "create_hedged_inference",
+    "DEFAULT_HEDGE_PERCENTILE",
+    "DEFAULT_HEDGE_MIN_DELAY_MS",
+]
@@ -10,9 +10,9 @@ Ash-NLP is a CRISIS DETECTION BACKEND that:
 ********************************************************************************
 Model Loader for Ash-NLP Ensemble Service
 ---
-FILE VERSION: v5.0-3-4.3-1
-LAST MODIFIED: 2025-12-31
-PHASE: Phase 3 Step 4.3 - Ensemble Model Loading
+FILE VERSION: v5.0-8-23.0-1
+LAST MODIFIED: 2026-02-22
+PHASE: Phase 8 Step 23.0 - Shared-Premise Encoder Reuse
 CLEAN ARCHITECTURE: v5.1 Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-nlp
 Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
@@ -23,6 +23,9 @@ RESPONSIBILITIES:
 - Provide unified access to model instances
 - Handle GPU memory efficiently
 - Support lazy loading and parallel initialization
+- Load extra BART replicas (models.bart_replicas) for hedged inference
+- Adopt a reloaded configuration (crisis labels) without reloading models
+- Share one CrisisLabelSet across BART replicas (encoded once)
 """
 
 import asyncio
@@ -35,6 +38,9 @@ from src.models import (
     BaseModelWrapper,
     ModelInfo,
     create_bart_classifier,
+    resolve_crisis_labels,
+    resolve_safe_labels,
+    resolve_umbrella_labels,
     create_sentiment_analyzer,
     create_irony_detector,
     create_emotions_classifier,
@@ -44,7 +50,7 @@ if TYPE_CHECKING:
     from src.managers.config_manager import ConfigManager
 
 # Module version
-__version__ = "v5.0-3-4.3-1"
+__version__ = "v5.0-8-23.0-1"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -52,6 +58,9 @@ logger = logging.getLogger(__name__)
 # Model names in load order (primary first)
 MODEL_NAMES = ["bart", "sentiment", "irony", "emotions"]
 
+# Model that may run on several replicas (Phase 8 hedging)
+REPLICATED_MODEL = "bart"
+
 # Factory function mapping
 MODEL_FACTORIES = {
     "bart": create_bart_classifier,
@@ -89,6 +98,7 @@ class ModelLoader:
         config_manager: Optional["ConfigManager"] = None,
         lazy_load: bool = True,
         warmup_on_load: bool = True,
+        bart_replicas: int = 1,
     ):
         """
         Initialize Model Loader.
@@ -97,13 +107,16 @@ class ModelLoader:
             config_manager: Configuration manager instance
             lazy_load: If True, models load on first access
             warmup_on_load: If True, run warmup after loading
+            bart_replicas: BART instances to keep (each one execution slot)
         """
         self.config_manager = config_manager
         self.lazy_load = lazy_load
         self.warmup_on_load = warmup_on_load
+        self.bart_replicas = max(1, bart_replicas)
 
-        # Model storage
+        # Model storage (extra replicas beyond the primary instance)
         self._models: Dict[str, BaseModelWrapper] = {}
+        self._replicas: Dict[str, List[BaseModelWrapper]] = {}
         self._load_times: Dict[str, float] = {}
         self._is_initialized: bool = False
 
@@ -175,12 +188,41 @@ class ModelLoader:
                 f"(device: {model._actual_device})"
             )
 
+            if model_name == REPLICATED_MODEL and self.bart_replicas > 1:
+                self._load_replicas(model_name, factory)
+
             return model
 
         except Exception as e:
             logger.error(f"❌ Failed to load {model_name}: {e}")
             return None
 
+    def _load_replicas(self, model_name: str, factory: Any) -> None:
+        """
+        Load extra instances of a model up to bart_replicas in total.
+
+        A replica that fails to load is skipped; hedging simply has fewer
+        slots to work with.
+        """
+        replicas = self._replicas.setdefault(model_name, [])
+        while len(replicas) < self.bart_replicas - 1:
+            try:
+                replica = factory(config_manager=self.config_manager)
+                replica.load()
+                if self.warmup_on_load:
+                    replica.warmup()
+            except Exception as e:
+                logger.error(f"❌ Failed to load {model_name} replica: {e}")
+                return
+            primary = self._models.get(model_name)
+            if primary is not None and hasattr(replica, "set_label_set"):
+                # Same label set object (and encodings) as the primary
+                replica.set_label_set(primary.get_label_set())
+            replicas.append(replica)
+            logger.info(
+                f"✅ {model_name} replica {len(replicas) + 1}/{self.bart_replicas} loaded"
+            )
+
     def load_all_models(self) -> Dict[str, bool]:
         """
         Load all ensemble models.
@@ -288,6 +330,127 @@ class ModelLoader:
         logger.warning(f"⚠️ Model {model_name} not loaded")
         return None
 
+    def get_replicas(self, model_name: str) -> List[BaseModelWrapper]:
+        """
+        Get every loaded instance of a model (primary instance first).
+
+        Args:
+            model_name: Name of model
+
+        Returns:
+            List of model wrappers (empty if the model is unavailable)
+        """
+        model = self.get_model(model_name)
+        if model is None:
+            return []
+        return [model, *self._replicas.get(model_name, [])]
+
+    def apply_config(self, config_manager: "ConfigManager") -> int:
+        """
+        Adopt a reloaded configuration without reloading any model.
+
+        Loaded BART instances (primary and replicas) switch to the new
+        crisis labels; models loaded later read the new config_manager.
+
+        Args:
+            config_manager: Reloaded configuration manager
+
+        Returns:
+            Number of loaded BART instances whose labels were updated
+        """
+        self.config_manager = config_manager
+        labels = resolve_crisis_labels(config_manager)
+        if not labels:
+            return 0
+        return self.set_crisis_labels(
+            labels,
+            resolve_safe_labels(config_manager),
+            resolve_umbrella_labels(config_manager),
+        )
+
+    def set_crisis_labels(
+        self,
+        labels: List[str],
+        safe_labels: Optional[List[str]] = None,
+        umbrella_labels: Optional[List[str]] = None,
+    ) -> int:
+        """
+        Switch every loaded BART instance to a new crisis label set.
+
+        The primary builds the set (re-encoding only changed hypotheses)
+        and the replicas adopt the same object.
+
+        Args:
+            labels: Candidate labels
+            safe_labels: Safe labels (default: keep the current ones)
+            umbrella_labels: Two-stage umbrella labels (default: keep)
+
+        Returns:
+            Number of BART instances updated
+        """
+        primary = self._models.get(REPLICATED_MODEL)
+        if primary is None or not hasattr(primary, "set_crisis_labels"):
+            return 0
+
+        label_set = primary.set_crisis_labels(
+            labels, safe_labels=safe_labels, umbrella_labels=umbrella_labels
+        )
+        updated = 1
+        for replica in self._replicas.get(REPLICATED_MODEL, []):
+            if replica is not primary and hasattr(replica, "set_label_set"):
+                replica.set_label_set(label_set)
+                updated += 1
+        return updated
+
+    def get_two_stage_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Two-stage BART screening statistics summed over all instances.
+
+        Returns:
+            Stats dictionary, or None when BART is not loaded
+        """
+        instances = self.get_replicas(REPLICATED_MODEL)
+        if not instances or not hasattr(instances[0], "get_two_stage_stats"):
+            return None
+        stats = instances[0].get_two_stage_stats()
+        for replica in instances[1:]:
+            extra = replica.get_two_stage_stats()
+            stats["screened"] += extra["screened"]
+            stats["expanded"] += extra["expanded"]
+        stats["expansion_rate"] = (
+            round(stats["expanded"] / stats["screened"], 4) if stats["screened"] else 0.0
+        )
+        return stats
+
+    def get_shared_premise_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Shared-premise BART scoring statistics summed over all instances.
+
+        Returns:
+            Stats dictionary, or None when BART is not loaded
+        """
+        instances = self.get_replicas(REPLICATED_MODEL)
+        if not instances or not hasattr(instances[0], "get_shared_premise_stats"):
+            return None
+        stats = instances[0].get_shared_premise_stats()
+        for replica in instances[1:]:
+            for key, value in replica.get_shared_premise_stats().items():
+                if key in ("enabled", "active"):
+                    continue
+                stats[key] = stats.get(key, 0) + value
+        return stats
+
+    def get_label_set_hash(self) -> str:
+        """
+        Content hash of the BART label set in use.
+
+        Returns:
+            Hash string ("" when BART is not loaded)
+        """
+        primary = self._models.get(REPLICATED_MODEL)
+        label_set = getattr(primary, "label_set", None)
+        return label_set.content_hash if label_set is not None else ""
+
     def get_bart(self):
         """Get BART crisis classifier."""
         return self.get_model("bart")
@@ -347,6 +510,8 @@ class ModelLoader:
         try:
             self._models[model_name].unload()
             del self._models[model_name]
+            for replica in self._replicas.pop(model_name, []):
+                replica.unload()
             self._models_loaded -= 1
 
             logger.info(f"🗑️ Unloaded {model_name}")
@@ -420,6 +585,7 @@ class ModelLoader:
                     "enabled": model.is_enabled(),
                     "device": model._actual_device,
                     "load_time_s": self._load_times.get(name, 0),
+                    "replicas": 1 + len(self._replicas.get(name, [])),
                     "stats": model.get_stats(),
                 }
             else:
@@ -525,6 +691,7 @@ def create_model_loader(
     config_manager: Optional["ConfigManager"] = None,
     lazy_load: bool = True,
     warmup_on_load: bool = True,
+    bart_replicas: int = 1,
 ) -> ModelLoader:
     """
     Factory function for ModelLoader.
@@ -535,6 +702,7 @@ def create_model_loader(
         config_manager: Configuration manager instance
         lazy_load: If True, models load on first access (default: True)
         warmup_on_load: If True, run warmup after loading (default: True)
+        bart_replicas: BART instances to load (default: 1, no hedging)
 
     Returns:
         Configured ModelLoader instance
@@ -549,11 +717,13 @@ def create_model_loader(
         models_config = config_manager.get_section("models")
         if models_config:
             warmup_on_load = models_config.get("warmup_enabled", warmup_on_load)
+            bart_replicas = models_config.get("bart_replicas", bart_replicas)
 
     return ModelLoader(
         config_manager=config_manager,
         lazy_load=lazy_load,
         warmup_on_load=warmup_on_load,
+        bart_replicas=bart_replicas,
     )
 
 
@@ -565,4 +735,5 @@ __all__ = [
     "ModelLoader",
     "create_model_loader",
     "MODEL_NAMES",
+    "REPLICATED_MODEL",
 ]
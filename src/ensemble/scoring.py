@@ -10,10 +10,10 @@ Ash-NLP is a CRISIS DETECTION BACKEND that:
 ********************************************************************************
 Weighted Scoring System for Ash-NLP Ensemble Service
 ---
-FILE VERSION: v5.0-3-4.3-2
-LAST MODIFIED: 2025-12-31
-PHASE: Phase 3 Step 4.3 - Ensemble Weighted Scoring
-CLEAN ARCHITECTURE: v5.1 Compliant
+FILE VERSION: v5.0-8-19.0-1
+LAST MODIFIED: 2026-02-18
+PHASE: Phase 8 Step 19.0 - Compiled Decision Plan
+CLEAN ARCHITECTURE: v5.2.3 Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-nlp
 Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
 
@@ -31,12 +31,19 @@ ALGORITHM:
 4. Apply irony dampening factor
 5. Calculate confidence from model agreement
 6. Map final score to severity level
+
+PHASE 8 SEVERITY BOUNDS:
+- Thresholds compile to an ascending bounds tuple (compile_bounds) when
+  they change; each lookup is then one bisect (from_bounds)
+- Bounds are suffix minima of low/medium/high/critical, so the result
+  matches from_score even when thresholds are out of order
 """
 
 import logging
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from src.models import ModelResult, ModelRole
 
@@ -44,7 +51,7 @@ if TYPE_CHECKING:
     from src.managers.config_manager import ConfigManager
 
 # Module version
-__version__ = "v5.0-3-4.3-2"
+__version__ = "v5.0-8-19.0-1"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -87,6 +94,63 @@ class CrisisSeverity(Enum):
         else:
             return cls.SAFE
 
+    @staticmethod
+    def compile_bounds(thresholds: Dict[str, float]) -> Tuple[float, float, float, float]:
+        """
+        Compile thresholds into ascending low/medium/high/critical bounds.
+
+        Each bound is the smallest threshold at or above its level, which
+        is exactly where from_score starts returning that level or higher.
+
+        Args:
+            thresholds: Dictionary with critical, high, medium, low thresholds
+
+        Returns:
+            Bounds tuple for from_bounds()
+        """
+        bounds = [
+            float(thresholds.get(key, default))
+            for key, default in SEVERITY_THRESHOLD_DEFAULTS
+        ]
+        for i in range(len(bounds) - 2, -1, -1):
+            bounds[i] = min(bounds[i], bounds[i + 1])
+        return tuple(bounds)
+
+    @staticmethod
+    def from_bounds(score: float, bounds: Tuple[float, ...]) -> "CrisisSeverity":
+        """
+        Map score to severity using compiled bounds (see compile_bounds).
+
+        Args:
+            score: Crisis score (0.0 - 1.0)
+            bounds: Ascending bounds from compile_bounds()
+
+        Returns:
+            CrisisSeverity enum value
+        """
+        if score != score:
+            # NaN fails every comparison in from_score
+            return CrisisSeverity.SAFE
+        return SEVERITY_LADDER[bisect_right(bounds, score)]
+
+
+# Threshold keys (ascending) with from_score's defaults
+SEVERITY_THRESHOLD_DEFAULTS = (
+    ("low", 0.30),
+    ("medium", 0.50),
+    ("high", 0.70),
+    ("critical", 0.85),
+)
+
+# Severity for each count of bounds at or below the score
+SEVERITY_LADDER = (
+    CrisisSeverity.SAFE,
+    CrisisSeverity.LOW,
+    CrisisSeverity.MEDIUM,
+    CrisisSeverity.HIGH,
+    CrisisSeverity.CRITICAL,
+)
+
 
 # =============================================================================
 # Scoring Data Classes
@@ -238,6 +302,7 @@ class WeightedScorer:
         """
         self.weights = weights or self.DEFAULT_WEIGHTS.copy()
         self.thresholds = thresholds or self.DEFAULT_THRESHOLDS.copy()
+        self._severity_bounds = CrisisSeverity.compile_bounds(self.thresholds)
 
         # Validate weights
         self._validate_weights()
@@ -554,7 +619,7 @@ class WeightedScorer:
         confidence = self._calculate_confidence(signals)
 
         # Determine severity
-        severity = CrisisSeverity.from_score(final_score, self.thresholds)
+        severity = CrisisSeverity.from_bounds(final_score, self._severity_bounds)
 
         # Check for critical label override
         if "bart" in signals:
@@ -639,6 +704,7 @@ class WeightedScorer:
     def set_thresholds(self, thresholds: Dict[str, float]) -> None:
         """Update severity thresholds."""
         self.thresholds.update(thresholds)
+        self._severity_bounds = CrisisSeverity.compile_bounds(self.thresholds)
         logger.info(f"Updated thresholds: {self.thresholds}")
 
     def get_weights(self) -> Dict[str, float]:
@@ -649,6 +715,10 @@ class WeightedScorer:
         """Get current thresholds."""
         return self.thresholds.copy()
 
+    def get_severity_bounds(self) -> Tuple[float, ...]:
+        """Get compiled severity bounds (low, medium, high, critical)."""
+        return self._severity_bounds
+
 
 # =============================================================================
 # FACTORY FUNCTION - Clean Architecture v5.1 Compliance (Rule #1)
@@ -713,6 +783,7 @@ __all__ = [
     "WeightedScorer",
     "create_weighted_scorer",
     "CrisisSeverity",
+    "SEVERITY_LADDER",
     "ModelSignal",
     "EnsembleScore",
 ]
@@ -10,9 +10,9 @@ Ash-NLP is a CRISIS DETECTION BACKEND that:
 ********************************************************************************
 Managers Package for Ash-NLP Service
 ---
-FILE VERSION: v5.0-6-3.0-1
-LAST MODIFIED: 2026-01-02
-PHASE: Phase 6 - Sprint 3 (FE-005)
+FILE VERSION: v5.0-8-20.0-1
+LAST MODIFIED: 2026-02-19
+PHASE: Phase 8 Step 20.0 - Hot Configuration Reload
 CLEAN ARCHITECTURE: v5.1 Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-nlp
 Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
@@ -23,6 +23,7 @@ MANAGERS:
 - ConfigManager: Configuration loading and validation
 - ContextConfigManager: Phase 5 context analysis configuration (NEW)
 - SecretsManager: Secure secrets management
+- ConfigWatcher: Reloads configuration when its files change (Phase 8)
 
 USAGE:
     from src.managers import create_config_manager, create_context_config_manager
@@ -35,7 +36,7 @@ USAGE:
 """
 
 # Module version
-__version__ = "v5.0-6-3.0-1"
+__version__ = "v5.0-8-20.0-1"
 
 # =============================================================================
 # Configuration Manager
@@ -59,6 +60,8 @@ from .context_config_manager import (
     TemporalDetectionConfig,
     TrendAnalysisConfig,
     InterventionConfig,
+    HistoryStoreConfig,
+    EscalationSweepConfig,
     KnownPattern,
     # FE-005: Per-severity thresholds
     SeverityThreshold,
@@ -78,6 +81,15 @@ from .secrets_manager import (
     KNOWN_SECRETS,
 )
 
+# =============================================================================
+# Configuration Watcher (Phase 8)
+# =============================================================================
+
+from .config_watcher import (
+    ConfigWatcher,
+    create_config_watcher,
+)
+
 # =============================================================================
 # Public API
 # =============================================================================
@@ -95,6 +107,8 @@ __all__ = [
     "TemporalDetectionConfig",
     "TrendAnalysisConfig",
     "InterventionConfig",
+    "HistoryStoreConfig",
+    "EscalationSweepConfig",
     "KnownPattern",
     # FE-005: Per-severity thresholds
     "SeverityThreshold",
@@ -106,4 +120,7 @@ __all__ = [
     "get_secret",
     "SecretNotFoundError",
     "KNOWN_SECRETS",
+    # Config Watcher (Phase 8)
+    "ConfigWatcher",
+    "create_config_watcher",
 ]
@@ -0,0 +1,341 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+CORE PRINCIPLE: Multi-Model Ensemble → Weighted Decision Engine → Crisis Classification
+******************  CORE SYSTEM VISION (Never to be violated):  ****************
+Ash-NLP is a CRISIS DETECTION BACKEND that:
+1. PRIMARY: Uses BART Zero-Shot Classification for semantic crisis detection
+2. CONTEXTUAL: Enhances with sentiment, irony, and emotion model signals
+3. ENSEMBLE: Combines weighted model outputs through decision engine
+4. PURPOSE: Detect crisis messages in Discord community communications
+********************************************************************************
+Configuration File Watcher for Ash-NLP Service
+---
+FILE VERSION: v5.0-8-20.0-1
+LAST MODIFIED: 2026-02-19
+PHASE: Phase 8 Step 20.0 - Hot Configuration Reload
+CLEAN ARCHITECTURE: v5.2.3 Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+
+RESPONSIBILITIES:
+- Poll the configuration files (default.json, <environment>.json,
+  consensus_config.json, context_config.json) for changes
+- Reject a change while any watched file fails to parse (the running
+  configuration stays in place until the file is fixed)
+- Load fresh ConfigManager / ContextConfigManager instances and hand them
+  to a reload callback (the engine decides what to rebuild)
+- Run in every worker process, so each worker picks up the same files
+
+POLLING:
+    every interval: stat watched files (mtime, size)
+        → unchanged: nothing to do
+        → changed: parse each file → build managers → on_reload(...)
+
+USAGE:
+    watcher = create_config_watcher(config, on_reload=engine.reload_config)
+    if watcher:
+        watcher.start()
+        ...
+        await watcher.stop()
+"""
+
+import asyncio
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .config_manager import ConfigManager, create_config_manager
+from .context_config_manager import ContextConfigManager, create_context_config_manager
+
+# Module version
+__version__ = "v5.0-8-20.0-1"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Defaults (performance config)
+DEFAULT_RELOAD_INTERVAL_SECONDS = 5.0
+
+# Called with the freshly loaded managers; returns a summary for stats
+ReloadCallback = Callable[[ConfigManager, ContextConfigManager], Any]
+
+# (mtime_ns, size) per file; None when the file does not exist
+Fingerprint = Dict[str, Optional[Tuple[int, int]]]
+
+
+# =============================================================================
+# Config Watcher
+# =============================================================================
+
+
+class ConfigWatcher:
+    """
+    Polling watcher that reloads configuration when its files change.
+
+    check_once() is synchronous (file reads and manager construction) and
+    runs in a worker thread; checks never overlap.
+
+    Clean Architecture v5.2.3 Compliance:
+    - Factory function: create_config_watcher()
+    - Reload behaviour injected (on_reload)
+    """
+
+    def __init__(
+        self,
+        config_dir: Union[str, Path],
+        environment: str,
+        on_reload: ReloadCallback,
+        context_config_dir: Optional[Union[str, Path]] = None,
+        interval_seconds: float = DEFAULT_RELOAD_INTERVAL_SECONDS,
+    ):
+        """
+        Initialize ConfigWatcher.
+
+        Args:
+            config_dir: Directory of default.json / <environment>.json /
+                consensus_config.json
+            environment: Environment name used for the override file
+            on_reload: Called with the new ConfigManager and ContextConfigManager
+            context_config_dir: Directory of context_config.json
+                (default: config_dir)
+            interval_seconds: Seconds between checks
+
+        Note:
+            Use create_config_watcher() factory function instead.
+        """
+        self.config_dir = Path(config_dir)
+        self.context_config_dir = Path(context_config_dir or config_dir)
+        self.environment = environment
+        self.interval_seconds = interval_seconds
+        self._on_reload = on_reload
+
+        self._paths: List[Path] = [
+            self.config_dir / ConfigManager.DEFAULT_CONFIG,
+            self.config_dir / f"{environment}.json",
+            self.config_dir / ConfigManager.CONSENSUS_CONFIG,
+            self.context_config_dir / ContextConfigManager.CONFIG_FILE,
+        ]
+        self._fingerprint = self._take_fingerprint()
+
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+
+        # Statistics
+        self._checks = 0
+        self._reloads = 0
+        self._rejected = 0
+        self._failed = 0
+        self._last_reload_at: Optional[float] = None
+        self._last_result: Any = None
+        self._last_error: Optional[str] = None
+
+        logger.info(
+            f"✅ ConfigWatcher v{__version__} initialized "
+            f"(interval={interval_seconds:.1f}s, files={len(self._paths)})"
+        )
+
+    # =========================================================================
+    # Checks
+    # =========================================================================
+
+    def _take_fingerprint(self) -> Fingerprint:
+        """Stat every watched file."""
+        fingerprint: Fingerprint = {}
+        for path in self._paths:
+            try:
+                stat = path.stat()
+            except OSError:
+                fingerprint[str(path)] = None
+            else:
+                fingerprint[str(path)] = (stat.st_mtime_ns, stat.st_size)
+        return fingerprint
+
+    def check_once(self) -> bool:
+        """
+        Reload if any watched file changed since the last check.
+
+        A file that fails to parse rejects the whole change; it is retried
+        once the file changes again.
+
+        Returns:
+            True if a reload was applied
+        """
+        self._checks += 1
+        fingerprint = self._take_fingerprint()
+        if fingerprint == self._fingerprint:
+            return False
+        changed = [
+            path for path, value in fingerprint.items()
+            if value != self._fingerprint.get(path)
+        ]
+        self._fingerprint = fingerprint
+
+        for path in self._paths:
+            if fingerprint[str(path)] is None:
+                continue
+            try:
+                with open(path, "r", encoding="utf-8") as fh:
+                    json.load(fh)
+            except (OSError, ValueError) as e:
+                self._rejected += 1
+                self._last_error = f"{path.name}: {e}"
+                logger.error(
+                    f"❌ Config reload rejected, {path.name} is invalid: {e} "
+                    f"(keeping the running configuration)"
+                )
+                return False
+
+        logger.info(
+            f"🔁 Config change detected: {', '.join(Path(p).name for p in changed)}"
+        )
+        try:
+            config = create_config_manager(
+                config_dir=self.config_dir, environment=self.environment
+            )
+            context_config = create_context_config_manager(
+                config_dir=self.context_config_dir
+            )
+            self._last_result = self._on_reload(config, context_config)
+        except Exception as e:
+            self._failed += 1
+            self._last_error = str(e)
+            logger.error(f"❌ Config reload failed: {e}", exc_info=True)
+            return False
+
+        self._reloads += 1
+        self._last_reload_at = time.time()
+        self._last_error = None
+        return True
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    def start(self) -> None:
+        """Start the periodic check task on the running event loop."""
+        if self._task is not None and not self._task.done():
+            return
+        self._running = True
+        self._task = asyncio.get_running_loop().create_task(self._run_loop())
+        logger.info(f"👀 Config watcher started (every {self.interval_seconds:.1f}s)")
+
+    async def stop(self) -> None:
+        """Stop the periodic check task and wait for it to finish."""
+        self._running = False
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("🛑 Config watcher stopped")
+
+    async def _run_loop(self) -> None:
+        """Sleep, check, repeat; errors are logged and the loop continues."""
+        while self._running:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await asyncio.to_thread(self.check_once)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Config watcher check failed: {e}", exc_info=True)
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the periodic check task is active."""
+        return self._task is not None and not self._task.done()
+
+    # =========================================================================
+    # Statistics
+    # =========================================================================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get watcher statistics.
+
+        Returns:
+            Dictionary with settings and counters
+        """
+        return {
+            "running": self.is_running,
+            "interval_seconds": self.interval_seconds,
+            "files": [path.name for path in self._paths],
+            "checks": self._checks,
+            "reloads": self._reloads,
+            "rejected": self._rejected,
+            "failed": self._failed,
+            "last_reload_at": self._last_reload_at,
+            "last_result": self._last_result,
+            "last_error": self._last_error,
+        }
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return (
+            f"ConfigWatcher(dir={self.config_dir}, "
+            f"reloads={self._reloads}, running={self.is_running})"
+        )
+
+
+# =============================================================================
+# FACTORY FUNCTION - Clean Architecture v5.1 Compliance (Rule #1)
+# =============================================================================
+
+
+def create_config_watcher(
+    config_manager: ConfigManager,
+    on_reload: ReloadCallback,
+    context_config_dir: Optional[Union[str, Path]] = None,
+    interval_seconds: Optional[float] = None,
+) -> Optional[ConfigWatcher]:
+    """
+    Factory function for ConfigWatcher.
+
+    Args:
+        config_manager: Running configuration (directory, environment, settings)
+        on_reload: Called with the new ConfigManager and ContextConfigManager
+        context_config_dir: Directory of context_config.json
+            (default: the config manager's directory)
+        interval_seconds: Override the configured check interval
+
+    Returns:
+        ConfigWatcher, or None when performance.config_reload_enabled is off
+
+    Example:
+        >>> watcher = create_config_watcher(config, on_reload=engine.reload_config)
+        >>> if watcher:
+        ...     watcher.start()
+    """
+    perf_config = config_manager.get_performance_config() or {}
+    if not perf_config.get("config_reload_enabled", False):
+        logger.debug("Config reload disabled by configuration")
+        return None
+
+    if interval_seconds is None:
+        interval_seconds = perf_config.get(
+            "config_reload_interval_seconds", DEFAULT_RELOAD_INTERVAL_SECONDS
+        )
+
+    return ConfigWatcher(
+        config_dir=config_manager.config_dir,
+        environment=config_manager.environment,
+        on_reload=on_reload,
+        context_config_dir=context_config_dir,
+        interval_seconds=interval_seconds,
+    )
+
+
+# =============================================================================
+# Export public interface
+# =============================================================================
+
+__all__ = [
+    "ConfigWatcher",
+    "create_config_watcher",
+    "DEFAULT_RELOAD_INTERVAL_SECONDS",
+]
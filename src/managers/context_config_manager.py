@@ -10,9 +10,9 @@ Ash-NLP is a CRISIS DETECTION BACKEND that:
 ********************************************************************************
 Context Configuration Manager for Ash-NLP Service - Phase 5
 ---
-FILE VERSION: v5.0-6-3.0-1
-LAST MODIFIED: 2026-01-02
-PHASE: Phase 6 - Sprint 3 (FE-005: Per-Severity Thresholds)
+FILE VERSION: v5.0-8-10.0-1
+LAST MODIFIED: 2026-02-09
+PHASE: Phase 8 Step 10.0 - Background Escalation Sweep
 CLEAN ARCHITECTURE: v5.1 Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-nlp
 Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
@@ -31,6 +31,8 @@ CONFIGURATION SECTIONS:
 - trend_analysis: Trend direction and velocity settings
 - intervention: Urgency levels and recommendations
 - known_patterns: Named escalation pattern definitions
+- history_store: Server-side per-user score history (Phase 8)
+- escalation_sweep: Background cross-user escalation screening (Phase 8)
 """
 
 import json
@@ -41,7 +43,7 @@ from pathlib import Path
 from dataclasses import dataclass, field
 
 # Module version
-__version__ = "v5.0-6-3.0-1"
+__version__ = "v5.0-8-10.0-1"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -159,6 +161,25 @@ class InterventionConfig:
     urgency_levels: Dict[str, Dict[str, Any]] = field(default_factory=dict)
 
 
+@dataclass
+class HistoryStoreConfig:
+    """Server-side per-user history store configuration (Phase 8)."""
+    enabled: bool = True
+    max_users: int = 10000
+    max_entries_per_user: int = 50
+    ttl_hours: float = 72.0
+    snapshot_path: str = ""
+
+
+@dataclass
+class EscalationSweepConfig:
+    """Background cross-user escalation sweep configuration (Phase 8)."""
+    enabled: bool = False
+    interval_seconds: float = 60.0
+    tick_budget_ms: float = 50.0
+    batch_size: int = 256
+
+
 @dataclass
 class KnownPattern:
     """Single known escalation pattern definition."""
@@ -191,6 +212,8 @@ class ContextConfigManager:
         _temporal_detection: Resolved temporal detection settings
         _trend_analysis: Resolved trend analysis settings
         _intervention: Resolved intervention settings
+        _history_store: Resolved history store settings (Phase 8)
+        _escalation_sweep: Resolved escalation sweep settings (Phase 8)
         _known_patterns: Dictionary of known escalation patterns
     """
     
@@ -225,6 +248,8 @@ class ContextConfigManager:
         self._temporal_detection = TemporalDetectionConfig()
         self._trend_analysis = TrendAnalysisConfig()
         self._intervention = InterventionConfig()
+        self._history_store = HistoryStoreConfig()
+        self._escalation_sweep = EscalationSweepConfig()
         self._known_patterns: Dict[str, KnownPattern] = {}
         
         # Load configuration
@@ -338,6 +363,10 @@ class ContextConfigManager:
         # Resolve intervention section
         self._resolve_intervention()
         
+        # Resolve history_store section (Phase 8)
+        self._resolve_history_store()
+        self._resolve_escalation_sweep()
+        
         # Load known patterns
         self._load_known_patterns()
         
@@ -365,12 +394,13 @@ class ContextConfigManager:
             ),
         )
         
-        # Validate range
-        if not (3 <= self._context_analysis.max_history_size <= 50):
+        # Validate range (Phase 8: ceiling raised from 50 to 500 with
+        # vectorized context primitives)
+        if not (3 <= self._context_analysis.max_history_size <= 500):
             self._validation_errors.append(
-                f"max_history_size={self._context_analysis.max_history_size} out of range [3, 50], clamping"
+                f"max_history_size={self._context_analysis.max_history_size} out of range [3, 500], clamping"
             )
-            self._context_analysis.max_history_size = max(3, min(50, self._context_analysis.max_history_size))
+            self._context_analysis.max_history_size = max(3, min(500, self._context_analysis.max_history_size))
     
     def _resolve_escalation_detection(self) -> None:
         """Resolve escalation_detection configuration section with FE-005 enhancements."""
@@ -513,6 +543,90 @@ class ContextConfigManager:
             urgency_levels=section.get("urgency_levels", {}),
         )
     
+    def _resolve_history_store(self) -> None:
+        """Resolve history_store configuration section (Phase 8)."""
+        section = self._raw_config.get("history_store", {})
+        defaults = section.get("defaults", {})
+        
+        self._history_store = HistoryStoreConfig(
+            enabled=self._resolve_env_value(
+                section.get("enabled"), defaults.get("enabled", True), bool
+            ),
+            max_users=self._resolve_env_value(
+                section.get("max_users"), defaults.get("max_users", 10000), int
+            ),
+            max_entries_per_user=self._resolve_env_value(
+                section.get("max_entries_per_user"), defaults.get("max_entries_per_user", 50), int
+            ),
+            ttl_hours=self._resolve_env_value(
+                section.get("ttl_hours"), defaults.get("ttl_hours", 72.0), float
+            ),
+            snapshot_path=self._resolve_env_value(
+                section.get("snapshot_path"), defaults.get("snapshot_path", ""), str
+            ) or "",
+        )
+        
+        # Validate ranges
+        if self._history_store.max_users < 1:
+            self._validation_errors.append(
+                f"history_store.max_users={self._history_store.max_users} < 1, using 1"
+            )
+            self._history_store.max_users = 1
+        if not (3 <= self._history_store.max_entries_per_user <= 500):
+            self._validation_errors.append(
+                f"history_store.max_entries_per_user={self._history_store.max_entries_per_user} "
+                f"out of range [3, 500], clamping"
+            )
+            self._history_store.max_entries_per_user = max(
+                3, min(500, self._history_store.max_entries_per_user)
+            )
+    
+    def _resolve_escalation_sweep(self) -> None:
+        """Resolve escalation_sweep configuration section (Phase 8)."""
+        section = self._raw_config.get("escalation_sweep", {})
+        defaults = section.get("defaults", {})
+        
+        self._escalation_sweep = EscalationSweepConfig(
+            enabled=self._resolve_env_value(
+                section.get("enabled"), defaults.get("enabled", False), bool
+            ),
+            interval_seconds=self._resolve_env_value(
+                section.get("interval_seconds"), defaults.get("interval_seconds", 60.0), float
+            ),
+            tick_budget_ms=self._resolve_env_value(
+                section.get("tick_budget_ms"), defaults.get("tick_budget_ms", 50.0), float
+            ),
+            batch_size=self._resolve_env_value(
+                section.get("batch_size"), defaults.get("batch_size", 256), int
+            ),
+        )
+        
+        # Validate ranges
+        if not (1.0 <= self._escalation_sweep.interval_seconds <= 3600.0):
+            self._validation_errors.append(
+                f"escalation_sweep.interval_seconds={self._escalation_sweep.interval_seconds} "
+                f"out of range [1, 3600], clamping"
+            )
+            self._escalation_sweep.interval_seconds = max(
+                1.0, min(3600.0, self._escalation_sweep.interval_seconds)
+            )
+        if not (1.0 <= self._escalation_sweep.tick_budget_ms <= 5000.0):
+            self._validation_errors.append(
+                f"escalation_sweep.tick_budget_ms={self._escalation_sweep.tick_budget_ms} "
+                f"out of range [1, 5000], clamping"
+            )
+            self._escalation_sweep.tick_budget_ms = max(
+                1.0, min(5000.0, self._escalation_sweep.tick_budget_ms)
+            )
+        if not (1 <= self._escalation_sweep.batch_size <= 10000):
+            self._validation_errors.append(
+                f"escalation_sweep.batch_size={self._escalation_sweep.batch_size} "
+                f"out of range [1, 10000], clamping"
+            )
+            self._escalation_sweep.batch_size = max(
+                1, min(10000, self._escalation_sweep.batch_size)
+            )
+    
     def _load_known_patterns(self) -> None:
         """Load known escalation patterns from configuration."""
         patterns_section = self._raw_config.get("known_patterns", {})
@@ -539,6 +653,8 @@ class ContextConfigManager:
         self._temporal_detection = TemporalDetectionConfig()
         self._trend_analysis = TrendAnalysisConfig()
         self._intervention = InterventionConfig()
+        self._history_store = HistoryStoreConfig()
+        self._escalation_sweep = EscalationSweepConfig()
         self._known_patterns = {}
     
     # =========================================================================
@@ -590,6 +706,24 @@ class ContextConfigManager:
         """
         return self._intervention
     
+    def get_history_store_config(self) -> HistoryStoreConfig:
+        """
+        Get server-side history store configuration (Phase 8).
+        
+        Returns:
+            HistoryStoreConfig with capacity, TTL and snapshot settings
+        """
+        return self._history_store
+    
+    def get_escalation_sweep_config(self) -> EscalationSweepConfig:
+        """
+        Get background escalation sweep configuration (Phase 8).
+        
+        Returns:
+            EscalationSweepConfig with interval, tick budget and batch size
+        """
+        return self._escalation_sweep
+    
     def get_known_patterns(self) -> Dict[str, KnownPattern]:
         """
         Get dictionary of known escalation patterns.
@@ -699,6 +833,19 @@ class ContextConfigManager:
                 "escalation_urgency_boost": self._intervention.escalation_urgency_boost,
                 "late_night_urgency_boost": self._intervention.late_night_urgency_boost,
             },
+            "history_store": {
+                "enabled": self._history_store.enabled,
+                "max_users": self._history_store.max_users,
+                "max_entries_per_user": self._history_store.max_entries_per_user,
+                "ttl_hours": self._history_store.ttl_hours,
+                "snapshot_enabled": bool(self._history_store.snapshot_path),
+            },
+            "escalation_sweep": {
+                "enabled": self._escalation_sweep.enabled,
+                "interval_seconds": self._escalation_sweep.interval_seconds,
+                "tick_budget_ms": self._escalation_sweep.tick_budget_ms,
+                "batch_size": self._escalation_sweep.batch_size,
+            },
             "known_pattern_count": len(self._known_patterns),
         }
     
@@ -762,6 +909,8 @@ __all__ = [
     "TemporalDetectionConfig",
     "TrendAnalysisConfig",
     "InterventionConfig",
+    "HistoryStoreConfig",
+    "EscalationSweepConfig",
     "KnownPattern",
     # FE-005: Per-severity thresholds
     "SeverityThreshold",
@@ -66,7 +66,28 @@ from .base import (
 from .bart_classifier import (
     BARTCrisisClassifier,
     create_bart_classifier,
+    resolve_crisis_labels,
+    resolve_safe_labels,
+    resolve_umbrella_labels,
     DEFAULT_CRISIS_LABELS,
+    DEFAULT_EXPANSION_THRESHOLD,
+)
+
+# Versioned BART candidate label sets (Phase 8)
+from .label_set import (
+    CrisisLabelSet,
+    create_crisis_label_set,
+    compute_label_set_hash,
+    DEFAULT_HYPOTHESIS_TEMPLATE,
+    DEFAULT_SAFE_LABELS,
+    DEFAULT_UMBRELLA_LABELS,
+)
+
+# Shared-premise BART NLI scoring (Phase 8, experimental)
+from .shared_premise import (
+    SharedPremiseScorer,
+    create_shared_premise_scorer,
+    DEFAULT_PREMISE_CACHE_SIZE,
 )
 
 # Cardiff Sentiment Analyzer - SECONDARY (weight 0.25)
@@ -167,7 +188,22 @@ __all__ = [
     # BART Crisis Classifier
     "BARTCrisisClassifier",
     "create_bart_classifier",
+    "resolve_crisis_labels",
+    "resolve_safe_labels",
+    "resolve_umbrella_labels",
     "DEFAULT_CRISIS_LABELS",
+    "DEFAULT_EXPANSION_THRESHOLD",
+    # Crisis Label Sets
+    "CrisisLabelSet",
+    "create_crisis_label_set",
+    "compute_label_set_hash",
+    "DEFAULT_HYPOTHESIS_TEMPLATE",
+    "DEFAULT_SAFE_LABELS",
+    "DEFAULT_UMBRELLA_LABELS",
+    # Shared premise
+    "SharedPremiseScorer",
+    "create_shared_premise_scorer",
+    "DEFAULT_PREMISE_CACHE_SIZE",
     # Sentiment Analyzer
     "SentimentAnalyzer",
     "create_sentiment_analyzer",
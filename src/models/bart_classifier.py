@@ -10,10 +10,10 @@ Ash-NLP is a CRISIS DETECTION BACKEND that:
 ********************************************************************************
 BART Zero-Shot Crisis Classifier for Ash-NLP Service
 ---
-FILE VERSION: v5.0-3-4.2-2
-LAST MODIFIED: 2025-12-31
-PHASE: Phase 3 Step 4.2 - Model Wrapper Implementation
-CLEAN ARCHITECTURE: v5.1 Compliant
+FILE VERSION: v5.0-8-23.0-3
+LAST MODIFIED: 2026-02-22
+PHASE: Phase 8 Step 23.0 - Shared-Premise Encoder Reuse
+CLEAN ARCHITECTURE: v5.2.3 Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-nlp
 Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
 
@@ -22,15 +22,36 @@ RESPONSIBILITIES:
 - Provide candidate labels for crisis detection
 - Return standardized ModelResult for ensemble processing
 - Handle multi-label scoring for crisis severity assessment
+- Hold candidate labels as a versioned CrisisLabelSet (content hash for
+  cache keys, tokenized hypotheses re-encoded only when they change;
+  only the shared-premise mode uses the tokenized hypotheses)
+- Optional two-stage mode: screen with umbrella + safe labels, expand to
+  the full label set only when the umbrella score reaches the threshold
+- Optional shared-premise mode (experimental): encode the message once per
+  call and reuse it for every hypothesis (see shared_premise.py)
 
 MODEL DETAILS:
 - HuggingFace ID: facebook/bart-large-mnli
 - Task: zero-shot-classification
 - Role: PRIMARY (weight: 0.50)
 - Phase 2 Accuracy: 100% across 207 test cases
+
+TWO-STAGE MODE (model_bart.two_stage_enabled):
+    message → screening labels (umbrella + safe labels, 5 NLI pairs)
+        → umbrella ranks first, or umbrella score ≥ expansion_threshold
+            → full label set (16 NLI pairs), full distribution returned
+        → otherwise the screening result, projected onto the full label
+          set (each crisis label scored like the umbrella label), is
+          returned (top label is safe)
+
+SHARED-PREMISE MODE (model_bart.shared_premise_enabled, experimental):
+    Both stages above go through SharedPremiseScorer instead of the pipeline
+    when torch is available; scores are close to, not identical with, the
+    pipeline's (check with python -m src.benchmark.premise_parity).
 """
 
 import logging
+import threading
 from typing import Any, Dict, List, Optional
 
 from .base import (
@@ -39,13 +60,23 @@ from .base import (
     ModelRole,
     ModelTask,
 )
+from .label_set import (
+    DEFAULT_HYPOTHESIS_TEMPLATE,
+    CrisisLabelSet,
+    HypothesisEncoder,
+    create_crisis_label_set,
+)
+from .shared_premise import SharedPremiseScorer, create_shared_premise_scorer
 
 # Module version
-__version__ = "v5.0-3-4.2-2"
+__version__ = "v5.0-8-23.0-3"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+# Umbrella score at which two-stage mode runs the full label set
+DEFAULT_EXPANSION_THRESHOLD = 0.25
+
 # Default crisis labels (can be overridden via config)
 DEFAULT_CRISIS_LABELS = [
     # Primary crisis indicators (critical/high severity)
@@ -103,6 +134,12 @@ class BARTCrisisClassifier(BaseModelWrapper):
         device: str = "auto",
         enabled: bool = True,
         crisis_labels: Optional[List[str]] = None,
+        safe_labels: Optional[List[str]] = None,
+        hypothesis_template: str = DEFAULT_HYPOTHESIS_TEMPLATE,
+        umbrella_labels: Optional[List[str]] = None,
+        two_stage: bool = False,
+        expansion_threshold: float = DEFAULT_EXPANSION_THRESHOLD,
+        shared_premise: bool = False,
     ):
         """
         Initialize BART Crisis Classifier.
@@ -113,6 +150,12 @@ class BARTCrisisClassifier(BaseModelWrapper):
             device: Device to run on (auto, cuda, cpu)
             enabled: Whether this model is enabled
             crisis_labels: Candidate labels for classification
+            safe_labels: Candidate labels that indicate no crisis
+            hypothesis_template: Zero-shot hypothesis template
+            umbrella_labels: Coarse crisis labels for two-stage screening
+            two_stage: Screen first, run the full label set only on expansion
+            expansion_threshold: Umbrella score that triggers expansion
+            shared_premise: Score through SharedPremiseScorer once loaded
         """
         super().__init__(
             model_id=model_id,
@@ -124,12 +167,60 @@ class BARTCrisisClassifier(BaseModelWrapper):
             enabled=enabled,
         )
 
-        # Set crisis labels
-        self.crisis_labels = crisis_labels or DEFAULT_CRISIS_LABELS.copy()
+        # Set crisis labels (encoded once the tokenizer is loaded)
+        self.label_set: CrisisLabelSet = create_crisis_label_set(
+            crisis_labels or DEFAULT_CRISIS_LABELS,
+            safe_labels=safe_labels,
+            hypothesis_template=hypothesis_template,
+            umbrella_labels=umbrella_labels,
+        )
+
+        # Two-stage screening (Phase 8)
+        self.two_stage = two_stage
+        self.expansion_threshold = expansion_threshold
+        self._stage_lock = threading.Lock()
+        self._screened = 0
+        self._expanded = 0
+
+        # Shared-premise scoring (Phase 8, created on load)
+        self.shared_premise = shared_premise
+        self._premise_scorer: Optional[SharedPremiseScorer] = None
 
         logger.info(
             f"🎯 BART Crisis Classifier initialized "
-            f"(labels: {len(self.crisis_labels)}, weight: {self.weight})"
+            f"(labels: {len(self.crisis_labels)}, weight: {self.weight}"
+            + (f", two-stage at {expansion_threshold:g}" if two_stage else "")
+            + (", shared premise" if shared_premise else "")
+            + ")"
+        )
+
+    @property
+    def crisis_labels(self) -> List[str]:
+        """Current candidate labels."""
+        return list(self.label_set.labels)
+
+    def load(self) -> bool:
+        """Load the pipeline, then encode the label set's hypotheses."""
+        loaded = super().load()
+        self.label_set = self.label_set.rebuild(
+            self.label_set.labels, encoder=self._hypothesis_encoder()
+        )
+        if loaded and self.shared_premise and self._premise_scorer is None:
+            self._premise_scorer = create_shared_premise_scorer(self._pipeline)
+        return loaded
+
+    def unload(self) -> None:
+        """Unload model (and the shared-premise scorer built on it)."""
+        self._premise_scorer = None
+        super().unload()
+
+    def _hypothesis_encoder(self) -> Optional[HypothesisEncoder]:
+        """Tokenize hypotheses with the pipeline's tokenizer (if it has one)."""
+        tokenizer = getattr(self._pipeline, "tokenizer", None)
+        if tokenizer is None:
+            return None
+        return lambda hypothesis: tuple(
+            tokenizer(hypothesis, add_special_tokens=False)["input_ids"]
         )
 
     def _load_model(self) -> Any:
@@ -189,15 +280,137 @@ class BARTCrisisClassifier(BaseModelWrapper):
         if self._pipeline is None:
             raise RuntimeError("Model not loaded")
 
-        # Use provided labels or default crisis labels
-        candidate_labels = labels or self.crisis_labels
+        # Use provided labels or the current label set (read once)
+        label_set = self.label_set
+        kwargs.setdefault("hypothesis_template", label_set.hypothesis_template)
+
+        if labels or not self.two_stage or not label_set.umbrella_labels:
+            return self._classify(
+                text,
+                candidate_labels=labels or list(label_set.labels),
+                multi_label=multi_label,
+                **kwargs,
+            )
+        return self._run_two_stage(text, label_set, multi_label, **kwargs)
+
+    def _run_two_stage(
+        self,
+        text: Any,
+        label_set: CrisisLabelSet,
+        multi_label: bool,
+        **kwargs,
+    ) -> Any:
+        """
+        Screen with umbrella + safe labels; expand flagged texts.
+
+        Handles a single text or a batch (expanded texts are re-run in one
+        batched call and put back in place). Texts that are not expanded
+        get their screening result projected onto the full label set
+        (CrisisLabelSet.project_screening), so both paths are scored on
+        the same scale.
+        """
+        screened = self._classify(
+            text,
+            candidate_labels=list(label_set.screening_labels),
+            multi_label=multi_label,
+            **kwargs,
+        )
+
+        batched = isinstance(text, list)
+        texts = text if batched else [text]
+        outputs = list(screened) if batched else [screened]
+        expand = [
+            i for i, output in enumerate(outputs)
+            if self._needs_expansion(output, label_set)
+        ]
+
+        with self._stage_lock:
+            self._screened += len(texts)
+            self._expanded += len(expand)
+
+        if not expand:
+            projected = [
+                label_set.project_screening(output, normalize=not multi_label)
+                for output in outputs
+            ]
+            return projected if batched else projected[0]
+
+        full = self._classify(
+            [texts[i] for i in expand] if batched else text,
+            candidate_labels=list(label_set.labels),
+            multi_label=multi_label,
+            **kwargs,
+        )
+        if not batched:
+            return full
+        if isinstance(full, dict):
+            full = [full]
+        expanded = dict(zip(expand, full))
+        return [
+            expanded[i] if i in expanded
+            else label_set.project_screening(output, normalize=not multi_label)
+            for i, output in enumerate(outputs)
+        ]
+
+    def _classify(self, text: Any, candidate_labels: List[str], **kwargs) -> Any:
+        """
+        Zero-shot call through the shared-premise scorer or the pipeline.
 
-        # Run inference
-        result = self._pipeline(
-            text, candidate_labels=candidate_labels, multi_label=multi_label, **kwargs
+        Only the shared-premise scorer reads label_set.encodings. The
+        default pipeline path tokenizes every message + hypothesis pair
+        itself, so the precomputed hypotheses save nothing there.
+        """
+        scorer = self._premise_scorer
+        if scorer is None:
+            return self._pipeline(text, candidate_labels=candidate_labels, **kwargs)
+        return scorer(
+            text,
+            candidate_labels=candidate_labels,
+            encodings=self.label_set.encodings,
+            **kwargs,
         )
 
-        return result
+    def _needs_expansion(self, output: Dict[str, Any], label_set: CrisisLabelSet) -> bool:
+        """Expand when an umbrella label ranks first or reaches the threshold."""
+        labels = output.get("labels") or []
+        if not labels or labels[0] in label_set.umbrella_labels:
+            return True
+        scores = dict(zip(labels, output.get("scores") or []))
+        return label_set.umbrella_score(scores) >= self.expansion_threshold
+
+    def get_two_stage_stats(self) -> Dict[str, Any]:
+        """
+        Get two-stage screening statistics.
+
+        Returns:
+            Dictionary with settings, screened/expanded counts and rate
+        """
+        with self._stage_lock:
+            screened, expanded = self._screened, self._expanded
+        return {
+            "enabled": self.two_stage,
+            "expansion_threshold": self.expansion_threshold,
+            "screening_labels": len(self.label_set.screening_labels),
+            "full_labels": len(self.label_set.labels),
+            "screened": screened,
+            "expanded": expanded,
+            "expansion_rate": round(expanded / screened, 4) if screened else 0.0,
+        }
+
+    def get_shared_premise_stats(self) -> Dict[str, Any]:
+        """
+        Get shared-premise scoring statistics.
+
+        Returns:
+            Dictionary with the setting, whether the scorer is active and
+            its counters (empty when inactive)
+        """
+        scorer = self._premise_scorer
+        return {
+            "enabled": self.shared_premise,
+            "active": scorer is not None,
+            **(scorer.get_stats() if scorer is not None else {}),
+        }
 
     def _process_output(self, raw_output: Any, latency_ms: float) -> ModelResult:
         """
@@ -289,34 +502,8 @@ class BARTCrisisClassifier(BaseModelWrapper):
         if not result.success or not result.all_scores:
             return 0.0
 
-        # Crisis-indicating labels (sum their scores)
-        crisis_labels = {
-            "suicide ideation",
-            "self-harm",
-            "domestic violence",
-            "panic attack",
-            "severe depression",
-            "substance abuse crisis",
-            "emotional distress",
-            "anxiety",
-            "grief",
-            "relationship crisis",
-            "identity crisis",
-            "isolation",
-        }
-
-        crisis_score_sum = sum(
-            score
-            for label, score in result.all_scores.items()
-            if label in crisis_labels
-        )
-
-        # Normalize (scores may not sum to 1.0 in multi-label mode)
-        total_score = sum(result.all_scores.values())
-        if total_score > 0:
-            return crisis_score_sum / total_score
-
-        return 0.0
+        # Scores may not sum to 1.0 in multi-label mode; the set normalizes
+        return self.label_set.crisis_score(result.all_scores)
 
     def is_crisis_label(self, label: str) -> bool:
         """
@@ -328,27 +515,51 @@ class BARTCrisisClassifier(BaseModelWrapper):
         Returns:
             True if label indicates crisis
         """
-        safe_labels = {
-            "casual conversation",
-            "positive sharing",
-            "seeking information",
-            "general discussion",
-        }
-        return label.lower() not in safe_labels
+        return self.label_set.is_crisis_label(label)
 
-    def set_crisis_labels(self, labels: List[str]) -> None:
+    def set_crisis_labels(
+        self,
+        labels: List[str],
+        safe_labels: Optional[List[str]] = None,
+        umbrella_labels: Optional[List[str]] = None,
+    ) -> CrisisLabelSet:
         """
         Update the candidate labels for classification.
 
+        Only hypotheses the current set has not encoded are tokenized.
+
         Args:
             labels: New list of candidate labels
+            safe_labels: New safe labels (default: keep the current ones)
+            umbrella_labels: New umbrella labels (default: keep the current ones)
+
+        Returns:
+            The label set now in use
         """
-        self.crisis_labels = labels.copy()
-        logger.info(f"Updated crisis labels: {len(self.crisis_labels)} labels")
+        encoder = self._hypothesis_encoder() if self._is_loaded else None
+        self.label_set = self.label_set.rebuild(
+            labels,
+            safe_labels=safe_labels,
+            encoder=encoder,
+            umbrella_labels=umbrella_labels,
+        )
+        logger.info(
+            f"Updated crisis labels: {len(self.label_set.labels)} labels "
+            f"(set {self.label_set.content_hash})"
+        )
+        return self.label_set
+
+    def set_label_set(self, label_set: CrisisLabelSet) -> None:
+        """Adopt a label set built elsewhere (e.g. by another replica)."""
+        self.label_set = label_set
+
+    def get_label_set(self) -> CrisisLabelSet:
+        """Get the current label set."""
+        return self.label_set
 
     def get_crisis_labels(self) -> List[str]:
         """Get current crisis labels."""
-        return self.crisis_labels.copy()
+        return list(self.label_set.labels)
 
 
 # =============================================================================
@@ -356,6 +567,58 @@ class BARTCrisisClassifier(BaseModelWrapper):
 # =============================================================================
 
 
+def resolve_crisis_labels(config_manager: Any) -> Optional[List[str]]:
+    """
+    Build the candidate label list from the crisis_labels config section.
+
+    Args:
+        config_manager: ConfigManager instance
+
+    Returns:
+        primary + secondary + safe labels, or None if the section is empty
+    """
+    labels_config = config_manager.get_crisis_labels()
+    if not labels_config:
+        return None
+    return (
+        labels_config.get("primary_labels", [])
+        + labels_config.get("secondary_labels", [])
+        + labels_config.get("safe_labels", [])
+    )
+
+
+def resolve_safe_labels(config_manager: Any) -> Optional[List[str]]:
+    """
+    Get the safe labels from the crisis_labels config section.
+
+    Args:
+        config_manager: ConfigManager instance
+
+    Returns:
+        Safe labels, or None if the section does not list any
+    """
+    labels_config = config_manager.get_crisis_labels()
+    if not labels_config:
+        return None
+    return labels_config.get("safe_labels") or None
+
+
+def resolve_umbrella_labels(config_manager: Any) -> Optional[List[str]]:
+    """
+    Get the two-stage umbrella labels from the crisis_labels config section.
+
+    Args:
+        config_manager: ConfigManager instance
+
+    Returns:
+        Umbrella labels, or None if the section does not list any
+    """
+    labels_config = config_manager.get_crisis_labels()
+    if not labels_config:
+        return None
+    return labels_config.get("umbrella_labels") or None
+
+
 def create_bart_classifier(
     config: Optional[Dict[str, Any]] = None,
     config_manager: Optional[Any] = None,
@@ -383,6 +646,8 @@ def create_bart_classifier(
     # Build configuration from various sources
     model_config = {}
     crisis_labels = None
+    safe_labels = None
+    umbrella_labels = None
 
     # Priority 1: ConfigManager
     if config_manager is not None:
@@ -396,6 +661,13 @@ def create_bart_classifier(
                     "weight", BARTCrisisClassifier.DEFAULT_WEIGHT
                 ),
                 "enabled": bart_config.get("enabled", True),
+                "two_stage_enabled": bart_config.get("two_stage_enabled", False),
+                "expansion_threshold": bart_config.get(
+                    "expansion_threshold", DEFAULT_EXPANSION_THRESHOLD
+                ),
+                "shared_premise_enabled": bart_config.get(
+                    "shared_premise_enabled", False
+                ),
             }
 
         # Get device from general model config
@@ -404,13 +676,9 @@ def create_bart_classifier(
             model_config["device"] = models_config.get("device", "auto")
 
         # Get crisis labels
-        labels_config = config_manager.get_crisis_labels()
-        if labels_config:
-            crisis_labels = (
-                labels_config.get("primary_labels", [])
-                + labels_config.get("secondary_labels", [])
-                + labels_config.get("safe_labels", [])
-            )
+        crisis_labels = resolve_crisis_labels(config_manager)
+        safe_labels = resolve_safe_labels(config_manager)
+        umbrella_labels = resolve_umbrella_labels(config_manager)
 
     # Priority 2: Direct config dict
     if config:
@@ -425,6 +693,13 @@ def create_bart_classifier(
         device=model_config.get("device", "auto"),
         enabled=model_config.get("enabled", True),
         crisis_labels=crisis_labels,
+        safe_labels=safe_labels,
+        umbrella_labels=umbrella_labels,
+        two_stage=model_config.get("two_stage_enabled", False),
+        expansion_threshold=model_config.get(
+            "expansion_threshold", DEFAULT_EXPANSION_THRESHOLD
+        ),
+        shared_premise=model_config.get("shared_premise_enabled", False),
     )
 
 
@@ -435,5 +710,9 @@ def create_bart_classifier(
 __all__ = [
     "BARTCrisisClassifier",
     "create_bart_classifier",
+    "resolve_crisis_labels",
+    "resolve_safe_labels",
+    "resolve_umbrella_labels",
     "DEFAULT_CRISIS_LABELS",
+    "DEFAULT_EXPANSION_THRESHOLD",
 ]
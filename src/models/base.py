@@ -10,9 +10,9 @@ Ash-NLP is a CRISIS DETECTION BACKEND that:
 ********************************************************************************
 Abstract Base Model Class for Ash-NLP Service
 ---
-FILE VERSION: v5.0-6-2.0-1
-LAST MODIFIED: 2026-01-02
-PHASE: Phase 6 - Sprint 2 (FE-003: Token Truncation)
+FILE VERSION: v5.0-8-6.0-1
+LAST MODIFIED: 2026-02-05
+PHASE: Phase 8 Step 6.0 - Batched History Scoring
 CLEAN ARCHITECTURE: v5.1 Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-nlp
 Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
@@ -23,6 +23,8 @@ RESPONSIBILITIES:
 - Ensure consistent response format across all models
 - Handle errors gracefully with logging
 - FE-003: Smart token truncation for long inputs
+- Phase 8: Export per-model inference latency and errors to metrics
+- Phase 8: Batched inference (one pipeline call for many texts)
 """
 
 import logging
@@ -33,8 +35,10 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple, Union
 from enum import Enum
 
+from src.utils.metrics import observe_model_inference, record_model_error
+
 # Module version
-__version__ = "v5.0-6-2.0-1"
+__version__ = "v5.0-8-6.0-1"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -267,12 +271,15 @@ class BaseModelWrapper(ABC):
         """
         Run model-specific inference.
 
+        HuggingFace pipelines also accept a list of texts and return one
+        output per text; analyze_batch() relies on this.
+
         Args:
-            text: Input text to analyze
+            text: Input text to analyze (or list of texts)
             **kwargs: Model-specific parameters
 
         Returns:
-            Raw model output
+            Raw model output (list of outputs for list input)
         """
         pass
 
@@ -347,12 +354,14 @@ class BaseModelWrapper(ABC):
             # Update performance tracking
             self._total_inferences += 1
             self._total_latency_ms += latency_ms
+            observe_model_inference(self.name, latency_ms)
 
             return result
 
         except Exception as e:
             latency_ms = (time.perf_counter() - start_time) * 1000
             logger.error(f"❌ Inference error in {self.name}: {e}")
+            record_model_error(self.name, type(e).__name__)
 
             return ModelResult.create_error(
                 model_name=self.name,
@@ -361,6 +370,83 @@ class BaseModelWrapper(ABC):
                 latency_ms=latency_ms,
             )
 
+    def analyze_batch(self, texts: List[str], **kwargs) -> List[ModelResult]:
+        """
+        Analyze several texts in a single pipeline call.
+
+        Falls back to per-text analyze() if the batched call fails, so the
+        result list always lines up with the input list.
+
+        Args:
+            texts: Input texts to analyze
+            **kwargs: Model-specific parameters
+
+        Returns:
+            One ModelResult per input text, in order
+        """
+        if not texts:
+            return []
+
+        if not self.enabled:
+            return [
+                ModelResult.create_error(
+                    model_name=self.name,
+                    model_role=self.role,
+                    error="Model is disabled",
+                )
+                for _ in texts
+            ]
+
+        if not self._is_loaded:
+            try:
+                self.load()
+            except Exception as e:
+                logger.error(f"❌ Failed to load {self.name}: {e}")
+                return [
+                    ModelResult.create_error(
+                        model_name=self.name,
+                        model_role=self.role,
+                        error=f"Model loading failed: {str(e)}",
+                    )
+                    for _ in texts
+                ]
+
+        processed_texts = [self._truncate_text(text)[0] for text in texts]
+
+        start_time = time.perf_counter()
+
+        try:
+            raw_outputs = self._run_inference(processed_texts, **kwargs)
+            latency_ms = (time.perf_counter() - start_time) * 1000
+
+            # Some pipelines unwrap single-item batches
+            if isinstance(raw_outputs, dict):
+                raw_outputs = [raw_outputs]
+            if len(raw_outputs) != len(processed_texts):
+                raise ValueError(
+                    f"expected {len(processed_texts)} outputs, got {len(raw_outputs)}"
+                )
+
+            # Attribute the batch latency evenly across items
+            item_latency_ms = latency_ms / len(processed_texts)
+            results = [
+                self._process_output(raw, item_latency_ms) for raw in raw_outputs
+            ]
+
+            self._total_inferences += len(results)
+            self._total_latency_ms += latency_ms
+            observe_model_inference(self.name, latency_ms)
+
+            return results
+
+        except Exception as e:
+            logger.warning(
+                f"⚠️ Batch inference failed in {self.name} ({len(texts)} texts), "
+                f"falling back to per-text: {e}"
+            )
+            record_model_error(self.name, type(e).__name__)
+            return [self.analyze(text, **kwargs) for text in texts]
+
     def load(self) -> bool:
         """
         Load the model (called automatically on first analyze).
@@ -0,0 +1,382 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+CORE PRINCIPLE: Multi-Model Ensemble → Weighted Decision Engine → Crisis Classification
+******************  CORE SYSTEM VISION (Never to be violated):  ****************
+Ash-NLP is a CRISIS DETECTION BACKEND that:
+1. PRIMARY: Uses BART Zero-Shot Classification for semantic crisis detection
+2. CONTEXTUAL: Enhances with sentiment, irony, and emotion model signals
+3. ENSEMBLE: Combines weighted model outputs through decision engine
+4. PURPOSE: Detect crisis messages in Discord community communications
+********************************************************************************
+Versioned Crisis Label Sets for Ash-NLP Service
+---
+FILE VERSION: v5.0-8-22.0-3
+LAST MODIFIED: 2026-02-21
+PHASE: Phase 8 Step 22.0 - Two-Stage BART Screening
+CLEAN ARCHITECTURE: v5.2.3 Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+
+RESPONSIBILITIES:
+- Hold one BART candidate label set as an immutable object:
+    - labels in classification order, and which of them are safe
+    - coarse umbrella labels for two-stage screening (umbrella + safe
+      labels are scored first; the full set only when that looks like crisis)
+    - the hypothesis sentence for each label (zero-shot template)
+    - tokenized hypotheses (when a tokenizer is available; read only by
+      the opt-in shared-premise scorer, the pipeline tokenizes pairs itself)
+    - a content hash and a version number
+- Rebuild from a previous set re-encoding only new or changed hypotheses
+- Score a BART result against the set's own crisis labels
+
+CACHE KEYS:
+    The content hash depends only on labels, safe labels and template, so
+    switching back to an earlier label set (A/B experiments) reuses the
+    cache entries computed under it.
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Mapping, Optional, Tuple
+
+# Module version
+__version__ = "v5.0-8-22.0-3"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Default zero-shot hypothesis template (same as the transformers pipeline)
+DEFAULT_HYPOTHESIS_TEMPLATE = "This example is {}."
+
+# Safe indicators (low/no severity) unless the config names others
+DEFAULT_SAFE_LABELS: Tuple[str, ...] = (
+    "casual conversation",
+    "positive sharing",
+    "seeking information",
+    "general discussion",
+)
+
+# Coarse crisis hypotheses for two-stage screening
+DEFAULT_UMBRELLA_LABELS: Tuple[str, ...] = ("crisis or emotional distress",)
+
+# Hex characters of the SHA-256 digest kept as the content hash
+LABEL_SET_HASH_LENGTH = 16
+
+# Tokenizes one hypothesis; result is stored as-is
+HypothesisEncoder = Callable[[str], Any]
+
+
+def compute_label_set_hash(
+    labels: Iterable[str],
+    safe_labels: Iterable[str],
+    hypothesis_template: str,
+    umbrella_labels: Iterable[str] = (),
+) -> str:
+    """
+    Content hash of a label set.
+
+    Label order is part of the hash (it is the order BART receives).
+
+    Returns:
+        Hex digest prefix (LABEL_SET_HASH_LENGTH characters)
+    """
+    payload = json.dumps(
+        [list(labels), sorted(safe_labels), hypothesis_template, list(umbrella_labels)],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return digest[:LABEL_SET_HASH_LENGTH]
+
+
+# =============================================================================
+# Crisis Label Set
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class CrisisLabelSet:
+    """
+    Immutable BART candidate label set.
+
+    Attributes:
+        labels: Candidate labels in classification order
+        safe_labels: Labels indicating no crisis
+        crisis_labels: Labels indicating crisis (labels minus safe labels,
+            plus umbrella labels)
+        hypothesis_template: Zero-shot template ("{}" is the label)
+        hypotheses: Hypothesis sentence per label (umbrella labels included)
+        encodings: Tokenized hypothesis per hypothesis sentence
+            (empty when no tokenizer was available; used by the
+            shared-premise scorer only)
+        content_hash: Hash of labels, safe labels, umbrella labels and template
+        version: Increments with every content change made through rebuild()
+        umbrella_labels: Coarse crisis labels for two-stage screening
+        screening_labels: Umbrella labels followed by the safe labels
+            (candidate labels of the screening stage)
+    """
+
+    labels: Tuple[str, ...]
+    safe_labels: FrozenSet[str]
+    crisis_labels: FrozenSet[str]
+    hypothesis_template: str
+    hypotheses: Mapping[str, str]
+    encodings: Mapping[str, Any]
+    content_hash: str
+    version: int = 0
+    umbrella_labels: Tuple[str, ...] = ()
+    screening_labels: Tuple[str, ...] = ()
+
+    # =========================================================================
+    # Scoring
+    # =========================================================================
+
+    def is_crisis_label(self, label: str) -> bool:
+        """Check if a label indicates crisis (anything not safe)."""
+        return label.lower() not in self.safe_labels
+
+    def crisis_score(self, all_scores: Mapping[str, float]) -> float:
+        """
+        Share of the score mass on this set's crisis labels.
+
+        Args:
+            all_scores: Label → score from a BART result
+
+        Returns:
+            Aggregate crisis score (0.0 - 1.0)
+        """
+        total = 0.0
+        crisis = 0.0
+        for label, score in all_scores.items():
+            total += score
+            if label in self.crisis_labels:
+                crisis += score
+        return crisis / total if total > 0 else 0.0
+
+    # =========================================================================
+    # Rebuild
+    # =========================================================================
+
+    def umbrella_score(self, all_scores: Mapping[str, float]) -> float:
+        """
+        Highest umbrella label score in a screening result.
+
+        Args:
+            all_scores: Label → score from a screening-stage BART result
+
+        Returns:
+            Umbrella score (0.0 when the set has no umbrella labels)
+        """
+        return max(
+            (all_scores.get(label, 0.0) for label in self.umbrella_labels),
+            default=0.0,
+        )
+
+    def project_screening(
+        self, output: Mapping[str, Any], normalize: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Map a screening-stage result onto the full label set's scale.
+
+        Zero-shot scores are per-label entailment scores, normalized over
+        the candidates. A screening result is normalized over 5 labels
+        instead of the full set, which inflates the safe labels. Here each
+        crisis label of the full set is scored like the umbrella label it
+        was screened by, safe labels keep their score, and the result is
+        renormalized over the full set.
+
+        Args:
+            output: Screening-stage pipeline output (labels, scores)
+            normalize: Renormalize (False for multi-label results, where
+                scores are independent)
+
+        Returns:
+            Pipeline-shaped output over the full label set, ranked
+        """
+        screened = dict(zip(output.get("labels") or [], output.get("scores") or []))
+        umbrella = self.umbrella_score(screened)
+        scores = {
+            label: (
+                screened.get(label, 0.0)
+                if label.lower() in self.safe_labels
+                else umbrella
+            )
+            for label in self.labels
+        }
+
+        total = sum(scores.values())
+        if normalize and total > 0:
+            scores = {label: score / total for label, score in scores.items()}
+
+        ranked = sorted(scores.items(), key=lambda kv: kv[1], reverse=True)
+        return {
+            **output,
+            "labels": [label for label, _ in ranked],
+            "scores": [score for _, score in ranked],
+        }
+
+    def rebuild(
+        self,
+        labels: Iterable[str],
+        safe_labels: Optional[Iterable[str]] = None,
+        hypothesis_template: Optional[str] = None,
+        encoder: Optional[HypothesisEncoder] = None,
+        umbrella_labels: Optional[Iterable[str]] = None,
+    ) -> "CrisisLabelSet":
+        """
+        Build the next label set, reusing this set's hypothesis encodings.
+
+        Args:
+            labels: New candidate labels
+            safe_labels: New safe labels (default: keep this set's)
+            hypothesis_template: New template (default: keep this set's)
+            encoder: Tokenizes hypotheses that have no encoding yet
+            umbrella_labels: New umbrella labels (default: keep this set's)
+
+        Returns:
+            This set when nothing changed, otherwise a new set (version + 1
+            when the content changed)
+        """
+        return create_crisis_label_set(
+            labels,
+            safe_labels=self.safe_labels if safe_labels is None else safe_labels,
+            hypothesis_template=hypothesis_template or self.hypothesis_template,
+            encoder=encoder,
+            previous=self,
+            umbrella_labels=(
+                self.umbrella_labels if umbrella_labels is None else umbrella_labels
+            ),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for status output."""
+        return {
+            "content_hash": self.content_hash,
+            "version": self.version,
+            "labels": len(self.labels),
+            "crisis_labels": len(self.crisis_labels),
+            "safe_labels": len(self.safe_labels),
+            "umbrella_labels": list(self.umbrella_labels),
+            "hypothesis_template": self.hypothesis_template,
+            "encoded_hypotheses": len(self.encodings),
+        }
+
+
+def _next_version(previous: Optional[CrisisLabelSet], content_hash: str) -> int:
+    """Version for a rebuilt set (unchanged content keeps its version)."""
+    if previous is None:
+        return 0
+    if previous.content_hash == content_hash:
+        return previous.version
+    return previous.version + 1
+
+
+# =============================================================================
+# FACTORY FUNCTION - Clean Architecture v5.1 Compliance (Rule #1)
+# =============================================================================
+
+
+def create_crisis_label_set(
+    labels: Iterable[str],
+    safe_labels: Optional[Iterable[str]] = None,
+    hypothesis_template: str = DEFAULT_HYPOTHESIS_TEMPLATE,
+    encoder: Optional[HypothesisEncoder] = None,
+    previous: Optional[CrisisLabelSet] = None,
+    umbrella_labels: Optional[Iterable[str]] = None,
+) -> CrisisLabelSet:
+    """
+    Factory function for CrisisLabelSet.
+
+    With a previous set, hypotheses it already encoded are reused and
+    only new or changed ones go through the encoder.
+
+    Args:
+        labels: Candidate labels in classification order
+        safe_labels: Labels indicating no crisis (default: DEFAULT_SAFE_LABELS)
+        hypothesis_template: Zero-shot template ("{}" is the label)
+        encoder: Tokenizes one hypothesis (None: no encodings)
+        previous: Set being replaced (for encoding reuse and versioning)
+        umbrella_labels: Coarse crisis labels for two-stage screening
+            (default: DEFAULT_UMBRELLA_LABELS)
+
+    Returns:
+        CrisisLabelSet (previous itself when the content is unchanged and
+        no encodings are missing)
+
+    Example:
+        >>> label_set = create_crisis_label_set(DEFAULT_CRISIS_LABELS)
+        >>> label_set.crisis_score(result.all_scores)
+    """
+    labels = tuple(dict.fromkeys(labels))
+    safe = frozenset(
+        label.lower()
+        for label in (DEFAULT_SAFE_LABELS if safe_labels is None else safe_labels)
+    )
+    umbrella = tuple(
+        dict.fromkeys(
+            DEFAULT_UMBRELLA_LABELS if umbrella_labels is None else umbrella_labels
+        )
+    )
+    content_hash = compute_label_set_hash(labels, safe, hypothesis_template, umbrella)
+    hypotheses = {
+        label: hypothesis_template.format(label) for label in (*labels, *umbrella)
+    }
+
+    reusable: Mapping[str, Any] = previous.encodings if previous is not None else {}
+    missing = [h for h in hypotheses.values() if h not in reusable]
+    if (
+        previous is not None
+        and previous.content_hash == content_hash
+        and (encoder is None or not missing)
+    ):
+        return previous
+
+    encodings: Dict[str, Any] = {}
+    reused = 0
+    for hypothesis in hypotheses.values():
+        if hypothesis in reusable:
+            encodings[hypothesis] = reusable[hypothesis]
+            reused += 1
+        elif encoder is not None:
+            encodings[hypothesis] = encoder(hypothesis)
+
+    label_set = CrisisLabelSet(
+        labels=labels,
+        safe_labels=safe,
+        crisis_labels=frozenset(
+            [label for label in labels if label.lower() not in safe] + list(umbrella)
+        ),
+        hypothesis_template=hypothesis_template,
+        hypotheses=MappingProxyType(hypotheses),
+        encodings=MappingProxyType(encodings),
+        content_hash=content_hash,
+        version=_next_version(previous, content_hash),
+        umbrella_labels=umbrella,
+        screening_labels=umbrella
+        + tuple(label for label in labels if label.lower() in safe),
+    )
+
+    if previous is not None:
+        logger.info(
+            f"🏷️ Crisis label set v{label_set.version} ({content_hash}): "
+            f"{len(labels)} labels, {len(encodings) - reused} hypotheses encoded, "
+            f"{reused} reused"
+        )
+    return label_set
+
+
+# =============================================================================
+# Export public interface
+# =============================================================================
+
+__all__ = [
+    "CrisisLabelSet",
+    "create_crisis_label_set",
+    "compute_label_set_hash",
+    "DEFAULT_HYPOTHESIS_TEMPLATE",
+    "DEFAULT_SAFE_LABELS",
+    "DEFAULT_UMBRELLA_LABELS",
+]
@@ -0,0 +1,458 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+CORE PRINCIPLE: Multi-Model Ensemble → Weighted Decision Engine → Crisis Classification
+******************  CORE SYSTEM VISION (Never to be violated):  ****************
+Ash-NLP is a CRISIS DETECTION BACKEND that:
+1. PRIMARY: Uses BART Zero-Shot Classification for semantic crisis detection
+2. CONTEXTUAL: Enhances with sentiment, irony, and emotion model signals
+3. ENSEMBLE: Combines weighted model outputs through decision engine
+4. PURPOSE: Detect crisis messages in Discord community communications
+********************************************************************************
+Shared-Premise BART NLI Scorer for Ash-NLP Service (EXPERIMENTAL)
+---
+FILE VERSION: v5.0-8-23.0-1
+LAST MODIFIED: 2026-02-22
+PHASE: Phase 8 Step 23.0 - Shared-Premise Encoder Reuse
+CLEAN ARCHITECTURE: v5.2.3 Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+
+RESPONSIBILITIES:
+- Score zero-shot candidate labels with the zero-shot pipeline's own
+  BART-MNLI model, encoding the message (premise) once per call instead of
+  once per label
+- Return results in the pipeline's format (sequence, labels, scores)
+- Keep the last few premise encodings so a repeated message (two-stage
+  expansion, retries) skips the premise pass entirely
+
+HOW IT WORKS:
+    premise pass (once):   <s> message </s></s>
+        → every encoder layer's key/value projections are kept (KV prefix)
+    hypothesis pass (batched over labels):   hypothesis </s>
+        → each encoder layer attends to [premise KV ; hypothesis KV]
+    decoder + classification head: unchanged, full sequence per label
+
+PARITY:
+    BART's encoder is bidirectional. In the standard pipeline the message
+    tokens also attend to the hypothesis; here they do not (the premise is
+    encoded on its own, like a causal prefix). Scores are therefore close to,
+    not identical with, the pipeline's. Measure the difference with
+    src.benchmark.premise_parity before enabling model_bart.shared_premise_enabled.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+# Module version
+__version__ = "v5.0-8-23.0-1"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Premise encodings kept per scorer (keyed by premise token ids)
+DEFAULT_PREMISE_CACHE_SIZE = 8
+
+# Per-layer (keys, values) of the premise, shaped (1, heads, tokens, head_dim)
+PremiseKV = List[Tuple[Any, Any]]
+
+
+# =============================================================================
+# Shared-Premise Scorer
+# =============================================================================
+
+
+class SharedPremiseScorer:
+    """
+    Zero-shot NLI scoring with the premise encoded once per message.
+
+    Works on the model and tokenizer of a loaded zero-shot pipeline; no
+    extra weights are loaded. Safe to call from several threads (the
+    premise cache is locked; inference itself holds no state).
+
+    Clean Architecture v5.2.3 Compliance:
+    - Factory function: create_shared_premise_scorer()
+    """
+
+    def __init__(
+        self,
+        model: Any,
+        tokenizer: Any,
+        cache_size: int = DEFAULT_PREMISE_CACHE_SIZE,
+    ):
+        """
+        Initialize SharedPremiseScorer.
+
+        Args:
+            model: BartForSequenceClassification (MNLI head)
+            tokenizer: Matching BART tokenizer
+            cache_size: Premise encodings to keep (0 disables the cache)
+
+        Note:
+            Use create_shared_premise_scorer() factory function instead.
+        """
+        import torch
+
+        self._torch = torch
+        self.model = model
+        self.tokenizer = tokenizer
+        self.cache_size = cache_size
+
+        self._encoder = model.model.encoder
+        self._decoder = model.model.decoder
+        self._config = model.config
+        self._max_length = min(
+            getattr(tokenizer, "model_max_length", 1024) or 1024,
+            self._config.max_position_embeddings,
+        )
+
+        # Token scale: newer transformers scale inside embed_tokens
+        if hasattr(self._encoder.embed_tokens, "embed_scale"):
+            self._embed_scale = 1.0
+        else:
+            self._embed_scale = getattr(self._encoder, "embed_scale", 1.0)
+
+        self.entailment_id, self.contradiction_id = self._resolve_nli_ids()
+
+        self._cache: "OrderedDict[Tuple[int, ...], Tuple[PremiseKV, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Statistics
+        self._calls = 0
+        self._pairs = 0
+        self._premise_tokens = 0
+        self._premise_tokens_encoded = 0
+        self._cache_hits = 0
+
+        logger.info(
+            f"✅ SharedPremiseScorer v{__version__} initialized "
+            f"(layers={len(self._encoder.layers)}, cache={cache_size})"
+        )
+
+    def _resolve_nli_ids(self) -> Tuple[int, int]:
+        """Entailment / contradiction logit indices (same rule as the pipeline)."""
+        entailment_id = -1
+        for label, index in (self._config.label2id or {}).items():
+            if label.lower().startswith("entail"):
+                entailment_id = index
+                break
+        return entailment_id, -1 if entailment_id == 0 else 0
+
+    # =========================================================================
+    # Classification
+    # =========================================================================
+
+    def __call__(
+        self,
+        text: Any,
+        candidate_labels: Sequence[str],
+        hypothesis_template: str = "This example is {}.",
+        multi_label: bool = False,
+        encodings: Optional[Mapping[str, Any]] = None,
+        **kwargs,
+    ) -> Any:
+        """
+        Classify one text or a list of texts (pipeline-compatible).
+
+        Args:
+            text: Message or list of messages
+            candidate_labels: Labels to score
+            hypothesis_template: Zero-shot template ("{}" is the label)
+            multi_label: Score labels independently instead of normalizing
+            encodings: Tokenized hypotheses (CrisisLabelSet.encodings);
+                missing ones are tokenized here
+            **kwargs: Other pipeline arguments (ignored)
+
+        Returns:
+            {"sequence", "labels", "scores"} per text, labels by score
+        """
+        if isinstance(text, list):
+            return [
+                self.classify(t, candidate_labels, hypothesis_template, multi_label, encodings)
+                for t in text
+            ]
+        return self.classify(text, candidate_labels, hypothesis_template, multi_label, encodings)
+
+    def classify(
+        self,
+        text: str,
+        candidate_labels: Sequence[str],
+        hypothesis_template: str = "This example is {}.",
+        multi_label: bool = False,
+        encodings: Optional[Mapping[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Classify one text against the candidate labels.
+
+        Returns:
+            {"sequence", "labels", "scores"}, labels sorted by score
+        """
+        torch = self._torch
+        labels = list(candidate_labels)
+        if len(labels) == 1:
+            multi_label = True  # same as the pipeline
+
+        hypothesis_ids = [
+            list(self._hypothesis_ids(hypothesis_template.format(label), encodings))
+            + [self._config.eos_token_id]
+            for label in labels
+        ]
+        premise_ids = self._premise_ids(text, max(len(ids) for ids in hypothesis_ids))
+
+        with torch.inference_mode():
+            logits = self._forward(premise_ids, hypothesis_ids)
+
+        if multi_label:
+            pair = logits[:, [self.contradiction_id, self.entailment_id]]
+            scores = pair.softmax(dim=-1)[:, 1]
+        else:
+            scores = logits[:, self.entailment_id].softmax(dim=-1)
+        scores = scores.float().cpu().tolist()
+
+        with self._lock:
+            self._calls += 1
+            self._pairs += len(labels)
+            self._premise_tokens += len(premise_ids) * len(labels)
+
+        order = sorted(range(len(labels)), key=lambda i: scores[i], reverse=True)
+        return {
+            "sequence": text,
+            "labels": [labels[i] for i in order],
+            "scores": [scores[i] for i in order],
+        }
+
+    def _hypothesis_ids(
+        self, hypothesis: str, encodings: Optional[Mapping[str, Any]]
+    ) -> Sequence[int]:
+        """Token ids of one hypothesis (label set encoding when available)."""
+        if encodings is not None:
+            encoded = encodings.get(hypothesis)
+            if encoded is not None:
+                return encoded
+        return self.tokenizer(hypothesis, add_special_tokens=False)["input_ids"]
+
+    def _premise_ids(self, text: str, hypothesis_length: int) -> Tuple[int, ...]:
+        """<s> message </s></s>, truncated so the longest pair still fits."""
+        budget = self._max_length - hypothesis_length - 3
+        ids = self.tokenizer(text, add_special_tokens=False)["input_ids"][:budget]
+        eos = self._config.eos_token_id
+        return (self._config.bos_token_id, *ids, eos, eos)
+
+    # =========================================================================
+    # Forward pass
+    # =========================================================================
+
+    def _forward(self, premise_ids: Tuple[int, ...], hypothesis_ids: List[List[int]]) -> Any:
+        """
+        Entailment logits for every (premise, hypothesis) pair.
+
+        Returns:
+            Tensor (len(hypothesis_ids), num_labels)
+        """
+        torch = self._torch
+        device = self._encoder.embed_tokens.weight.device
+        batch = len(hypothesis_ids)
+        premise_length = len(premise_ids)
+        pad_id = self._config.pad_token_id
+
+        premise_kv, premise_states = self._encode_premise(premise_ids, device)
+
+        width = max(len(ids) for ids in hypothesis_ids)
+        hyp = torch.full((batch, width), pad_id, dtype=torch.long, device=device)
+        hyp_mask = torch.zeros((batch, width), dtype=torch.bool, device=device)
+        for row, ids in enumerate(hypothesis_ids):
+            hyp[row, : len(ids)] = torch.tensor(ids, dtype=torch.long, device=device)
+            hyp_mask[row, : len(ids)] = True
+
+        hyp_states = self._embed(hyp, premise_length)
+        # Hypothesis tokens attend to the whole premise and their own tokens
+        attend = torch.cat(
+            [torch.ones((batch, premise_length), dtype=torch.bool, device=device), hyp_mask],
+            dim=1,
+        )[:, None, None, :]
+        for layer, (keys, values) in zip(self._encoder.layers, premise_kv):
+            hyp_states = self._layer(
+                layer, hyp_states, keys.expand(batch, -1, -1, -1),
+                values.expand(batch, -1, -1, -1), attend,
+            )
+
+        encoder_states = torch.cat(
+            [premise_states.expand(batch, -1, -1), hyp_states], dim=1
+        )
+        input_ids = torch.cat(
+            [torch.tensor(premise_ids, device=device).expand(batch, -1), hyp], dim=1
+        )
+        attention_mask = attend[:, 0, 0, :].long()
+
+        decoder_input_ids = input_ids.new_full(input_ids.shape, pad_id)
+        decoder_input_ids[:, 1:] = input_ids[:, :-1]
+        decoder_input_ids[:, 0] = self._config.decoder_start_token_id
+        decoder_out = self._decoder(
+            input_ids=decoder_input_ids,
+            encoder_hidden_states=encoder_states,
+            encoder_attention_mask=attention_mask,
+        )
+        hidden = decoder_out[0]
+
+        # Sentence representation: hidden state at the last </s>
+        eos_mask = input_ids.eq(self._config.eos_token_id)
+        representation = hidden[eos_mask, :].view(batch, -1, hidden.size(-1))[:, -1, :]
+        return self.model.classification_head(representation)
+
+    def _encode_premise(self, premise_ids: Tuple[int, ...], device: Any) -> Tuple[PremiseKV, Any]:
+        """Premise KV prefix and final states (cached by token ids)."""
+        torch = self._torch
+        with self._lock:
+            cached = self._cache.get(premise_ids)
+            if cached is not None:
+                self._cache.move_to_end(premise_ids)
+                self._cache_hits += 1
+                return cached
+
+        states = self._embed(torch.tensor([premise_ids], device=device), 0)
+        attend = torch.ones((1, 1, 1, len(premise_ids)), dtype=torch.bool, device=device)
+        premise_kv: PremiseKV = []
+        for layer in self._encoder.layers:
+            keys, values = self._project_kv(layer.self_attn, states)
+            premise_kv.append((keys, values))
+            states = self._layer(layer, states, keys[:, :, :0], values[:, :, :0], attend)
+        entry = (premise_kv, states)
+
+        with self._lock:
+            self._premise_tokens_encoded += len(premise_ids)
+            if self.cache_size > 0:
+                self._cache[premise_ids] = entry
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return entry
+
+    def _embed(self, input_ids: Any, offset: int) -> Any:
+        """Token + learned position embeddings, positions starting at offset."""
+        torch = self._torch
+        encoder = self._encoder
+        positions = torch.arange(
+            offset, offset + input_ids.size(1), device=input_ids.device
+        )
+        position_offset = getattr(encoder.embed_positions, "offset", 2)
+        states = encoder.embed_tokens(input_ids) * self._embed_scale
+        states = states + encoder.embed_positions.weight[positions + position_offset]
+        return encoder.layernorm_embedding(states)
+
+    def _project_kv(self, attn: Any, states: Any) -> Tuple[Any, Any]:
+        """Key / value projections split into heads."""
+        return self._heads(attn, attn.k_proj(states)), self._heads(attn, attn.v_proj(states))
+
+    @staticmethod
+    def _heads(attn: Any, tensor: Any) -> Any:
+        """(batch, tokens, dim) → (batch, heads, tokens, head_dim)."""
+        batch, tokens, _ = tensor.shape
+        return tensor.view(batch, tokens, attn.num_heads, attn.head_dim).transpose(1, 2)
+
+    def _layer(self, layer: Any, states: Any, prefix_keys: Any, prefix_values: Any, attend: Any) -> Any:
+        """One BartEncoderLayer (post-norm, eval mode) with a KV prefix."""
+        torch = self._torch
+        attn = layer.self_attn
+        keys, values = self._project_kv(attn, states)
+        keys = torch.cat([prefix_keys, keys], dim=2)
+        values = torch.cat([prefix_values, values], dim=2)
+        queries = self._heads(attn, attn.q_proj(states))
+
+        context = torch.nn.functional.scaled_dot_product_attention(
+            queries, keys, values, attn_mask=attend, scale=attn.scaling
+        )
+        batch, _, tokens, _ = context.shape
+        context = context.transpose(1, 2).reshape(batch, tokens, -1)
+
+        states = layer.self_attn_layer_norm(states + attn.out_proj(context))
+        hidden = layer.fc2(layer.activation_fn(layer.fc1(states)))
+        return layer.final_layer_norm(states + hidden)
+
+    # =========================================================================
+    # Statistics
+    # =========================================================================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get scorer statistics.
+
+        premise_tokens counts message tokens the standard pipeline would
+        encode (once per label); premise_tokens_encoded is what this scorer
+        actually encoded.
+
+        Returns:
+            Dictionary with call, pair and token counters
+        """
+        with self._lock:
+            return {
+                "calls": self._calls,
+                "pairs": self._pairs,
+                "premise_tokens": self._premise_tokens,
+                "premise_tokens_encoded": self._premise_tokens_encoded,
+                "premise_cache_hits": self._cache_hits,
+                "premise_cache_size": len(self._cache),
+            }
+
+    def clear_cache(self) -> None:
+        """Drop cached premise encodings."""
+        with self._lock:
+            self._cache.clear()
+
+
+# =============================================================================
+# FACTORY FUNCTION - Clean Architecture v5.1 Compliance (Rule #1)
+# =============================================================================
+
+
+def create_shared_premise_scorer(
+    pipeline: Any,
+    cache_size: int = DEFAULT_PREMISE_CACHE_SIZE,
+) -> Optional[SharedPremiseScorer]:
+    """
+    Factory function for SharedPremiseScorer.
+
+    Args:
+        pipeline: Loaded zero-shot-classification pipeline
+        cache_size: Premise encodings to keep
+
+    Returns:
+        SharedPremiseScorer, or None when torch is unavailable or the
+        pipeline's model is not a BART-style encoder-decoder
+
+    Example:
+        >>> scorer = create_shared_premise_scorer(classifier._pipeline)
+        >>> scorer("I can't do this anymore", candidate_labels=labels)
+    """
+    try:
+        import torch  # noqa: F401
+    except ImportError:
+        logger.warning("⚠️ Shared-premise scoring needs torch; using the standard pipeline")
+        return None
+
+    model = getattr(pipeline, "model", None)
+    tokenizer = getattr(pipeline, "tokenizer", None)
+    encoder = getattr(getattr(model, "model", None), "encoder", None)
+    if (
+        tokenizer is None
+        or encoder is None
+        or not hasattr(encoder, "layernorm_embedding")
+        or not hasattr(model, "classification_head")
+    ):
+        logger.warning(
+            "⚠️ Shared-premise scoring needs a BART sequence-classification model; "
+            "using the standard pipeline"
+        )
+        return None
+
+    return SharedPremiseScorer(model, tokenizer, cache_size=cache_size)
+
+
+# =============================================================================
+# Export public interface
+# =============================================================================
+
+__all__ = [
+    "SharedPremiseScorer",
+    "create_shared_premise_scorer",
+    "DEFAULT_PREMISE_CACHE_SIZE",
+]
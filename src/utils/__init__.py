@@ -21,11 +21,14 @@ PACKAGE CONTENTS:
 - retry.py: Retry decorator with exponential backoff
 - timeout.py: Timeout wrapper for model inference
 - alerting.py: Discord webhook alerting service
+- alert_outbox.py: Background Discord alert delivery (Phase 8)
 - logging.py: Structured JSON logging
 - metrics.py: Prometheus metrics (optional)
 - cache.py: Response caching layer
 - text_truncation.py: Smart text truncation for long inputs (FE-003)
 - history_debug.py: History validation and debugging utilities (FE-007)
+- timing.py: Per-stage request timing (Phase 8)
+- near_duplicate.py: Near-duplicate message index (Phase 8)
 """
 
 __version__ = "v5.0-6-4.0-1"
@@ -74,6 +77,12 @@ from src.utils.alerting import (
     format_conflict_summary,
 )
 
+# Alert outbox (Phase 8)
+from src.utils.alert_outbox import (
+    AlertOutbox,
+    create_alert_outbox,
+)
+
 # Logging
 from src.utils.logging import (
     JSONFormatter,
@@ -92,14 +101,25 @@ from src.utils.logging import (
 from src.utils.metrics import (
     PROMETHEUS_AVAILABLE,
     record_request,
+    record_http_request,
     record_crisis_detection,
     record_model_inference,
     record_model_error,
     set_models_loaded,
+    record_stage_timings,
+    observe_model_inference,
+    record_engine_request,
+    record_cache_operation,
+    record_vigil_request,
+    record_alert,
     setup_metrics,
+    get_metrics_middleware,
     get_metrics_status,
 )
 
+# Per-stage timing (Phase 8)
+from src.utils.timing import StageTimer
+
 # Cache
 from src.utils.cache import (
     ResponseCache,
@@ -109,6 +129,14 @@ from src.utils.cache import (
     cached_response_async,
 )
 
+# Near-duplicate index (Phase 8)
+from src.utils.near_duplicate import (
+    NearDuplicateIndex,
+    NearDuplicateMatch,
+    create_near_duplicate_index,
+    normalize_message,
+)
+
 # Text Truncation (FE-003)
 from src.utils.text_truncation import (
     TruncationStrategy,
@@ -168,6 +196,9 @@ __all__ = [
     "DEFAULT_CONFLICT_ALERT_THRESHOLD",
     "generate_disagreement_chart",
     "format_conflict_summary",
+    # Alert outbox (Phase 8)
+    "AlertOutbox",
+    "create_alert_outbox",
     # Logging
     "JSONFormatter",
     "HumanFormatter",
@@ -182,18 +213,33 @@ __all__ = [
     # Metrics
     "PROMETHEUS_AVAILABLE",
     "record_request",
+    "record_http_request",
     "record_crisis_detection",
     "record_model_inference",
     "record_model_error",
     "set_models_loaded",
+    "record_stage_timings",
+    "observe_model_inference",
+    "record_engine_request",
+    "record_cache_operation",
+    "record_vigil_request",
+    "record_alert",
     "setup_metrics",
+    "get_metrics_middleware",
     "get_metrics_status",
+    # Timing (Phase 8)
+    "StageTimer",
     # Cache
     "ResponseCache",
     "CacheEntry",
     "create_response_cache",
     "cached_response",
     "cached_response_async",
+    # Near-duplicate index (Phase 8)
+    "NearDuplicateIndex",
+    "NearDuplicateMatch",
+    "create_near_duplicate_index",
+    "normalize_message",
     # Text Truncation (FE-003)
     "TruncationStrategy",
     "TruncationResult",
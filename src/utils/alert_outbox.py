@@ -0,0 +1,633 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+CORE PRINCIPLE: Multi-Model Ensemble → Weighted Decision Engine → Crisis Classification
+******************  CORE SYSTEM VISION (Never to be violated):  ****************
+Ash-NLP is a CRISIS DETECTION BACKEND that:
+1. PRIMARY: Uses BART Zero-Shot Classification for semantic crisis detection
+2. CONTEXTUAL: Enhances with sentiment, irony, and emotion model signals
+3. ENSEMBLE: Combines weighted model outputs through decision engine
+4. PURPOSE: Detect crisis messages in Discord community communications
+********************************************************************************
+Discord Alert Outbox for Ash-NLP Service
+---
+FILE VERSION: v5.0-8-25.0-2
+LAST MODIFIED: 2026-02-24
+PHASE: Phase 8 Step 25.0 - Background Alert Delivery
+CLEAN ARCHITECTURE: v5.2.3 Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+
+RESPONSIBILITIES:
+- Take alerts off the analysis path: enqueue() is O(1), thread-safe and
+  never touches the network (sync analysis threads and the event loop)
+- Deliver queued alerts from one background task over the alerter's
+  pooled aiohttp session
+- Coalesce bursts: an alert identical (severity + title + user) to one
+  still queued only bumps its occurrence count, and up to 10 queued alerts are
+  sent as the embeds of one webhook message
+- Honor Discord rate limits (429 Retry-After, X-RateLimit-Reset-After) and
+  retry 5xx / connection errors with backoff
+- Bound the queue; when full, new alerts are dropped (CRITICAL alerts
+  evict the oldest queued alert instead)
+
+DELIVERY:
+    enqueue(alert) → pending entry (or occurrence count +1) → wake worker
+    worker: wait → linger (collect the burst) → take ≤ 10 entries
+        → POST {"embeds": [...]} → 2xx: sent
+                                  → 429: wait Retry-After, retry
+                                  → 5xx / error: backoff, retry
+                                  → other: failed
+
+USAGE:
+    outbox = create_alert_outbox(alerter, config_manager=config)
+    if outbox:
+        outbox.start()          # also routes alerter sends through it
+        ...
+        await outbox.stop()     # delivers what is still queued
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, replace
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from src.utils.alerting import (
+    DISCORD_LIMITS,
+    USER_AGENT,
+    Alert,
+    AlertSeverity,
+    DiscordAlerter,
+    calculate_embed_size,
+)
+from src.utils.metrics import record_alert
+
+# Module version
+__version__ = "v5.0-8-25.0-2"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Defaults (performance config)
+DEFAULT_MAX_SIZE = 256
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_LINGER_MS = 250
+DEFAULT_MAX_RETRY_AFTER_SECONDS = 60.0
+
+# Webhook request timeout and stop() drain budget
+DEFAULT_REQUEST_TIMEOUT_SECONDS = 10.0
+DEFAULT_DRAIN_TIMEOUT_SECONDS = 5.0
+
+# First backoff for 5xx / connection errors (doubles per attempt)
+BACKOFF_BASE_SECONDS = 0.5
+
+# Delivery latencies kept for get_stats()
+LATENCY_WINDOW = 200
+
+
+# =============================================================================
+# Outbox Entry
+# =============================================================================
+
+
+@dataclass
+class _OutboxEntry:
+    """A queued alert and how many identical alerts it stands for."""
+
+    alert: Alert
+    key: Tuple[str, str, str]
+    enqueued_at: float
+    count: int = 1
+
+    def to_embed(self) -> Dict[str, Any]:
+        """Render the Discord embed, noting coalesced occurrences."""
+        alert = self.alert
+        if self.count > 1:
+            alert = replace(
+                alert, fields={**alert.fields, "Occurrences": str(self.count)}
+            )
+        return alert.to_discord_embed()
+
+
+# =============================================================================
+# Alert Outbox
+# =============================================================================
+
+
+class AlertOutbox:
+    """
+    Bounded alert queue drained by a background delivery task.
+
+    enqueue() may be called from any thread; delivery runs on the event
+    loop that called start(). While running, the alerter's send methods
+    enqueue here instead of posting to the webhook themselves.
+
+    Clean Architecture v5.2.3 Compliance:
+    - Factory function: create_alert_outbox()
+    - Alerter injected (webhook URL and pooled session)
+    """
+
+    def __init__(
+        self,
+        alerter: DiscordAlerter,
+        max_size: int = DEFAULT_MAX_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        linger_ms: float = DEFAULT_LINGER_MS,
+        max_retry_after_seconds: float = DEFAULT_MAX_RETRY_AFTER_SECONDS,
+        request_timeout_seconds: float = DEFAULT_REQUEST_TIMEOUT_SECONDS,
+    ):
+        """
+        Initialize AlertOutbox.
+
+        Args:
+            alerter: DiscordAlerter providing the webhook URL and session
+            max_size: Queued alerts before new ones are dropped
+            max_retries: Retries per webhook message (429, 5xx, errors)
+            linger_ms: Wait after the first alert of a burst before sending
+            max_retry_after_seconds: Longest rate limit waited out; longer
+                Retry-After values fail the message
+            request_timeout_seconds: Timeout of one webhook request
+
+        Note:
+            Use create_alert_outbox() factory function instead.
+        """
+        self.alerter = alerter
+        self.max_size = max(1, int(max_size))
+        self.max_retries = max(0, int(max_retries))
+        self.linger_seconds = max(0.0, linger_ms / 1000.0)
+        self.max_retry_after_seconds = max_retry_after_seconds
+        self.request_timeout_seconds = request_timeout_seconds
+
+        # Queue state (guarded by _lock; enqueue() runs on any thread)
+        self._lock = threading.Lock()
+        self._queue: Deque[_OutboxEntry] = deque()
+        self._pending: Dict[Tuple[str, str, str], _OutboxEntry] = {}
+        self._wakeup_scheduled = False
+
+        # Worker state (event loop thread only)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+        self._blocked_until = 0.0
+        self._timeout = None
+
+        # Statistics
+        self._enqueued = 0
+        self._coalesced = 0
+        self._dropped = 0
+        self._delivered = 0
+        self._failed = 0
+        self._messages = 0
+        self._retries = 0
+        self._rate_limited = 0
+        self._latencies_ms: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._last_error: Optional[str] = None
+
+    # =========================================================================
+    # Enqueue (any thread)
+    # =========================================================================
+
+    def enqueue(self, alert: Alert) -> bool:
+        """
+        Queue an alert for background delivery.
+
+        Args:
+            alert: Alert to deliver
+
+        Returns:
+            True if queued or coalesced, False if dropped
+        """
+        # Alerts about different users are never merged
+        key = (alert.severity.name, alert.title, alert.fields.get("User ID", ""))
+        evicted: Optional[_OutboxEntry] = None
+
+        with self._lock:
+            entry = self._pending.get(key)
+            if entry is not None:
+                entry.count += 1
+                self._coalesced += 1
+                return True
+
+            full = len(self._queue) >= self.max_size
+            if full and alert.severity is not AlertSeverity.CRITICAL:
+                self._dropped += 1
+            else:
+                if full:
+                    evicted = self._queue.popleft()
+                    del self._pending[evicted.key]
+                    self._dropped += evicted.count
+                entry = _OutboxEntry(
+                    alert=alert, key=key, enqueued_at=time.perf_counter()
+                )
+                self._queue.append(entry)
+                self._pending[key] = entry
+                self._enqueued += 1
+                notify = not self._wakeup_scheduled
+                self._wakeup_scheduled = True
+
+        if entry is None:
+            record_alert(alert.severity.name.lower(), "dropped")
+            logger.debug(f"🔕 Alert outbox full, dropped: {alert.title}")
+            return False
+
+        if evicted is not None:
+            record_alert(evicted.alert.severity.name.lower(), "dropped")
+            logger.warning(
+                f"🔕 Alert outbox full, evicted '{evicted.alert.title}' "
+                f"for critical alert"
+            )
+
+        if notify:
+            self._notify()
+        return True
+
+    def _notify(self) -> None:
+        """Wake the worker from whichever thread enqueued."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(self._wakeup.set)
+        except RuntimeError:
+            # Loop shutting down; stop() drains or counts what is left
+            pass
+
+    @property
+    def queue_depth(self) -> int:
+        """Alerts waiting for delivery."""
+        return len(self._queue)
+
+    # =========================================================================
+    # Delivery (event loop)
+    # =========================================================================
+
+    def _take_batch(self) -> List[_OutboxEntry]:
+        """Remove up to one webhook message worth of entries from the queue."""
+        limit = DISCORD_LIMITS["embeds_per_message"]
+        with self._lock:
+            batch = []
+            while self._queue and len(batch) < limit:
+                entry = self._queue.popleft()
+                del self._pending[entry.key]
+                batch.append(entry)
+            return batch
+
+    async def _drain(self) -> None:
+        """Deliver everything queued, one webhook message at a time."""
+        while True:
+            batch = self._take_batch()
+            if not batch:
+                return
+
+            messages = self._split_messages(batch)
+            for i, message in enumerate(messages):
+                try:
+                    await self._deliver(message)
+                except asyncio.CancelledError:
+                    # stop() ran out of time; taken alerts count as dropped
+                    self._dropped += sum(
+                        entry.count for pending in messages[i:] for entry, _ in pending
+                    )
+                    raise
+
+    @staticmethod
+    def _split_messages(
+        batch: List[_OutboxEntry],
+    ) -> List[List[Tuple[_OutboxEntry, Dict[str, Any]]]]:
+        """Render embeds and split them by Discord's total embed size."""
+        messages: List[List[Tuple[_OutboxEntry, Dict[str, Any]]]] = [[]]
+        size = 0
+        for entry in batch:
+            embed = entry.to_embed()
+            embed_size = calculate_embed_size(embed)
+            if messages[-1] and size + embed_size > DISCORD_LIMITS["embed_total"]:
+                messages.append([])
+                size = 0
+            messages[-1].append((entry, embed))
+            size += embed_size
+        return messages
+
+    async def _deliver(self, message: List[Tuple[_OutboxEntry, Dict[str, Any]]]) -> bool:
+        """
+        POST one webhook message, retrying per Discord's rate limits.
+
+        Args:
+            message: Entries and their rendered embeds
+
+        Returns:
+            True if Discord accepted the message
+        """
+        payload = {"embeds": [embed for _, embed in message]}
+        attempt = 0
+
+        while True:
+            wait = self._blocked_until - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            post_start = time.perf_counter()
+            retry_after: Optional[float] = None
+            try:
+                session = await self.alerter._get_session()
+                async with session.post(
+                    self.alerter.webhook_url,
+                    json=payload,
+                    headers={
+                        "Content-Type": "application/json",
+                        "User-Agent": USER_AGENT,
+                    },
+                    timeout=self._request_timeout(),
+                ) as response:
+                    post_ms = (time.perf_counter() - post_start) * 1000
+                    self._observe_rate_limit(response.headers)
+                    if 200 <= response.status < 300:
+                        self._record_delivered(message, post_ms)
+                        return True
+
+                    body = await response.text()
+                    self._last_error = f"{response.status} - {body[:200]}"
+                    if response.status == 429:
+                        self._rate_limited += 1
+                        retry_after = self._retry_after(response.headers, body)
+                        if retry_after > self.max_retry_after_seconds:
+                            logger.error(
+                                f"❌ Discord rate limit of {retry_after:.1f}s exceeds "
+                                f"{self.max_retry_after_seconds:.0f}s, giving up"
+                            )
+                            retry_after = None
+                            attempt = self.max_retries
+                    elif response.status >= 500:
+                        retry_after = BACKOFF_BASE_SECONDS * (2 ** attempt)
+                    else:
+                        attempt = self.max_retries
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._last_error = str(e)
+                retry_after = BACKOFF_BASE_SECONDS * (2 ** attempt)
+
+            if retry_after is None or attempt >= self.max_retries:
+                self._record_failed(message)
+                return False
+
+            attempt += 1
+            self._retries += 1
+            logger.debug(
+                f"🔁 Alert delivery retry {attempt}/{self.max_retries} "
+                f"in {retry_after:.2f}s ({self._last_error})"
+            )
+            await asyncio.sleep(min(retry_after, self.max_retry_after_seconds))
+
+    def _request_timeout(self) -> Any:
+        """aiohttp timeout for one webhook request (built once, lazily)."""
+        if self._timeout is None:
+            import aiohttp
+
+            self._timeout = aiohttp.ClientTimeout(total=self.request_timeout_seconds)
+        return self._timeout
+
+    @staticmethod
+    def _retry_after(headers: Any, body: str) -> float:
+        """Seconds to wait from a 429 (Retry-After header or JSON body)."""
+        value = headers.get("Retry-After")
+        if value is None:
+            try:
+                value = json.loads(body).get("retry_after")
+            except (ValueError, AttributeError):
+                value = None
+        try:
+            return max(0.0, float(value))
+        except (TypeError, ValueError):
+            return 1.0
+
+    def _observe_rate_limit(self, headers: Any) -> None:
+        """Hold the next request when Discord reports an exhausted bucket."""
+        if headers.get("X-RateLimit-Remaining") != "0":
+            return
+        try:
+            reset_after = float(headers.get("X-RateLimit-Reset-After", 0))
+        except (TypeError, ValueError):
+            return
+        self._blocked_until = time.monotonic() + min(
+            reset_after, self.max_retry_after_seconds
+        )
+
+    def _record_delivered(
+        self, message: List[Tuple[_OutboxEntry, Dict[str, Any]]], post_ms: float
+    ) -> None:
+        """Count a delivered webhook message and its alerts."""
+        now = time.perf_counter()
+        self._messages += 1
+        self._last_error = None
+        for entry, _ in message:
+            latency_ms = (now - entry.enqueued_at) * 1000
+            self._delivered += entry.count
+            self._latencies_ms.append(latency_ms)
+            record_alert(entry.alert.severity.name.lower(), "sent", post_ms)
+            logger.info(
+                f"🔔 Alert sent: {entry.alert.title}"
+                + (f" (×{entry.count})" if entry.count > 1 else "")
+            )
+
+    def _record_failed(self, message: List[Tuple[_OutboxEntry, Dict[str, Any]]]) -> None:
+        """Count the alerts of an undeliverable webhook message."""
+        for entry, _ in message:
+            self._failed += entry.count
+            record_alert(entry.alert.severity.name.lower(), "failed")
+        logger.error(
+            f"❌ Failed to deliver {len(message)} alert(s): {self._last_error}"
+        )
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    def start(self) -> None:
+        """Start the delivery task on the running loop and attach to the alerter."""
+        if self._task is not None and not self._task.done():
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._running = True
+        self._task = self._loop.create_task(self._run_loop())
+        self.alerter.set_outbox(self)
+        if self._queue:
+            self._wakeup.set()
+        logger.info(
+            f"📮 Alert outbox started (max {self.max_size} queued, "
+            f"linger {self.linger_seconds * 1000:.0f}ms)"
+        )
+
+    async def stop(self, timeout: float = DEFAULT_DRAIN_TIMEOUT_SECONDS) -> None:
+        """
+        Stop accepting alerts, deliver what is queued, and stop the task.
+
+        Args:
+            timeout: Seconds to spend delivering queued alerts
+        """
+        self._running = False
+        if self._task is None:
+            return
+        self.alerter.set_outbox(None)
+        self._wakeup.set()
+        dropped_before = self._dropped
+        try:
+            await asyncio.wait_for(self._task, timeout)
+        except asyncio.TimeoutError:
+            pass
+
+        with self._lock:
+            self._dropped += sum(entry.count for entry in self._queue)
+            self._queue.clear()
+            self._pending.clear()
+        undelivered = self._dropped - dropped_before
+        if undelivered:
+            logger.warning(
+                f"🔕 Alert outbox stopped with {undelivered} undelivered alert(s)"
+            )
+
+        self._task = None
+        logger.info("🛑 Alert outbox stopped")
+
+    async def _run_loop(self) -> None:
+        """Wait for alerts, let the burst settle, deliver; until stopped."""
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            with self._lock:
+                self._wakeup_scheduled = False
+
+            if self._running and self.linger_seconds:
+                await asyncio.sleep(self.linger_seconds)
+            try:
+                await self._drain()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._last_error = str(e)
+                logger.error(f"❌ Alert outbox delivery failed: {e}", exc_info=True)
+
+            if not self._running:
+                return
+
+    @property
+    def is_running(self) -> bool:
+        """Whether alerts are being accepted and delivered."""
+        return self._running and self._task is not None and not self._task.done()
+
+    # =========================================================================
+    # Statistics
+    # =========================================================================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get outbox statistics.
+
+        Returns:
+            Dictionary with queue depth, counters and delivery latency
+            (enqueue → accepted by Discord, last 200 alerts)
+        """
+        latencies = sorted(self._latencies_ms)
+        if latencies:
+            delivery_ms = {
+                "mean": round(sum(latencies) / len(latencies), 2),
+                "p50": round(latencies[len(latencies) // 2], 2),
+                "p95": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 2),
+                "max": round(latencies[-1], 2),
+            }
+        else:
+            delivery_ms = None
+
+        return {
+            "running": self.is_running,
+            "queue_depth": self.queue_depth,
+            "max_size": self.max_size,
+            "enqueued": self._enqueued,
+            "coalesced": self._coalesced,
+            "dropped": self._dropped,
+            "delivered": self._delivered,
+            "failed": self._failed,
+            "webhook_messages": self._messages,
+            "retries": self._retries,
+            "rate_limited": self._rate_limited,
+            "delivery_ms": delivery_ms,
+            "last_error": self._last_error,
+        }
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return (
+            f"AlertOutbox(depth={self.queue_depth}, delivered={self._delivered}, "
+            f"dropped={self._dropped}, running={self.is_running})"
+        )
+
+
+# =============================================================================
+# FACTORY FUNCTION - Clean Architecture v5.1 Compliance (Rule #1)
+# =============================================================================
+
+
+def create_alert_outbox(
+    alerter: Optional[DiscordAlerter],
+    config_manager: Any = None,
+    **overrides: Any,
+) -> Optional[AlertOutbox]:
+    """
+    Factory function for AlertOutbox.
+
+    Args:
+        alerter: DiscordAlerter whose alerts the outbox delivers
+        config_manager: ConfigManager (performance.alert_outbox_* settings)
+        **overrides: AlertOutbox arguments taking precedence
+
+    Returns:
+        AlertOutbox, or None when there is nothing to deliver (no alerter,
+        alerting disabled, testing mode) or performance.alert_outbox_enabled
+        is off
+
+    Example:
+        >>> outbox = create_alert_outbox(alerter, config_manager=config)
+        >>> if outbox:
+        ...     outbox.start()
+    """
+    if alerter is None or not alerter.enabled:
+        return None
+
+    settings: Dict[str, Any] = {}
+    if config_manager is not None:
+        perf_config = config_manager.get_performance_config() or {}
+        if not perf_config.get("alert_outbox_enabled", True):
+            logger.debug("Alert outbox disabled by configuration")
+            return None
+        settings = {
+            "max_size": perf_config.get("alert_outbox_max_size", DEFAULT_MAX_SIZE),
+            "max_retries": perf_config.get(
+                "alert_outbox_max_retries", DEFAULT_MAX_RETRIES
+            ),
+            "linger_ms": perf_config.get("alert_outbox_linger_ms", DEFAULT_LINGER_MS),
+            "max_retry_after_seconds": perf_config.get(
+                "alert_outbox_max_retry_after_seconds", DEFAULT_MAX_RETRY_AFTER_SECONDS
+            ),
+        }
+
+    settings.update(overrides)
+    return AlertOutbox(alerter, **settings)
+
+
+# =============================================================================
+# Export public interface
+# =============================================================================
+
+__all__ = [
+    "AlertOutbox",
+    "create_alert_outbox",
+    "DEFAULT_MAX_SIZE",
+    "DEFAULT_MAX_RETRIES",
+    "DEFAULT_LINGER_MS",
+    "DEFAULT_MAX_RETRY_AFTER_SECONDS",
+]
@@ -10,9 +10,9 @@ Ash-NLP is a CRISIS DETECTION BACKEND that:
 ********************************************************************************
 Discord Alerting Service for Ash-NLP
 ---
-FILE VERSION: v5.0-6-4.0-4
-LAST MODIFIED: 2026-01-02
-PHASE: Phase 6 - Sprint 4 (FE-002, FE-008, FE-011: Enhanced Conflict Alerts)
+FILE VERSION: v5.0-8-25.0-2
+LAST MODIFIED: 2026-02-24
+PHASE: Phase 8 Step 25.0 - Background Alert Delivery
 CLEAN ARCHITECTURE: v5.1 Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-nlp
 Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
@@ -24,6 +24,9 @@ RESPONSIBILITIES:
 - Support async and sync operations
 - Phase 4: Send conflict alerts for ensemble disagreements
 - Phase 5: Send escalation alerts for crisis pattern detection
+- Phase 8: Export alert outcomes and webhook latency to metrics
+- Phase 8: Hand alerts to an attached AlertOutbox (background delivery)
+  instead of posting from the caller's thread or task
 
 WEBHOOK SETUP:
 1. Create webhook in Discord server (Server Settings > Integrations > Webhooks)
@@ -51,8 +54,10 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional
 
+from src.utils.metrics import record_alert
+
 # Module version
-__version__ = "v5.0-6-4.0-4"
+__version__ = "v5.0-8-25.0-2"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -560,10 +565,15 @@ class DiscordAlerter:
         # Phase 5: Escalation alert cooldown
         self._escalation_cooldown_seconds = escalation_cooldown_seconds
         self._last_escalation_alert = 0.0
+        # Phase 8: Keyed escalation cooldowns (e.g. one per swept user)
+        self._last_escalation_alert_by_key: Dict[str, float] = {}
 
         # HTTP session (lazy init)
         self._session = None
 
+        # Phase 8: Background delivery (set by AlertOutbox.start())
+        self._outbox = None
+
         if self._testing_mode:
             logger.info(f"🧪 Discord alerter in TESTING MODE for {service_name} (webhooks suppressed)")
         elif self.enabled:
@@ -585,6 +595,28 @@ class DiscordAlerter:
             await self._session.close()
             self._session = None
 
+    def set_outbox(self, outbox) -> None:
+        """
+        Route sends through an AlertOutbox (Phase 8).
+
+        While the outbox is running, send_alert() and send_alert_sync()
+        only enqueue; None restores direct webhook posts.
+
+        Args:
+            outbox: AlertOutbox instance, or None to detach
+        """
+        self._outbox = outbox
+
+    def _enqueue(self, alert: Alert) -> Optional[bool]:
+        """Queue an alert on the running outbox; None when there is none."""
+        outbox = self._outbox
+        if outbox is None or not outbox.is_running:
+            return None
+        queued = outbox.enqueue(alert)
+        if queued:
+            self._record_alert()
+        return queued
+
     # =========================================================================
     # Throttling
     # =========================================================================
@@ -631,14 +663,33 @@ class DiscordAlerter:
         """Record a conflict alert timestamp (Phase 4)."""
         self._last_conflict_alert = time.time()
 
-    def _should_throttle_escalation(self) -> bool:
-        """Check if escalation alert should be throttled (Phase 5)."""
+    def _should_throttle_escalation(self, throttle_key: Optional[str] = None) -> bool:
+        """
+        Check if escalation alert should be throttled (Phase 5).
+
+        Args:
+            throttle_key: Cooldown key (None = the shared escalation cooldown)
+        """
         now = time.time()
-        return now - self._last_escalation_alert < self._escalation_cooldown_seconds
+        if throttle_key is None:
+            last = self._last_escalation_alert
+        else:
+            last = self._last_escalation_alert_by_key.get(throttle_key, 0.0)
+        return now - last < self._escalation_cooldown_seconds
 
-    def _record_escalation_alert(self):
+    def _record_escalation_alert(self, throttle_key: Optional[str] = None):
         """Record an escalation alert timestamp (Phase 5)."""
-        self._last_escalation_alert = time.time()
+        now = time.time()
+        if throttle_key is None:
+            self._last_escalation_alert = now
+            return
+        # Drop keys whose cooldown has passed so the map stays small
+        self._last_escalation_alert_by_key = {
+            key: ts
+            for key, ts in self._last_escalation_alert_by_key.items()
+            if now - ts < self._escalation_cooldown_seconds
+        }
+        self._last_escalation_alert_by_key[throttle_key] = now
 
     # =========================================================================
     # Send Methods
@@ -714,20 +765,31 @@ class DiscordAlerter:
             alert: Alert to send
 
         Returns:
-            True if sent successfully
+            True if sent successfully (or queued on the running outbox)
         """
+        severity = alert.severity.name.lower()
+
         # Phase 6 FE-009: Handle testing mode
         if self._testing_mode:
+            record_alert(severity, "suppressed")
             return self._handle_testing_mode_alert(alert)
 
         if not self.enabled:
             logger.debug(f"Alert skipped (disabled): {alert.title}")
+            record_alert(severity, "disabled")
             return False
 
         if self._should_throttle():
             logger.warning(f"Alert throttled: {alert.title}")
+            record_alert(severity, "throttled")
             return False
 
+        # Phase 8: Background delivery
+        queued = self._enqueue(alert)
+        if queued is not None:
+            return queued
+
+        start_time = time.perf_counter()
         try:
             session = await self._get_session()
 
@@ -743,16 +805,20 @@ class DiscordAlerter:
                     "User-Agent": USER_AGENT,
                 },
             ) as response:
+                delivery_ms = (time.perf_counter() - start_time) * 1000
                 if response.status == 204:
                     self._record_alert()
+                    record_alert(severity, "sent", delivery_ms)
                     logger.info(f"🔔 Alert sent: {alert.title}")
                     return True
                 else:
                     body = await response.text()
+                    record_alert(severity, "failed", delivery_ms)
                     logger.error(f"Discord webhook failed: {response.status} - {body}")
                     return False
 
         except Exception as e:
+            record_alert(severity, "failed")
             logger.error(f"Failed to send alert: {e}")
             return False
 
@@ -764,19 +830,30 @@ class DiscordAlerter:
             alert: Alert to send
 
         Returns:
-            True if sent successfully
+            True if sent successfully (or queued on the running outbox)
         """
+        severity = alert.severity.name.lower()
+
         # Phase 6 FE-009: Handle testing mode
         if self._testing_mode:
+            record_alert(severity, "suppressed")
             return self._handle_testing_mode_alert(alert)
 
         if not self.enabled:
+            record_alert(severity, "disabled")
             return False
 
         if self._should_throttle():
             logger.warning(f"Alert throttled: {alert.title}")
+            record_alert(severity, "throttled")
             return False
 
+        # Phase 8: Background delivery (no blocking request on this thread)
+        queued = self._enqueue(alert)
+        if queued is not None:
+            return queued
+
+        start_time = time.perf_counter()
         try:
             import urllib.request
 
@@ -793,14 +870,17 @@ class DiscordAlerter:
             )
 
             with urllib.request.urlopen(req, timeout=10) as response:
+                delivery_ms = (time.perf_counter() - start_time) * 1000
                 if response.status == 204:
                     self._record_alert()
+                    record_alert(severity, "sent", delivery_ms)
                     logger.info(f"🔔 Alert sent (sync): {alert.title}")
                     return True
 
         except Exception as e:
             logger.error(f"Failed to send alert (sync): {e}")
 
+        record_alert(severity, "failed")
         return False
 
     # =========================================================================
@@ -1066,6 +1146,7 @@ class DiscordAlerter:
         user_id: Optional[str] = None,
         channel_id: Optional[str] = None,
         source: str = "context_analyzer",
+        throttle_key: Optional[str] = None,
     ) -> bool:
         """
         Send an alert for crisis escalation detection (Phase 5).
@@ -1082,6 +1163,8 @@ class DiscordAlerter:
             user_id: Optional user identifier
             channel_id: Optional channel identifier
             source: Source component
+            throttle_key: Escalation cooldown key (None = shared cooldown;
+                the escalation sweep uses one key per user)
 
         Returns:
             True if alert sent successfully
@@ -1098,7 +1181,7 @@ class DiscordAlerter:
             return False
 
         # Check escalation-specific cooldown (applies in both modes)
-        if self._should_throttle_escalation():
+        if self._should_throttle_escalation(throttle_key):
             logger.debug(f"Escalation alert on cooldown: {escalation_rate}")
             return False
 
@@ -1162,7 +1245,7 @@ class DiscordAlerter:
 
         result = await self.send_alert(alert)
         if result:
-            self._record_escalation_alert()
+            self._record_escalation_alert(throttle_key)
         return result
 
     def send_escalation_alert_sync(
@@ -1178,6 +1261,7 @@ class DiscordAlerter:
         user_id: Optional[str] = None,
         channel_id: Optional[str] = None,
         source: str = "context_analyzer",
+        throttle_key: Optional[str] = None,
     ) -> bool:
         """
         Send an escalation alert synchronously (Phase 5).
@@ -1194,6 +1278,8 @@ class DiscordAlerter:
             user_id: Optional user identifier
             channel_id: Optional channel identifier
             source: Source component
+            throttle_key: Escalation cooldown key (None = shared cooldown;
+                the escalation sweep uses one key per user)
 
         Returns:
             True if alert sent successfully
@@ -1206,7 +1292,7 @@ class DiscordAlerter:
         if not self._testing_mode and not self.enabled:
             return False
 
-        if self._should_throttle_escalation():
+        if self._should_throttle_escalation(throttle_key):
             logger.debug(f"Escalation alert on cooldown: {escalation_rate}")
             return False
 
@@ -1243,7 +1329,7 @@ class DiscordAlerter:
 
         result = self.send_alert_sync(alert)
         if result:
-            self._record_escalation_alert()
+            self._record_escalation_alert(throttle_key)
         return result
 
     # =========================================================================
@@ -1400,6 +1486,7 @@ class DiscordAlerter:
                 self._escalation_cooldown_seconds
                 - (time.time() - self._last_escalation_alert),
             ),
+            "escalation_cooldown_keys": len(self._last_escalation_alert_by_key),
             "throttle_config": {
                 "window_seconds": self.throttle.window_seconds,
                 "max_alerts": self.throttle.max_alerts,
@@ -1407,6 +1494,7 @@ class DiscordAlerter:
                 "conflict_cooldown_seconds": self._conflict_cooldown_seconds,
                 "escalation_cooldown_seconds": self._escalation_cooldown_seconds,
             },
+            "outbox": self._outbox.get_stats() if self._outbox is not None else None,
         }
 
 
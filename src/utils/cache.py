@@ -10,9 +10,9 @@ Ash-NLP is a CRISIS DETECTION BACKEND that:
 ********************************************************************************
 Response Cache for Ash-NLP Service
 ---
-FILE VERSION: v5.0-3-7.4-1
-LAST MODIFIED: 2026-01-01
-PHASE: Phase 3 Step 7.4 - Response Caching
+FILE VERSION: v5.0-8-21.0-2
+LAST MODIFIED: 2026-02-20
+PHASE: Phase 8 Step 21.0 - Versioned Crisis Label Sets
 CLEAN ARCHITECTURE: v5.1 Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-nlp
 Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
@@ -25,10 +25,13 @@ RESPONSIBILITIES:
 - Memory-bounded cache with LRU eviction
 
 CACHE STRATEGY:
-- Key: Hash of normalized message text
+- Key: Hash of namespace + normalized message text (the engine uses the
+  BART label set hash as namespace, so each label set has its own entries)
 - Value: CrisisAssessment result
 - TTL: Configurable (default 5 minutes)
 - Max Size: Configurable (default 1000 entries)
+- Version: Entries carry the config version they were computed under;
+  set_version() makes every older entry a miss ("stale") without a scan
 
 USAGE:
     from src.utils import ResponseCache, create_response_cache
@@ -55,8 +58,10 @@ from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Any, Dict, Generic, Optional, TypeVar
 
+from src.utils.metrics import record_cache_operation
+
 # Module version
-__version__ = "v5.0-3-7.4-1"
+__version__ = "v5.0-8-21.0-2"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -80,12 +85,14 @@ class CacheEntry(Generic[T]):
         created_at: Timestamp when entry was created
         expires_at: Timestamp when entry expires
         hits: Number of times entry was accessed
+        version: Config version the value was computed under
     """
 
     value: T
     created_at: float
     expires_at: float
     hits: int = 0
+    version: int = 0
 
     def is_expired(self) -> bool:
         """Check if entry has expired."""
@@ -139,10 +146,14 @@ class ResponseCache(Generic[T]):
         # Lock for thread safety
         self._lock = threading.RLock()
 
+        # Config version; entries from other versions are stale
+        self.version: int = 0
+
         # Statistics
         self._hits: int = 0
         self._misses: int = 0
         self._evictions: int = 0
+        self._stale: int = 0
 
         logger.debug(
             f"ResponseCache initialized (max_size={max_size}, ttl={ttl_seconds}s)"
@@ -152,39 +163,61 @@ class ResponseCache(Generic[T]):
     # Core Operations
     # =========================================================================
 
-    def get(self, key: str) -> Optional[T]:
+    def get(self, key: str, namespace: str = "") -> Optional[T]:
         """
         Get a value from the cache.
 
         Args:
             key: Cache key (message text)
+            namespace: Key namespace (e.g. label set hash)
 
         Returns:
             Cached value or None if not found/expired
         """
-        cache_key = self._make_key(key)
+        cache_key = self._make_key(key, namespace)
 
         with self._lock:
             entry = self._cache.get(cache_key)
 
             if entry is None:
                 self._misses += 1
-                return None
+                operation = "miss"
+                value = None
 
             # Check expiration
-            if entry.is_expired():
+            elif entry.is_expired():
                 self._remove_entry(cache_key)
                 self._misses += 1
-                return None
+                operation = "expired"
+                value = None
 
-            # Move to end (LRU update)
-            self._cache.move_to_end(cache_key)
-            entry.touch()
-            self._hits += 1
+            # Computed under an older configuration
+            elif entry.version != self.version:
+                self._remove_entry(cache_key)
+                self._misses += 1
+                self._stale += 1
+                operation = "stale"
+                value = None
 
-            return entry.value
+            else:
+                # Move to end (LRU update)
+                self._cache.move_to_end(cache_key)
+                entry.touch()
+                self._hits += 1
+                operation = "hit"
+                value = entry.value
 
-    def set(self, key: str, value: T, ttl_override: Optional[float] = None) -> None:
+        record_cache_operation(operation)
+        return value
+
+    def set(
+        self,
+        key: str,
+        value: T,
+        ttl_override: Optional[float] = None,
+        version: Optional[int] = None,
+        namespace: str = "",
+    ) -> None:
         """
         Store a value in the cache.
 
@@ -192,18 +225,32 @@ class ResponseCache(Generic[T]):
             key: Cache key (message text)
             value: Value to cache
             ttl_override: Override default TTL for this entry
+            version: Config version the value was computed under
+                (default: current); an older version is never stored
+            namespace: Key namespace (e.g. label set hash)
         """
-        cache_key = self._make_key(key)
+        if self.max_size <= 0:
+            # Cache disabled (e.g. cache_enabled=false): nothing to evict
+            return
+
+        cache_key = self._make_key(key, namespace)
         ttl = ttl_override if ttl_override is not None else self.ttl_seconds
         now = time.time()
 
-        entry = CacheEntry(
-            value=value,
-            created_at=now,
-            expires_at=now + ttl,
-        )
-
         with self._lock:
+            if version is None:
+                version = self.version
+            elif version != self.version:
+                # Computed before a reload; caching it would serve old config
+                return
+
+            entry = CacheEntry(
+                value=value,
+                created_at=now,
+                expires_at=now + ttl,
+                version=version,
+            )
+
             # Remove existing entry if present
             if cache_key in self._cache:
                 del self._cache[cache_key]
@@ -215,17 +262,18 @@ class ResponseCache(Generic[T]):
             # Add new entry
             self._cache[cache_key] = entry
 
-    def delete(self, key: str) -> bool:
+    def delete(self, key: str, namespace: str = "") -> bool:
         """
         Delete an entry from the cache.
 
         Args:
             key: Cache key
+            namespace: Key namespace
 
         Returns:
             True if entry was deleted
         """
-        cache_key = self._make_key(key)
+        cache_key = self._make_key(key, namespace)
 
         with self._lock:
             if cache_key in self._cache:
@@ -246,22 +294,38 @@ class ResponseCache(Generic[T]):
             logger.info(f"Cache cleared ({count} entries)")
             return count
 
-    def contains(self, key: str) -> bool:
+    def contains(self, key: str, namespace: str = "") -> bool:
         """
         Check if key exists and is not expired.
 
         Args:
             key: Cache key
+            namespace: Key namespace
 
         Returns:
             True if key exists and is valid
         """
-        return self.get(key) is not None
+        return self.get(key, namespace) is not None
 
     # =========================================================================
     # Maintenance
     # =========================================================================
 
+    def set_version(self, version: int) -> None:
+        """
+        Switch to a new config version.
+
+        Entries from other versions become misses on their next read (and
+        are dropped then, or by LRU eviction), so this is O(1).
+
+        Args:
+            version: New config version
+        """
+        with self._lock:
+            if version != self.version:
+                self.version = version
+                logger.debug(f"Cache config version set to {version}")
+
     def cleanup_expired(self) -> int:
         """
         Remove all expired entries.
@@ -291,6 +355,7 @@ class ResponseCache(Generic[T]):
             oldest_key = next(iter(self._cache))
             del self._cache[oldest_key]
             self._evictions += 1
+            record_cache_operation("eviction")
 
     def _remove_entry(self, cache_key: str) -> None:
         """Remove a specific entry."""
@@ -301,7 +366,7 @@ class ResponseCache(Generic[T]):
     # Key Management
     # =========================================================================
 
-    def _make_key(self, text: str) -> str:
+    def _make_key(self, text: str, namespace: str = "") -> str:
         """
         Create a cache key from text.
 
@@ -309,12 +374,15 @@ class ResponseCache(Generic[T]):
 
         Args:
             text: Original text
+            namespace: Key namespace (not normalized)
 
         Returns:
             Cache key string
         """
         if self.normalize_keys:
             text = text.lower().strip()
+        if namespace:
+            text = f"{namespace}\x00{text}"
 
         # Use hash for consistent key length
         return hashlib.md5(text.encode("utf-8")).hexdigest()
@@ -342,6 +410,8 @@ class ResponseCache(Generic[T]):
                 "misses": self._misses,
                 "hit_rate": round(hit_rate, 4),
                 "evictions": self._evictions,
+                "stale": self._stale,
+                "version": self.version,
             }
 
     def reset_stats(self) -> None:
@@ -350,6 +420,7 @@ class ResponseCache(Generic[T]):
             self._hits = 0
             self._misses = 0
             self._evictions = 0
+            self._stale = 0
 
     # =========================================================================
     # Context Manager
@@ -10,9 +10,9 @@ Ash-NLP is a CRISIS DETECTION BACKEND that:
 ********************************************************************************
 Prometheus Metrics for Ash-NLP Service (Optional)
 ---
-FILE VERSION: v5.0-3-6.3-1
-LAST MODIFIED: 2026-01-01
-PHASE: Phase 3 Step 6.3 - Performance Profiling
+FILE VERSION: v5.0-8-12.0-1
+LAST MODIFIED: 2026-02-11
+PHASE: Phase 8 Step 12.0 - Fused ASGI Middleware
 CLEAN ARCHITECTURE: v5.1 Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-nlp
 Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
@@ -30,6 +30,14 @@ METRICS:
 - ash_nlp_model_inference_duration_seconds: Model inference latency
 - ash_nlp_model_errors_total: Model failures
 - ash_nlp_models_loaded: Number of loaded models
+- ash_nlp_stage_duration_seconds: Per-stage engine latency (Phase 8)
+- ash_nlp_engine_requests_total / ash_nlp_engine_duration_seconds: Engine
+  analyses by outcome (inference, cache_hit, error) (Phase 8)
+- ash_nlp_cache_operations_total: Response cache hits/misses/evictions (Phase 8)
+- ash_nlp_vigil_requests_total / ash_nlp_vigil_duration_seconds: Ash-Vigil
+  calls by status (Phase 8)
+- ash_nlp_alerts_total / ash_nlp_alert_delivery_seconds: Discord alerts by
+  severity and outcome (Phase 8)
 - ash_nlp_gpu_memory_bytes: GPU memory usage (if available)
 
 USAGE:
@@ -48,6 +56,11 @@ USAGE:
 
 NOTE: This module is OPTIONAL. If prometheus_client is not installed,
 a no-op implementation is used and metrics are simply logged.
+
+HOT PATH (Phase 8):
+    The observe_*/record_* helpers called per request return immediately
+    when prometheus_client is absent, and cache labelled children so the
+    per-call cost with Prometheus is one dict lookup plus observe().
 """
 
 import logging
@@ -56,7 +69,7 @@ from contextlib import contextmanager
 from typing import Any, Callable, Dict, Optional
 
 # Module version
-__version__ = "v5.0-3-6.3-1"
+__version__ = "v5.0-8-12.0-1"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -80,6 +93,24 @@ except ImportError:
     logger.info("prometheus_client not installed, metrics disabled")
 
 
+# =============================================================================
+# Histogram Buckets
+# =============================================================================
+
+# Millisecond-scale inference latencies (seconds): fine below 100ms where
+# CPU/GPU models actually land, coarse tail for cold starts and stalls
+LATENCY_BUCKETS_MS = [
+    0.001, 0.0025, 0.005, 0.01, 0.02, 0.035, 0.05, 0.075,
+    0.1, 0.15, 0.25, 0.5, 1.0, 2.5,
+]
+
+# Sub-millisecond engine stages (seconds)
+STAGE_BUCKETS = [
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5,
+]
+
+
 # =============================================================================
 # Metric Definitions (when Prometheus is available)
 # =============================================================================
@@ -124,7 +155,7 @@ if PROMETHEUS_AVAILABLE:
         "ash_nlp_model_inference_duration_seconds",
         "Model inference duration in seconds",
         ["model"],
-        buckets=[0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0],
+        buckets=LATENCY_BUCKETS_MS,
         registry=REGISTRY,
     )
 
@@ -155,6 +186,68 @@ if PROMETHEUS_AVAILABLE:
         registry=REGISTRY,
     )
 
+    # Engine stage metrics (Phase 8)
+    STAGE_DURATION = Histogram(
+        "ash_nlp_stage_duration_seconds",
+        "Decision engine stage duration in seconds",
+        ["stage"],
+        buckets=STAGE_BUCKETS,
+        registry=REGISTRY,
+    )
+
+    ENGINE_REQUESTS = Counter(
+        "ash_nlp_engine_requests_total",
+        "Decision engine analyses by outcome",
+        ["outcome"],  # inference, cache_hit, error
+        registry=REGISTRY,
+    )
+
+    ENGINE_DURATION = Histogram(
+        "ash_nlp_engine_duration_seconds",
+        "Decision engine end-to-end analysis duration in seconds",
+        ["outcome"],
+        buckets=LATENCY_BUCKETS_MS,
+        registry=REGISTRY,
+    )
+
+    # Response cache metrics (Phase 8)
+    CACHE_OPERATIONS = Counter(
+        "ash_nlp_cache_operations_total",
+        "Response cache operations",
+        ["operation"],  # hit, miss, expired, stale, eviction
+        registry=REGISTRY,
+    )
+
+    # Ash-Vigil client metrics (Phase 8)
+    VIGIL_REQUESTS = Counter(
+        "ash_nlp_vigil_requests_total",
+        "Ash-Vigil calls by resulting status",
+        ["status"],
+        registry=REGISTRY,
+    )
+
+    VIGIL_DURATION = Histogram(
+        "ash_nlp_vigil_duration_seconds",
+        "Ash-Vigil successful call duration in seconds",
+        buckets=LATENCY_BUCKETS_MS,
+        registry=REGISTRY,
+    )
+
+    # Discord alerting metrics (Phase 8)
+    ALERTS = Counter(
+        "ash_nlp_alerts_total",
+        "Discord alerts by severity and outcome",
+        ["severity", "outcome"],  # sent, failed, throttled, disabled, suppressed, dropped
+        registry=REGISTRY,
+    )
+
+    ALERT_DELIVERY_DURATION = Histogram(
+        "ash_nlp_alert_delivery_seconds",
+        "Discord webhook delivery duration in seconds",
+        buckets=[0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
+        registry=REGISTRY,
+    )
+
 
 # =============================================================================
 # No-Op Implementations (when Prometheus not available)
@@ -204,6 +297,33 @@ if not PROMETHEUS_AVAILABLE:
     MODELS_LOADED = NoOpMetric()
     GPU_MEMORY = NoOpMetric()
     UPTIME = NoOpMetric()
+    STAGE_DURATION = NoOpMetric()
+    ENGINE_REQUESTS = NoOpMetric()
+    ENGINE_DURATION = NoOpMetric()
+    CACHE_OPERATIONS = NoOpMetric()
+    VIGIL_REQUESTS = NoOpMetric()
+    VIGIL_DURATION = NoOpMetric()
+    ALERTS = NoOpMetric()
+    ALERT_DELIVERY_DURATION = NoOpMetric()
+
+
+# =============================================================================
+# Labelled Child Cache (Phase 8)
+# =============================================================================
+
+# (metric id, label values) → bound child. Label sets are small and fixed
+# (model names, stages, statuses), so this never grows unbounded.
+_children: Dict[tuple, Any] = {}
+
+
+def _child(metric: Any, *label_values: str) -> Any:
+    """Return the labelled child of a metric, caching the lookup."""
+    key = (id(metric), label_values)
+    child = _children.get(key)
+    if child is None:
+        child = metric.labels(*label_values)
+        _children[key] = child
+    return child
 
 
 # =============================================================================
@@ -245,6 +365,30 @@ def record_request(endpoint: str, method: str = "POST"):
         REQUEST_DURATION.labels(endpoint=endpoint).observe(duration)
 
 
+def record_http_request(
+    endpoint: str,
+    method: str,
+    status: int,
+    duration_seconds: float,
+) -> None:
+    """
+    Record one completed HTTP request (Phase 8).
+
+    Called by the fused ASGI middleware (src.api.middleware.AshMiddleware).
+
+    Args:
+        endpoint: Request path
+        method: HTTP method
+        status: Response status code
+        duration_seconds: Time from request start to response end
+    """
+    if not PROMETHEUS_AVAILABLE:
+        return
+
+    REQUEST_COUNT.labels(endpoint=endpoint, method=method, status=str(status)).inc()
+    REQUEST_DURATION.labels(endpoint=endpoint).observe(duration_seconds)
+
+
 def record_crisis_detection(
     severity: str,
     score: float,
@@ -293,6 +437,101 @@ def record_model_inference(model_name: str):
         MODEL_INFERENCE_DURATION.labels(model=model_name).observe(duration)
 
 
+def record_stage_timings(stages: Dict[str, float]) -> None:
+    """
+    Record per-stage engine latencies (Phase 8).
+
+    Args:
+        stages: Stage name → elapsed milliseconds (StageTimer.stages)
+    """
+    if not PROMETHEUS_AVAILABLE:
+        return
+
+    for stage, elapsed_ms in stages.items():
+        _child(STAGE_DURATION, stage).observe(elapsed_ms / 1000.0)
+
+
+def observe_model_inference(model_name: str, latency_ms: float) -> None:
+    """
+    Record one completed model inference (Phase 8).
+
+    Non-context-manager variant of record_model_inference() for callers
+    that already measured latency (BaseModelWrapper.analyze).
+
+    Args:
+        model_name: Name of the model
+        latency_ms: Inference latency in milliseconds
+    """
+    if not PROMETHEUS_AVAILABLE:
+        return
+
+    _child(MODEL_INFERENCE_DURATION, model_name).observe(latency_ms / 1000.0)
+
+
+def record_engine_request(outcome: str, elapsed_ms: float) -> None:
+    """
+    Record one decision engine analysis (Phase 8).
+
+    Args:
+        outcome: inference, cache_hit or error
+        elapsed_ms: End-to-end engine time in milliseconds
+    """
+    if not PROMETHEUS_AVAILABLE:
+        return
+
+    _child(ENGINE_REQUESTS, outcome).inc()
+    _child(ENGINE_DURATION, outcome).observe(elapsed_ms / 1000.0)
+
+
+def record_cache_operation(operation: str) -> None:
+    """
+    Record a response cache operation (Phase 8).
+
+    Args:
+        operation: hit, miss, expired, stale or eviction
+    """
+    if not PROMETHEUS_AVAILABLE:
+        return
+
+    _child(CACHE_OPERATIONS, operation).inc()
+
+
+def record_vigil_request(status: str, latency_ms: Optional[float] = None) -> None:
+    """
+    Record an Ash-Vigil call outcome (Phase 8).
+
+    Args:
+        status: VigilStatus value (used, timeout, unavailable, ...)
+        latency_ms: Call latency in milliseconds (successful calls only)
+    """
+    if not PROMETHEUS_AVAILABLE:
+        return
+
+    _child(VIGIL_REQUESTS, status).inc()
+    if latency_ms is not None:
+        VIGIL_DURATION.observe(latency_ms / 1000.0)
+
+
+def record_alert(
+    severity: str, outcome: str, delivery_ms: Optional[float] = None
+) -> None:
+    """
+    Record a Discord alert attempt (Phase 8).
+
+    Args:
+        severity: Alert severity name
+        outcome: sent, failed, throttled, disabled, suppressed or dropped
+            (outbox full)
+        delivery_ms: Webhook round-trip in milliseconds (when attempted)
+    """
+    if not PROMETHEUS_AVAILABLE:
+        return
+
+    _child(ALERTS, severity, outcome).inc()
+    if delivery_ms is not None:
+        ALERT_DELIVERY_DURATION.observe(delivery_ms / 1000.0)
+
+
 def record_model_error(model_name: str, error_type: str) -> None:
     """
     Record a model error.
@@ -376,6 +615,10 @@ def get_metrics_middleware():
     """
     Get middleware for automatic request metrics.
 
+    Apps built with create_app() record request metrics in the fused ASGI
+    middleware instead (record_http_request); this remains for apps that
+    do not use setup_middleware().
+
     Returns:
         Middleware class or None if Prometheus unavailable
     """
@@ -442,10 +685,18 @@ __all__ = [
     "PROMETHEUS_AVAILABLE",
     # Recording functions
     "record_request",
+    "record_http_request",
     "record_crisis_detection",
     "record_model_inference",
     "record_model_error",
     "set_models_loaded",
+    # Hot-path recording (Phase 8)
+    "record_stage_timings",
+    "observe_model_inference",
+    "record_engine_request",
+    "record_cache_operation",
+    "record_vigil_request",
+    "record_alert",
     "update_gpu_memory",
     "set_uptime",
     # FastAPI integration
@@ -453,6 +704,9 @@ __all__ = [
     "get_metrics_middleware",
     # Status
     "get_metrics_status",
+    # Buckets
+    "LATENCY_BUCKETS_MS",
+    "STAGE_BUCKETS",
     # Registry (for custom metrics)
     "REGISTRY",
 ]
@@ -0,0 +1,525 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+CORE PRINCIPLE: Multi-Model Ensemble → Weighted Decision Engine → Crisis Classification
+******************  CORE SYSTEM VISION (Never to be violated):  ****************
+Ash-NLP is a CRISIS DETECTION BACKEND that:
+1. PRIMARY: Uses BART Zero-Shot Classification for semantic crisis detection
+2. CONTEXTUAL: Enhances with sentiment, irony, and emotion model signals
+3. ENSEMBLE: Combines weighted model outputs through decision engine
+4. PURPOSE: Detect crisis messages in Discord community communications
+********************************************************************************
+Near-Duplicate Message Index for Ash-NLP Service
+---
+FILE VERSION: v5.0-8-24.0-3
+LAST MODIFIED: 2026-02-23
+PHASE: Phase 8 Step 24.0 - Near-Duplicate Cache
+CLEAN ARCHITECTURE: v5.2.3 Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+
+RESPONSIBILITIES:
+- Find a previously analyzed message that is a near-duplicate of a new one
+  (raid floods, copypasta with changed emoji, casing or punctuation)
+- Keep a bounded index (LRU) of normalized messages per cache namespace
+- Match identical normalized text by key (default); with word changes
+  allowed, match only above a strict similarity threshold and within
+  max_word_changes of the same words in the same order
+
+MATCHING:
+    normalize: NFKC, casefold, drop punctuation / symbols / emoji,
+        collapse elongated letters (3+ → 1; digits and punctuation are
+        never collapsed: "1000" stays "1000") and whitespace
+    max_word_changes = 0 (default): dict lookup on the normalized text
+    max_word_changes > 0:
+        sketch: bottom-k MinHash over character shingles
+        candidates: messages sharing one of the query's smallest shingle hashes
+        match: estimated Jaccard ≥ threshold
+            AND the normalized word sequences are within max_word_changes
+            word insertions / deletions of each other
+
+WHY THE WORD CHECK:
+    Shingle similarity of a long copypasta stays high when a short sentence
+    is appended ("... i want to die"), a "not" is removed, or a "not" is
+    moved ("i want to live and i do not want to die" → "i do not want to
+    live and i want to die"). Comparing the ordered words (not word sets)
+    keeps such a message from reusing a benign result; it is analyzed
+    normally instead. A single removed "not" is one word change, so the
+    default allows none: only emoji, casing, punctuation and elongation
+    variants reuse a result, and for that a normalized-key lookup is
+    enough (no sketches are built).
+"""
+
+import heapq
+import logging
+import re
+import threading
+import unicodedata
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# Module version
+__version__ = "v5.0-8-24.0-3"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Defaults (performance config)
+DEFAULT_SIMILARITY_THRESHOLD = 0.9
+DEFAULT_MAX_ENTRIES = 2000
+DEFAULT_MIN_LENGTH = 32
+DEFAULT_MAX_WORD_CHANGES = 0
+
+# Sketch parameters
+DEFAULT_SHINGLE_SIZE = 5
+DEFAULT_SKETCH_SIZE = 128
+DEFAULT_BANDS = 8
+
+# Variation selectors and the keycap mark (emoji modifiers, not text)
+_EMOJI_MARKS = frozenset(chr(c) for c in range(0xFE00, 0xFE10)) | {"⃣"}
+
+# Three or more of the same letter (elongation: "sooo" → "so"); digits
+# are left alone so "1000" and "10" stay different
+_REPEATS = re.compile(r"([^\W\d_])\1{2,}")
+
+
+def normalize_message(text: str) -> str:
+    """
+    Normalize a message for near-duplicate matching.
+
+    Keeps letters, digits and combining marks; spaces replace separators;
+    punctuation, symbols (emoji) and control / format characters (zero-width
+    joiners) are dropped.
+
+    Returns:
+        Normalized text (words separated by single spaces)
+    """
+    chars: List[str] = []
+    for ch in unicodedata.normalize("NFKC", text).casefold():
+        category = unicodedata.category(ch)[0]
+        if category in "LN" or (category == "M" and ch not in _EMOJI_MARKS):
+            chars.append(ch)
+        elif category == "Z" or ch.isspace():
+            chars.append(" ")
+    return " ".join(_REPEATS.sub(r"\1", "".join(chars)).split())
+
+
+def word_changes(a: List[str], b: List[str], limit: int) -> int:
+    """
+    Word insertions plus deletions turning sequence a into sequence b.
+
+    A replaced or moved word counts twice (removed, then inserted).
+
+    Args:
+        a: Normalized words of one message
+        b: Normalized words of the other
+        limit: Largest distance of interest
+
+    Returns:
+        The distance, or limit + 1 when it exceeds limit
+    """
+    if a == b:
+        return 0
+    if limit <= 0 or abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    # Longest common subsequence, one row at a time
+    previous = [0] * (len(b) + 1)
+    for word in a:
+        current = [0]
+        for j, other in enumerate(b):
+            if word == other:
+                current.append(previous[j] + 1)
+            else:
+                current.append(max(previous[j + 1], current[j]))
+        previous = current
+    distance = len(a) + len(b) - 2 * previous[-1]
+    return distance if distance <= limit else limit + 1
+
+
+def _bottom_k(hashes: Iterable[int], k: int) -> array:
+    """The k smallest distinct hashes, sorted."""
+    return array("q", heapq.nsmallest(k, set(hashes)))
+
+
+def estimate_similarity(a: Iterable[int], b: Iterable[int], k: int) -> float:
+    """
+    Jaccard estimate from two bottom-k sketches.
+
+    Exact when both shingle sets have at most k shingles.
+    """
+    set_a, set_b = set(a), set(b)
+    union = heapq.nsmallest(k, set_a | set_b)
+    if not union:
+        return 0.0
+    both = sum(1 for h in union if h in set_a and h in set_b)
+    return both / len(union)
+
+
+# =============================================================================
+# Near-Duplicate Match
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class NearDuplicateMatch:
+    """
+    A near-duplicate found in the index.
+
+    Attributes:
+        text: The indexed message (its cache key)
+        similarity: Estimated Jaccard similarity of the shingle sets
+        word_changes: Word insertions / deletions between the two messages
+    """
+
+    text: str
+    similarity: float
+    word_changes: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary (flag on the reused assessment)."""
+        return {
+            "similarity": round(self.similarity, 4),
+            "word_changes": self.word_changes,
+        }
+
+
+@dataclass(frozen=True)
+class _IndexEntry:
+    """One indexed message."""
+
+    namespace: str
+    text: str
+    normalized: str
+    sketch: Optional[array]
+
+
+# =============================================================================
+# Near-Duplicate Index
+# =============================================================================
+
+
+class NearDuplicateIndex:
+    """
+    Bounded index of analyzed messages by normalized text.
+
+    With max_word_changes > 0 it also keeps MinHash sketches to find
+    similar (not identical) messages.
+
+    Stores sketches and keys only; the results themselves stay in the
+    ResponseCache, so TTL, config-version and label-set rules still apply
+    to a near-duplicate hit.
+
+    Clean Architecture v5.2.3 Compliance:
+    - Factory function: create_near_duplicate_index()
+    """
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        min_length: int = DEFAULT_MIN_LENGTH,
+        max_word_changes: int = DEFAULT_MAX_WORD_CHANGES,
+        shingle_size: int = DEFAULT_SHINGLE_SIZE,
+        sketch_size: int = DEFAULT_SKETCH_SIZE,
+        bands: int = DEFAULT_BANDS,
+    ):
+        """
+        Initialize NearDuplicateIndex.
+
+        Args:
+            threshold: Minimum estimated similarity for a match (only
+                used when max_word_changes > 0)
+            max_entries: Indexed messages kept (least recently used evicted)
+            min_length: Normalized messages shorter than this never match
+            max_word_changes: Word insertions / deletions allowed between
+                the two messages (order matters; a moved word counts twice).
+                0 matches identical normalized text by key only
+            shingle_size: Characters per shingle
+            sketch_size: Hashes kept per message (bottom-k)
+            bands: Smallest hashes used to find candidates
+
+        Note:
+            Use create_near_duplicate_index() factory function instead.
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.min_length = min_length
+        self.max_word_changes = max_word_changes
+        self.shingle_size = shingle_size
+        self.sketch_size = sketch_size
+        self.bands = bands
+
+        self._entries: "OrderedDict[Tuple[str, str], _IndexEntry]" = OrderedDict()
+        self._postings: Dict[Tuple[str, int], Set[Tuple[str, str]]] = {}
+        self._lock = threading.Lock()
+
+        # Statistics
+        self._lookups = 0
+        self._matches = 0
+        self._too_short = 0
+        self._below_threshold = 0
+        self._word_rejections = 0
+        self._evictions = 0
+
+        logger.info(
+            f"✅ NearDuplicateIndex v{__version__} initialized "
+            f"(threshold={threshold}, max_entries={max_entries}, "
+            f"max_word_changes={max_word_changes})"
+        )
+
+    @property
+    def fuzzy(self) -> bool:
+        """Whether similar (not only identical normalized) messages match."""
+        return self.max_word_changes > 0
+
+    # =========================================================================
+    # Sketching
+    # =========================================================================
+
+    def _sketch(self, normalized: str) -> array:
+        """Bottom-k sketch of the normalized text's shingles."""
+        size = self.shingle_size
+        if len(normalized) <= size:
+            shingles: Iterable[str] = (normalized,)
+        else:
+            shingles = (
+                normalized[i:i + size] for i in range(len(normalized) - size + 1)
+            )
+        # Built-in str hash: fast, and stable for the life of the process,
+        # which is as long as the index lives
+        return _bottom_k(map(hash, shingles), self.sketch_size)
+
+    # =========================================================================
+    # Index Operations
+    # =========================================================================
+
+    def add(self, text: str, namespace: str = "") -> bool:
+        """
+        Index a message whose result was just cached.
+
+        Args:
+            text: Message text (the response cache key)
+            namespace: Cache namespace (label set hash)
+
+        Returns:
+            True if indexed (False when too short to ever match)
+        """
+        normalized = normalize_message(text)
+        if len(normalized) < self.min_length:
+            return False
+
+        key = (namespace, normalized)
+        sketch = self._sketch(normalized) if self.fuzzy else None
+        entry = _IndexEntry(namespace, text, normalized, sketch)
+        with self._lock:
+            if key in self._entries:
+                self._unlink(key)
+            self._entries[key] = entry
+            if sketch is not None:
+                for value in sketch[: self.bands]:
+                    self._postings.setdefault((namespace, value), set()).add(key)
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._unlink(oldest)
+                self._evictions += 1
+        return True
+
+    def lookup(self, text: str, namespace: str = "") -> Optional[NearDuplicateMatch]:
+        """
+        Find the most similar indexed message.
+
+        Args:
+            text: New message text
+            namespace: Cache namespace (label set hash)
+
+        Returns:
+            NearDuplicateMatch, or None when nothing passes the threshold
+            and word check
+        """
+        normalized = normalize_message(text)
+        key = (namespace, normalized)
+        with self._lock:
+            self._lookups += 1
+            if len(normalized) < self.min_length:
+                self._too_short += 1
+                return None
+
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._matches += 1
+                self._entries.move_to_end(key)
+                return NearDuplicateMatch(entry.text, 1.0, 0)
+            if not self.fuzzy:
+                return None
+
+        sketch = self._sketch(normalized)
+        with self._lock:
+            candidates: Set[Tuple[str, str]] = set()
+            for value in sketch[: self.bands]:
+                candidates |= self._postings.get((namespace, value), set())
+            entries = [self._entries[key] for key in candidates]
+
+        best: Optional[NearDuplicateMatch] = None
+        best_key: Optional[Tuple[str, str]] = None
+        rejected_by_words = False
+        words = normalized.split()
+        for entry in entries:
+            similarity = estimate_similarity(sketch, entry.sketch, self.sketch_size)
+            if similarity < self.threshold or (best and similarity <= best.similarity):
+                continue
+            changes = word_changes(
+                words, entry.normalized.split(), self.max_word_changes
+            )
+            if changes > self.max_word_changes:
+                rejected_by_words = True
+                continue
+            best = NearDuplicateMatch(entry.text, similarity, changes)
+            best_key = (namespace, entry.normalized)
+
+        with self._lock:
+            if best is not None:
+                self._matches += 1
+                if best_key in self._entries:
+                    self._entries.move_to_end(best_key)
+            elif rejected_by_words:
+                self._word_rejections += 1
+            elif entries:
+                self._below_threshold += 1
+        return best
+
+    def _unlink(self, key: Tuple[str, str]) -> None:
+        """Remove an entry and its postings (caller holds the lock)."""
+        entry = self._entries.pop(key)
+        if entry.sketch is None:
+            return
+        for value in entry.sketch[: self.bands]:
+            posting = self._postings.get((entry.namespace, value))
+            if posting is not None:
+                posting.discard(key)
+                if not posting:
+                    del self._postings[(entry.namespace, value)]
+
+    def clear(self) -> int:
+        """
+        Drop every indexed message.
+
+        Returns:
+            Number of entries cleared
+        """
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            self._postings.clear()
+            return count
+
+    # =========================================================================
+    # Statistics
+    # =========================================================================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get index statistics.
+
+        Returns:
+            Dictionary with settings and counters
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "mode": "minhash" if self.fuzzy else "exact",
+                "threshold": self.threshold,
+                "max_word_changes": self.max_word_changes,
+                "lookups": self._lookups,
+                "matches": self._matches,
+                "match_rate": (
+                    round(self._matches / self._lookups, 4) if self._lookups else 0.0
+                ),
+                "too_short": self._too_short,
+                "below_threshold": self._below_threshold,
+                "word_rejections": self._word_rejections,
+                "evictions": self._evictions,
+            }
+
+    def __len__(self) -> int:
+        """Return number of indexed messages."""
+        with self._lock:
+            return len(self._entries)
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return (
+            f"NearDuplicateIndex(size={len(self)}/{self.max_entries}, "
+            f"threshold={self.threshold})"
+        )
+
+
+# =============================================================================
+# FACTORY FUNCTION - Clean Architecture v5.1 Compliance (Rule #1)
+# =============================================================================
+
+
+def create_near_duplicate_index(
+    config_manager: Any = None,
+    **overrides: Any,
+) -> Optional[NearDuplicateIndex]:
+    """
+    Factory function for NearDuplicateIndex.
+
+    Args:
+        config_manager: ConfigManager (performance.near_duplicate_* settings)
+        **overrides: NearDuplicateIndex arguments taking precedence
+
+    Returns:
+        NearDuplicateIndex, or None when performance.near_duplicate_enabled
+        is off (or no config and no overrides were given)
+
+    Example:
+        >>> index = create_near_duplicate_index(config_manager=config)
+        >>> match = index.lookup(message, namespace=label_set_hash) if index else None
+    """
+    settings: Dict[str, Any] = {}
+    if config_manager is not None:
+        perf_config = config_manager.get_performance_config() or {}
+        if not perf_config.get("near_duplicate_enabled", False):
+            logger.debug("Near-duplicate cache disabled by configuration")
+            return None
+        settings = {
+            "threshold": perf_config.get(
+                "near_duplicate_threshold", DEFAULT_SIMILARITY_THRESHOLD
+            ),
+            "max_entries": perf_config.get(
+                "near_duplicate_max_entries", DEFAULT_MAX_ENTRIES
+            ),
+            "min_length": perf_config.get(
+                "near_duplicate_min_length", DEFAULT_MIN_LENGTH
+            ),
+            "max_word_changes": perf_config.get(
+                "near_duplicate_max_word_changes", DEFAULT_MAX_WORD_CHANGES
+            ),
+        }
+    elif not overrides:
+        return None
+
+    settings.update(overrides)
+    return NearDuplicateIndex(**settings)
+
+
+# =============================================================================
+# Export public interface
+# =============================================================================
+
+__all__ = [
+    "NearDuplicateIndex",
+    "NearDuplicateMatch",
+    "create_near_duplicate_index",
+    "normalize_message",
+    "estimate_similarity",
+    "word_changes",
+    "DEFAULT_SIMILARITY_THRESHOLD",
+    "DEFAULT_MAX_ENTRIES",
+    "DEFAULT_MIN_LENGTH",
+    "DEFAULT_MAX_WORD_CHANGES",
+]
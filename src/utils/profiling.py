@@ -0,0 +1,450 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+CORE PRINCIPLE: Multi-Model Ensemble → Weighted Decision Engine → Crisis Classification
+******************  CORE SYSTEM VISION (Never to be violated):  ****************
+Ash-NLP is a CRISIS DETECTION BACKEND that:
+1. PRIMARY: Uses BART Zero-Shot Classification for semantic crisis detection
+2. CONTEXTUAL: Enhances with sentiment, irony, and emotion model signals
+3. ENSEMBLE: Combines weighted model outputs through decision engine
+4. PURPOSE: Detect crisis messages in Discord community communications
+********************************************************************************
+On-Demand Profiling for Ash-NLP Service
+---
+FILE VERSION: v5.0-8-4.0-1
+LAST MODIFIED: 2026-02-03
+PHASE: Phase 8 Step 4.0 - On-Demand Profiling
+CLEAN ARCHITECTURE: v5.2.3 Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+
+RESPONSIBILITIES:
+- Sample Python stacks of every thread for a bounded time window
+- Aggregate samples into flamegraph-compatible collapsed stacks
+- Optionally capture a torch.profiler trace of a single call
+- Cost nothing when idle: no hooks, no threads outside a capture
+
+OUTPUT FORMAT (collapsed stacks, one line per unique stack):
+    MainThread;run (uvicorn/server.py:61);analyze (src/ensemble/decision_engine.py:1017) 42
+
+    Feed to flamegraph.pl, speedscope or inferno-flamegraph as-is.
+
+USAGE:
+    from src.utils.profiling import create_sampling_profiler
+
+    profiler = create_sampling_profiler()
+    result = profiler.capture(duration_s=10)
+    open("profile.folded", "w").write(result.to_collapsed())
+"""
+
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Module version
+__version__ = "v5.0-8-4.0-1"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Leaf frames that mean "this thread is blocked, not burning CPU"
+_IDLE_LEAVES = {
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("selectors.py", "select"),
+    ("queue.py", "get"),
+    ("thread.py", "_worker"),
+}
+
+# Path prefixes trimmed from frame labels to keep stacks readable
+_PATH_PREFIXES = sorted(
+    {p for p in sys.path if p and os.path.isdir(p)} | {os.getcwd()},
+    key=len,
+    reverse=True,
+)
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a capture is requested while another is running."""
+
+    pass
+
+
+# =============================================================================
+# Profile Result
+# =============================================================================
+
+
+@dataclass
+class ProfileResult:
+    """
+    Aggregated sampling profile.
+
+    Attributes:
+        duration_s: Wall-clock capture duration
+        interval_ms: Target sampling interval
+        samples: Number of sampling passes taken
+        stacks: Collapsed stack → sample count
+    """
+
+    duration_s: float
+    interval_ms: float
+    samples: int
+    stacks: Dict[str, int] = field(default_factory=dict)
+
+    def to_collapsed(self) -> str:
+        """Render in collapsed-stack (folded) format, hottest first."""
+        lines = [
+            f"{stack} {count}"
+            for stack, count in sorted(
+                self.stacks.items(), key=lambda kv: kv[1], reverse=True
+            )
+        ]
+        return "\n".join(lines) + ("\n" if lines else "")
+
+    def top_frames(self, limit: int = 10) -> List[Tuple[str, int]]:
+        """Leaf frames with the most samples (self time)."""
+        leaves: Dict[str, int] = {}
+        for stack, count in self.stacks.items():
+            leaf = stack.rsplit(";", 1)[-1]
+            leaves[leaf] = leaves.get(leaf, 0) + count
+        return sorted(leaves.items(), key=lambda kv: kv[1], reverse=True)[:limit]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary (summary, without stacks)."""
+        return {
+            "duration_s": round(self.duration_s, 3),
+            "interval_ms": self.interval_ms,
+            "samples": self.samples,
+            "unique_stacks": len(self.stacks),
+            "top_frames": [
+                {"frame": frame, "samples": count}
+                for frame, count in self.top_frames()
+            ],
+        }
+
+
+# =============================================================================
+# Sampling Profiler
+# =============================================================================
+
+
+class SamplingProfiler:
+    """
+    Wall-clock sampling profiler over sys._current_frames().
+
+    A daemon thread wakes every interval, snapshots the stack of every
+    other thread and counts identical stacks. Nothing is installed in
+    the interpreter, so there is no overhead outside start()/stop().
+    Only one capture can run at a time per profiler.
+
+    Clean Architecture v5.1 Compliance:
+    - Factory function: create_sampling_profiler()
+    """
+
+    def __init__(
+        self,
+        interval_ms: float = 5.0,
+        max_duration_s: float = 60.0,
+        include_idle: bool = False,
+    ):
+        """
+        Initialize profiler.
+
+        Args:
+            interval_ms: Default sampling interval
+            max_duration_s: Hard cap on any single capture
+            include_idle: Keep stacks of blocked threads (locks, selectors)
+        """
+        self.interval_ms = interval_ms
+        self.max_duration_s = max_duration_s
+        self.include_idle = include_idle
+
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._stacks: Dict[str, int] = {}
+        self._samples = 0
+        self._started_at = 0.0
+        self._active_interval_ms = interval_ms
+        self._active_include_idle = include_idle
+
+        # Frame label cache: code object → label
+        self._labels: Dict[Any, str] = {}
+
+    @property
+    def is_running(self) -> bool:
+        """Whether a capture is in progress."""
+        return self._thread is not None
+
+    # =========================================================================
+    # Capture Control
+    # =========================================================================
+
+    def start(
+        self,
+        interval_ms: Optional[float] = None,
+        include_idle: Optional[bool] = None,
+    ) -> None:
+        """
+        Start sampling in a background thread.
+
+        Raises:
+            ProfilerBusyError: A capture is already running
+        """
+        if not self._lock.acquire(blocking=False):
+            raise ProfilerBusyError("A profile capture is already running")
+
+        self._stacks = {}
+        self._samples = 0
+        self._active_interval_ms = interval_ms or self.interval_ms
+        self._active_include_idle = (
+            self.include_idle if include_idle is None else include_idle
+        )
+        self._stop_event.clear()
+        self._started_at = time.perf_counter()
+
+        self._thread = threading.Thread(
+            target=self._run, name="ash-profiler", daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            f"🔬 Sampling profiler started (interval={self._active_interval_ms}ms)"
+        )
+
+    def stop(self) -> ProfileResult:
+        """
+        Stop sampling and return the aggregated profile.
+
+        Raises:
+            RuntimeError: No capture is running
+        """
+        thread = self._thread
+        if thread is None:
+            raise RuntimeError("Profiler is not running")
+
+        self._stop_event.set()
+        thread.join()
+        duration_s = time.perf_counter() - self._started_at
+
+        result = ProfileResult(
+            duration_s=duration_s,
+            interval_ms=self._active_interval_ms,
+            samples=self._samples,
+            stacks=self._stacks,
+        )
+
+        self._thread = None
+        self._stacks = {}
+        self._lock.release()
+
+        logger.info(
+            f"🔬 Sampling profiler stopped "
+            f"({result.samples} samples, {len(result.stacks)} stacks, {duration_s:.2f}s)"
+        )
+        return result
+
+    def capture(
+        self,
+        duration_s: float,
+        interval_ms: Optional[float] = None,
+        include_idle: Optional[bool] = None,
+    ) -> ProfileResult:
+        """
+        Blocking capture for a fixed duration (capped at max_duration_s).
+
+        Use start()/stop() from async code to avoid blocking the loop.
+        """
+        self.start(interval_ms=interval_ms, include_idle=include_idle)
+        try:
+            time.sleep(min(duration_s, self.max_duration_s))
+        finally:
+            result = self.stop()
+        return result
+
+    def profile_call(
+        self,
+        func: Callable[..., Any],
+        *args,
+        interval_ms: Optional[float] = None,
+        **kwargs,
+    ) -> Tuple[Any, ProfileResult]:
+        """
+        Sample while running a single call.
+
+        Returns:
+            (call result, profile)
+        """
+        self.start(interval_ms=interval_ms, include_idle=False)
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            profile = self.stop()
+        return result, profile
+
+    # =========================================================================
+    # Sampling Loop
+    # =========================================================================
+
+    def _run(self) -> None:
+        """Sampler thread body."""
+        own_ident = threading.get_ident()
+        interval_s = self._active_interval_ms / 1000.0
+        deadline = self._started_at + self.max_duration_s
+        include_idle = self._active_include_idle
+
+        while not self._stop_event.wait(interval_s):
+            if time.perf_counter() >= deadline:
+                logger.warning("🔬 Profiler hit max duration, sampling stopped")
+                break
+
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                if not include_idle and self._is_idle(frame):
+                    continue
+                stack = self._collapse(names.get(ident, f"thread-{ident}"), frame)
+                self._stacks[stack] = self._stacks.get(stack, 0) + 1
+            self._samples += 1
+
+    @staticmethod
+    def _is_idle(frame: Any) -> bool:
+        """Whether the leaf frame is a known blocking wait."""
+        code = frame.f_code
+        return (os.path.basename(code.co_filename), code.co_name) in _IDLE_LEAVES
+
+    def _collapse(self, thread_name: str, frame: Any) -> str:
+        """Build 'thread;root;...;leaf' for one thread's stack."""
+        labels: List[str] = []
+        labels_cache = self._labels
+        while frame is not None:
+            code = frame.f_code
+            label = labels_cache.get(code)
+            if label is None:
+                label = _frame_label(code)
+                labels_cache[code] = label
+            labels.append(label)
+            frame = frame.f_back
+        labels.append(thread_name.replace(";", ":"))
+        labels.reverse()
+        return ";".join(labels)
+
+
+def _frame_label(code: Any) -> str:
+    """Readable, collapse-safe label for a code object."""
+    filename = code.co_filename
+    for prefix in _PATH_PREFIXES:
+        if filename.startswith(prefix):
+            filename = filename[len(prefix):].lstrip(os.sep)
+            break
+    label = f"{code.co_name} ({filename}:{code.co_firstlineno})"
+    return label.replace(";", ":")
+
+
+# =============================================================================
+# torch.profiler Capture (optional)
+# =============================================================================
+
+
+def is_torch_profiler_available() -> bool:
+    """Check whether torch.profiler can be used."""
+    try:
+        import torch.profiler  # noqa: F401
+
+        return True
+    except ImportError:
+        return False
+
+
+def profile_torch_call(
+    func: Callable[..., Any],
+    *args,
+    metric: str = "self_cpu_time_total",
+    **kwargs,
+) -> Tuple[Any, str]:
+    """
+    Run one call under torch.profiler and export collapsed stacks.
+
+    Args:
+        func: Callable to profile (e.g. engine.analyze)
+        metric: self_cpu_time_total or self_cuda_time_total
+        *args, **kwargs: Passed to func
+
+    Returns:
+        (call result, collapsed-stack text weighted by the metric in us)
+
+    Raises:
+        RuntimeError: torch is not installed
+    """
+    try:
+        import torch
+        from torch.profiler import ProfilerActivity, profile
+    except ImportError as e:
+        raise RuntimeError("torch.profiler is not available") from e
+
+    activities = [ProfilerActivity.CPU]
+    if torch.cuda.is_available():
+        activities.append(ProfilerActivity.CUDA)
+
+    with profile(activities=activities, with_stack=True) as prof:
+        result = func(*args, **kwargs)
+
+    fd, path = tempfile.mkstemp(prefix="ash-torch-", suffix=".folded")
+    os.close(fd)
+    try:
+        prof.export_stacks(path, metric)
+        with open(path, "r", encoding="utf-8") as handle:
+            collapsed = handle.read()
+    finally:
+        os.unlink(path)
+
+    logger.info(f"🔬 torch.profiler capture complete ({metric})")
+    return result, collapsed
+
+
+# =============================================================================
+# FACTORY FUNCTION - Clean Architecture v5.1 Compliance (Rule #1)
+# =============================================================================
+
+
+def create_sampling_profiler(
+    interval_ms: float = 5.0,
+    max_duration_s: float = 60.0,
+    include_idle: bool = False,
+) -> SamplingProfiler:
+    """
+    Factory function for SamplingProfiler.
+
+    Args:
+        interval_ms: Default sampling interval
+        max_duration_s: Hard cap on any single capture
+        include_idle: Keep stacks of blocked threads
+
+    Returns:
+        Configured SamplingProfiler instance
+    """
+    return SamplingProfiler(
+        interval_ms=interval_ms,
+        max_duration_s=max_duration_s,
+        include_idle=include_idle,
+    )
+
+
+__all__ = [
+    "ProfileResult",
+    "ProfilerBusyError",
+    "SamplingProfiler",
+    "create_sampling_profiler",
+    "is_torch_profiler_available",
+    "profile_torch_call",
+]
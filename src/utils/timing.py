@@ -0,0 +1,141 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+CORE PRINCIPLE: Multi-Model Ensemble → Weighted Decision Engine → Crisis Classification
+******************  CORE SYSTEM VISION (Never to be violated):  ****************
+Ash-NLP is a CRISIS DETECTION BACKEND that:
+1. PRIMARY: Uses BART Zero-Shot Classification for semantic crisis detection
+2. CONTEXTUAL: Enhances with sentiment, irony, and emotion model signals
+3. ENSEMBLE: Combines weighted model outputs through decision engine
+4. PURPOSE: Detect crisis messages in Discord community communications
+********************************************************************************
+Per-Stage Timing for Ash-NLP Service
+---
+FILE VERSION: v5.0-8-2.0-1
+LAST MODIFIED: 2026-02-02
+PHASE: Phase 8 Step 2.0 - Per-Stage Latency Instrumentation
+CLEAN ARCHITECTURE: v5.2.3 Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+Community: The Alphabet Cartel - https://discord.gg/alphabetcartel | https://alphabetcartel.org
+
+RESPONSIBILITIES:
+- Attribute request latency to named pipeline stages
+- Keep per-request overhead to a few perf_counter() calls
+- Produce a JSON-friendly breakdown for debug responses and metrics
+
+USAGE:
+    from src.utils.timing import StageTimer
+
+    timer = StageTimer()
+
+    with timer.stage("scoring"):
+        score = scorer.calculate_score(...)
+
+    timer.add("inference", inference_ms)
+    breakdown = timer.to_dict()
+    # {"total_ms": 12.4, "stages": {"scoring": 0.08, ...}, "unattributed_ms": 0.3}
+"""
+
+import time
+from typing import Any, Dict, Optional
+
+# Module version
+__version__ = "v5.0-8-2.0-1"
+
+_perf_counter = time.perf_counter
+
+
+# =============================================================================
+# Stage Span
+# =============================================================================
+
+
+class _StageSpan:
+    """Context manager recording one stage into its owning StageTimer."""
+
+    __slots__ = ("_timer", "_name", "_start")
+
+    def __init__(self, timer: "StageTimer", name: str):
+        self._timer = timer
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self) -> "_StageSpan":
+        self._start = _perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self._timer.add(self._name, (_perf_counter() - self._start) * 1000)
+        return False
+
+
+# =============================================================================
+# Stage Timer
+# =============================================================================
+
+
+class StageTimer:
+    """
+    Lightweight per-request stage timer.
+
+    One instance per request; not shared across threads. Repeated stages
+    accumulate (e.g. two cache operations add into "cache").
+
+    Attributes:
+        started_at: perf_counter() value at construction
+        stages: Stage name → accumulated milliseconds
+        models: Per-model inference latency in milliseconds
+    """
+
+    __slots__ = ("started_at", "stages", "models")
+
+    def __init__(self, started_at: Optional[float] = None):
+        """
+        Initialize timer.
+
+        Args:
+            started_at: Explicit start (perf_counter seconds), default now
+        """
+        self.started_at = started_at if started_at is not None else _perf_counter()
+        self.stages: Dict[str, float] = {}
+        self.models: Dict[str, float] = {}
+
+    def stage(self, name: str) -> _StageSpan:
+        """Time a block as the named stage."""
+        return _StageSpan(self, name)
+
+    def add(self, name: str, elapsed_ms: float) -> None:
+        """Add elapsed milliseconds to a stage."""
+        self.stages[name] = self.stages.get(name, 0.0) + elapsed_ms
+
+    def set_models(self, per_model_latency: Dict[str, float]) -> None:
+        """Attach per-model inference latencies (they overlap when parallel)."""
+        self.models = dict(per_model_latency)
+
+    def elapsed_ms(self) -> float:
+        """Milliseconds since the timer started."""
+        return (_perf_counter() - self.started_at) * 1000
+
+    def to_dict(self, total_ms: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Build the timing breakdown.
+
+        Args:
+            total_ms: End-to-end time (default: elapsed now)
+
+        Returns:
+            Dict with total_ms, stages, models and unattributed_ms
+        """
+        if total_ms is None:
+            total_ms = self.elapsed_ms()
+        attributed = sum(self.stages.values())
+        return {
+            "total_ms": round(total_ms, 3),
+            "stages": {name: round(ms, 3) for name, ms in self.stages.items()},
+            "models": {name: round(ms, 3) for name, ms in self.models.items()},
+            "unattributed_ms": round(max(0.0, total_ms - attributed), 3),
+        }
+
+
+__all__ = [
+    "StageTimer",
+]
@@ -0,0 +1,53 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+---
+Shared Test Fixtures
+---
+FILE VERSION: v5.0-8-1.0-2
+LAST MODIFIED: 2026-02-02
+PHASE: Phase 8 Step 1.0 - Performance Benchmark Harness
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+
+Engines are built from the benchmark harness stubs (src/benchmark), so no
+test downloads or loads a model.
+"""
+
+import pytest
+
+from src.benchmark import create_benchmark_engine
+from src.managers.config_manager import create_config_manager
+from src.managers.context_config_manager import create_context_config_manager
+
+
+@pytest.fixture(scope="session")
+def context_config():
+    """Context analysis configuration (context_config.json)."""
+    return create_context_config_manager()
+
+
+@pytest.fixture
+def load_config(monkeypatch):
+    """Load the testing configuration with NLP_* environment overrides."""
+
+    def load(**env):
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        return create_config_manager(environment="testing")
+
+    return load
+
+
+@pytest.fixture
+def make_engine():
+    """Build stub-backed decision engines; all are shut down afterwards."""
+    engines = []
+
+    def make(**kwargs):
+        kwargs.setdefault("latency", "zero")
+        engine = create_benchmark_engine(**kwargs)
+        engines.append(engine)
+        return engine
+
+    yield make
+    for engine in engines:
+        engine.shutdown()
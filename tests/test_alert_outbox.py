@@ -0,0 +1,265 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+---
+Alert Outbox Tests
+---
+FILE VERSION: v5.0-8-25.0-1
+LAST MODIFIED: 2026-02-24
+PHASE: Phase 8 Step 25.0 - Background Alert Delivery
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from src.utils import alert_outbox
+from src.utils.alert_outbox import AlertOutbox, create_alert_outbox
+from src.utils.alerting import Alert, AlertSeverity, DiscordAlerter
+
+pytestmark = pytest.mark.unit
+
+WEBHOOK_URL = "https://discord.test/api/webhooks/1/token"
+
+
+class FakeResponse:
+    def __init__(self, status, headers=None, body=""):
+        self.status = status
+        self.headers = headers or {}
+        self.body = body
+
+    async def text(self):
+        return self.body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    """Records webhook posts and answers with queued responses (then 204)."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.posts = []
+
+    def post(self, url, json=None, **kwargs):
+        self.posts.append(json)
+        return self.responses.pop(0) if self.responses else FakeResponse(204)
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def alerter():
+    return DiscordAlerter(webhook_url=WEBHOOK_URL, testing_mode=False)
+
+
+def make_alert(user_id="a", severity=AlertSeverity.ESCALATION, title="Escalation: Rapid"):
+    return Alert(
+        severity=severity,
+        title=title,
+        description="Crisis escalation pattern detected.",
+        fields={"User ID": user_id},
+    )
+
+
+def deliver(outbox, session, alerts):
+    """Start the outbox, enqueue the alerts, and stop (drains the queue)."""
+    outbox.alerter._session = session
+
+    async def run():
+        outbox.start()
+        for alert in alerts:
+            outbox.enqueue(alert)
+        await outbox.stop()
+
+    asyncio.run(run())
+    return outbox.get_stats()
+
+
+# =============================================================================
+# Factory
+# =============================================================================
+
+
+class TestCreateAlertOutbox:
+    def test_nothing_to_deliver(self, alerter, load_config):
+        assert create_alert_outbox(None) is None
+        assert create_alert_outbox(DiscordAlerter(WEBHOOK_URL, testing_mode=True)) is None
+
+        config = load_config(NLP_ALERT_OUTBOX_ENABLED="false")
+        assert create_alert_outbox(alerter, config) is None
+
+    def test_settings_from_config_and_overrides(self, alerter, load_config):
+        config = load_config(NLP_ALERT_OUTBOX_LINGER_MS="40")
+        outbox = create_alert_outbox(alerter, config, max_size=4)
+
+        assert outbox.linger_seconds == pytest.approx(0.04)
+        assert outbox.max_size == 4
+
+
+# =============================================================================
+# Enqueue
+# =============================================================================
+
+
+class TestEnqueue:
+    def test_identical_alerts_coalesce(self, alerter):
+        outbox = AlertOutbox(alerter)
+        for _ in range(3):
+            assert outbox.enqueue(make_alert())
+
+        stats = outbox.get_stats()
+        assert stats["queue_depth"] == 1
+        assert stats["enqueued"] == 1
+        assert stats["coalesced"] == 2
+
+    def test_full_queue_drops_new_alerts(self, alerter):
+        outbox = AlertOutbox(alerter, max_size=2)
+        assert outbox.enqueue(make_alert("a"))
+        assert outbox.enqueue(make_alert("b"))
+
+        assert not outbox.enqueue(make_alert("c"))
+        assert outbox.get_stats()["dropped"] == 1
+
+    def test_critical_alert_evicts_oldest(self, alerter):
+        outbox = AlertOutbox(alerter, max_size=2)
+        outbox.enqueue(make_alert("a"))
+        outbox.enqueue(make_alert("a"))
+        outbox.enqueue(make_alert("b"))
+
+        assert outbox.enqueue(make_alert("c", severity=AlertSeverity.CRITICAL))
+
+        queued = [entry.alert.fields["User ID"] for entry in outbox._queue]
+        assert queued == ["b", "c"]
+        # The evicted entry stood for two alerts
+        assert outbox.get_stats()["dropped"] == 2
+
+
+# =============================================================================
+# Delivery
+# =============================================================================
+
+
+class TestDelivery:
+    def test_burst_sent_as_one_message(self, alerter):
+        session = FakeSession()
+        alerts = [make_alert("a"), make_alert("b"), make_alert("a"), make_alert("c")]
+
+        stats = deliver(AlertOutbox(alerter, linger_ms=0), session, alerts)
+
+        assert len(session.posts) == 1
+        embeds = session.posts[0]["embeds"]
+        assert len(embeds) == 3
+        occurrences = [
+            field["value"] for field in embeds[0]["fields"] if field["name"] == "Occurrences"
+        ]
+        assert occurrences == ["2"]
+        assert stats["delivered"] == 4
+        assert stats["webhook_messages"] == 1
+        assert stats["queue_depth"] == 0
+        assert not stats["running"]
+
+    def test_embed_limit_splits_messages(self, alerter):
+        session = FakeSession()
+        alerts = [make_alert(str(i)) for i in range(12)]
+
+        stats = deliver(AlertOutbox(alerter, linger_ms=0), session, alerts)
+
+        assert [len(post["embeds"]) for post in session.posts] == [10, 2]
+        assert stats["delivered"] == 12
+
+    def test_rate_limit_is_retried(self, alerter):
+        session = FakeSession(FakeResponse(429, {"Retry-After": "0"}))
+
+        stats = deliver(AlertOutbox(alerter, linger_ms=0), session, [make_alert()])
+
+        assert len(session.posts) == 2
+        assert stats["rate_limited"] == 1
+        assert stats["retries"] == 1
+        assert stats["delivered"] == 1
+        assert stats["last_error"] is None
+
+    def test_server_errors_fail_after_retries(self, alerter, monkeypatch):
+        monkeypatch.setattr(alert_outbox, "BACKOFF_BASE_SECONDS", 0.0)
+        session = FakeSession(*(FakeResponse(503, body="unavailable") for _ in range(3)))
+
+        stats = deliver(
+            AlertOutbox(alerter, linger_ms=0, max_retries=2), session, [make_alert()]
+        )
+
+        assert len(session.posts) == 3
+        assert stats["failed"] == 1
+        assert stats["delivered"] == 0
+        assert stats["last_error"].startswith("503")
+
+    def test_client_error_is_not_retried(self, alerter):
+        session = FakeSession(FakeResponse(400, body="bad embed"))
+
+        stats = deliver(AlertOutbox(alerter, linger_ms=0), session, [make_alert()])
+
+        assert len(session.posts) == 1
+        assert stats["retries"] == 0
+        assert stats["failed"] == 1
+
+    def test_long_retry_after_gives_up(self, alerter):
+        session = FakeSession(FakeResponse(429, body='{"retry_after": 120}'))
+
+        stats = deliver(
+            AlertOutbox(alerter, linger_ms=0, max_retry_after_seconds=5),
+            session,
+            [make_alert()],
+        )
+
+        assert len(session.posts) == 1
+        assert stats["failed"] == 1
+
+
+# =============================================================================
+# Alerter Integration
+# =============================================================================
+
+
+class TestAlerterRouting:
+    def test_sends_are_queued_while_running(self, alerter):
+        session = FakeSession()
+        alerter._session = session
+        outbox = AlertOutbox(alerter, linger_ms=0)
+
+        async def run():
+            outbox.start()
+            assert await alerter.send_alert(make_alert("a"))
+            assert await alerter.send_alert(make_alert("b"))
+            assert session.posts == []
+            await outbox.stop()
+
+        asyncio.run(run())
+
+        assert len(session.posts) == 1
+        assert alerter._outbox is None
+        assert outbox.get_stats()["delivered"] == 2
+
+    def test_enqueue_from_worker_thread_wakes_delivery(self, alerter):
+        session = FakeSession()
+        alerter._session = session
+        outbox = AlertOutbox(alerter, linger_ms=0)
+
+        async def run():
+            outbox.start()
+            thread = threading.Thread(target=outbox.enqueue, args=(make_alert(),))
+            thread.start()
+            thread.join()
+            for _ in range(100):
+                if session.posts:
+                    break
+                await asyncio.sleep(0.01)
+            delivered = list(session.posts)
+            await outbox.stop()
+            return delivered
+
+        assert len(asyncio.run(run())) == 1
@@ -0,0 +1,97 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+---
+Benchmark Harness Tests
+---
+FILE VERSION: v5.0-8-1.0-2
+LAST MODIFIED: 2026-02-02
+PHASE: Phase 8 Step 1.0 - Performance Benchmark Harness
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+"""
+
+import pytest
+
+from src.benchmark import (
+    TrafficProfile,
+    compare_reports,
+    create_traffic_generator,
+    run_benchmark,
+)
+from src.benchmark.harness import percentile, summarize_latencies
+
+
+class TestLatencyStatistics:
+    @pytest.mark.unit
+    def test_percentile_interpolates(self):
+        values = [4.0, 1.0, 3.0, 2.0]
+        assert percentile(values, 0) == 1.0
+        assert percentile(values, 50) == pytest.approx(2.5)
+        assert percentile(values, 100) == 4.0
+        assert percentile([], 95) == 0.0
+
+    @pytest.mark.unit
+    def test_summary(self):
+        summary = summarize_latencies([1.0, 2.0, 3.0])
+        assert summary["count"] == 3
+        assert summary["mean"] == pytest.approx(2.0)
+        assert summary["p50"] == pytest.approx(2.0)
+        assert summarize_latencies([]) == {"count": 0}
+
+
+class TestTraffic:
+    @pytest.mark.unit
+    def test_same_seed_same_stream(self):
+        first = create_traffic_generator(profile=TrafficProfile(seed=7)).generate(30)
+        second = create_traffic_generator(profile=TrafficProfile(seed=7)).generate(30)
+        assert [r.message for r in first] == [r.message for r in second]
+
+
+class TestCompareReports:
+    BASELINE = {
+        "scenarios": {
+            "engine_sync": {
+                "throughput_rps": 100.0,
+                "latency_ms": {"p50": 10.0, "p95": 20.0, "p99": 30.0},
+                "stages_ms": {"inference": {"p95": 15.0}},
+            }
+        }
+    }
+
+    @pytest.mark.unit
+    def test_within_threshold(self):
+        assert compare_reports(self.BASELINE, self.BASELINE, threshold_pct=10.0) == []
+
+    @pytest.mark.unit
+    def test_latency_and_throughput_regressions(self):
+        current = {
+            "scenarios": {
+                "engine_sync": {
+                    "throughput_rps": 80.0,
+                    "latency_ms": {"p50": 10.0, "p95": 25.0, "p99": 30.0},
+                    "stages_ms": {"inference": {"p95": 15.0}},
+                }
+            }
+        }
+        metrics = {r["metric"] for r in compare_reports(self.BASELINE, current)}
+        assert metrics == {"throughput_rps", "latency.p95"}
+
+
+class TestRunBenchmark:
+    @pytest.mark.integration
+    def test_engine_scenarios(self):
+        report = run_benchmark(
+            requests=20,
+            scenarios=["engine_sync", "engine_async"],
+            latency="zero",
+            warmup=2,
+        ).to_dict()
+
+        for name in ("engine_sync", "engine_async"):
+            scenario = report["scenarios"][name]
+            assert scenario["latency_ms"]["count"] == 20
+            assert "inference" in scenario["stages_ms"]
+
+    @pytest.mark.unit
+    def test_unknown_scenario(self):
+        with pytest.raises(ValueError):
+            run_benchmark(requests=1, scenarios=["nope"])
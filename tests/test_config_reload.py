@@ -0,0 +1,89 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+---
+Configuration Reload Tests
+---
+FILE VERSION: v5.0-8-20.0-2
+LAST MODIFIED: 2026-02-19
+PHASE: Phase 8 Step 20.0 - Hot Configuration Reload
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+
+reload_config() must apply every reloadable section: conflict resolution
+settings rebuild the resolver, and weight changes reach the fallback
+strategy as well as the scorer. Runtime setters invalidate cached
+results the same way.
+"""
+
+import pytest
+
+from src.ensemble.scoring import CrisisSeverity
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture
+def engine(load_config, make_engine):
+    config = load_config(
+        NLP_CONFLICT_RESOLUTION_STRATEGY="conservative",
+        NLP_MODEL_BART_WEIGHT="0.5",
+        NLP_MODEL_SENTIMENT_WEIGHT="0.25",
+    )
+    return make_engine(config_manager=config)
+
+
+class TestReloadConfig:
+    def test_conflict_resolution_strategy_is_reloaded(self, engine, load_config):
+        old_resolver = engine.conflict_resolver
+        config = load_config(NLP_CONFLICT_RESOLUTION_STRATEGY="optimistic")
+
+        summary = engine.reload_config(config)
+
+        assert "conflict_resolution" in summary["changed"]
+        assert "conflict_resolver" in summary["rebuilt"]
+        assert engine.conflict_resolver is not old_resolver
+        assert engine.conflict_resolver.get_config()["default_strategy"] == "optimistic"
+
+    def test_weight_change_updates_fallback(self, engine, load_config):
+        config = load_config(
+            NLP_MODEL_BART_WEIGHT="0.6",
+            NLP_MODEL_SENTIMENT_WEIGHT="0.15",
+        )
+
+        summary = engine.reload_config(config)
+
+        assert "fallback_weights" in summary["rebuilt"]
+        status = engine.fallback.get_status()
+        assert status["base_weights"]["bart"] == pytest.approx(0.6)
+        assert status["base_weights"]["sentiment"] == pytest.approx(0.15)
+        assert engine.fallback.current_weights == status["base_weights"]
+
+    def test_weight_change_keeps_failed_models(self, engine, load_config):
+        engine.fallback.handle_model_failure("irony", "down")
+        assert "irony" in engine.fallback.failed_models
+
+        config = load_config(
+            NLP_MODEL_BART_WEIGHT="0.6",
+            NLP_MODEL_SENTIMENT_WEIGHT="0.15",
+        )
+        engine.reload_config(config)
+
+        weights = engine.fallback.current_weights
+        assert "irony" in engine.fallback.failed_models
+        assert weights["irony"] == 0.0
+        assert sum(weights.values()) == pytest.approx(1.0)
+
+
+class TestSetterInvalidation:
+    def test_threshold_setter_invalidates_cached_results(self, make_engine):
+        engine = make_engine()
+        message = "I don't see the point anymore"
+        before = engine.analyze(message)
+        assert engine.analyze(message).cached
+
+        engine.set_severity_thresholds({"critical": 0.0})
+        after = engine.analyze(message)
+
+        assert not after.cached
+        assert before.severity != CrisisSeverity.CRITICAL
+        assert after.severity == CrisisSeverity.CRITICAL
+        assert engine.get_cache_stats()["version"] == engine.get_config_version()
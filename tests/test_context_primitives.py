@@ -0,0 +1,90 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+---
+Vectorized Context Primitives Tests
+---
+FILE VERSION: v5.0-8-8.0-1
+LAST MODIFIED: 2026-02-07
+PHASE: Phase 8 Step 8.0 - Vectorized Context Primitives
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+"""
+
+import random
+
+import pytest
+from pydantic import ValidationError
+
+from src.api.schemas import AnalyzeRequest
+from src.benchmark.context_bench import run_context_benchmark
+from src.context import primitives
+from src.context.primitives import (
+    NUMPY_AVAILABLE,
+    VECTORIZE_MIN_LENGTH,
+    count_non_dips,
+    count_transitions,
+    find_inflection_points,
+    smooth_scores,
+)
+
+needs_numpy = pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy not installed")
+
+
+def random_scores(size, seed):
+    rng = random.Random(seed)
+    # Quantized so some deltas land exactly on the tolerance
+    return [round(rng.random() * 20) / 20 for _ in range(size)]
+
+
+class TestPurePython:
+    @pytest.mark.unit
+    def test_smoothing(self):
+        assert smooth_scores([0.3, 0.6, 0.9]) == pytest.approx([0.45, 0.6, 0.75])
+        assert smooth_scores([0.5]) == [0.5]
+
+    @pytest.mark.unit
+    def test_transitions_and_dips(self):
+        values = [0.1, 0.4, 0.35, 0.35, 0.0]
+        assert count_transitions(values, tolerance=0.1) == (1, 1)
+        assert count_non_dips(values, dip_tolerance=0.1) == 3
+
+    @pytest.mark.unit
+    def test_inflections_skip_flat_deltas(self):
+        assert find_inflection_points([0.1, 0.5, 0.5, 0.2, 0.6], tolerance=0.05) == [2, 3]
+        assert find_inflection_points([0.1, 0.2, 0.3], tolerance=0.05) == []
+
+
+@needs_numpy
+class TestNumpyParity:
+    @pytest.mark.unit
+    @pytest.mark.parametrize("size", [VECTORIZE_MIN_LENGTH - 1, VECTORIZE_MIN_LENGTH, 300])
+    def test_paths_agree(self, size):
+        for seed in range(5):
+            values = random_scores(size, seed)
+            assert smooth_scores(values) == pytest.approx(
+                smooth_scores(values, vectorize=False)
+            )
+            for tolerance in (0.0, 0.05, 0.15):
+                assert count_transitions(values, tolerance) == count_transitions(
+                    values, tolerance, vectorize=False
+                )
+                assert count_non_dips(values, tolerance) == count_non_dips(
+                    values, tolerance, vectorize=False
+                )
+                assert find_inflection_points(values, tolerance) == find_inflection_points(
+                    values, tolerance, vectorize=False
+                )
+
+    @pytest.mark.integration
+    def test_analyzer_outputs_match(self):
+        results = run_context_benchmark(sizes=[10, 200], iterations=1)
+        assert all(entry["outputs_match"] for entry in results["sizes"].values())
+        assert primitives.set_vectorize_enabled(True)
+
+
+class TestHistoryCeiling:
+    @pytest.mark.unit
+    def test_request_accepts_200_items(self):
+        item = {"message": "hi", "timestamp": "2026-02-07T12:00:00Z"}
+        AnalyzeRequest(message="hello", message_history=[item] * 200)
+        with pytest.raises(ValidationError):
+            AnalyzeRequest(message="hello", message_history=[item] * 201)
@@ -0,0 +1,240 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+---
+Context Window Equivalence Tests
+---
+FILE VERSION: v5.0-8-7.0-1
+LAST MODIFIED: 2026-02-06
+PHASE: Phase 8 Step 7.0 - Incremental Context State
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+
+analyze_window() must return exactly what the batch analyze() returns for
+the same window contents, for every push / evict sequence. ContextAnalyzer
+must fall back to the batch path (and give the batch result) whenever the
+window cannot mirror the store.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.context import (
+    ContextAnalyzer,
+    UserHistoryStore,
+    create_context_window,
+    create_escalation_detector,
+    create_temporal_detector,
+    create_trend_analyzer,
+)
+from src.context.history_store import to_epoch
+
+pytestmark = pytest.mark.unit
+
+SEEDS = range(12)
+TIMEZONES = [None, "America/New_York", "Asia/Kolkata"]
+
+
+@pytest.fixture(scope="module")
+def detectors(context_config):
+    return (
+        create_escalation_detector(context_config),
+        create_trend_analyzer(context_config),
+        create_temporal_detector(context_config),
+    )
+
+
+def random_score(rng: random.Random, previous: float) -> float:
+    """Scores on a coarse grid (ties, flat runs) mixed with random walks."""
+    roll = rng.random()
+    if roll < 0.3:
+        return previous
+    if roll < 0.6:
+        return rng.choice([0.0, 0.05, 0.1, 0.25, 0.5, 0.55, 0.7, 0.85, 0.9, 1.0])
+    return min(1.0, max(0.0, previous + rng.uniform(-0.3, 0.35)))
+
+
+def random_gap(rng: random.Random) -> timedelta:
+    """Rapid bursts, ordinary gaps and multi-hour jumps (late night)."""
+    roll = rng.random()
+    if roll < 0.4:
+        return timedelta(seconds=rng.randint(1, 300))
+    if roll < 0.8:
+        return timedelta(minutes=rng.randint(5, 120))
+    return timedelta(hours=rng.randint(2, 9), minutes=rng.randint(0, 59))
+
+
+def assert_window_matches_batch(detectors, window, user_timezone):
+    escalation, trend, temporal = detectors
+    scores, timestamps = window.scores(), window.timestamps()
+    current = timestamps[-1] if timestamps else None
+
+    assert escalation.analyze_window(window) == escalation.analyze(scores, timestamps)
+    assert trend.analyze_window(window) == trend.analyze(scores, timestamps)
+    assert temporal.analyze_window(window, current, user_timezone) == temporal.analyze(
+        timestamps, current, user_timezone
+    )
+
+
+# =============================================================================
+# Detector Equivalence
+# =============================================================================
+
+
+class TestAnalyzeWindowEquivalence:
+    @pytest.mark.parametrize("seed", SEEDS)
+    @pytest.mark.parametrize("user_timezone", TIMEZONES)
+    def test_random_push_and_evict(self, detectors, seed, user_timezone):
+        rng = random.Random(seed)
+        capacity = rng.randint(3, 25)
+        window = create_context_window(capacity, detectors[2], user_timezone)
+
+        timestamp = datetime(2026, 2, 1) + timedelta(hours=rng.randint(0, 23))
+        score = rng.random()
+        for _ in range(200):
+            action = rng.random()
+            if action < 0.75 or not len(window):
+                timestamp += random_gap(rng)
+                score = random_score(rng, score)
+                assert window.push(timestamp, to_epoch(timestamp), score)
+            elif action < 0.85:
+                window.pop_left()
+            elif action < 0.95:
+                window.trim(rng.randint(0, len(window)))
+            else:
+                cutoff = to_epoch(timestamp - timedelta(hours=rng.randint(1, 12)))
+                window.expire(cutoff)
+
+            if len(window):
+                assert_window_matches_batch(detectors, window, user_timezone)
+
+    def test_rejects_out_of_order_and_tied_timestamps(self, detectors):
+        window = create_context_window(10, detectors[2])
+        start = datetime(2026, 2, 1, 12)
+        assert window.push(start, to_epoch(start), 0.2)
+        assert window.push(start + timedelta(minutes=5), to_epoch(start) + 300, 0.4)
+
+        before = window.scores()
+        assert not window.push(start, to_epoch(start), 0.9)
+        assert not window.push(start + timedelta(minutes=5), to_epoch(start) + 300, 0.9)
+        assert window.scores() == before
+
+    def test_timezone_mismatch_uses_batch(self, detectors):
+        _, _, temporal = detectors
+        window = create_context_window(10, temporal, "America/New_York")
+        start = datetime(2026, 2, 1, 3)
+        for i in range(5):
+            ts = start + timedelta(minutes=7 * i)
+            window.push(ts, to_epoch(ts), 0.1 * i)
+
+        timestamps = window.timestamps()
+        assert temporal.analyze_window(
+            window, timestamps[-1], "Asia/Tokyo"
+        ) == temporal.analyze(timestamps, timestamps[-1], "Asia/Tokyo")
+
+
+# =============================================================================
+# ContextAnalyzer Fallbacks
+# =============================================================================
+
+
+def make_analyzer(context_config, batch_only=False):
+    analyzer = ContextAnalyzer(
+        context_config_manager=context_config,
+        history_store=UserHistoryStore(max_users=100, max_entries_per_user=15),
+    )
+    if batch_only:
+        analyzer._analyze_window = lambda *args, **kwargs: None
+    return analyzer
+
+
+class TestContextAnalyzerWindowPath:
+    """Window path vs. an analyzer forced onto the batch path."""
+
+    USER = "user-1"
+
+    def analyze_both(self, incremental, batch, score, timestamp, user_timezone=None):
+        results = [
+            analyzer.analyze(
+                current_message="message",
+                current_score=score,
+                current_timestamp=timestamp,
+                user_id=self.USER,
+                user_timezone=user_timezone,
+            ).to_dict()
+            for analyzer in (incremental, batch)
+        ]
+        assert results[0] == results[1]
+        return results[0]
+
+    @pytest.mark.parametrize("seed", SEEDS)
+    def test_random_sequences_with_fallbacks(self, context_config, seed):
+        rng = random.Random(seed)
+        incremental = make_analyzer(context_config)
+        batch = make_analyzer(context_config, batch_only=True)
+        user_timezone = rng.choice(TIMEZONES)
+
+        timestamp = datetime.utcnow() - timedelta(hours=48)
+        score = rng.random()
+        for _ in range(120):
+            roll = rng.random()
+            has_history = incremental._history_store.has_user(self.USER)
+            if roll < 0.08 and has_history:
+                # Out-of-order arrival: batch fallback, window dropped
+                late = timestamp - timedelta(minutes=rng.randint(1, 600))
+                self.analyze_both(incremental, batch, rng.random(), late, user_timezone)
+                assert self.USER not in incremental._windows
+                continue
+            if roll < 0.14 and has_history:
+                # Tied timestamp with a different score
+                self.analyze_both(incremental, batch, rng.random(), timestamp, user_timezone)
+                assert self.USER not in incremental._windows
+                continue
+            if roll < 0.2:
+                # Another writer (seed / replica) moves the store revision
+                timestamp += random_gap(rng)
+                extra = rng.random()
+                for analyzer in (incremental, batch):
+                    analyzer._history_store.record(self.USER, timestamp, extra)
+
+            timestamp += random_gap(rng)
+            score = random_score(rng, score)
+            self.analyze_both(incremental, batch, score, timestamp, user_timezone)
+
+            store = incremental._history_store
+            window = incremental._windows.get(self.USER)
+            if window is not None:
+                assert window.revision == store.get_revision(self.USER)
+
+    def test_store_revision_change_rebuilds_window(self, context_config):
+        incremental = make_analyzer(context_config)
+        batch = make_analyzer(context_config, batch_only=True)
+        start = datetime.utcnow() - timedelta(hours=5)
+
+        for i in range(6):
+            self.analyze_both(incremental, batch, 0.1 * i, start + timedelta(minutes=10 * i))
+        window = incremental._windows[self.USER]
+
+        # Out-of-order write straight into the store (e.g. a replica snapshot)
+        for analyzer in (incremental, batch):
+            analyzer._history_store.record(self.USER, start + timedelta(minutes=25), 0.95)
+        assert window.revision != incremental._history_store.get_revision(self.USER)
+
+        result = self.analyze_both(incremental, batch, 0.6, start + timedelta(minutes=70))
+        assert incremental._windows[self.USER] is not window
+        assert 0.95 in result["trajectory"]["scores"]
+
+    def test_timezone_change_rebuilds_window(self, context_config):
+        incremental = make_analyzer(context_config)
+        batch = make_analyzer(context_config, batch_only=True)
+        start = datetime.utcnow() - timedelta(hours=5)
+
+        for i in range(4):
+            self.analyze_both(incremental, batch, 0.2, start + timedelta(minutes=i), "UTC")
+        window = incremental._windows[self.USER]
+
+        self.analyze_both(
+            incremental, batch, 0.3, start + timedelta(minutes=9), "America/New_York"
+        )
+        assert incremental._windows[self.USER] is not window
+        assert incremental._windows[self.USER].timezone == "America/New_York"
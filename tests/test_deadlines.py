@@ -0,0 +1,66 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+---
+Deadline Budget Tests
+---
+FILE VERSION: v5.0-8-16.0-1
+LAST MODIFIED: 2026-02-15
+PHASE: Phase 8 Step 16.0 - Deadline Budgets
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.benchmark.stubs import ZERO_LATENCY_PROFILES, StubLatencyProfile
+
+pytestmark = pytest.mark.integration
+
+SLOW_MS = 1500.0
+MESSAGE = "I feel like nothing matters anymore"
+
+
+@pytest.fixture
+def slow_irony_engine(load_config, make_engine):
+    # 200 ms SLO: secondary models get 100 ms
+    config = load_config(NLP_INFERENCE_SLO_MS="200")
+    profiles = {**ZERO_LATENCY_PROFILES, "irony": StubLatencyProfile(base_ms=SLOW_MS)}
+    return make_engine(config_manager=config, latency_profiles=profiles)
+
+
+def assert_irony_dropped(engine, assessment, elapsed_ms):
+    assert elapsed_ms < SLOW_MS / 2
+    assert "irony" not in assessment.models_used
+    assert "bart" in assessment.models_used
+    failed = engine.fallback.get_snapshot().failed_models
+    assert "irony" in failed
+
+
+class TestDeadlines:
+    def test_sync_request_does_not_wait_for_late_secondary(self, slow_irony_engine):
+        start = time.perf_counter()
+        assessment = slow_irony_engine.analyze(MESSAGE)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        assert_irony_dropped(slow_irony_engine, assessment, elapsed_ms)
+
+    def test_async_request_does_not_wait_for_late_secondary(self, slow_irony_engine):
+        start = time.perf_counter()
+        assessment = asyncio.run(slow_irony_engine.analyze_async(MESSAGE))
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        assert_irony_dropped(slow_irony_engine, assessment, elapsed_ms)
+
+    def test_erroring_secondary_left_out_of_scoring(self, make_engine):
+        engine = make_engine()
+
+        def broken(text, **kwargs):
+            raise RuntimeError("CUDA out of memory")
+
+        engine.model_loader.get_model("emotions")._pipeline = broken
+        assessment = engine.analyze(MESSAGE)
+
+        assert "emotions" not in assessment.models_used
+        assert "emotions" not in assessment.signals
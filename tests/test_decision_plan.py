@@ -0,0 +1,141 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+---
+Compiled Decision Plan Tests
+---
+FILE VERSION: v5.0-8-19.0-1
+LAST MODIFIED: 2026-02-18
+PHASE: Phase 8 Step 19.0 - Compiled Decision Plan
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+"""
+
+import random
+
+import pytest
+
+from src.ensemble.consensus import (
+    ConsensusAlgorithm,
+    ConsensusSelector,
+    weighted_voting_consensus,
+)
+from src.ensemble.scoring import CrisisSeverity
+
+DEFAULT_THRESHOLDS = {"critical": 0.85, "high": 0.70, "medium": 0.50, "low": 0.30}
+
+# Thresholds the config validator does not reject but that are out of order
+OUT_OF_ORDER = [
+    {"critical": 0.6, "high": 0.7, "medium": 0.5, "low": 0.3},
+    {"critical": 0.9, "high": 0.2, "medium": 0.5, "low": 0.4},
+    {"critical": 0.1, "high": 0.1, "medium": 0.1, "low": 0.1},
+    {"high": 0.4},
+]
+
+SIGNALS = {"bart": 0.8, "sentiment": 0.4, "irony": 0.1, "emotions": 0.6}
+
+
+# =============================================================================
+# Severity Bounds
+# =============================================================================
+
+
+class TestSeverityBounds:
+    @pytest.mark.unit
+    @pytest.mark.parametrize("thresholds", [DEFAULT_THRESHOLDS, *OUT_OF_ORDER])
+    def test_bounds_match_from_score(self, thresholds):
+        bounds = CrisisSeverity.compile_bounds(thresholds)
+        assert list(bounds) == sorted(bounds)
+
+        rng = random.Random(7)
+        edges = [b + d for b in bounds for d in (-1e-9, 0.0, 1e-9)]
+        for score in edges + [rng.random() for _ in range(500)] + [0.0, 1.0]:
+            assert CrisisSeverity.from_bounds(score, bounds) == CrisisSeverity.from_score(
+                score, thresholds
+            ), score
+
+    @pytest.mark.unit
+    def test_nan_is_safe(self):
+        bounds = CrisisSeverity.compile_bounds(DEFAULT_THRESHOLDS)
+        assert CrisisSeverity.from_bounds(float("nan"), bounds) == CrisisSeverity.SAFE
+
+
+# =============================================================================
+# Consensus Plan
+# =============================================================================
+
+
+class TestConsensusPlan:
+    @pytest.mark.unit
+    def test_setters_swap_in_a_new_plan(self):
+        selector = ConsensusSelector()
+        plan = selector.get_plan()
+
+        selector.set_algorithm(ConsensusAlgorithm.MAJORITY_VOTING)
+        selector.set_weights({"bart": 0.7})
+        selector.set_thresholds({"crisis": "0.4"})
+
+        current = selector.get_plan()
+        assert current.version == plan.version + 3
+        assert current.default_algorithm == ConsensusAlgorithm.MAJORITY_VOTING
+        assert current.weights["bart"] == 0.7
+        assert current.thresholds["crisis"] == 0.4
+        # The old plan is untouched for requests still holding it
+        assert plan.default_algorithm == ConsensusAlgorithm.WEIGHTED_VOTING
+        assert plan.weights["bart"] == 0.5
+
+    @pytest.mark.unit
+    def test_plan_is_read_only(self):
+        plan = ConsensusSelector().get_plan()
+        with pytest.raises(TypeError):
+            plan.weights["bart"] = 1.0
+
+    @pytest.mark.unit
+    def test_runner_matches_direct_call(self):
+        selector = ConsensusSelector(weights={"bart": 0.6}, thresholds={"crisis": 0.45})
+        expected = weighted_voting_consensus(
+            SIGNALS, weights=selector.weights, crisis_threshold=0.45
+        )
+
+        result = selector.select_and_run(SIGNALS)
+        assert result.crisis_score == expected.crisis_score
+        assert result.is_crisis == expected.is_crisis
+
+
+# =============================================================================
+# Engine Decision Plan
+# =============================================================================
+
+
+class TestEngineDecisionPlan:
+    @pytest.mark.integration
+    def test_setters_rebuild_the_plan(self, make_engine):
+        engine = make_engine()
+        start = engine.get_decision_plan().version
+
+        engine.set_severity_thresholds({"critical": 0.6, "high": 0.7})
+        plan = engine.get_decision_plan()
+        assert plan.version == start + 1
+        assert plan.severity(0.65) == CrisisSeverity.CRITICAL
+        assert plan.severity(0.65) == CrisisSeverity.from_score(0.65, plan.thresholds)
+
+        engine.set_consensus_algorithm("unanimous")
+        plan = engine.get_decision_plan()
+        assert plan.version == start + 2
+        assert plan.consensus.default_algorithm == ConsensusAlgorithm.UNANIMOUS
+
+    @pytest.mark.integration
+    def test_invalid_algorithm_keeps_the_plan(self, make_engine):
+        engine = make_engine()
+        plan = engine.get_decision_plan()
+
+        engine.set_consensus_algorithm("coin_flip")
+        assert engine.get_decision_plan() is plan
+
+    @pytest.mark.integration
+    def test_refresh_picks_up_outside_changes(self, make_engine):
+        engine = make_engine()
+        engine.consensus_selector.set_weights({"bart": 0.9})
+        assert engine.get_decision_plan().consensus.weights["bart"] != 0.9
+
+        plan = engine.refresh_decision_plan()
+        assert plan.consensus.weights["bart"] == 0.9
+        assert engine.get_status()["decision_plan"]["version"] == plan.version
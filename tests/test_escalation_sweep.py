@@ -0,0 +1,105 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+---
+Escalation Sweep Tests
+---
+FILE VERSION: v5.0-8-20.0-2
+LAST MODIFIED: 2026-02-19
+PHASE: Phase 8 Step 20.0 - Hot Configuration Reload
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.context import ContextAnalyzer, UserHistoryStore
+from src.context.escalation_sweep import EscalationSweeper
+from src.utils.alert_outbox import AlertOutbox
+from src.utils.alerting import Alert, AlertSeverity, DiscordAlerter
+
+pytestmark = pytest.mark.unit
+
+ESCALATING = [0.1, 0.2, 0.35, 0.55, 0.75, 0.9]
+STEADY = [0.2, 0.2, 0.2, 0.2, 0.2, 0.2]
+
+
+@pytest.fixture
+def store():
+    return UserHistoryStore()
+
+
+@pytest.fixture
+def alerter():
+    return DiscordAlerter(testing_mode=True)
+
+
+@pytest.fixture
+def sweeper(context_config, store, alerter):
+    analyzer = ContextAnalyzer(context_config_manager=context_config, history_store=store)
+    return EscalationSweeper(analyzer, alerter=alerter)
+
+
+def record_history(store, user_id, scores):
+    start = datetime.utcnow() - timedelta(hours=3)
+    for i, score in enumerate(scores):
+        store.record(user_id, start + timedelta(minutes=20 * i), score)
+
+
+class TestSweepAlerts:
+    def test_every_escalating_user_is_alerted(self, sweeper, store, alerter):
+        for user_id in ("a", "b", "c"):
+            record_history(store, user_id, ESCALATING)
+        record_history(store, "calm", STEADY)
+
+        assert asyncio.run(sweeper.run_once()) == 3
+
+        alerted = {a.fields["User ID"] for a in alerter.get_suppressed_alerts()}
+        assert alerted == {"a", "b", "c"}
+        assert sweeper.get_stats()["alerts_undelivered"] == 0
+
+    def test_analyzer_escalation_cooldown_does_not_block_sweep(
+        self, sweeper, store, alerter
+    ):
+        # A request-path escalation alert starts the shared cooldown
+        alerter._record_escalation_alert()
+        record_history(store, "a", ESCALATING)
+
+        assert asyncio.run(sweeper.run_once()) == 1
+
+    def test_cooldown_only_after_delivery(self, sweeper, store, alerter):
+        alerter._user_requested_enabled = False
+        record_history(store, "a", ESCALATING)
+
+        assert asyncio.run(sweeper.run_once()) == 0
+        assert sweeper.get_stats()["alerts_undelivered"] == 1
+
+        # Next message from the user: the earlier miss must not suppress it
+        alerter._user_requested_enabled = True
+        store.record("a", datetime.utcnow() - timedelta(minutes=30), 0.95)
+        assert asyncio.run(sweeper.run_once()) == 1
+
+    def test_delivered_user_is_on_cooldown(self, sweeper, store):
+        record_history(store, "a", ESCALATING)
+        assert asyncio.run(sweeper.run_once()) == 1
+
+        store.record("a", datetime.utcnow() - timedelta(minutes=30), 0.95)
+        assert asyncio.run(sweeper.run_once()) == 0
+        assert sweeper.get_stats()["alerts_suppressed"] == 1
+
+    def test_outbox_keeps_alerts_for_different_users(self, alerter):
+        outbox = AlertOutbox(alerter)
+        for user_id in ("a", "b", "a"):
+            outbox.enqueue(
+                Alert(
+                    severity=AlertSeverity.ESCALATION,
+                    title="Escalation: Rapid",
+                    description="Crisis escalation pattern detected.",
+                    fields={"User ID": user_id},
+                )
+            )
+
+        stats = outbox.get_stats()
+        assert stats["queue_depth"] == 2
+        assert stats["coalesced"] == 1
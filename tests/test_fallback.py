@@ -0,0 +1,191 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+---
+Fallback Strategy Tests
+---
+FILE VERSION: v5.0-8-18.0-2
+LAST MODIFIED: 2026-02-17
+PHASE: Phase 8 Step 18.0 - Thread-Safe Fallback State
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+"""
+
+import random
+import sys
+import threading
+
+import pytest
+
+from src.benchmark.fallback_stress import SECONDARY_MODELS, check_snapshot, run_fallback_stress
+from src.ensemble.fallback import (
+    LATENCY_MIN_SAMPLES,
+    CircuitBreaker,
+    CircuitState,
+    create_fallback_strategy,
+)
+
+pytestmark = pytest.mark.unit
+
+BUDGET_MS = 100.0
+
+
+@pytest.fixture
+def fallback():
+    return create_fallback_strategy(failure_threshold=3, recovery_timeout=60.0)
+
+
+@pytest.fixture
+def fast_switching():
+    """Switch threads far more often than the default 5 ms."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+# =============================================================================
+# Concurrency
+# =============================================================================
+
+
+class TestConcurrentSnapshots:
+    @pytest.mark.slow
+    def test_stress_run_has_no_violations(self):
+        result = run_fallback_stress(threads=6, ops=1500, seed=3)
+        assert result["violations"] == []
+        assert result["failures_recorded"] == result["failures_issued"]
+
+    def test_readers_never_see_torn_state(self, fast_switching):
+        fallback = create_fallback_strategy(failure_threshold=2, recovery_timeout=0.001)
+        slow_ms = fallback.secondary_budget_ms * 2
+        stop = threading.Event()
+        problems = []
+        versions = []
+
+        def writer(seed):
+            rng = random.Random(seed)
+            for _ in range(800):
+                model = rng.choice(SECONDARY_MODELS)
+                roll = rng.random()
+                if roll < 0.3:
+                    fallback.circuit_breakers[model].record_failure()
+                    fallback.handle_model_failure(model, "test")
+                elif roll < 0.6:
+                    fallback.record_latency(model, slow_ms if roll < 0.45 else 1.0)
+                else:
+                    fallback.handle_model_success(model)
+
+        def reader():
+            while not stop.is_set():
+                snapshot = fallback.get_snapshot()
+                versions.append(snapshot.version)
+                problem = check_snapshot(fallback, snapshot)
+                if problem:
+                    problems.append(problem)
+
+        readers = [threading.Thread(target=reader) for _ in range(2)]
+        writers = [threading.Thread(target=writer, args=(i,)) for i in range(4)]
+        for thread in readers + writers:
+            thread.start()
+        for thread in writers:
+            thread.join()
+        stop.set()
+        for thread in readers:
+            thread.join()
+
+        assert problems == []
+        assert versions and max(versions) <= fallback.get_snapshot().version
+        assert len(fallback.failure_history) <= fallback.FAILURE_HISTORY_SIZE
+
+    def test_concurrent_breaker_updates_are_counted(self, fast_switching):
+        breaker = CircuitBreaker(model_name="irony", failure_threshold=10**6)
+
+        def hammer():
+            for _ in range(500):
+                breaker.record_failure()
+                breaker.record_latency(1.0)
+
+        threads = [threading.Thread(target=hammer) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert breaker.failure_count == 2000
+        assert len(breaker.latencies) == breaker.latency_window
+
+
+# =============================================================================
+# Deadline Budgets
+# =============================================================================
+
+
+class TestDeadlineMiss:
+    def test_late_secondary_is_dropped(self, fallback):
+        fallback.handle_deadline_miss("emotions", fallback.secondary_budget_ms + 5)
+
+        snapshot = fallback.get_snapshot()
+        assert snapshot.failed_models == frozenset({"emotions"})
+        assert snapshot.weights["emotions"] == 0.0
+        assert sum(snapshot.weights.values()) == pytest.approx(1.0)
+        assert "Deadline exceeded" in fallback.failure_history[-1].error
+
+    def test_primary_is_never_dropped(self, fallback):
+        fallback.handle_deadline_miss("bart", 10**6)
+        assert not fallback.get_snapshot().is_degraded
+
+    def test_deadlines_follow_the_slo(self, fallback):
+        assert fallback.get_deadline_ms("sentiment") == fallback.secondary_budget_ms
+        assert fallback.get_deadline_ms("bart") >= fallback.inference_slo_ms
+
+
+# =============================================================================
+# Latency Circuit Breaking
+# =============================================================================
+
+
+class TestLatencyBreaker:
+    def make_breaker(self):
+        return CircuitBreaker(model_name="sentiment", latency_threshold_ms=BUDGET_MS)
+
+    def test_needs_minimum_samples(self):
+        breaker = self.make_breaker()
+        for _ in range(LATENCY_MIN_SAMPLES - 1):
+            assert not breaker.record_latency(BUDGET_MS * 5)
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.record_latency(BUDGET_MS * 5)
+        assert breaker.open_reason == "latency"
+
+    def test_opens_on_p95_not_on_one_outlier(self):
+        breaker = self.make_breaker()
+        for _ in range(LATENCY_MIN_SAMPLES - 1):
+            breaker.record_latency(10.0)
+        assert not breaker.record_latency(BUDGET_MS * 5)
+
+        # A second slow sample moves the nearest-rank p95 over the budget
+        assert breaker.record_latency(BUDGET_MS * 5)
+        assert breaker.state == CircuitState.OPEN
+
+    def test_slow_half_open_probe_reopens(self):
+        breaker = self.make_breaker()
+        breaker.recovery_timeout = 0.0
+        for _ in range(LATENCY_MIN_SAMPLES):
+            breaker.record_latency(BUDGET_MS * 5)
+        assert breaker.can_call()
+        assert breaker.state == CircuitState.HALF_OPEN
+
+        assert breaker.record_latency(BUDGET_MS + 1)
+        assert breaker.state == CircuitState.OPEN
+
+    def test_primary_never_opens_on_latency(self, fallback):
+        for _ in range(LATENCY_MIN_SAMPLES * 2):
+            fallback.record_latency("bart", 10**6)
+        assert fallback.can_call_model("bart")
+
+    def test_open_latency_circuit_redistributes_weight(self, fallback):
+        slow_ms = fallback.secondary_budget_ms * 2
+        for _ in range(LATENCY_MIN_SAMPLES):
+            fallback.record_latency("irony", slow_ms)
+
+        assert not fallback.can_call_model("irony")
+        assert fallback.get_snapshot().weights["irony"] == 0.0
+        assert fallback.get_status()["circuit_breakers"]["irony"]["open_reason"] == "latency"
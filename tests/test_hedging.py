@@ -0,0 +1,77 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+---
+Hedged Inference Tests
+---
+FILE VERSION: v5.0-8-17.0-2
+LAST MODIFIED: 2026-02-16
+PHASE: Phase 8 Step 17.0 - Hedged BART Requests
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+
+Every replica slot claimed for a call must be returned, whether the call
+runs, fails, or is cancelled while still queued.
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.ensemble import HedgedInference
+from src.ensemble.hedging import MIN_LATENCY_SAMPLES
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def hedging():
+    hedging = HedgedInference(max_replicas=2, hedge_percentile=50.0, min_delay_ms=1.0)
+    yield hedging
+    hedging.shutdown()
+
+
+class TestSlotRelease:
+    def test_cancelled_queued_call_releases_slot(self, hedging):
+        # Occupy both workers so the next call stays queued
+        gate = threading.Event()
+        blockers = [hedging._pool.submit(gate.wait) for _ in range(2)]
+
+        replica = object()
+        try:
+            assert hedging._acquire([replica]) is replica
+            queued = hedging._submit(lambda r: "never", replica)
+
+            assert queued.cancel()
+            assert id(replica) not in hedging._busy
+        finally:
+            gate.set()
+            for blocker in blockers:
+                blocker.result()
+
+    def test_hedged_calls_release_both_slots(self, hedging):
+        replicas = ["primary", "spare"]
+        for _ in range(MIN_LATENCY_SAMPLES):
+            hedging.call(replicas, lambda r: r)
+
+        slow = threading.Event()
+
+        def fn(replica):
+            if replica == "primary":
+                slow.wait(1.0)
+            return replica
+
+        assert hedging.call(replicas, fn) == "spare"
+        slow.set()
+        deadline = time.monotonic() + 1.0
+        while hedging._busy and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not hedging._busy
+        assert hedging.get_stats()["hedge_wins"] == 1
+
+    def test_failed_call_releases_slot(self, hedging):
+        def fail(replica):
+            raise RuntimeError("replica down")
+
+        with pytest.raises(RuntimeError):
+            hedging.call(["primary"], fail)
+        assert not hedging._busy
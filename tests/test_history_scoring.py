@@ -0,0 +1,82 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+---
+Batched History Scoring Tests
+---
+FILE VERSION: v5.0-8-6.0-1
+LAST MODIFIED: 2026-02-05
+PHASE: Phase 8 Step 6.0 - Batched History Scoring
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+START = datetime.utcnow() - timedelta(hours=1)
+UNSCORED = ["can't focus today", "feeling really low", "nobody would notice"]
+
+
+def history(messages):
+    return [
+        {"message": text, "timestamp": (START + timedelta(minutes=10 * i)).isoformat()}
+        for i, text in enumerate(messages)
+    ]
+
+
+def history_stats(assessment):
+    return assessment.context_analysis.to_dict()["history_analyzed"]
+
+
+class TestAnalyzeBatch:
+    @pytest.mark.unit
+    def test_matches_single_calls_in_one_pipeline_call(self, make_engine):
+        bart = make_engine().model_loader.get_model("bart")
+        calls = bart._pipeline.calls
+
+        batched = bart.analyze_batch(UNSCORED)
+
+        assert bart._pipeline.calls == calls + 1
+        singles = [bart.analyze(text) for text in UNSCORED]
+        assert [r.all_scores for r in batched] == [r.all_scores for r in singles]
+
+    @pytest.mark.unit
+    def test_empty_batch(self, make_engine):
+        assert make_engine().model_loader.get_model("bart").analyze_batch([]) == []
+
+
+class TestEngineHistoryScoring:
+    @pytest.mark.integration
+    def test_unscored_history_is_scored_with_the_message(self, make_engine):
+        engine = make_engine()
+        bart = engine.model_loader.get_model("bart")
+        calls = bart._pipeline.calls
+
+        assessment = engine.analyze("I give up", message_history=history(UNSCORED))
+
+        assert bart._pipeline.calls == calls + 1
+        stats = history_stats(assessment)
+        # History plus the current message
+        assert stats["message_count"] == len(UNSCORED) + 1
+        assert stats["scores_computed"] == len(UNSCORED)
+        assert stats["scores_cached"] == 0
+
+    @pytest.mark.integration
+    def test_second_request_reuses_scores(self, make_engine):
+        engine = make_engine()
+        engine.analyze("I give up", message_history=history(UNSCORED))
+
+        stats = history_stats(
+            engine.analyze("still here", message_history=history(UNSCORED))
+        )
+        assert stats["scores_computed"] == 0
+        assert stats["scores_cached"] == len(UNSCORED)
+
+    @pytest.mark.integration
+    def test_supplied_scores_are_kept(self, make_engine):
+        items = history(UNSCORED)
+        items[0]["crisis_score"] = 0.9
+
+        stats = history_stats(make_engine().analyze("I give up", message_history=items))
+        assert stats["message_count"] == len(UNSCORED) + 1
+        assert stats["scores_computed"] == len(UNSCORED) - 1
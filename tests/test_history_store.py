@@ -0,0 +1,102 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+---
+User History Store Tests
+---
+FILE VERSION: v5.0-8-5.0-2
+LAST MODIFIED: 2026-02-04
+PHASE: Phase 8 Step 5.0 - Server-Side User History Store
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.context import UserHistoryStore
+
+START = datetime.utcnow() - timedelta(hours=2)
+
+
+class TestUserHistoryStore:
+    @pytest.mark.unit
+    def test_keeps_entries_sorted_and_bounded(self):
+        store = UserHistoryStore(max_entries_per_user=3)
+        for minutes, score in [(0, 0.1), (20, 0.3), (10, 0.2), (30, 0.4)]:
+            store.record("u", START + timedelta(minutes=minutes), score)
+
+        scores, timestamps = store.get_sequences("u")
+        assert scores == [0.2, 0.3, 0.4]
+        assert timestamps == sorted(timestamps)
+
+    @pytest.mark.unit
+    def test_retried_message_is_not_stored_twice(self):
+        store = UserHistoryStore()
+        assert store.record("u", START, 0.5)
+        assert not store.record("u", START, 0.5)
+        assert store.get_stats()["entries"] == 1
+
+    @pytest.mark.unit
+    def test_least_recent_user_evicted(self):
+        store = UserHistoryStore(max_users=2)
+        for user in ("a", "b", "c"):
+            store.record(user, START, 0.1)
+        assert not store.has_user("a")
+        assert store.get_stats()["user_evictions"] == 1
+
+    @pytest.mark.unit
+    def test_expired_entries_dropped(self):
+        store = UserHistoryStore(ttl_seconds=3600)
+        store.record("u", START, 0.1)
+        store.record("u", START + timedelta(minutes=90), 0.2)
+        scores, _ = store.get_sequences("u")
+        assert scores == [0.2]
+
+    @pytest.mark.unit
+    def test_seed_only_unknown_users(self):
+        store = UserHistoryStore()
+        items = [(START, 0.1), (START + timedelta(minutes=5), 0.2)]
+        assert store.seed("u", items) == 2
+        assert store.seed("u", items) == 0
+
+    @pytest.mark.unit
+    def test_snapshot_round_trip(self, tmp_path):
+        path = str(tmp_path / "history.json")
+        store = UserHistoryStore(snapshot_path=path)
+        store.record("u", START, 0.4)
+        assert store.save_snapshot() == 1
+
+        restored = UserHistoryStore(snapshot_path=path)
+        assert restored.get_sequences("u")[0] == [0.4]
+
+
+class TestResponseCacheIsolation:
+    """Per-user context analysis must never be served from another user's hit."""
+
+    MESSAGE = "I feel hopeless tonight"
+    HISTORY = [
+        {"message": "rough day", "timestamp": START.isoformat(), "crisis_score": 0.3}
+    ]
+
+    @pytest.mark.integration
+    def test_users_get_their_own_context(self, make_engine):
+        engine = make_engine()
+        first = engine.analyze(self.MESSAGE, user_id="a", message_history=self.HISTORY)
+        second = engine.analyze(self.MESSAGE, user_id="b")
+
+        assert second is not first
+        assert not second.cached
+        history = second.context_analysis.to_dict()["history_analyzed"]
+        assert history["source"] == "store"
+        assert history["message_count"] == 1
+
+    @pytest.mark.integration
+    def test_cache_hit_returns_copy(self, make_engine):
+        engine = make_engine()
+        first = engine.analyze("just chilling")
+        first_time = first.processing_time_ms
+        second = engine.analyze("just chilling")
+
+        assert second.cached and not first.cached
+        assert second is not first
+        assert first.processing_time_ms == first_time
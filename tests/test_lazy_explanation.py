@@ -0,0 +1,52 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+---
+Lazy Explanation Tests
+---
+FILE VERSION: v5.0-8-15.0-1
+LAST MODIFIED: 2026-02-14
+PHASE: Phase 8 Step 15.0 - Lazy Explanations
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+"""
+
+import pytest
+
+from src.ensemble.explainability import LazyExplanation, VerbosityLevel
+
+pytestmark = pytest.mark.integration
+
+MESSAGES = [
+    "I don't want to be here anymore",
+    "great game last night lol",
+    "I'm so tired of everything, nothing helps",
+]
+
+
+class TestLazyExplanation:
+    def test_nothing_rendered_until_read(self, make_engine):
+        explanation = make_engine().analyze(MESSAGES[0]).explanation
+
+        assert isinstance(explanation, LazyExplanation)
+        assert set(explanation._values) == {"verbosity"}
+
+        explanation["decision_summary"]
+        assert set(explanation._values) == {"verbosity", "decision_summary"}
+
+    @pytest.mark.parametrize("verbosity", [level.value for level in VerbosityLevel])
+    def test_matches_eager_explanation(self, make_engine, verbosity):
+        engine = make_engine()
+        for message in MESSAGES:
+            assessment = engine.analyze(message, verbosity=verbosity, use_cache=False)
+            eager = engine.explainability_generator.generate(
+                assessment.aggregated_result, VerbosityLevel(verbosity)
+            ).to_dict()
+
+            assert list(assessment.explanation) == list(eager)
+            assert dict(assessment.explanation) == eager
+            assert assessment.to_dict()["explanation"] == eager
+
+    def test_unknown_key(self, make_engine):
+        explanation = make_engine().analyze(MESSAGES[1]).explanation
+        with pytest.raises(KeyError):
+            explanation["nope"]
+        assert explanation.get("nope") is None
@@ -0,0 +1,70 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+---
+Live Request Path Metrics Tests
+---
+FILE VERSION: v5.0-8-3.0-1
+LAST MODIFIED: 2026-02-03
+PHASE: Phase 8 Step 3.0 - Live Request Path Metrics
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+"""
+
+import pytest
+
+from src.utils import metrics
+from src.utils.metrics import PROMETHEUS_AVAILABLE
+
+needs_prometheus = pytest.mark.skipif(
+    not PROMETHEUS_AVAILABLE, reason="prometheus_client not installed"
+)
+
+
+class CountingMetric:
+    def __init__(self):
+        self.lookups = 0
+
+    def labels(self, *values):
+        self.lookups += 1
+        return values
+
+
+class TestLabelledChildren:
+    @pytest.mark.unit
+    def test_child_lookup_cached(self):
+        metric = CountingMetric()
+        first = metrics._child(metric, "bart")
+        second = metrics._child(metric, "bart")
+        metrics._child(metric, "irony")
+
+        assert first is second
+        assert metric.lookups == 2
+
+
+class TestRecording:
+    @pytest.mark.unit
+    def test_helpers_never_raise(self):
+        metrics.record_stage_timings({"inference": 3.0, "scoring": 0.1})
+        metrics.observe_model_inference("bart", 12.0)
+        metrics.record_engine_request("inference", 15.0)
+        metrics.record_cache_operation("miss")
+        metrics.record_vigil_request("success", 4.0)
+
+    @pytest.mark.unit
+    def test_status_matches_availability(self):
+        status = metrics.get_metrics_status()
+        assert status["prometheus_available"] == PROMETHEUS_AVAILABLE
+        assert (status["metrics_endpoint"] is not None) == PROMETHEUS_AVAILABLE
+
+    @needs_prometheus
+    @pytest.mark.integration
+    def test_engine_records_stages_and_outcomes(self, make_engine):
+        def sample(name, **labels):
+            return metrics.REGISTRY.get_sample_value(name, labels) or 0.0
+
+        before_stage = sample("ash_nlp_stage_duration_seconds_count", stage="inference")
+        before_requests = sample("ash_nlp_engine_requests_total", outcome="inference")
+
+        make_engine().analyze("everything is falling apart")
+
+        assert sample("ash_nlp_stage_duration_seconds_count", stage="inference") == before_stage + 1
+        assert sample("ash_nlp_engine_requests_total", outcome="inference") == before_requests + 1
@@ -0,0 +1,104 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+---
+Fused ASGI Middleware Tests
+---
+FILE VERSION: v5.0-8-12.0-1
+LAST MODIFIED: 2026-02-11
+PHASE: Phase 8 Step 12.0 - Fused ASGI Middleware
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+"""
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from src.api.middleware import (
+    INTERNAL_KEY_HEADER,
+    REQUEST_ID_HEADER,
+    get_request_context,
+    setup_middleware,
+)
+
+pytestmark = pytest.mark.unit
+
+BYPASS_KEY = "internal-secret"
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+
+    @app.get("/echo")
+    async def echo(request: Request):
+        context = get_request_context()
+        return {
+            "state": request.state.request_id,
+            "context": context.request_id if context else None,
+        }
+
+    @app.post("/analyze/batch")
+    async def batch():
+        return {}
+
+    @app.get("/health")
+    async def health():
+        return {}
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    setup_middleware(app, requests_per_minute=2, rate_limit_bypass_key=BYPASS_KEY)
+    return TestClient(app)
+
+
+class TestRequestId:
+    def test_generated_and_shared_with_the_endpoint(self, client):
+        response = client.get("/echo")
+        request_id = response.headers[REQUEST_ID_HEADER]
+
+        assert request_id.startswith("req_")
+        assert response.json() == {"state": request_id, "context": request_id}
+        assert get_request_context() is None
+
+    def test_client_id_echoed_if_valid(self, client):
+        assert client.get("/echo", headers={REQUEST_ID_HEADER: "bot-42"}).headers[
+            REQUEST_ID_HEADER
+        ] == "bot-42"
+        assert client.get("/echo", headers={REQUEST_ID_HEADER: "bad id!"}).headers[
+            REQUEST_ID_HEADER
+        ].startswith("req_")
+
+
+class TestRateLimiting:
+    def test_limited_with_retry_after(self, client):
+        assert client.get("/echo").status_code == 200
+        assert client.get("/echo").status_code == 200
+
+        limited = client.get("/echo")
+        assert limited.status_code == 429
+        assert limited.json()["error"] == "rate_limit_exceeded"
+        assert int(limited.headers["Retry-After"]) >= 1
+        assert REQUEST_ID_HEADER in limited.headers
+
+    def test_exempt_requests(self, client):
+        for _ in range(3):
+            assert client.get("/health").status_code == 200
+            assert client.get("/echo", headers={INTERNAL_KEY_HEADER: BYPASS_KEY}).status_code == 200
+
+    def test_batch_has_its_own_bucket(self, client):
+        client.get("/echo")
+        client.get("/echo")
+        assert client.post("/analyze/batch").status_code == 200
+        assert client.post("/analyze/batch").status_code == 429
+
+
+class TestErrors:
+    def test_unhandled_exception_becomes_json_500(self, client):
+        response = client.get("/boom", headers={REQUEST_ID_HEADER: "req-err"})
+
+        assert response.status_code == 500
+        assert response.json()["error"] == "internal_error"
+        assert response.json()["request_id"] == "req-err"
+        assert response.headers[REQUEST_ID_HEADER] == "req-err"
@@ -0,0 +1,134 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+---
+Near-Duplicate Index Tests
+---
+FILE VERSION: v5.0-8-24.0-3
+LAST MODIFIED: 2026-02-23
+PHASE: Phase 8 Step 24.0 - Near-Duplicate Cache
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+"""
+
+import pytest
+
+from src.utils.near_duplicate import (
+    NearDuplicateIndex,
+    normalize_message,
+    word_changes,
+)
+
+ORIGINAL = "i want to live and i do not want to die, everything is fine lol"
+NEGATION_MOVED = "i do not want to live and i want to die, everything is fine lol"
+
+LONG_ORIGINAL = (
+    "i am not going to kill myself tonight, i am going to call my friend "
+    "and we are going to watch movies until i fall asleep on the couch"
+)
+LONG_NEGATION_MOVED = (
+    "i am going to kill myself tonight, i am not going to call my friend "
+    "and we are going to watch movies until i fall asleep on the couch"
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def index():
+    return NearDuplicateIndex(threshold=0.8)
+
+
+@pytest.fixture
+def fuzzy_index():
+    return NearDuplicateIndex(threshold=0.8, max_word_changes=1)
+
+
+class TestWordChanges:
+    def test_identical(self):
+        assert word_changes(["a", "b"], ["a", "b"], 0) == 0
+
+    def test_reordered_words_are_changes(self):
+        assert word_changes(["a", "not", "b"], ["not", "a", "b"], 5) == 2
+
+    def test_replacement_counts_twice(self):
+        assert word_changes(["want", "to", "live"], ["want", "to", "die"], 5) == 2
+
+    def test_capped_at_limit(self):
+        assert word_changes(["a"], ["b", "c", "d"], 1) == 2
+
+
+class TestNegationSwap:
+    """A moved "not" must never reuse the benign original's result."""
+
+    @pytest.mark.parametrize(
+        "original, variant",
+        [(ORIGINAL, NEGATION_MOVED), (LONG_ORIGINAL, LONG_NEGATION_MOVED)],
+    )
+    def test_moved_negation_does_not_match(self, index, original, variant):
+        assert sorted(normalize_message(original).split()) == sorted(
+            normalize_message(variant).split()
+        )
+        index.add(original)
+        assert index.lookup(variant) is None
+
+    @pytest.mark.parametrize(
+        "original, variant",
+        [(ORIGINAL, NEGATION_MOVED), (LONG_ORIGINAL, LONG_NEGATION_MOVED)],
+    )
+    def test_moved_negation_with_word_budget(self, fuzzy_index, original, variant):
+        fuzzy_index.add(original)
+        assert fuzzy_index.lookup(variant) is None
+        assert fuzzy_index.get_stats()["word_rejections"] == 1
+
+
+class TestNumbers:
+    """Repeated digits are content, not elongation."""
+
+    ORIGINAL = "i took 1000 pills and i am going to sleep now, see you all"
+
+    def test_digits_are_not_collapsed(self):
+        assert normalize_message("took 1000 pills!!!") == "took 1000 pills"
+        assert normalize_message("soooo tired") == "so tired"
+
+    @pytest.mark.parametrize("fixture", ["index", "fuzzy_index"])
+    def test_different_amounts_do_not_match(self, request, fixture):
+        index = request.getfixturevalue(fixture)
+        index.add(self.ORIGINAL)
+        assert index.lookup(self.ORIGINAL.replace("1000", "10")) is None
+        assert index.lookup(self.ORIGINAL.replace("1000", "100000")) is None
+
+
+class TestCosmeticVariants:
+    def test_emoji_casing_punctuation_and_elongation_match(self, index):
+        index.add(ORIGINAL)
+        match = index.lookup(
+            "I want to liiiive and I do NOT want to die... everything is fine lol 😂😂"
+        )
+        assert match is not None
+        assert match.text == ORIGINAL
+        assert match.word_changes == 0
+
+    def test_appended_sentence_does_not_match(self, index):
+        index.add(LONG_ORIGINAL)
+        assert index.lookup(LONG_ORIGINAL + " i want to die") is None
+
+    def test_namespaces_are_separate(self, index):
+        index.add(ORIGINAL, namespace="a")
+        assert index.lookup(ORIGINAL + "!!", namespace="b") is None
+
+
+class TestLookupModes:
+    def test_default_is_a_normalized_key_lookup(self, index):
+        index.add(ORIGINAL)
+        match = index.lookup(ORIGINAL.upper() + " 🙂")
+
+        assert match.similarity == 1.0
+        assert index.get_stats()["mode"] == "exact"
+        assert not index._postings
+
+    def test_word_budget_allows_a_filler_word(self, fuzzy_index):
+        fuzzy_index.add(LONG_ORIGINAL)
+        match = fuzzy_index.lookup(LONG_ORIGINAL + " ok")
+
+        assert match is not None
+        assert match.word_changes == 1
+        assert fuzzy_index.get_stats()["mode"] == "minhash"
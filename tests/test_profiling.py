@@ -0,0 +1,78 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+---
+Sampling Profiler Tests
+---
+FILE VERSION: v5.0-8-4.0-1
+LAST MODIFIED: 2026-02-03
+PHASE: Phase 8 Step 4.0 - On-Demand Profiling
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+"""
+
+import time
+
+import pytest
+
+from src.utils.profiling import (
+    ProfileResult,
+    ProfilerBusyError,
+    create_sampling_profiler,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def busy_loop(seconds):
+    end = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < end:
+        total += 1
+    return total
+
+
+class TestProfileResult:
+    def test_collapsed_hottest_first(self):
+        result = ProfileResult(
+            duration_s=1.0,
+            interval_ms=5.0,
+            samples=5,
+            stacks={"Main;a;b": 1, "Main;a;c": 3, "Worker;c": 1},
+        )
+
+        assert result.to_collapsed().splitlines()[0] == "Main;a;c 3"
+        assert result.top_frames(1) == [("c", 4)]
+        assert result.to_dict()["unique_stacks"] == 3
+
+
+class TestSamplingProfiler:
+    def test_profile_call_sees_the_call(self):
+        profiler = create_sampling_profiler(interval_ms=1.0)
+
+        value, profile = profiler.profile_call(busy_loop, 0.2)
+
+        assert value > 0
+        assert profile.samples > 0
+        assert any("busy_loop" in stack for stack in profile.stacks)
+        assert not profiler.is_running
+
+    def test_one_capture_at_a_time(self):
+        profiler = create_sampling_profiler()
+        profiler.start()
+        try:
+            with pytest.raises(ProfilerBusyError):
+                profiler.start()
+        finally:
+            profiler.stop()
+
+        # The slot is free again after stop()
+        profiler.start()
+        profiler.stop()
+
+    def test_stop_without_start(self):
+        with pytest.raises(RuntimeError):
+            create_sampling_profiler().stop()
+
+    def test_capture_capped_at_max_duration(self):
+        profiler = create_sampling_profiler(interval_ms=1.0, max_duration_s=0.05)
+        result = profiler.capture(duration_s=5.0)
+        assert result.duration_s < 1.0
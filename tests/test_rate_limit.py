@@ -0,0 +1,80 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+---
+Token Bucket Rate Limiting Tests
+---
+FILE VERSION: v5.0-8-11.0-1
+LAST MODIFIED: 2026-02-10
+PHASE: Phase 8 Step 11.0 - Token Bucket Rate Limiting
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+"""
+
+import pytest
+
+from src.api.rate_limit import (
+    RateLimitDecision,
+    RouteLimit,
+    build_route_limits,
+    create_rate_limit_backend,
+)
+
+pytestmark = pytest.mark.unit
+
+PER_SECOND = RouteLimit(name="default", requests_per_minute=60)
+
+
+def drain(backend, key, limit, now=0.0):
+    for _ in range(int(limit.capacity)):
+        assert backend.acquire(key, limit, now=now).allowed
+
+
+class TestTokenBucket:
+    def test_burst_then_limited(self):
+        backend = create_rate_limit_backend()
+        drain(backend, "a", PER_SECOND)
+
+        decision = backend.acquire("a", PER_SECOND, now=0.0)
+        assert not decision.allowed
+        assert decision.remaining == 0
+        assert decision.retry_after == pytest.approx(1.0)
+        assert backend.acquire("b", PER_SECOND, now=0.0).allowed
+
+    def test_refills_at_the_sustained_rate(self):
+        backend = create_rate_limit_backend()
+        drain(backend, "a", PER_SECOND)
+
+        assert backend.acquire("a", PER_SECOND, now=1.0).allowed
+        assert not backend.acquire("a", PER_SECOND, now=1.5).allowed
+        assert backend.acquire("a", PER_SECOND, now=2.5).allowed
+
+    def test_full_idle_buckets_evicted(self):
+        backend = create_rate_limit_backend()
+        backend.acquire("a", PER_SECOND, now=0.0)
+
+        # "a" is full again after one second
+        backend.acquire("b", PER_SECOND, now=5.0)
+        assert len(backend) == 1
+        assert backend.get_stats()["idle_evictions"] == 1
+
+    def test_least_recent_client_evicted_at_capacity(self):
+        backend = create_rate_limit_backend(max_clients=2)
+        drain(backend, "a", PER_SECOND)
+        backend.acquire("b", PER_SECOND, now=0.0)
+        backend.acquire("a", PER_SECOND, now=0.0)
+        backend.acquire("c", PER_SECOND, now=0.0)
+
+        # "a" was used last, so "b" went; "a" is still drained
+        assert backend.get_stats()["capacity_evictions"] == 1
+        assert not backend.acquire("a", PER_SECOND, now=0.0).allowed
+
+    def test_retry_after_header_rounds_up(self):
+        assert RateLimitDecision(False, 0, retry_after=0.2).retry_after_header == "1"
+        assert RateLimitDecision(False, 0, retry_after=2.1).retry_after_header == "3"
+
+
+class TestRouteLimits:
+    def test_batch_defaults_to_a_tenth(self):
+        default, routes = build_route_limits(60)
+        assert default.requests_per_minute == 60
+        assert routes["/analyze/batch"].requests_per_minute == 6
+        assert build_route_limits(5)[1]["/analyze/batch"].requests_per_minute == 1
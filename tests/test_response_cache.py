@@ -0,0 +1,38 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+---
+Response Cache Tests
+---
+FILE VERSION: v5.0-8-21.0-2
+LAST MODIFIED: 2026-02-20
+PHASE: Phase 8 Step 21.0 - Versioned Crisis Label Sets
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+
+A config with performance.cache_enabled=false must give a working engine
+with no response cache, including the benchmark engine.
+"""
+
+import pytest
+
+from src.utils.cache import create_response_cache
+
+
+class TestDisabledCache:
+    @pytest.mark.unit
+    def test_zero_size_cache_stores_nothing(self):
+        cache = create_response_cache(max_size=0, ttl_seconds=0)
+
+        cache.set("hello", "value")
+
+        assert cache.get("hello") is None
+        assert cache.get_stats()["size"] == 0
+
+    @pytest.mark.integration
+    def test_benchmark_engine_follows_config(self, load_config, make_engine):
+        config = load_config()
+        assert not config.get_performance_config()["cache_enabled"]
+
+        engine = make_engine(config_manager=config)
+        assert engine._cache is None
+        assessment = engine.analyze("I can't do this anymore")
+        assert assessment.crisis_score is not None
@@ -0,0 +1,86 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+---
+Fast Response Serialization Tests
+---
+FILE VERSION: v5.0-8-13.0-1
+LAST MODIFIED: 2026-02-12
+PHASE: Phase 8 Step 13.0 - Fast Response Serialization
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+"""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from pydantic import ValidationError
+
+from src.api import serialization
+from src.api.schemas import AnalyzeRequest, AnalyzeResponse
+from src.api.serialization import (
+    COMPACT_FIELDS,
+    build_analyze_payload,
+    dumps,
+    resolve_projection,
+)
+
+HISTORY = [
+    {
+        "message": "rough day",
+        "timestamp": (datetime.utcnow() - timedelta(minutes=30)).isoformat(),
+        "crisis_score": 0.4,
+    }
+]
+
+
+@pytest.fixture
+def assessment(make_engine):
+    return make_engine().analyze(
+        "I don't know how much longer I can keep going",
+        message_history=HISTORY,
+        user_id="u1",
+    )
+
+
+def as_json(payload):
+    return json.loads(dumps(payload))
+
+
+class TestPayload:
+    @pytest.mark.integration
+    def test_same_document_as_the_schema(self, assessment):
+        payload = build_analyze_payload(assessment, request_id="req-1", include_timing=True)
+
+        expected = AnalyzeResponse.model_validate(payload).model_dump(mode="json")
+        assert as_json(payload) == expected
+        assert list(payload) == list(expected)
+
+    @pytest.mark.integration
+    def test_projection_builds_only_requested_sections(self, assessment):
+        fields = resolve_projection(["crisis_score", "context_analysis"])
+        payload = build_analyze_payload(assessment, fields=fields)
+
+        assert list(payload) == ["crisis_score", "context_analysis"]
+        assert payload["context_analysis"]["history_analyzed"]["message_count"] == 2
+
+    @pytest.mark.unit
+    def test_compact_adds_to_fields(self):
+        assert resolve_projection(None) is None
+        assert resolve_projection(["explanation"], compact=True) == COMPACT_FIELDS | {
+            "explanation"
+        }
+
+    @pytest.mark.unit
+    def test_unknown_fields_rejected(self):
+        with pytest.raises(ValidationError):
+            AnalyzeRequest(message="hi", fields=["crisis_score", "nope"])
+
+
+class TestEncoding:
+    @pytest.mark.integration
+    def test_stdlib_fallback_matches(self, assessment, monkeypatch):
+        payload = build_analyze_payload(assessment, request_id="req-1")
+        encoded = as_json(payload)
+
+        monkeypatch.setattr(serialization, "ORJSON_AVAILABLE", False)
+        assert as_json(payload) == encoded
@@ -0,0 +1,155 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+---
+Response Serialization Tests
+---
+FILE VERSION: v5.0-8-14.0-2
+LAST MODIFIED: 2026-02-13
+PHASE: Phase 8 Step 14.0 - MessagePack Content Negotiation
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+"""
+
+import json
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from starlette.requests import Request
+
+from src.api import serialization
+from src.api.serialization import (
+    MSGPACK_AVAILABLE,
+    NegotiatedRoute,
+    accepts_msgpack,
+    build_analyze_payload,
+    dumps,
+    negotiate_response,
+    packb,
+    resolve_projection,
+    unpackb,
+)
+
+needs_msgpack = pytest.mark.skipif(not MSGPACK_AVAILABLE, reason="msgpack not installed")
+
+
+class EchoRequest(BaseModel):
+    message: str
+    count: int = 1
+
+
+@pytest.fixture
+def client():
+    router = APIRouter(route_class=NegotiatedRoute)
+
+    @router.post("/echo")
+    async def echo(body: EchoRequest, request: Request):
+        return negotiate_response(body.model_dump(), request)
+
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+class TestAcceptsMsgpack:
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "accept",
+        [
+            "application/msgpack",
+            "application/x-msgpack",
+            "application/json;q=0.5, application/msgpack;q=0.9",
+            "Application/MsgPack; q=1",
+        ],
+    )
+    def test_selects_msgpack(self, accept):
+        assert accepts_msgpack(accept)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "accept",
+        [
+            None,
+            "",
+            "*/*",
+            "application/*",
+            "application/json",
+            "application/msgpack;q=0",
+            "application/x-msgpack; q=0.0, */*",
+            "application/msgpack;q=bad",
+        ],
+    )
+    def test_keeps_json(self, accept):
+        assert not accepts_msgpack(accept)
+
+
+@needs_msgpack
+class TestNegotiatedRoute:
+    @pytest.mark.unit
+    def test_msgpack_round_trip(self, client):
+        response = client.post(
+            "/echo",
+            content=packb({"message": "hi", "count": 2}),
+            headers={
+                "content-type": "application/x-msgpack",
+                "accept": "application/msgpack",
+            },
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/msgpack"
+        assert unpackb(response.content) == {"message": "hi", "count": 2}
+
+    @pytest.mark.unit
+    def test_msgpack_body_validated_like_json(self, client):
+        response = client.post(
+            "/echo",
+            content=packb({"count": 2}),
+            headers={"content-type": "application/msgpack"},
+        )
+        assert response.status_code == 422
+
+    @pytest.mark.unit
+    def test_bad_body_is_400(self, client):
+        response = client.post(
+            "/echo",
+            content=b"\xc1\xc1",
+            headers={"content-type": "application/msgpack"},
+        )
+        assert response.status_code == 400
+        assert response.headers["content-type"] == "application/json"
+
+    @pytest.mark.unit
+    def test_without_msgpack(self, client, monkeypatch):
+        body = packb({"message": "hi"})
+        monkeypatch.setattr(serialization, "MSGPACK_AVAILABLE", False)
+
+        rejected = client.post(
+            "/echo",
+            content=body,
+            headers={"content-type": "application/msgpack"},
+        )
+        assert rejected.status_code == 415
+
+        fallback = client.post(
+            "/echo", json={"message": "hi"}, headers={"accept": "application/msgpack"}
+        )
+        assert fallback.status_code == 200
+        assert fallback.json() == {"message": "hi", "count": 1}
+
+
+class TestAnalyzePayload:
+    @needs_msgpack
+    @pytest.mark.integration
+    def test_msgpack_and_json_documents_match(self, make_engine):
+        assessment = make_engine().analyze("I don't see the point anymore")
+        payload = build_analyze_payload(assessment, request_id="req-1")
+
+        assert unpackb(packb(payload)) == json.loads(dumps(payload))
+
+    @pytest.mark.integration
+    def test_compact_projection(self, make_engine):
+        assessment = make_engine().analyze("just chilling")
+        fields = resolve_projection(compact=True)
+        payload = build_analyze_payload(assessment, request_id="req-1", fields=fields)
+
+        assert set(payload) == serialization.COMPACT_FIELDS
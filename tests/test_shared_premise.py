@@ -0,0 +1,117 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+---
+Shared-Premise Scoring Tests
+---
+FILE VERSION: v5.0-8-23.0-1
+LAST MODIFIED: 2026-02-22
+PHASE: Phase 8 Step 23.0 - Shared-Premise Encoder Reuse
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+
+Score parity needs the real model (src.benchmark.premise_parity); these
+tests cover the wiring and the fallback to the standard pipeline.
+"""
+
+import pytest
+
+from src.benchmark.stubs import ZERO_LATENCY_PROFILES, StubZeroShotPipeline
+from src.models import create_bart_classifier, create_shared_premise_scorer
+
+MESSAGES = [
+    "I can't do this anymore",
+    "just chilling with the cat",
+    "everything feels heavy lately",
+]
+
+
+class RecordingScorer:
+    """Stands in for SharedPremiseScorer, answering through the stub pipeline."""
+
+    def __init__(self, pipeline):
+        self.pipeline = pipeline
+        self.calls = []
+
+    def __call__(self, text, candidate_labels, encodings=None, **kwargs):
+        self.calls.append((tuple(candidate_labels), encodings))
+        return self.pipeline(text, candidate_labels=candidate_labels, **kwargs)
+
+    def get_stats(self):
+        return {"calls": len(self.calls)}
+
+
+def make_classifier(shared_premise, two_stage=False):
+    classifier = create_bart_classifier()
+    classifier.shared_premise = shared_premise
+    classifier.two_stage = two_stage
+    classifier._pipeline = StubZeroShotPipeline(latency=ZERO_LATENCY_PROFILES["bart"])
+    classifier._is_loaded = True
+    return classifier
+
+
+class TestFallback:
+    @pytest.mark.unit
+    def test_factory_rejects_non_bart_pipeline(self):
+        pipeline = StubZeroShotPipeline(latency=ZERO_LATENCY_PROFILES["bart"])
+        assert create_shared_premise_scorer(pipeline) is None
+
+    @pytest.mark.unit
+    def test_unsupported_pipeline_keeps_standard_path(self):
+        standard, shared = make_classifier(False), make_classifier(True)
+        shared.load()
+
+        assert shared.get_shared_premise_stats() == {"enabled": True, "active": False}
+        for message in MESSAGES:
+            assert shared.analyze(message).all_scores == standard.analyze(message).all_scores
+
+    @pytest.mark.integration
+    def test_config_enables_mode(self, load_config, make_engine):
+        config = load_config(NLP_MODEL_BART_SHARED_PREMISE_ENABLED="true")
+        engine = make_engine(config_manager=config)
+
+        assert engine.get_status()["bart_shared_premise"] == {
+            "enabled": True,
+            "active": False,
+        }
+
+
+class TestScorerWiring:
+    @pytest.mark.unit
+    def test_scorer_gets_label_set_encodings(self):
+        classifier = make_classifier(True)
+        scorer = RecordingScorer(classifier._pipeline)
+        classifier._premise_scorer = scorer
+
+        result = classifier.analyze(MESSAGES[0])
+
+        assert classifier._pipeline.calls == 1
+        assert scorer.calls == [
+            (tuple(classifier.crisis_labels), classifier.label_set.encodings)
+        ]
+        assert result.all_scores == make_classifier(False).analyze(MESSAGES[0]).all_scores
+        assert classifier.get_shared_premise_stats() == {
+            "enabled": True,
+            "active": True,
+            "calls": 1,
+        }
+
+    @pytest.mark.unit
+    def test_two_stage_calls_go_through_scorer(self):
+        classifier = make_classifier(True, two_stage=True)
+        scorer = RecordingScorer(classifier._pipeline)
+        classifier._premise_scorer = scorer
+
+        for message in MESSAGES:
+            classifier.analyze(message)
+
+        stats = classifier.get_two_stage_stats()
+        assert len(scorer.calls) == stats["screened"] + stats["expanded"]
+        assert len(scorer.calls) == classifier._pipeline.calls
+
+    @pytest.mark.unit
+    def test_unload_drops_scorer(self):
+        classifier = make_classifier(True)
+        classifier._premise_scorer = RecordingScorer(classifier._pipeline)
+
+        classifier.unload()
+
+        assert classifier.get_shared_premise_stats()["active"] is False
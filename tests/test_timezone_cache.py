@@ -0,0 +1,102 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+---
+Timezone Resolution Cache Tests
+---
+FILE VERSION: v5.0-8-9.0-1
+LAST MODIFIED: 2026-02-08
+PHASE: Phase 8 Step 9.0 - Timezone Resolution Cache
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.context import create_temporal_detector
+from src.context.temporal_detector import local_time_fields, resolve_timezone
+
+NEW_YORK = "America/New_York"
+
+# Around the 2026 US DST changes, including a fraction of a second before
+# the hour and an aware timestamp in another offset
+TIMESTAMPS = [
+    datetime(2026, 3, 8, 6, 59, 59, 900000),
+    datetime(2026, 3, 8, 7, 0, 0),
+    datetime(2026, 11, 1, 5, 30),
+    datetime(2026, 11, 1, 6, 30),
+    datetime(2026, 11, 1, 3, 30, tzinfo=timezone(timedelta(hours=-3))),
+]
+
+
+class TestResolveTimezone:
+    @pytest.mark.unit
+    def test_resolved_once(self):
+        assert resolve_timezone(NEW_YORK) is resolve_timezone(NEW_YORK)
+
+    @pytest.mark.unit
+    def test_invalid_name_cached_as_none(self):
+        resolve_timezone("Not/AZone")
+        hits = resolve_timezone.cache_info().hits
+
+        assert resolve_timezone("Not/AZone") is None
+        assert resolve_timezone.cache_info().hits == hits + 1
+
+
+class TestLocalTimeFields:
+    @pytest.mark.unit
+    def test_matches_astimezone_across_dst(self):
+        zone = resolve_timezone(NEW_YORK)
+        hours, weekdays = local_time_fields(TIMESTAMPS, zone)
+
+        expected = [
+            (ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)).astimezone(zone)
+            for ts in TIMESTAMPS
+        ]
+        assert hours == [local.hour for local in expected]
+        assert weekdays == [local.weekday() for local in expected]
+
+    @pytest.mark.unit
+    def test_without_zone_uses_timestamps_as_given(self):
+        assert local_time_fields(TIMESTAMPS[:2], None) == ([6, 7], [6, 6])
+
+
+class TestTemporalDetector:
+    @pytest.mark.unit
+    def test_local_hour_for_user_timezone(self, context_config):
+        detector = create_temporal_detector(context_config)
+        # 03:00 UTC is 22:00 the previous evening in New York (EST)
+        timestamps = [datetime(2026, 1, 1, 2, 30), datetime(2026, 1, 1, 3, 0)]
+
+        analysis = detector.analyze(timestamps, user_timezone=NEW_YORK)
+        assert analysis.local_hour == 22
+        assert analysis.user_timezone == NEW_YORK
+
+        later = detector.analyze(
+            timestamps, datetime(2026, 1, 1, 8, 0), user_timezone=NEW_YORK
+        )
+        assert later.local_hour == 3
+
+    @pytest.mark.unit
+    def test_invalid_timezone_falls_back(self, context_config):
+        detector = create_temporal_detector(context_config)
+        analysis = detector.analyze([datetime(2026, 1, 1, 3, 0)], user_timezone="Not/AZone")
+        assert analysis.local_hour is None
+
+
+class TestEnginePlumbing:
+    @pytest.mark.integration
+    def test_user_timezone_reaches_temporal_factors(self, make_engine):
+        history = [{
+            "message": "rough day",
+            "timestamp": (datetime.utcnow() - timedelta(minutes=30)).isoformat(),
+            "crisis_score": 0.3,
+        }]
+
+        assessment = make_engine().analyze(
+            "hi", message_history=history, user_timezone=NEW_YORK
+        )
+
+        temporal = assessment.context_analysis.to_dict()["temporal_factors"]
+        assert temporal["user_timezone"] == NEW_YORK
+        assert temporal["local_hour"] is not None
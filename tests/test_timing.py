@@ -0,0 +1,57 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+---
+Stage Timer Tests
+---
+FILE VERSION: v5.0-8-2.0-1
+LAST MODIFIED: 2026-02-02
+PHASE: Phase 8 Step 2.0 - Per-Stage Latency Instrumentation
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+"""
+
+import asyncio
+
+import pytest
+
+from src.utils.timing import StageTimer
+
+
+class TestStageTimer:
+    @pytest.mark.unit
+    def test_repeated_stages_accumulate(self):
+        timer = StageTimer(started_at=0.0)
+        timer.add("cache", 1.5)
+        timer.add("cache", 0.5)
+        timer.add("scoring", 2.0)
+
+        breakdown = timer.to_dict(total_ms=10.0)
+        assert breakdown["stages"] == {"cache": 2.0, "scoring": 2.0}
+        assert breakdown["unattributed_ms"] == 6.0
+
+    @pytest.mark.unit
+    def test_span_records_on_error(self):
+        timer = StageTimer()
+        with pytest.raises(RuntimeError):
+            with timer.stage("inference"):
+                raise RuntimeError("boom")
+        assert "inference" in timer.stages
+
+    @pytest.mark.unit
+    def test_unattributed_never_negative(self):
+        timer = StageTimer()
+        timer.add("inference", 50.0)
+        assert timer.to_dict(total_ms=10.0)["unattributed_ms"] == 0.0
+
+
+class TestEngineTiming:
+    @pytest.mark.integration
+    def test_sync_and_async_breakdowns(self, make_engine):
+        engine = make_engine()
+        for assessment in (
+            engine.analyze("I can't sleep and everything feels heavy"),
+            asyncio.run(engine.analyze_async("rough week, need to vent")),
+        ):
+            timing = assessment.timing
+            assert {"inference", "scoring"} <= set(timing["stages"])
+            assert set(timing["models"]) >= {"bart"}
+            assert timing["total_ms"] == pytest.approx(assessment.processing_time_ms, abs=0.01)
@@ -0,0 +1,110 @@
+"""
+Ash-NLP: Crisis Detection Backend for The Alphabet Cartel Discord Community
+---
+Two-Stage BART Screening Tests
+---
+FILE VERSION: v5.0-8-22.0-3
+LAST MODIFIED: 2026-02-21
+PHASE: Phase 8 Step 22.0 - Two-Stage BART Screening
+Repository: https://github.com/the-alphabet-cartel/ash-nlp
+"""
+
+import pytest
+
+from src.benchmark.stubs import ZERO_LATENCY_PROFILES, StubZeroShotPipeline
+from src.benchmark.traffic import create_traffic_generator
+from src.ensemble.scoring import create_weighted_scorer
+from src.models import create_bart_classifier, create_crisis_label_set
+from src.models.bart_classifier import DEFAULT_CRISIS_LABELS
+
+UMBRELLA = "crisis or emotional distress"
+
+
+def make_classifier(two_stage):
+    classifier = create_bart_classifier()
+    classifier.two_stage = two_stage
+    classifier._pipeline = StubZeroShotPipeline(latency=ZERO_LATENCY_PROFILES["bart"])
+    classifier._is_loaded = True
+    return classifier
+
+
+@pytest.fixture(scope="module")
+def messages():
+    return [r.message for r in create_traffic_generator().generate(200)]
+
+
+class TestProjectScreening:
+    @pytest.mark.unit
+    def test_crisis_labels_scored_like_umbrella(self):
+        label_set = create_crisis_label_set(DEFAULT_CRISIS_LABELS)
+        screening = {
+            "sequence": "hi",
+            "labels": ["casual conversation", "general discussion", UMBRELLA,
+                       "seeking information", "positive sharing"],
+            "scores": [0.5, 0.2, 0.1, 0.1, 0.1],
+        }
+
+        projected = label_set.project_screening(screening)
+        scores = dict(zip(projected["labels"], projected["scores"]))
+
+        # 12 crisis labels at 0.1 plus 0.9 of safe mass
+        assert set(scores) == set(DEFAULT_CRISIS_LABELS)
+        assert projected["labels"][0] == "casual conversation"
+        assert scores["casual conversation"] == pytest.approx(0.5 / 2.1)
+        assert scores["grief"] == pytest.approx(0.1 / 2.1)
+        assert sum(scores.values()) == pytest.approx(1.0)
+
+    @pytest.mark.unit
+    def test_multi_label_scores_not_renormalized(self):
+        label_set = create_crisis_label_set(DEFAULT_CRISIS_LABELS)
+        screening = {"labels": ["casual conversation", UMBRELLA], "scores": [0.8, 0.3]}
+
+        projected = label_set.project_screening(screening, normalize=False)
+        scores = dict(zip(projected["labels"], projected["scores"]))
+
+        assert scores["casual conversation"] == 0.8
+        assert scores["anxiety"] == 0.3
+        assert scores["positive sharing"] == 0.0
+
+
+class TestSingleStageParity:
+    @pytest.mark.integration
+    def test_screened_results_on_full_set_scale(self, messages):
+        single, two_stage = make_classifier(False), make_classifier(True)
+        scorer = create_weighted_scorer()
+        label_set = single.label_set
+
+        score_gaps = []
+        for message in messages:
+            full = single.analyze(message)
+            staged = two_stage.analyze(message)
+            assert set(staged.all_scores) == set(full.all_scores)
+
+            if staged.all_scores == full.all_scores:
+                continue
+            assert not label_set.is_crisis_label(staged.label)
+
+            signal_gap = abs(
+                scorer.extract_bart_signal(full).crisis_signal
+                - scorer.extract_bart_signal(staged).crisis_signal
+            )
+            assert signal_gap < 0.1
+            score_gaps.append(abs(
+                label_set.crisis_score(full.all_scores)
+                - label_set.crisis_score(staged.all_scores)
+            ))
+
+        # One umbrella score stands in for 12 crisis labels: close on average
+        stats = two_stage.get_two_stage_stats()
+        assert len(score_gaps) == stats["screened"] - stats["expanded"] > 0
+        assert sum(score_gaps) / len(score_gaps) < 0.15
+
+    @pytest.mark.integration
+    def test_batched_matches_single_calls(self, messages):
+        classifier = make_classifier(True)
+        batch = messages[:40]
+
+        batched = classifier._run_inference(batch)
+        singles = [classifier._run_inference(message) for message in batch]
+
+        assert batched == singles